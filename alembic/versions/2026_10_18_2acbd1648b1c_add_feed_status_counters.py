@@ -0,0 +1,51 @@
+"""add per-status download counters to feed.
+
+Revision ID: 2acbd1648b1c
+Revises: cd7b74287486
+Create Date: 2026-10-18 22:04:51.603118
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from alembic_helpers.triggers import (
+    STATUS_COUNTER_COLUMNS,
+    create_status_counter_triggers,
+    drop_status_counter_triggers,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "2acbd1648b1c"
+down_revision: str | Sequence[str] | None = "cd7b74287486"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for _, column in STATUS_COUNTER_COLUMNS:
+        op.add_column(
+            "feed",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+
+    create_status_counter_triggers()
+
+    # Backfill from the download table; total_downloads is recounted as well so
+    # every counter starts from the same consistent snapshot.
+    counts = [("DOWNLOADED", "total_downloads"), *STATUS_COUNTER_COLUMNS]
+    assignments = ", ".join(
+        f"{column} = (SELECT COUNT(*) FROM download "
+        f"WHERE download.feed_id = feed.id AND download.status = '{status}')"
+        for status, column in counts
+    )
+    op.execute(f"UPDATE feed SET {assignments}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_status_counter_triggers()
+    for _, column in reversed(STATUS_COUNTER_COLUMNS):
+        op.drop_column("feed", column)
@@ -0,0 +1,33 @@
+"""add content key for sharing media files across feeds.
+
+Revision ID: 3f6a9d2c8b17
+Revises: 9c2e4f71a8d3
+Create Date: 2026-10-18 23:58:41.530112
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlmodel.sql.sqltypes import AutoString
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6a9d2c8b17"
+down_revision: str | Sequence[str] | None = "9c2e4f71a8d3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("download", sa.Column("content_key", AutoString(), nullable=True))
+    op.create_index(
+        "idx_download_content_key", "download", ["content_key"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_download_content_key", table_name="download")
+    op.drop_column("download", "content_key")
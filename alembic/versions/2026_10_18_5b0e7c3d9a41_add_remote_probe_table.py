@@ -0,0 +1,37 @@
+"""add remote_probe table caching probed media durations.
+
+Revision ID: 5b0e7c3d9a41
+Revises: 2acbd1648b1c
+Create Date: 2026-10-18 23:10:42.518306
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from anypod.db.types.timezone_aware_datetime import TimezoneAwareDatetime
+
+# revision identifiers, used by Alembic.
+revision: str = "5b0e7c3d9a41"
+down_revision: str | Sequence[str] | None = "2acbd1648b1c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "remoteprobe",
+        sa.Column("feed_id", sa.String(), nullable=False),
+        sa.Column("download_id", sa.String(), nullable=False),
+        sa.Column("media_fingerprint", sa.String(), nullable=False),
+        sa.Column("duration", sa.Integer(), nullable=False),
+        sa.Column("probed_at", TimezoneAwareDatetime(), nullable=False),
+        sa.PrimaryKeyConstraint("feed_id", "download_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("remoteprobe")
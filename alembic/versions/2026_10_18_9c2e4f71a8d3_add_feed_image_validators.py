@@ -0,0 +1,33 @@
+"""add HTTP validators and content hash for feed images.
+
+Revision ID: 9c2e4f71a8d3
+Revises: 5b0e7c3d9a41
+Create Date: 2026-10-18 23:48:05.112904
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlmodel.sql.sqltypes import AutoString
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c2e4f71a8d3"
+down_revision: str | Sequence[str] | None = "5b0e7c3d9a41"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("feed", sa.Column("image_etag", AutoString(), nullable=True))
+    op.add_column("feed", sa.Column("image_last_modified", AutoString(), nullable=True))
+    op.add_column("feed", sa.Column("image_content_hash", AutoString(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("feed", "image_content_hash")
+    op.drop_column("feed", "image_last_modified")
+    op.drop_column("feed", "image_etag")
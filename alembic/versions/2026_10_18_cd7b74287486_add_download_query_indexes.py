@@ -0,0 +1,55 @@
+"""add download query indexes.
+
+Replaces idx_feed_status with a composite (feed_id, status, published DESC)
+index that serves both the status filter and the newest-first ordering, and
+adds partial indexes for the work-queue statuses that are queried across feeds.
+
+Revision ID: cd7b74287486
+Revises: fd790245b92e
+Create Date: 2026-10-18 21:15:04.118227
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "cd7b74287486"
+down_revision: str | Sequence[str] | None = "fd790245b92e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PARTIAL_STATUS_INDEXES = {
+    "idx_download_queued": "QUEUED",
+    "idx_download_upcoming": "UPCOMING",
+    "idx_download_error": "ERROR",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "idx_feed_status_published",
+        "download",
+        ["feed_id", "status", sa.text("published DESC")],
+        unique=False,
+    )
+    op.drop_index("idx_feed_status", table_name="download")
+    for index_name, status in PARTIAL_STATUS_INDEXES.items():
+        op.create_index(
+            index_name,
+            "download",
+            [sa.text("published DESC")],
+            unique=False,
+            sqlite_where=sa.text(f"status = '{status}'"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index_name in PARTIAL_STATUS_INDEXES:
+        op.drop_index(index_name, table_name="download")
+    op.create_index("idx_feed_status", "download", ["feed_id", "status"], unique=False)
+    op.drop_index("idx_feed_status_published", table_name="download")
@@ -181,3 +181,99 @@ def create_download_triggers_v2() -> None:
 def drop_download_triggers_v2() -> None:
     """Drop download-related triggers if present (v2 version for clarity)."""
     drop_download_triggers()
+
+
+# ============================================================================
+# Per-status Counter Triggers
+# ============================================================================
+
+# DOWNLOADED rows are already counted in feed.total_downloads by the triggers
+# above, so only the remaining statuses get dedicated counter columns here.
+STATUS_COUNTER_COLUMNS = (
+    ("UPCOMING", "upcoming_count"),
+    ("QUEUED", "queued_count"),
+    ("ERROR", "error_count"),
+    ("SKIPPED", "skipped_count"),
+    ("ARCHIVED", "archived_count"),
+)
+
+TRIGGER_DOWNLOADS_AFTER_INSERT_STATUS_COUNTS = "downloads_after_insert_status_counts"
+TRIGGER_DOWNLOADS_AFTER_DELETE_STATUS_COUNTS = "downloads_after_delete_status_counts"
+TRIGGER_DOWNLOADS_STATUS_CHANGE_STATUS_COUNTS = "downloads_status_change_status_counts"
+
+STATUS_COUNTER_TRIGGER_NAMES = (
+    TRIGGER_DOWNLOADS_AFTER_INSERT_STATUS_COUNTS,
+    TRIGGER_DOWNLOADS_AFTER_DELETE_STATUS_COUNTS,
+    TRIGGER_DOWNLOADS_STATUS_CHANGE_STATUS_COUNTS,
+)
+
+
+def _status_counter_assignments(increment_from: str, decrement_from: str) -> str:
+    """Build the SET clause that adjusts every status counter column.
+
+    SQLite evaluates a comparison to 0 or 1, so each counter moves by the
+    difference between the new and old row matching its status.
+
+    Args:
+        increment_from: Row alias whose status adds one ("NEW"), or "" for none.
+        decrement_from: Row alias whose status subtracts one ("OLD"), or "" for none.
+
+    Returns:
+        Comma-separated column assignments.
+    """
+    assignments: list[str] = []
+    for status, column in STATUS_COUNTER_COLUMNS:
+        expr = column
+        if increment_from:
+            expr += f" + ({increment_from}.status = '{status}')"
+        if decrement_from:
+            expr += f" - ({decrement_from}.status = '{status}')"
+        assignments.append(f"{column} = {expr}")
+    return ",\n                ".join(assignments)
+
+
+STATUS_COUNTER_TRIGGER_STATEMENTS = (
+    f"""
+        CREATE TRIGGER IF NOT EXISTS {TRIGGER_DOWNLOADS_AFTER_INSERT_STATUS_COUNTS}
+        AFTER INSERT ON download
+        FOR EACH ROW
+        BEGIN
+            UPDATE feed SET
+                {_status_counter_assignments("NEW", "")}
+            WHERE id = NEW.feed_id;
+        END;
+    """,
+    f"""
+        CREATE TRIGGER IF NOT EXISTS {TRIGGER_DOWNLOADS_AFTER_DELETE_STATUS_COUNTS}
+        AFTER DELETE ON download
+        FOR EACH ROW
+        BEGIN
+            UPDATE feed SET
+                {_status_counter_assignments("", "OLD")}
+            WHERE id = OLD.feed_id;
+        END;
+    """,
+    f"""
+        CREATE TRIGGER IF NOT EXISTS {TRIGGER_DOWNLOADS_STATUS_CHANGE_STATUS_COUNTS}
+        AFTER UPDATE OF status ON download
+        FOR EACH ROW
+        WHEN OLD.status != NEW.status
+        BEGIN
+            UPDATE feed SET
+                {_status_counter_assignments("NEW", "OLD")}
+            WHERE id = NEW.feed_id;
+        END;
+    """,
+)
+
+
+def create_status_counter_triggers() -> None:
+    """Create triggers that maintain the per-status counters on feed."""
+    for statement in STATUS_COUNTER_TRIGGER_STATEMENTS:
+        op.execute(statement)
+
+
+def drop_status_counter_triggers() -> None:
+    """Drop the per-status counter triggers if present."""
+    for trigger in STATUS_COUNTER_TRIGGER_NAMES:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
@@ -20,6 +20,7 @@ from ..ffprobe import FFProbe
 from ..file_manager import FileManager
 from ..path_manager import PathManager
 from ..ytdlp_wrapper import YtdlpWrapper
+from ..ytdlp_wrapper.core import YtdlpCore
 from ..ytdlp_wrapper.handlers import HandlerSelector
 
 logger = logging.getLogger(__name__)
@@ -58,7 +59,8 @@ async def run_debug_downloader_mode(
         app_state_db = AppStateDatabase(db_core)
         ffmpeg = FFmpeg()
         ffprobe = FFProbe()
-        handler_selector = HandlerSelector(ffprobe)
+        ytdlp_core = YtdlpCore()
+        handler_selector = HandlerSelector(ffprobe, ytdlp_core)
         ytdlp_wrapper = YtdlpWrapper(
             paths,
             pot_provider_url=settings.pot_provider_url,
@@ -68,6 +70,7 @@ async def run_debug_downloader_mode(
             ffmpeg=ffmpeg,
             ffprobe=ffprobe,
             handler_selector=handler_selector,
+            ytdlp_core=ytdlp_core,
         )
         downloader = Downloader(
             download_db=download_db,
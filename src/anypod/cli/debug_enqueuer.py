@@ -17,10 +17,12 @@ from ..exceptions import DatabaseOperationError, EnqueueError, StateReconciliati
 from ..ffmpeg import FFmpeg
 from ..ffprobe import FFProbe
 from ..file_manager import FileManager
+from ..http_client import create_http_client
 from ..image_downloader import ImageDownloader
 from ..path_manager import PathManager
 from ..state_reconciler import StateReconciler
 from ..ytdlp_wrapper import YtdlpWrapper
+from ..ytdlp_wrapper.core import YtdlpCore
 from ..ytdlp_wrapper.handlers import HandlerSelector
 
 logger = logging.getLogger(__name__)
@@ -49,6 +51,9 @@ async def run_debug_enqueuer_mode(
         },
     )
 
+    http_client = create_http_client(
+        timeout=settings.image_download_timeout.total_seconds()
+    )
     try:
         db_core = SqlalchemyCore(db_dir)
         feed_db = FeedDatabase(db_core)
@@ -57,7 +62,8 @@ async def run_debug_enqueuer_mode(
         app_state_db = AppStateDatabase(db_core)
         ffmpeg = FFmpeg()
         ffprobe = FFProbe()
-        handler_selector = HandlerSelector(ffprobe)
+        ytdlp_core = YtdlpCore()
+        handler_selector = HandlerSelector(ffprobe, ytdlp_core)
         ytdlp_wrapper = YtdlpWrapper(
             paths,
             pot_provider_url=settings.pot_provider_url,
@@ -67,9 +73,12 @@ async def run_debug_enqueuer_mode(
             ffmpeg=ffmpeg,
             ffprobe=ffprobe,
             handler_selector=handler_selector,
+            ytdlp_core=ytdlp_core,
         )
         pruner = Pruner(feed_db, download_db, file_manager)
-        image_downloader = ImageDownloader(paths, ytdlp_wrapper, ffprobe, ffmpeg)
+        image_downloader = ImageDownloader(
+            paths, ytdlp_wrapper, ffprobe, ffmpeg, http_client
+        )
         state_reconciler = StateReconciler(
             file_manager,
             image_downloader,
@@ -83,6 +92,7 @@ async def run_debug_enqueuer_mode(
         logger.critical(
             "Failed to initialize components for Enqueuer debug mode.", exc_info=e
         )
+        await http_client.aclose()
         return
 
     logger.debug("Enqueuer and its dependencies initialized for debug mode.")
@@ -90,6 +100,7 @@ async def run_debug_enqueuer_mode(
     if not settings.feeds:
         logger.info("No feeds configured. Enqueuer debug mode has nothing to process.")
         await db_core.close()
+        await http_client.aclose()
         return
 
     # Run state reconciliation first to ensure feeds exist in database
@@ -105,6 +116,7 @@ async def run_debug_enqueuer_mode(
     except StateReconciliationError as e:
         logger.error("Failed to reconcile state.", exc_info=e)
         await db_core.close()
+        await http_client.aclose()
         return
 
     total_newly_queued_count = 0
@@ -187,5 +199,6 @@ async def run_debug_enqueuer_mode(
             logger.info("No downloads found in the database.")
     finally:
         await db_core.close()
+        await http_client.aclose()
 
     logger.info("Enqueuer debug mode processing complete.")
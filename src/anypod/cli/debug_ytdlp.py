@@ -14,6 +14,7 @@ from ..ffmpeg import FFmpeg
 from ..ffprobe import FFProbe
 from ..path_manager import PathManager
 from ..ytdlp_wrapper import YtdlpWrapper
+from ..ytdlp_wrapper.core import YtdlpCore
 from ..ytdlp_wrapper.handlers import HandlerSelector
 
 logger = logging.getLogger(__name__)
@@ -40,7 +41,8 @@ async def run_debug_ytdlp_mode(settings: AppSettings, paths: PathManager) -> Non
     app_state_db = AppStateDatabase(db_core)
     ffmpeg = FFmpeg()
     ffprobe = FFProbe()
-    handler_selector = HandlerSelector(ffprobe)
+    ytdlp_core = YtdlpCore()
+    handler_selector = HandlerSelector(ffprobe, ytdlp_core)
     ytdlp_wrapper = YtdlpWrapper(
         paths,
         pot_provider_url=settings.pot_provider_url,
@@ -50,6 +52,7 @@ async def run_debug_ytdlp_mode(settings: AppSettings, paths: PathManager) -> Non
         ffmpeg=ffmpeg,
         ffprobe=ffprobe,
         handler_selector=handler_selector,
+        ytdlp_core=ytdlp_core,
     )
 
     for feed_id, feed_config in settings.feeds.items():
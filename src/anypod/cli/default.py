@@ -5,28 +5,49 @@ runs state reconciliation, starts the scheduler, and manages the application lif
 """
 
 import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
 import logging
 
+import httpx
+
 from ..config import AppSettings
 from ..data_coordinator import DataCoordinator, Downloader, Enqueuer, Pruner
-from ..db import AppStateDatabase, DownloadDatabase, FeedDatabase
+from ..db import (
+    AppStateDatabase,
+    DownloadDatabase,
+    FeedDatabase,
+    RemoteProbeDatabase,
+)
+from ..db.maintenance import DatabaseMaintenance
 from ..db.sqlalchemy_core import SqlalchemyCore
+from ..disk_space import DiskSpaceGuard
 from ..exceptions import (
     DatabaseOperationError,
+    PruneError,
     StateReconciliationError,
 )
 from ..ffmpeg import FFmpeg
 from ..ffprobe import FFProbe
 from ..file_manager import FileManager
+from ..http_client import create_http_client
+from ..image_derivatives import ImageDerivativeCache
 from ..image_downloader import ImageDownloader
+from ..image_pipeline import ImagePipeline
+from ..logging_config import setup_logging
+from ..loop_monitor import LoopLagMonitor
 from ..manual_feed_runner import ManualFeedRunner
 from ..manual_submission_service import ManualSubmissionService
+from ..media_dedup import MediaDeduplicator
+from ..orphan_gc import OrphanFileCollector
+from ..partial_recovery import PartialDownloadRecovery
 from ..path_manager import PathManager
 from ..rss import RSSFeedGenerator
 from ..schedule import FeedScheduler
 from ..server import create_admin_server, create_server
 from ..state_reconciler import StateReconciler
+from ..subprocess_runner import ResourceLimits, SubprocessOperation, SubprocessRunner
 from ..ytdlp_wrapper import YtdlpWrapper
+from ..ytdlp_wrapper.core import DownloadProgressTracker, YtdlpCore
 from ..ytdlp_wrapper.handlers import HandlerSelector
 
 logger = logging.getLogger(__name__)
@@ -36,6 +57,9 @@ async def graceful_shutdown(
     scheduler: FeedScheduler | None,
     manual_feed_runner: ManualFeedRunner | None,
     db_core: SqlalchemyCore | None,
+    render_executor: Executor | None = None,
+    loop_monitor: LoopLagMonitor | None = None,
+    http_client: httpx.AsyncClient | None = None,
 ) -> None:
     """Perform graceful shutdown of all components in correct order.
 
@@ -43,6 +67,9 @@ async def graceful_shutdown(
         scheduler: The feed scheduler instance to shutdown.
         manual_feed_runner: The manual feed runner instance to shutdown.
         db_core: The database core instance to close.
+        render_executor: The RSS render worker pool to shut down.
+        loop_monitor: The event loop lag monitor to stop.
+        http_client: The shared outbound HTTP client to close.
     """
     logger.info("Shutdown signal received.")
 
@@ -70,11 +97,48 @@ async def graceful_shutdown(
         except Exception as e:
             logger.error("Error closing database connections.", exc_info=e)
 
+    # Step 4: Stop background workers
+    if render_executor:
+        render_executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("RSS render workers shut down.")
+    if loop_monitor:
+        await loop_monitor.stop()
+    if http_client:
+        try:
+            await http_client.aclose()
+            logger.info("HTTP client closed.")
+        except Exception as e:
+            logger.error("Error closing HTTP client.", exc_info=e)
+
     logger.info("Anypod shutdown completed.")
 
 
+def _subprocess_runner(settings: AppSettings) -> SubprocessRunner:
+    """Build the runner bounding every yt-dlp, ffprobe and ffmpeg process."""
+    return SubprocessRunner(
+        timeouts={
+            SubprocessOperation.YTDLP_METADATA: (
+                settings.subprocess_timeout_ytdlp_metadata.total_seconds()
+            ),
+            SubprocessOperation.YTDLP_DOWNLOAD: (
+                settings.subprocess_timeout_ytdlp_download.total_seconds()
+            ),
+            SubprocessOperation.FFPROBE: settings.subprocess_timeout_ffprobe.total_seconds(),
+            SubprocessOperation.FFMPEG: settings.subprocess_timeout_ffmpeg.total_seconds(),
+        },
+        limits=ResourceLimits(
+            max_memory_bytes=settings.subprocess_max_memory,
+            nice=settings.subprocess_nice,
+            ionice_class=settings.subprocess_ionice_class,
+        ),
+    )
+
+
 async def _init(
     settings: AppSettings,
+    render_executor: Executor,
+    http_client: httpx.AsyncClient,
+    disk_space_guard: DiskSpaceGuard,
 ) -> tuple[
     SqlalchemyCore,
     FileManager,
@@ -85,6 +149,7 @@ async def _init(
     YtdlpWrapper,
     ManualFeedRunner,
     ManualSubmissionService,
+    ImageDerivativeCache,
 ]:
     # Initialize path manager
     path_manager = PathManager(
@@ -114,11 +179,29 @@ async def _init(
     app_state_db = AppStateDatabase(db_core)
     feed_db = FeedDatabase(db_core)
     download_db = DownloadDatabase(db_core)
+    remote_probe_db = RemoteProbeDatabase(db_core)
+    db_maintenance = DatabaseMaintenance(
+        db_core,
+        backup_path=db_dir / "backups" / "anypod.db"
+        if settings.db_backup_enabled
+        else None,
+        remote_probe_db=remote_probe_db,
+    )
 
     # Initialize application components
-    ffmpeg = FFmpeg()
-    ffprobe = FFProbe()
-    handler_selector = HandlerSelector(ffprobe)
+    subprocess_runner = _subprocess_runner(settings)
+    ytdlp_core = YtdlpCore(subprocess_runner)
+    ffmpeg = FFmpeg(subprocess_runner)
+    ffprobe = FFProbe(subprocess_runner)
+    image_pipeline = ImagePipeline(
+        ffprobe, ffmpeg, max_dimension=settings.image_max_dimension
+    )
+    handler_selector = HandlerSelector(
+        ffprobe,
+        ytdlp_core,
+        probe_cache=remote_probe_db,
+        max_concurrent_probes=settings.remote_probe_concurrency,
+    )
     ytdlp_wrapper = YtdlpWrapper(
         paths=path_manager,
         pot_provider_url=settings.pot_provider_url,
@@ -128,13 +211,31 @@ async def _init(
         ffmpeg=ffmpeg,
         ffprobe=ffprobe,
         handler_selector=handler_selector,
+        ytdlp_core=ytdlp_core,
+        progress_tracker=DownloadProgressTracker(
+            min_speed=settings.download_min_speed,
+            stall_window=settings.download_stall_timeout.total_seconds(),
+        ),
+        image_pipeline=image_pipeline,
+    )
+    rss_generator = RSSFeedGenerator(
+        download_db=download_db,
+        paths=path_manager,
+        render_executor=render_executor,
     )
-    rss_generator = RSSFeedGenerator(download_db=download_db, paths=path_manager)
     image_downloader = ImageDownloader(
         paths=path_manager,
         ytdlp_wrapper=ytdlp_wrapper,
         ffprobe=ffprobe,
         ffmpeg=ffmpeg,
+        http_client=http_client,
+        max_image_bytes=settings.image_max_size,
+        image_pipeline=image_pipeline,
+    )
+    image_cache = ImageDerivativeCache(
+        paths=path_manager,
+        pipeline=image_pipeline,
+        max_bytes=settings.image_cache_max_size,
     )
 
     # Initialize data coordinator components
@@ -143,13 +244,27 @@ async def _init(
         download_db=download_db,
         feed_db=feed_db,
     )
+    media_deduplicator = (
+        MediaDeduplicator(download_db=download_db, file_manager=file_manager)
+        if settings.media_dedup_enabled
+        else None
+    )
+    partial_recovery = PartialDownloadRecovery(download_db, path_manager)
     downloader = Downloader(
         download_db=download_db,
         file_manager=file_manager,
         ytdlp_wrapper=ytdlp_wrapper,
         ffprobe=ffprobe,
+        media_deduplicator=media_deduplicator,
+        disk_space_guard=disk_space_guard,
+        partial_recovery=partial_recovery,
+    )
+    pruner = Pruner(
+        feed_db=feed_db,
+        download_db=download_db,
+        file_manager=file_manager,
+        storage_budget=settings.storage_budget,
     )
-    pruner = Pruner(feed_db=feed_db, download_db=download_db, file_manager=file_manager)
 
     data_coordinator = DataCoordinator(
         enqueuer=enqueuer,
@@ -180,6 +295,24 @@ async def _init(
         logger.error("State reconciliation failed, cannot continue.", exc_info=e)
         raise
 
+    # Apply retention changes from the config now rather than on each feed's next run
+    try:
+        await pruner.prune_all_feeds()
+    except PruneError as e:
+        logger.error("Startup prune pass failed.", exc_info=e)
+
+    # Keep partial files of interrupted downloads before any download starts
+    try:
+        await partial_recovery.recover(settings.feeds)
+    except (DatabaseOperationError, OSError) as e:
+        logger.error("Partial download recovery failed.", exc_info=e)
+
+    if media_deduplicator:
+        try:
+            await media_deduplicator.deduplicate_existing()
+        except DatabaseOperationError as e:
+            logger.error("Media deduplication pass failed.", exc_info=e)
+
     manual_feed_ids = [
         fid for fid, cfg in settings.feeds.items() if cfg.enabled and cfg.is_manual
     ]
@@ -217,6 +350,15 @@ async def _init(
         feed_configs=settings.feeds,
         data_coordinator=data_coordinator,
         feed_semaphore=feed_semaphore,
+        db_maintenance=db_maintenance,
+        maintenance_schedule=settings.db_maintenance_schedule,
+        orphan_collector=OrphanFileCollector(
+            download_db,
+            path_manager,
+            grace_period=settings.orphan_gc_grace_period,
+            batch_size=settings.orphan_gc_batch_size,
+        ),
+        orphan_gc_schedule=settings.orphan_gc_schedule,
     )
 
     return (
@@ -229,6 +371,7 @@ async def _init(
         ytdlp_wrapper,
         manual_feed_runner,
         manual_submission_service,
+        image_cache,
     )
 
 
@@ -249,6 +392,27 @@ async def default(settings: AppSettings) -> None:
     db_core: SqlalchemyCore | None = None
     scheduler: FeedScheduler | None = None
     manual_feed_runner: ManualFeedRunner | None = None
+    # Feed rendering is CPU-bound; keep it off the loop that serves HTTP
+    render_executor = ProcessPoolExecutor(
+        max_workers=1,
+        initializer=setup_logging,
+        initargs=(
+            settings.log_format,
+            settings.log_level,
+            settings.log_include_stacktrace,
+        ),
+    )
+    loop_monitor = LoopLagMonitor(trace_slow_callbacks=settings.slow_callback_tracing)
+    loop_monitor.start()
+    # One pooled client for all outbound image requests
+    http_client = create_http_client(
+        timeout=settings.image_download_timeout.total_seconds()
+    )
+    disk_space_guard = DiskSpaceGuard(
+        settings.data_dir,
+        min_free_bytes=settings.disk_min_free_space,
+        default_estimate=settings.download_size_estimate,
+    )
     try:
         (
             db_core,
@@ -260,7 +424,8 @@ async def default(settings: AppSettings) -> None:
             ytdlp_wrapper,
             manual_feed_runner,
             manual_submission_service,
-        ) = await _init(settings)
+            image_cache,
+        ) = await _init(settings, render_executor, http_client, disk_space_guard)
 
         # Create HTTP server with shutdown callback
         server = create_server(
@@ -275,9 +440,17 @@ async def default(settings: AppSettings) -> None:
             feed_configs=settings.feeds,
             cookies_path=settings.cookies_path,
             shutdown_callback=lambda: graceful_shutdown(
-                scheduler, manual_feed_runner, db_core
+                scheduler,
+                manual_feed_runner,
+                db_core,
+                render_executor,
+                loop_monitor,
+                http_client,
             ),
             include_admin=settings.single_server_mode,
+            loop_monitor=loop_monitor,
+            image_cache=image_cache,
+            disk_space_guard=disk_space_guard,
         )
 
         servers = [server]
@@ -308,6 +481,8 @@ async def default(settings: AppSettings) -> None:
                 manual_submission_service=manual_submission_service,
                 feed_configs=settings.feeds,
                 cookies_path=settings.cookies_path,
+                loop_monitor=loop_monitor,
+                disk_space_guard=disk_space_guard,
             )
             servers.append(admin_server)
             log_extra["admin_port"] = settings.admin_server_port
@@ -323,4 +498,11 @@ async def default(settings: AppSettings) -> None:
         await asyncio.gather(*(s.serve() for s in servers))
     except Exception as e:
         logger.error("Unexpected error during execution.", exc_info=e)
-        await graceful_shutdown(scheduler, manual_feed_runner, db_core)
+        await graceful_shutdown(
+            scheduler,
+            manual_feed_runner,
+            db_core,
+            render_executor,
+            loop_monitor,
+            http_client,
+        )
@@ -12,17 +12,19 @@ from pathlib import Path
 from typing import Any, Literal, cast
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from pydantic import Field, field_validator
+from pydantic import ByteSize, Field, ValidationInfo, field_validator
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
     SettingsConfigDict,
 )
 from pydantic_settings.sources import InitSettingsSource, YamlConfigSettingsSource
+import pytimeparse2  # pyright: ignore[reportMissingTypeStubs]
 import yaml
 
 from ..exceptions import ConfigLoadError
 from .feed_config import FeedConfig
+from .types import CronExpression
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +119,13 @@ class AppSettings(BaseSettings):
         config_file: Path to the YAML config file.
         cookies_path: Path to the cookies.txt file for yt-dlp authentication.
         pot_provider_url: URL for bgutil POT provider HTTP server used by yt-dlp.
+        db_maintenance_schedule: Cron schedule for database maintenance, or None to disable.
+        db_backup_enabled: Whether maintenance also writes a database snapshot.
+        orphan_gc_schedule: Cron schedule for the orphan file sweep, or None to disable.
+        orphan_gc_grace_period: Minimum age of an unreferenced file before it is deleted.
+        orphan_gc_batch_size: Directory entries examined per orphan sweep run.
+        media_dedup_enabled: Whether feeds share identical media via hardlinks.
+        slow_callback_tracing: Whether to time every event loop callback.
         feeds: Configuration for all podcast feeds.
     """
 
@@ -226,6 +235,208 @@ class AppSettings(BaseSettings):
         ),
     )
 
+    # Download throughput floor
+    download_min_speed: int = Field(
+        default=10 * 1024,
+        ge=0,
+        validation_alias="DOWNLOAD_MIN_SPEED",
+        description=(
+            "Minimum average download speed in bytes per second before a media download "
+            "is considered stalled and stopped. Set to 0 to disable."
+        ),
+    )
+    download_stall_timeout: timedelta = Field(
+        default=timedelta(minutes=5),
+        gt=timedelta(0),
+        validation_alias="DOWNLOAD_STALL_TIMEOUT",
+        description=(
+            "How long download speed must stay below DOWNLOAD_MIN_SPEED before the "
+            "download is stopped (e.g., '300', '5m')."
+        ),
+    )
+
+    storage_budget: ByteSize | None = Field(
+        default=None,
+        gt=0,
+        validation_alias="STORAGE_BUDGET",
+        description=(
+            "Total size of downloaded media kept across all feeds (e.g., '500GiB'); "
+            "the oldest episodes of any feed are pruned first. Unset for no limit."
+        ),
+    )
+
+    # Disk space admission control
+    disk_min_free_space: ByteSize = Field(
+        default=ByteSize(2 * 1024 * 1024 * 1024),
+        ge=0,
+        validation_alias="DISK_MIN_FREE_SPACE",
+        description=(
+            "Free space to keep on the data volume; downloads that would go below it "
+            "are deferred to a later run (e.g., '2GiB')."
+        ),
+    )
+    download_size_estimate: ByteSize = Field(
+        default=ByteSize(1024 * 1024 * 1024),
+        gt=0,
+        validation_alias="DOWNLOAD_SIZE_ESTIMATE",
+        description=(
+            "Space assumed for a download whose size the source does not report "
+            "(e.g., '1GiB')."
+        ),
+    )
+
+    remote_probe_concurrency: int = Field(
+        default=4,
+        ge=1,
+        validation_alias="REMOTE_PROBE_CONCURRENCY",
+        description=(
+            "Maximum number of concurrent ffprobe runs against remote media URLs "
+            "when a source does not report durations (Patreon)."
+        ),
+    )
+
+    # Direct image downloads
+    image_download_timeout: timedelta = Field(
+        default=timedelta(seconds=30),
+        validation_alias="IMAGE_DOWNLOAD_TIMEOUT",
+        description="Timeout for each stage of a direct image request (e.g., '30s').",
+    )
+    image_max_size: ByteSize = Field(
+        default=ByteSize(20 * 1024 * 1024),
+        gt=0,
+        validation_alias="IMAGE_MAX_SIZE",
+        description="Largest feed image accepted from a direct download (e.g., '20MiB').",
+    )
+    image_max_dimension: int = Field(
+        default=3000,
+        ge=1,
+        validation_alias="IMAGE_MAX_DIMENSION",
+        description=(
+            "Longest side in pixels that feed images and thumbnails are scaled "
+            "down to when converted."
+        ),
+    )
+    image_cache_max_size: ByteSize = Field(
+        default=ByteSize(256 * 1024 * 1024),
+        gt=0,
+        validation_alias="IMAGE_CACHE_MAX_SIZE",
+        description="Disk budget for resized image copies served via '?w=' (e.g., '256MiB').",
+    )
+
+    # Subprocess limits
+    subprocess_timeout_ytdlp_metadata: timedelta = Field(
+        default=timedelta(minutes=30),
+        gt=timedelta(0),
+        validation_alias="SUBPROCESS_TIMEOUT_YTDLP_METADATA",
+        description="Wall-clock limit for one yt-dlp metadata extraction (e.g., '30m').",
+    )
+    subprocess_timeout_ytdlp_download: timedelta = Field(
+        default=timedelta(hours=6),
+        gt=timedelta(0),
+        validation_alias="SUBPROCESS_TIMEOUT_YTDLP_DOWNLOAD",
+        description="Wall-clock limit for one yt-dlp media download (e.g., '6h').",
+    )
+    subprocess_timeout_ffprobe: timedelta = Field(
+        default=timedelta(minutes=2),
+        gt=timedelta(0),
+        validation_alias="SUBPROCESS_TIMEOUT_FFPROBE",
+        description="Wall-clock limit for one ffprobe invocation (e.g., '2m').",
+    )
+    subprocess_timeout_ffmpeg: timedelta = Field(
+        default=timedelta(minutes=10),
+        gt=timedelta(0),
+        validation_alias="SUBPROCESS_TIMEOUT_FFMPEG",
+        description="Wall-clock limit for one ffmpeg invocation (e.g., '10m').",
+    )
+    subprocess_max_memory: ByteSize | None = Field(
+        default=None,
+        gt=0,
+        validation_alias="SUBPROCESS_MAX_MEMORY",
+        description=(
+            "Address-space limit for each yt-dlp, ffprobe and ffmpeg process "
+            "(e.g., '4GiB'). Unset for no limit."
+        ),
+    )
+    subprocess_nice: int | None = Field(
+        default=None,
+        ge=0,
+        le=19,
+        validation_alias="SUBPROCESS_NICE",
+        description="CPU niceness for external tool processes (0-19). Unset to inherit.",
+    )
+    subprocess_ionice_class: int | None = Field(
+        default=None,
+        ge=1,
+        le=3,
+        validation_alias="SUBPROCESS_IONICE_CLASS",
+        description=(
+            "I/O scheduling class for external tool processes via ionice "
+            "(1 realtime, 2 best-effort, 3 idle). Unset to inherit."
+        ),
+    )
+
+    # Database maintenance configuration
+    db_maintenance_schedule: CronExpression | None = Field(
+        default=CronExpression("30 4 * * *"),
+        validation_alias="DB_MAINTENANCE_SCHEDULE",
+        description=(
+            "Cron schedule for database vacuum, WAL checkpoint, statistics refresh and backup. "
+            "Set to 'off' to disable."
+        ),
+    )
+    db_backup_enabled: bool = Field(
+        default=True,
+        validation_alias="DB_BACKUP_ENABLED",
+        description="Write a snapshot of the database during each maintenance run (true/false).",
+    )
+
+    # Orphan file garbage collection
+    orphan_gc_schedule: CronExpression | None = Field(
+        default=CronExpression("0 5 * * *"),
+        validation_alias="ORPHAN_GC_SCHEDULE",
+        description=(
+            "Cron schedule for deleting media, thumbnail, transcript and temporary "
+            "files that no download references. Set to 'off' to disable."
+        ),
+    )
+    orphan_gc_grace_period: timedelta = Field(
+        default=timedelta(hours=24),
+        gt=timedelta(0),
+        validation_alias="ORPHAN_GC_GRACE_PERIOD",
+        description="How long an unreferenced file must go unchanged before it is deleted (e.g., '24h').",
+    )
+    orphan_gc_batch_size: int = Field(
+        default=50_000,
+        ge=1,
+        validation_alias="ORPHAN_GC_BATCH_SIZE",
+        description=(
+            "Directory entries examined per orphan sweep; the next run resumes "
+            "where the previous one stopped."
+        ),
+    )
+
+    # Media sharing across feeds
+    media_dedup_enabled: bool = Field(
+        default=False,
+        validation_alias="MEDIA_DEDUP_ENABLED",
+        description=(
+            "Hardlink media already downloaded by another feed instead of downloading "
+            "it again, and link identical existing files at startup (true/false). "
+            "Requires all feeds to live on one filesystem."
+        ),
+    )
+
+    # Event loop diagnostics
+    slow_callback_tracing: bool = Field(
+        default=False,
+        validation_alias="SLOW_CALLBACK_TRACING",
+        description=(
+            "Time every event loop callback and report the ones that block the "
+            "loop in /admin/diagnostics (true/false). Wraps a private asyncio "
+            "method, so leave it off unless investigating lag."
+        ),
+    )
+
     feeds: dict[str, FeedConfig] = Field(
         default_factory=dict[str, FeedConfig],
         description="Configuration for all podcast feeds. Must be read from a YAML file.",
@@ -272,6 +483,73 @@ class AppSettings(BaseSettings):
             case _:
                 raise TypeError(f"tz must be a string, got {type(v).__name__}")
 
+    @field_validator("db_maintenance_schedule", "orphan_gc_schedule", mode="before")
+    @classmethod
+    def parse_maintenance_schedule(
+        cls, v: Any, info: ValidationInfo
+    ) -> CronExpression | None:
+        """Parse a maintenance job schedule into a CronExpression.
+
+        Args:
+            v: Value to parse, can be string, CronExpression, or None.
+            info: Validation info identifying the field being parsed.
+
+        Returns:
+            CronExpression instance, or None if the job is disabled.
+
+        Raises:
+            ValueError: If the schedule cannot be parsed.
+            TypeError: If the value is not a string, CronExpression, or None.
+        """
+        match v:
+            case CronExpression() | None:
+                return v
+            case str() if v.strip().lower() in ("", "off"):
+                return None
+            case str():
+                return CronExpression(v.strip())
+            case _:
+                raise TypeError(
+                    f"{info.field_name} must be 'off' or a cron expression, got {type(v).__name__}"
+                )
+
+    @field_validator(
+        "download_stall_timeout",
+        "image_download_timeout",
+        "orphan_gc_grace_period",
+        "subprocess_timeout_ytdlp_metadata",
+        "subprocess_timeout_ytdlp_download",
+        "subprocess_timeout_ffprobe",
+        "subprocess_timeout_ffmpeg",
+        mode="before",
+    )
+    @classmethod
+    def parse_duration(cls, v: Any) -> Any:
+        """Parse a duration string such as '5m' into a timedelta.
+
+        Args:
+            v: Value to parse, can be string, number of seconds, or timedelta.
+
+        Returns:
+            timedelta for duration strings; other values are passed through.
+
+        Raises:
+            ValueError: If the duration string format is invalid.
+        """
+        match v:
+            case str() as s:
+                seconds = cast(
+                    int | float | None,
+                    pytimeparse2.parse(s),  # pyright: ignore[reportUnknownMemberType]
+                )
+                if seconds is None:
+                    raise ValueError(
+                        f"Invalid duration format: '{s}'. Examples: '300', '90s', '5m'"
+                    )
+                return timedelta(seconds=seconds)
+            case _:
+                return v
+
     @field_validator("cookies_path", mode="before")
     @classmethod
     def normalize_cookies_path(cls, v: Any) -> Any:
@@ -12,7 +12,7 @@ from typing import Any, cast
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import pycountry
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ByteSize, Field, field_validator, model_validator
 import pytimeparse2  # pyright: ignore[reportMissingTypeStubs]
 
 from ..db.types.transcript_source import TranscriptSource
@@ -28,6 +28,7 @@ class FeedConfig(BaseModel):
         schedule: Cron schedule expression for feed processing.
         keep_last: Number of latest downloads to keep (prune policy).
         since: Only download newer downloads since this ISO8601 timestamp (prune policy).
+        max_bytes: Total size of downloaded media to keep (prune policy).
         max_errors: Max attempts for downloading before marking as ERROR.
         metadata: Podcast metadata overrides for RSS feed generation.
                   Any values not specified here will be extracted from
@@ -60,6 +61,14 @@ class FeedConfig(BaseModel):
         None,
         description="Date in YYYYMMDD format; downloads older than this date are ignored",
     )
+    max_bytes: ByteSize | None = Field(
+        default=None,
+        gt=0,
+        description=(
+            "Prune policy - total size of downloaded media to keep (e.g., '50GiB'); "
+            "the oldest episodes are pruned first"
+        ),
+    )
     max_errors: int = Field(
         default=3,
         ge=1,
@@ -28,6 +28,7 @@ from ..exceptions import (
 from ..rss import RSSFeedGenerator
 from .downloader import Downloader
 from .enqueuer import Enqueuer
+from .phase_timings import PhaseTimings
 from .pruner import Pruner
 from .types import PhaseResult, ProcessingResults
 
@@ -50,6 +51,7 @@ class DataCoordinator:
         _download_db: Database manager for download record operations.
         _feed_db: Database manager for feed record operations.
         _cookies_path: Path to cookies.txt file for yt-dlp authentication.
+        _phase_timings: Wall and CPU time histograms for each phase.
     """
 
     def __init__(
@@ -61,6 +63,7 @@ class DataCoordinator:
         download_db: DownloadDatabase,
         feed_db: FeedDatabase,
         cookies_path: Path | None = None,
+        phase_timings: PhaseTimings | None = None,
     ):
         self._enqueuer = enqueuer
         self._downloader = downloader
@@ -69,8 +72,14 @@ class DataCoordinator:
         self._download_db = download_db
         self._feed_db = feed_db
         self._cookies_path = cookies_path
+        self._phase_timings = phase_timings or PhaseTimings()
         logger.debug("DataCoordinator initialized.")
 
+    @property
+    def phase_timings(self) -> PhaseTimings:
+        """Return the per-phase timing histograms."""
+        return self._phase_timings
+
     async def _calculate_fetch_since_date(self, feed_id: str) -> datetime:
         """Calculate the date to use for fetching new downloads.
 
@@ -291,8 +300,18 @@ class DataCoordinator:
                 archived_count,
                 files_deleted_count,
             ) = await self._pruner.prune_feed_downloads(
-                feed_id, feed_config.keep_last, feed_config.since
+                feed_id,
+                feed_config.keep_last,
+                feed_config.since,
+                feed_config.max_bytes,
             )
+            # New media from this run may have pushed all feeds over the budget
+            (
+                budget_archived_count,
+                budget_files_deleted_count,
+            ) = await self._pruner.enforce_storage_budget()
+            archived_count += budget_archived_count
+            files_deleted_count += budget_files_deleted_count
         except PruneError as e:
             duration = time.time() - phase_start
             logger.error(
@@ -389,9 +408,10 @@ class DataCoordinator:
             start_time=start_time,
         )
 
-        results.rss_generation_result = await self._execute_rss_generation_phase(
-            feed_id
-        )
+        with self._phase_timings.measure("rss_generation"):
+            results.rss_generation_result = await self._execute_rss_generation_phase(
+                feed_id
+            )
         results.overall_success = results.rss_generation_result.success
 
         results.total_duration_seconds = (
@@ -528,25 +548,31 @@ class DataCoordinator:
             log_params["from_date"] = fetch_since_date.strftime("%Y%m%d")
 
             # Phase 1: Enqueue new downloads
-            results.enqueue_result = await self._execute_enqueue_phase(
-                feed_id, feed_config, fetch_since_date
-            )
+            with self._phase_timings.measure("enqueue"):
+                results.enqueue_result = await self._execute_enqueue_phase(
+                    feed_id, feed_config, fetch_since_date
+                )
 
             # Track if feed sync was updated successfully
             results.feed_sync_updated = results.enqueue_result.success
 
             # Phase 2: Download queued media (always attempt, even if enqueue failed)
-            results.download_result = await self._execute_download_phase(
-                feed_id, feed_config
-            )
+            with self._phase_timings.measure("download"):
+                results.download_result = await self._execute_download_phase(
+                    feed_id, feed_config
+                )
 
             # Phase 3: Prune old downloads (always attempt)
-            results.prune_result = await self._execute_prune_phase(feed_id, feed_config)
+            with self._phase_timings.measure("prune"):
+                results.prune_result = await self._execute_prune_phase(
+                    feed_id, feed_config
+                )
 
             # Phase 4: Generate RSS feed (always attempt)
-            results.rss_generation_result = await self._execute_rss_generation_phase(
-                feed_id
-            )
+            with self._phase_timings.measure("rss_generation"):
+                results.rss_generation_result = (
+                    await self._execute_rss_generation_phase(feed_id)
+                )
 
             # Determine overall success
             # Consider successful if at least RSS generation succeeded
@@ -6,17 +6,25 @@ to fetch media, the FileManager to handle file storage, and the DownloadDatabase
 to update download statuses and metadata.
 """
 
+from contextlib import AbstractContextManager, nullcontext
 from datetime import UTC, datetime
 import logging
 import mimetypes
 from pathlib import Path
+import time
 from typing import Any
 
 import aiofiles.os
 
 from ..config import FeedConfig
 from ..db.download_db import DownloadDatabase
-from ..db.types import Download, DownloadStatus, TranscriptSource
+from ..db.types import (
+    Download,
+    DownloadCompletion,
+    DownloadStatus,
+    TranscriptSource,
+)
+from ..disk_space import DiskSpaceGuard
 from ..exceptions import (
     DatabaseOperationError,
     DownloadError,
@@ -25,8 +33,15 @@ from ..exceptions import (
     FileOperationError,
     YtdlpApiError,
 )
-from ..ffprobe import FFProbe
+from ..ffprobe import FFProbe, MediaProbe
 from ..file_manager import FileManager
+from ..media_dedup import MediaDeduplicator, media_content_key
+from ..metrics.instruments import (
+    DOWNLOAD_BYTES,
+    DOWNLOAD_THROUGHPUT,
+    DOWNLOADS_DEFERRED,
+)
+from ..partial_recovery import PartialDownloadRecovery
 from ..ytdlp_wrapper import TranscriptInfo, YtdlpWrapper
 from .types import ArtifactDownloadResult, DownloadArtifact
 
@@ -45,6 +60,12 @@ class Downloader:
         download_db: Database manager for download record operations.
         file_manager: File manager for file system operations.
         ytdlp_wrapper: Wrapper for yt-dlp media download operations.
+        _media_deduplicator: Reuses media other feeds already downloaded, or
+            None when sharing media across feeds is disabled.
+        _disk_space_guard: Defers downloads while disk space is low, or None
+            to start every download.
+        _partial_recovery: Records media downloads in progress so their
+            partial files can be resumed after a restart, or None.
     """
 
     def __init__(
@@ -53,34 +74,60 @@ class Downloader:
         file_manager: FileManager,
         ytdlp_wrapper: YtdlpWrapper,
         ffprobe: FFProbe,
+        media_deduplicator: MediaDeduplicator | None = None,
+        disk_space_guard: DiskSpaceGuard | None = None,
+        partial_recovery: PartialDownloadRecovery | None = None,
     ):
         self.download_db = download_db
         self.file_manager = file_manager
         self.ytdlp_wrapper = ytdlp_wrapper
         self._ffprobe = ffprobe
+        self._media_deduplicator = media_deduplicator
+        self._disk_space_guard = disk_space_guard
+        self._partial_recovery = partial_recovery
         logger.debug("Downloader initialized.")
 
+    def _reserve_disk_space(self, download: Download) -> AbstractContextManager[bool]:
+        """Return a context admitting the download if disk space allows it.
+
+        Args:
+            download: The queued download about to start.
+
+        Returns:
+            Context manager yielding whether the download may start.
+        """
+        if self._disk_space_guard is None:
+            return nullcontext(True)
+        return self._disk_space_guard.reserve(download)
+
     async def _probe_download_duration(
-        self, download: Download, downloaded_file_path: Path
+        self,
+        download: Download,
+        downloaded_file_path: Path,
+        probe: MediaProbe | None = None,
     ) -> int | None:
-        """Return actual duration for the downloaded media when possible."""
+        """Return actual duration for the downloaded media when possible.
+
+        Reuses the probe taken while verifying the download when available;
+        otherwise the file is probed (served from the probe cache if unchanged).
+        """
         log_params = {
             "feed_id": download.feed_id,
             "download_id": download.id,
             "downloaded_file_path": str(downloaded_file_path),
         }
-        try:
-            duration = await self._ffprobe.get_duration_seconds_from_file(
-                downloaded_file_path
-            )
-        except (FFProbeError, FileNotFoundError) as e:
-            logger.warning(
-                "Unable to probe duration via ffprobe; keeping metadata value.",
-                extra=log_params,
-                exc_info=e,
-            )
-            return None
+        if probe is None:
+            try:
+                probe = await self._ffprobe.probe(downloaded_file_path)
+            except (FFProbeError, FileNotFoundError) as e:
+                logger.warning(
+                    "Unable to probe duration via ffprobe; keeping metadata value.",
+                    extra=log_params,
+                    exc_info=e,
+                )
+                return None
 
+        duration = probe.duration_seconds
         if duration <= 0:
             logger.warning(
                 "ffprobe reported non-positive duration; keeping metadata value.",
@@ -96,18 +143,23 @@ class Downloader:
         downloaded_file_path: Path,
         logs: str,
         transcript: TranscriptInfo | None = None,
+        probe: MediaProbe | None = None,
+        content_key: str | None = None,
     ) -> None:
         """Process a successfully downloaded file.
 
-        Updates the download record to DOWNLOADED status with all metadata
-        (extension, filesize, duration, thumbnail, transcript, logs) in a single
-        database upsert.
+        Gathers all artifact metadata (extension, filesize, duration, thumbnail,
+        transcript, logs) into a :class:`DownloadCompletion` and finalizes the
+        record to DOWNLOADED in a single database UPDATE. On success, the
+        in-memory ``download`` is updated to match the stored row.
 
         Args:
             download: The Download object to update.
             downloaded_file_path: Path to the successfully downloaded file.
             logs: yt-dlp execution logs.
             transcript: Transcript metadata if downloaded, None otherwise.
+            probe: ffprobe result from download verification, if available.
+            content_key: Media fingerprint used to share the file across feeds.
 
         Raises:
             DownloadError: If file operations or database update fails.
@@ -129,7 +181,7 @@ class Downloader:
             ) from e
 
         duration_seconds = await self._probe_download_duration(
-            download, downloaded_file_path
+            download, downloaded_file_path, probe
         )
 
         try:
@@ -143,26 +195,38 @@ class Downloader:
                 download_id=download.id,
             ) from e
 
-        download.status = DownloadStatus.DOWNLOADED
-        download.ext = downloaded_file_path.suffix.lstrip(".")
-        download.mime_type = (
-            mimetypes.guess_type(downloaded_file_path.name)[0]
-            or "application/octet-stream"
+        completion = DownloadCompletion(
+            ext=downloaded_file_path.suffix.lstrip("."),
+            mime_type=mimetypes.guess_type(downloaded_file_path.name)[0]
+            or "application/octet-stream",
+            filesize=file_stat.st_size,
+            duration=duration_seconds,
+            download_logs=logs,
+            thumbnail_ext="jpg" if has_thumb else None,
+            transcript_ext=transcript.ext if transcript else None,
+            transcript_lang=transcript.lang if transcript else None,
+            transcript_source=transcript.source if transcript else None,
+            content_key=content_key,
         )
-        download.filesize = file_stat.st_size
-        if duration_seconds is not None:
-            download.duration = duration_seconds
-        download.retries = 0
-        download.last_error = None
-        download.download_logs = logs
-        download.thumbnail_ext = "jpg" if has_thumb else None
-        if transcript:
-            download.transcript_ext = transcript.ext
-            download.transcript_lang = transcript.lang
-            download.transcript_source = transcript.source
+        await self._finalize_download(download, completion)
+        logger.info("Successfully downloaded media.", extra=log_params)
+
+    async def _finalize_download(
+        self, download: Download, completion: DownloadCompletion
+    ) -> None:
+        """Mark a download DOWNLOADED and mirror the stored row in memory.
+
+        Args:
+            download: The Download object to update.
+            completion: Artifact metadata of the finished download.
 
+        Raises:
+            DownloadError: If the database update fails.
+        """
         try:
-            await self.download_db.update_download(download)
+            await self.download_db.finalize_download(
+                download.feed_id, download.id, completion
+            )
         except (DownloadNotFoundError, DatabaseOperationError) as e:
             raise DownloadError(
                 message="Failed to update database record to DOWNLOADED.",
@@ -170,7 +234,22 @@ class Downloader:
                 download_id=download.id,
             ) from e
 
-        logger.info("Successfully downloaded media.", extra=log_params)
+        download.status = DownloadStatus.DOWNLOADED
+        download.ext = completion.ext
+        download.mime_type = completion.mime_type
+        download.filesize = completion.filesize
+        if completion.duration is not None:
+            download.duration = completion.duration
+        download.retries = 0
+        download.last_error = None
+        download.download_logs = completion.download_logs
+        download.thumbnail_ext = completion.thumbnail_ext
+        if completion.transcript_ext is not None:
+            download.transcript_ext = completion.transcript_ext
+            download.transcript_lang = completion.transcript_lang
+            download.transcript_source = completion.transcript_source
+        if completion.content_key is not None:
+            download.content_key = completion.content_key
 
     async def _handle_download_failure(
         self, download: Download, feed_config: FeedConfig, error: Exception
@@ -369,6 +448,154 @@ class Downloader:
         )
         return True
 
+    async def _reuse_shared_media(
+        self,
+        download: Download,
+        feed_config: FeedConfig,
+        content_key: str,
+        cookies_path: Path | None,
+        log_params: dict[str, Any],
+    ) -> ArtifactDownloadResult | None:
+        """Complete a download from media another feed already stored.
+
+        Artifacts the other feed does not have (a thumbnail, or a transcript
+        in this feed's language) are fetched individually.
+
+        Args:
+            download: The queued download to complete.
+            feed_config: The configuration for the feed.
+            content_key: The download's media fingerprint.
+            cookies_path: Path to cookies.txt file for yt-dlp authentication.
+            log_params: Logging context dictionary.
+
+        Returns:
+            The artifact result, or None if no shared media could be reused.
+
+        Raises:
+            DownloadError: If finalizing the download in the database fails.
+        """
+        assert self._media_deduplicator is not None
+        completion = await self._media_deduplicator.reuse_existing(
+            download, content_key, feed_config.transcript_lang
+        )
+        if completion is None:
+            return None
+        await self._finalize_download(download, completion)
+
+        result = ArtifactDownloadResult(media_downloaded=True)
+        result.thumbnail_downloaded = download.thumbnail_ext is not None
+        if not result.thumbnail_downloaded and download.remote_thumbnail_url:
+            try:
+                result.thumbnail_downloaded = await self._download_thumbnail_artifact(
+                    download, feed_config.yt_args, cookies_path, log_params
+                )
+            except DownloadError as e:
+                result.errors.append(e)
+
+        if feed_config.transcript_lang is not None and download.transcript_source in [
+            TranscriptSource.CREATOR,
+            TranscriptSource.AUTO,
+        ]:
+            result.transcript_downloaded = completion.transcript_ext is not None
+            if not result.transcript_downloaded:
+                try:
+                    result.transcript_downloaded = (
+                        await self._download_transcript_artifact(
+                            download,
+                            feed_config.transcript_lang,
+                            download.transcript_source,
+                            cookies_path,
+                            log_params,
+                        )
+                    )
+                except DownloadError as e:
+                    result.errors.append(e)
+        return result
+
+    async def _download_media_artifact(
+        self,
+        download: Download,
+        feed_config: FeedConfig,
+        content_key: str,
+        cookies_path: Path | None,
+        log_params: dict[str, Any],
+    ) -> ArtifactDownloadResult:
+        """Download media with yt-dlp and mark the download DOWNLOADED.
+
+        Args:
+            download: The queued download to fetch.
+            feed_config: The configuration for the feed.
+            content_key: The download's media fingerprint.
+            cookies_path: Path to cookies.txt file for yt-dlp authentication.
+            log_params: Logging context dictionary.
+
+        Returns:
+            The artifact result; media_downloaded is False if yt-dlp failed.
+
+        Raises:
+            DownloadError: If processing the downloaded file fails.
+        """
+        if self._partial_recovery is not None:
+            await self._partial_recovery.mark_started(download, content_key)
+        started = time.perf_counter()
+        try:
+            downloaded_media = await self.ytdlp_wrapper.download_media_to_file(
+                download,
+                feed_config.yt_args,
+                cookies_path=cookies_path,
+                transcript_lang=feed_config.transcript_lang,
+            )
+        except YtdlpApiError as e:
+            await self._persist_download_logs(download, e.logs or "")
+            logger.warning(
+                "Media artifact download failed.",
+                extra=log_params,
+                exc_info=e,
+            )
+            return ArtifactDownloadResult(
+                media_downloaded=False,
+                thumbnail_downloaded=False,
+                transcript_downloaded=False,
+                errors=[
+                    DownloadError(
+                        message="Failed to download media to file.",
+                        feed_id=download.feed_id,
+                        download_id=download.id,
+                    )
+                ],
+            )
+        elapsed = time.perf_counter() - started
+
+        await self._handle_download_success(
+            download,
+            downloaded_media.file_path,
+            downloaded_media.logs,
+            downloaded_media.transcript,
+            downloaded_media.probe,
+            content_key,
+        )
+        if self._partial_recovery is not None:
+            await self._partial_recovery.mark_finished(download)
+        DOWNLOAD_BYTES.inc(download.filesize, feed_id=download.feed_id)
+        if elapsed > 0:
+            DOWNLOAD_THROUGHPUT.observe(download.filesize / elapsed)
+        logger.debug("Media artifact downloaded successfully.", extra=log_params)
+
+        thumbnail_downloaded = download.thumbnail_ext is not None
+        if feed_config.transcript_lang is None or download.transcript_source not in [
+            TranscriptSource.CREATOR,
+            TranscriptSource.AUTO,
+        ]:
+            transcript_downloaded = None
+        else:
+            transcript_downloaded = downloaded_media.transcript is not None
+
+        return ArtifactDownloadResult(
+            media_downloaded=True,
+            thumbnail_downloaded=thumbnail_downloaded,
+            transcript_downloaded=transcript_downloaded,
+        )
+
     async def refresh_artifacts(
         self,
         download: Download,
@@ -510,55 +737,18 @@ class Downloader:
 
         # Handle MEDIA download (includes thumbnail + transcript if configured)
         if DownloadArtifact.MEDIA in artifacts:
-            try:
-                downloaded_media = await self.ytdlp_wrapper.download_media_to_file(
-                    download,
-                    feed_config.yt_args,
-                    cookies_path=cookies_path,
-                    transcript_lang=feed_config.transcript_lang,
-                )
-            except YtdlpApiError as e:
-                await self._persist_download_logs(download, e.logs or "")
-                logger.warning(
-                    "Media artifact download failed.",
-                    extra=log_params,
-                    exc_info=e,
-                )
-                return ArtifactDownloadResult(
-                    media_downloaded=False,
-                    thumbnail_downloaded=False,
-                    transcript_downloaded=False,
-                    errors=[
-                        DownloadError(
-                            message="Failed to download media to file.",
-                            feed_id=download.feed_id,
-                            download_id=download.id,
-                        )
-                    ],
+            content_key = media_content_key(download, feed_config.yt_args)
+            if self._media_deduplicator is None:
+                return await self._download_media_artifact(
+                    download, feed_config, content_key, cookies_path, log_params
                 )
-
-            await self._handle_download_success(
-                download,
-                downloaded_media.file_path,
-                downloaded_media.logs,
-                downloaded_media.transcript,
+            shared = await self._reuse_shared_media(
+                download, feed_config, content_key, cookies_path, log_params
             )
-            logger.debug("Media artifact downloaded successfully.", extra=log_params)
-
-            thumbnail_downloaded = download.thumbnail_ext is not None
-            if (
-                feed_config.transcript_lang is None
-                or download.transcript_source
-                not in [TranscriptSource.CREATOR, TranscriptSource.AUTO]
-            ):
-                transcript_downloaded = None
-            else:
-                transcript_downloaded = downloaded_media.transcript is not None
-
-            return ArtifactDownloadResult(
-                media_downloaded=True,
-                thumbnail_downloaded=thumbnail_downloaded,
-                transcript_downloaded=transcript_downloaded,
+            if shared is not None:
+                return shared
+            return await self._download_media_artifact(
+                download, feed_config, content_key, cookies_path, log_params
             )
 
         result = ArtifactDownloadResult()
@@ -695,15 +885,26 @@ class Downloader:
             extra={**log_params, "num_queued": len(ready_downloads)},
         )
 
-        for download in ready_downloads:
-            try:
-                result = await self.download_artifacts(
-                    download, feed_config, DownloadArtifact.ALL, cookies_path
-                )
-            except DownloadError as e:
-                await self._handle_download_failure(download, feed_config, e)
-                failure_count += 1
-                continue
+        for index, download in enumerate(ready_downloads):
+            with self._reserve_disk_space(download) as admitted:
+                if not admitted:
+                    # Stay QUEUED without a retry; the next run tries again
+                    deferred_count = len(ready_downloads) - index
+                    DOWNLOADS_DEFERRED.inc(deferred_count, reason="disk_space")
+                    logger.warning(
+                        "Deferred downloads until disk space is available.",
+                        extra={**log_params, "deferred_count": deferred_count},
+                    )
+                    break
+
+                try:
+                    result = await self.download_artifacts(
+                        download, feed_config, DownloadArtifact.ALL, cookies_path
+                    )
+                except DownloadError as e:
+                    await self._handle_download_failure(download, feed_config, e)
+                    failure_count += 1
+                    continue
 
             if result.all_succeeded:
                 success_count += 1
@@ -0,0 +1,103 @@
+"""Wall-clock and CPU time histograms for DataCoordinator phases."""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
+import time
+
+from ..metrics import Histogram, HistogramSnapshot
+from ..metrics.instruments import (
+    COORDINATOR_PHASE_CPU_SECONDS,
+    COORDINATOR_PHASE_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseTimingSnapshot:
+    """Timing histograms recorded for one phase.
+
+    Attributes:
+        wall_seconds: Elapsed wall-clock time per run.
+        cpu_seconds: Event-loop thread CPU time per run.
+    """
+
+    wall_seconds: HistogramSnapshot
+    cpu_seconds: HistogramSnapshot
+
+
+class PhaseTimings:
+    """Record how long each coordinator phase takes and how much of it is CPU.
+
+    CPU time is measured on the event-loop thread, so it includes any other
+    coroutine that ran while the phase was awaiting. A phase whose CPU time
+    approaches its wall time is keeping the loop busy rather than waiting on
+    I/O or subprocesses. Every run is also exported through the process-wide
+    coordinator phase metrics.
+
+    Attributes:
+        _wall: Wall-clock histograms keyed by phase name.
+        _cpu: CPU time histograms keyed by phase name.
+    """
+
+    def __init__(self) -> None:
+        self._wall: dict[str, Histogram] = {}
+        self._cpu: dict[str, Histogram] = {}
+
+    @contextmanager
+    def measure(self, phase: str) -> Generator[None]:
+        """Time the enclosed block and record it under ``phase``.
+
+        Args:
+            phase: Name of the phase being timed.
+
+        Yields:
+            None; timing is recorded when the block exits.
+        """
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self.record(
+                phase,
+                wall_seconds=time.perf_counter() - wall_start,
+                cpu_seconds=time.thread_time() - cpu_start,
+            )
+
+    def record(self, phase: str, wall_seconds: float, cpu_seconds: float) -> None:
+        """Add one run of a phase to its histograms.
+
+        Args:
+            phase: Name of the phase.
+            wall_seconds: Elapsed wall-clock time.
+            cpu_seconds: CPU time consumed on the event-loop thread.
+        """
+        self._wall.setdefault(phase, Histogram()).observe(wall_seconds)
+        self._cpu.setdefault(phase, Histogram()).observe(cpu_seconds)
+        COORDINATOR_PHASE_SECONDS.observe(wall_seconds, phase=phase)
+        COORDINATOR_PHASE_CPU_SECONDS.observe(cpu_seconds, phase=phase)
+        logger.debug(
+            "Phase timing recorded.",
+            extra={
+                "phase": phase,
+                "wall_seconds": round(wall_seconds, 3),
+                "cpu_seconds": round(cpu_seconds, 3),
+            },
+        )
+
+    def snapshot(self) -> dict[str, PhaseTimingSnapshot]:
+        """Return the histograms for every phase seen so far.
+
+        Returns:
+            Mapping of phase name to its timing snapshot.
+        """
+        return {
+            phase: PhaseTimingSnapshot(
+                wall_seconds=wall.snapshot(),
+                cpu_seconds=self._cpu[phase].snapshot(),
+            )
+            for phase, wall in self._wall.items()
+        }
@@ -5,34 +5,56 @@ and removing old downloads according to configured retention rules, including
 file deletion and database record archiving.
 """
 
+import asyncio
+from collections import defaultdict
+from collections.abc import Collection
 from datetime import datetime
 import logging
 from typing import Any
 
 from ..db import DownloadDatabase, FeedDatabase
-from ..db.types import Download, DownloadStatus
+from ..db.types import Download, DownloadStatus, PruneCandidate
 from ..exceptions import (
     DatabaseOperationError,
-    DownloadNotFoundError,
     FileOperationError,
     PruneError,
 )
 from ..file_manager import FileManager
+from ..metrics.instruments import FEED_STORAGE_BYTES, PRUNE_FAILURES
 
 logger = logging.getLogger(__name__)
 
+# Downloads whose files are deleted at the same time during a prune
+_FILE_DELETE_CONCURRENCY = 16
+
+
+def _prune_candidate(download: Download) -> PruneCandidate:
+    """Return the columns of a loaded download that pruning needs."""
+    return PruneCandidate(
+        feed_id=download.feed_id,
+        id=download.id,
+        status=download.status,
+        ext=download.ext,
+        thumbnail_ext=download.thumbnail_ext,
+        transcript_lang=download.transcript_lang,
+        transcript_ext=download.transcript_ext,
+    )
+
 
 class Pruner:
     """Manage the pruning of old downloads based on retention policies.
 
     The Pruner identifies downloads that should be removed according to
-    configured retention rules (keep_last count and prune_before_date),
-    deletes associated files, and archives database records.
+    configured retention rules (keep_last count, prune_before_date, a
+    per-feed size limit and a storage budget shared by all feeds), deletes
+    associated files, and archives database records.
 
     Attributes:
         _download_db: Database manager for download record operations.
         _feed_db: Database manager for feed record operations.
         _file_manager: File manager for file system operations.
+        _storage_budget: Total media size all feeds may keep, or None for
+            no limit.
     """
 
     def __init__(
@@ -40,10 +62,12 @@ class Pruner:
         feed_db: FeedDatabase,
         download_db: DownloadDatabase,
         file_manager: FileManager,
+        storage_budget: int | None = None,
     ):
         self._feed_db = feed_db
         self._download_db = download_db
         self._file_manager = file_manager
+        self._storage_budget = storage_budget
         logger.debug("Pruner initialized.")
 
     async def _identify_prune_candidates(
@@ -51,18 +75,21 @@ class Pruner:
         feed_id: str,
         keep_last: int | None,
         prune_before_date: datetime | None,
-    ) -> set[Download]:
+        max_bytes: int | None = None,
+    ) -> set[PruneCandidate]:
         """Identify downloads that are candidates for pruning.
 
-        Combines candidates from both keep_last and prune_before_date rules.
+        Combines candidates from the keep_last, prune_before_date and
+        max_bytes rules.
 
         Args:
             feed_id: The feed identifier.
             keep_last: Number of most recent downloads to keep (None to ignore).
             prune_before_date: Downloads published before this date are candidates (None to ignore).
+            max_bytes: Total media size to keep for the feed (None to ignore).
 
         Returns:
-            Set of Download objects that are candidates for pruning.
+            Set of prune candidates.
 
         Raises:
             PruneError: If database operations fail during candidate identification.
@@ -73,44 +100,44 @@ class Pruner:
             "prune_before_date": (
                 prune_before_date.isoformat() if prune_before_date else None
             ),
+            "max_bytes": max_bytes,
         }
-        candidate_downloads: set[Download] = set()
+        candidate_downloads: set[PruneCandidate] = set()
 
-        # Identify candidates by keep_last rule
-        if keep_last is not None and keep_last > 0:
+        # Identify candidates by keep_last and prune_before_date rules in one query
+        if (keep_last is not None and keep_last > 0) or prune_before_date is not None:
             logger.debug(
-                "Identifying prune candidates by keep_last rule.", extra=log_params
+                "Identifying prune candidates by keep_last and date rules.",
+                extra=log_params,
             )
             try:
-                downloads_for_keep_last = (
-                    await self._download_db.get_downloads_to_prune_by_keep_last(
-                        feed_id, keep_last
-                    )
+                retention_candidates = await self._download_db.get_prune_candidates(
+                    feed_id, keep_last, prune_before_date
                 )
             except DatabaseOperationError as e:
                 raise PruneError(
-                    message="Failed to identify downloads for keep_last pruning rule.",
+                    message="Failed to identify downloads for keep_last and date pruning rules.",
                     feed_id=feed_id,
                 ) from e
             else:
-                candidate_downloads.update(downloads_for_keep_last)
+                candidate_downloads.update(retention_candidates)
 
-        # Identify candidates by prune_before_date rule
-        if prune_before_date is not None:
-            logger.debug("Identifying prune candidates by date rule.", extra=log_params)
+        # Identify candidates by max_bytes rule
+        if max_bytes is not None:
+            logger.debug("Identifying prune candidates by size rule.", extra=log_params)
             try:
-                downloads_for_since = (
-                    await self._download_db.get_downloads_to_prune_by_since(
-                        feed_id, prune_before_date
+                downloads_over_size = (
+                    await self._download_db.get_downloads_to_prune_by_size(
+                        feed_id, max_bytes
                     )
                 )
             except DatabaseOperationError as e:
                 raise PruneError(
-                    message="Failed to identify downloads for date pruning rule.",
+                    message="Failed to identify downloads for size pruning rule.",
                     feed_id=feed_id,
                 ) from e
             else:
-                candidate_downloads.update(downloads_for_since)
+                candidate_downloads.update(downloads_over_size)
 
         logger.debug(
             "Identified candidates for pruning.",
@@ -118,11 +145,13 @@ class Pruner:
         )
         return candidate_downloads
 
-    async def _handle_file_deletion(self, download: Download, feed_id: str) -> None:
+    async def _handle_file_deletion(
+        self, download: Download | PruneCandidate, feed_id: str
+    ) -> None:
         """Handle file deletion for a DOWNLOADED item being pruned.
 
         Args:
-            download: The Download object with DOWNLOADED status.
+            download: The download with DOWNLOADED status.
             feed_id: The feed identifier.
 
         Raises:
@@ -141,7 +170,7 @@ class Pruner:
         )
 
         try:
-            await self._file_manager.delete_download_file(
+            space_freed = await self._file_manager.delete_download_file(
                 feed_id, download.id, download.ext
             )
         except FileOperationError as e:
@@ -150,13 +179,21 @@ class Pruner:
                 feed_id=feed_id,
                 download_id=download.id,
             ) from e
-        logger.debug("File deleted successfully during pruning.", extra=log_params)
+        if space_freed:
+            logger.debug("File deleted successfully during pruning.", extra=log_params)
+        else:
+            logger.debug(
+                "File unlinked during pruning; other feeds still share it.",
+                extra=log_params,
+            )
 
-    async def _handle_image_deletion(self, download: Download, feed_id: str) -> None:
+    async def _handle_image_deletion(
+        self, download: Download | PruneCandidate, feed_id: str
+    ) -> None:
         """Handle image deletion for a DOWNLOADED item being pruned.
 
         Args:
-            download: The Download object with DOWNLOADED status.
+            download: The download with DOWNLOADED status.
             feed_id: The feed identifier.
 
         Raises:
@@ -193,12 +230,12 @@ class Pruner:
             logger.debug("Image deleted successfully during pruning.", extra=log_params)
 
     async def _handle_transcript_deletion(
-        self, download: Download, feed_id: str
+        self, download: Download | PruneCandidate, feed_id: str
     ) -> None:
         """Handle transcript deletion for a DOWNLOADED item being pruned.
 
         Args:
-            download: The Download object with DOWNLOADED status.
+            download: The download with DOWNLOADED status.
             feed_id: The feed identifier.
 
         Raises:
@@ -236,119 +273,166 @@ class Pruner:
                 "Transcript deleted successfully during pruning.", extra=log_params
             )
 
-    async def _archive_download(self, download: Download, feed_id: str) -> None:
-        """Archive a download in the database.
+    async def _delete_download_artifacts(
+        self, download: Download | PruneCandidate, feed_id: str
+    ) -> bool:
+        """Delete the media file, thumbnail and transcript of a DOWNLOADED item.
+
+        A missing media file is tolerated; failing to delete the thumbnail or
+        transcript is logged and does not stop the download being archived.
 
         Args:
-            download: The Download object to archive.
+            download: The download with DOWNLOADED status.
             feed_id: The feed identifier.
 
+        Returns:
+            True if the media file was deleted, False if it was already gone.
+
         Raises:
-            PruneError: If the database archival operation fails.
+            PruneError: If the media file exists but cannot be deleted.
         """
         log_params: dict[str, Any] = {
             "feed_id": feed_id,
             "download_id": download.id,
         }
-        logger.debug("Attempting to archive download.", extra=log_params)
+        file_deleted = False
+        try:
+            await self._handle_file_deletion(download, feed_id)
+        except FileNotFoundError:
+            logger.warning(
+                "File not found during pruning, but DB record will still be archived.",
+                extra=log_params,
+            )
+        else:
+            file_deleted = True
 
         try:
-            await self._download_db.archive_download(feed_id, download.id)
-        except (DownloadNotFoundError, DatabaseOperationError) as e:
-            raise PruneError(
-                message="Failed to archive download.",
-                feed_id=feed_id,
-                download_id=download.id,
-            ) from e
-        logger.debug("Download archived successfully.", extra=log_params)
+            await self._handle_image_deletion(download, feed_id)
+        except PruneError:
+            logger.warning(
+                "Image deletion failed during pruning, continuing with DB archival.",
+                extra=log_params,
+            )
 
-    async def _process_single_download_for_pruning(
-        self, download: Download, feed_id: str
-    ) -> bool:
-        """Process a single download for pruning.
+        try:
+            await self._handle_transcript_deletion(download, feed_id)
+        except PruneError:
+            logger.warning(
+                "Transcript deletion failed during pruning, continuing with DB archival.",
+                extra=log_params,
+            )
 
-        Handles file deletion (if DOWNLOADED) and database archival.
+        return file_deleted
+
+    async def _prune_downloads(
+        self, feed_id: str, downloads: Collection[PruneCandidate]
+    ) -> tuple[int, int]:
+        """Delete the files of a feed's downloads concurrently, then archive them.
+
+        File deletions run concurrently, bounded by ``_FILE_DELETE_CONCURRENCY``;
+        the blocking filesystem calls execute on the default thread pool. A
+        download whose media file cannot be deleted is logged, counted in
+        ``anypod_prune_failures_total`` and left unarchived, so the next prune
+        selects it again. All other downloads are archived with one bulk
+        update in a single transaction.
 
         Args:
-            download: The Download object to process.
-            feed_id: The feed identifier.
+            feed_id: The feed the downloads belong to.
+            downloads: Downloads to prune.
 
         Returns:
-            True if a file was successfully deleted, False otherwise.
+            A tuple (archived_count, files_deleted_count).
 
         Raises:
-            PruneError: If any step in the pruning process fails.
+            PruneError: If the bulk archive update fails.
         """
-        log_params: dict[str, Any] = {
-            "feed_id": feed_id,
-            "download_id": download.id,
-            "download_status": download.status,
-        }
-        logger.debug("Processing single download for pruning.", extra=log_params)
-
-        file_deleted = False
+        log_params: dict[str, Any] = {"feed_id": feed_id}
+        semaphore = asyncio.Semaphore(_FILE_DELETE_CONCURRENCY)
 
-        # Delete file+thumbnail+transcript if the download is DOWNLOADED
-        if download.status == DownloadStatus.DOWNLOADED:
-            try:
-                await self._handle_file_deletion(download, feed_id)
-            except FileNotFoundError:
-                logger.warning(
-                    "File not found during pruning, but DB record will still be archived.",
-                    extra={**log_params, "download_id": download.id},
-                )
-            else:
-                file_deleted = True
+        async def _delete(download: PruneCandidate) -> bool:
+            if download.status != DownloadStatus.DOWNLOADED:
+                return False
+            async with semaphore:
+                return await self._delete_download_artifacts(download, feed_id)
 
-            try:
-                await self._handle_image_deletion(download, feed_id)
-            except PruneError:
-                logger.warning(
-                    "Image deletion failed during pruning, continuing with DB archival.",
-                    extra=log_params,
-                )
+        downloads = list(downloads)
+        outcomes = await asyncio.gather(
+            *(_delete(download) for download in downloads), return_exceptions=True
+        )
 
-            try:
-                await self._handle_transcript_deletion(download, feed_id)
-            except PruneError:
-                logger.warning(
-                    "Transcript deletion failed during pruning, continuing with DB archival.",
-                    extra=log_params,
+        to_archive: list[str] = []
+        files_deleted_count = 0
+        for download, outcome in zip(downloads, outcomes, strict=True):
+            if isinstance(outcome, PruneError):
+                logger.error(
+                    "Failed to delete files for download; it will be pruned again on the next run.",
+                    exc_info=outcome,
+                    extra={**log_params, "download_id": download.id},
                 )
+                PRUNE_FAILURES.inc(feed_id=feed_id)
+                continue
+            if isinstance(outcome, BaseException):
+                raise outcome
+            to_archive.append(download.id)
+            if outcome:
+                files_deleted_count += 1
 
-        # Always archive the download
-        await self._archive_download(download, feed_id)
+        try:
+            archived_count = await self._download_db.archive_downloads(
+                feed_id, to_archive
+            )
+        except DatabaseOperationError as e:
+            raise PruneError(
+                message="Failed to archive pruned downloads.",
+                feed_id=feed_id,
+            ) from e
 
-        return file_deleted
+        logger.debug(
+            "Pruned batch of downloads.",
+            extra={
+                **log_params,
+                "candidate_count": len(downloads),
+                "archived_count": archived_count,
+                "files_deleted_count": files_deleted_count,
+                "failed_count": len(downloads) - len(to_archive),
+            },
+        )
+        return archived_count, files_deleted_count
 
     async def prune_feed_downloads(
         self,
         feed_id: str,
         keep_last: int | None,
         prune_before_date: datetime | None,
+        max_bytes: int | None = None,
     ) -> tuple[int, int]:
         """Prune old downloads for a feed based on retention rules.
 
-        This method identifies download candidates for pruning based on two criteria:
+        This method identifies download candidates for pruning based on three criteria:
         1. keep_last: Retains only the specified number of the most recent downloads.
            Older downloads become candidates for pruning.
         2. prune_before_date: Downloads published before this timestamp become candidates.
+        3. max_bytes: Retains the most recent downloaded media that fits in this
+           many bytes. Older downloaded media becomes candidates for pruning.
 
-        The union of downloads identified by both criteria is processed. For each candidate:
-        - If its status is DOWNLOADED, its associated media file is deleted from the filesystem.
-        - The download's database record status is then updated to ARCHIVED.
+        The union of downloads identified by all criteria is processed as one batch:
+        - Files of DOWNLOADED candidates are deleted concurrently.
+        - The database records are then updated to ARCHIVED in a single transaction.
+        Candidates whose media file cannot be deleted stay as they are and are
+        picked up again by the next prune.
 
         Args:
             feed_id: The unique identifier of the feed to prune.
             keep_last: The number of most recent downloads to retain. If None, this rule is ignored.
             prune_before_date: Downloads published before this date are pruned. If None, this rule is ignored.
+            max_bytes: Total media size to keep for the feed. If None, this rule is ignored.
 
         Returns:
             A tuple (archived_count, files_deleted_count) indicating the number of
             downloads archived and the number of files successfully deleted.
 
         Raises:
-            PruneError: If candidate identification fails.
+            PruneError: If candidate identification or the bulk archive update fails.
         """
         log_params: dict[str, Any] = {
             "feed_id": feed_id,
@@ -360,7 +444,7 @@ class Pruner:
         logger.debug("Starting pruning process for feed.", extra=log_params)
 
         candidate_downloads = await self._identify_prune_candidates(
-            feed_id, keep_last, prune_before_date
+            feed_id, keep_last, prune_before_date, max_bytes
         )
 
         if not candidate_downloads:
@@ -372,43 +456,148 @@ class Pruner:
             extra={**log_params, "candidate_count": len(candidate_downloads)},
         )
 
+        archived_count, files_deleted_count = await self._prune_downloads(
+            feed_id, candidate_downloads
+        )
+
+        logger.info(
+            "Pruning process completed for feed.",
+            extra={
+                **log_params,
+                "archived_count": archived_count,
+                "files_deleted_count": files_deleted_count,
+            },
+        )
+        return archived_count, files_deleted_count
+
+    async def _prune_across_feeds(
+        self, candidates: list[PruneCandidate], log_params: dict[str, Any]
+    ) -> tuple[int, int]:
+        """Prune candidates from several feeds, one batch per feed.
+
+        A feed whose batch fails is logged and skipped so that the other
+        feeds are still pruned.
+
+        Args:
+            candidates: Prune candidates from any feed.
+            log_params: Context added to log records.
+
+        Returns:
+            A tuple (archived_count, files_deleted_count) summed over all feeds.
+        """
+        candidates_by_feed: dict[str, list[PruneCandidate]] = defaultdict(list)
+        for candidate in candidates:
+            candidates_by_feed[candidate.feed_id].append(candidate)
+
         archived_count = 0
         files_deleted_count = 0
-
-        for download in candidate_downloads:
+        for feed_id, feed_candidates in candidates_by_feed.items():
             try:
-                file_deleted = await self._process_single_download_for_pruning(
-                    download, feed_id
-                )
-                archived_count += 1
-                if file_deleted:
-                    files_deleted_count += 1
-
-                logger.info(
-                    "Download archived successfully.",
-                    extra={
-                        **log_params,
-                        "keep_last": keep_last,
-                        "prune_before_date": (
-                            prune_before_date.isoformat() if prune_before_date else None
-                        ),
-                        "download_id": download.id,
-                        "download_title": download.title,
-                        "file_deleted": file_deleted,
-                    },
+                feed_archived, feed_files_deleted = await self._prune_downloads(
+                    feed_id, feed_candidates
                 )
             except PruneError as e:
                 logger.error(
-                    "Failed to process download for pruning.",
+                    "Failed to prune feed.",
                     exc_info=e,
-                    extra={
-                        **log_params,
-                        "download_id": download.id,
-                    },
+                    extra={**log_params, "feed_id": feed_id},
                 )
+                continue
+            archived_count += feed_archived
+            files_deleted_count += feed_files_deleted
+        return archived_count, files_deleted_count
 
-        logger.debug(
-            "Pruning process completed for feed.",
+    async def prune_all_feeds(self) -> tuple[int, int]:
+        """Apply the keep_last and since rules of every enabled feed at once.
+
+        Uses the retention values stored on the feed rows, so candidates for
+        all feeds come from a single query. Size limits are not applied here;
+        they are enforced when each feed is processed.
+
+        Returns:
+            A tuple (archived_count, files_deleted_count) indicating the number of
+            downloads archived and the number of files successfully deleted.
+
+        Raises:
+            PruneError: If candidate identification fails.
+        """
+        try:
+            candidates = await self._download_db.get_prune_candidates_for_all_feeds()
+        except DatabaseOperationError as e:
+            raise PruneError(
+                message="Failed to identify downloads to prune across feeds."
+            ) from e
+
+        if not candidates:
+            logger.debug("No downloads found to prune across feeds.")
+            return 0, 0
+
+        archived_count, files_deleted_count = await self._prune_across_feeds(
+            candidates, {}
+        )
+        logger.info(
+            "Pruned downloads across feeds.",
+            extra={
+                "candidate_count": len(candidates),
+                "archived_count": archived_count,
+                "files_deleted_count": files_deleted_count,
+            },
+        )
+        return archived_count, files_deleted_count
+
+    async def enforce_storage_budget(self) -> tuple[int, int]:
+        """Prune the oldest downloaded media across all feeds to fit the budget.
+
+        Candidates come from a single query that keeps each feed's newest
+        download and then fills the budget with the newest remaining media
+        of any feed. Usage is the sum of recorded file sizes, so media shared
+        by several feeds through hardlinks counts once per feed and the disk
+        space actually used stays within the budget. Does nothing when no
+        budget is configured.
+
+        Returns:
+            A tuple (archived_count, files_deleted_count) indicating the number of
+            downloads archived and the number of files successfully deleted.
+
+        Raises:
+            PruneError: If candidate identification fails.
+        """
+        if self._storage_budget is None:
+            return 0, 0
+
+        log_params: dict[str, Any] = {"storage_budget": self._storage_budget}
+        try:
+            usage = await self._download_db.get_storage_usage()
+            for feed_id, used_bytes in usage.items():
+                FEED_STORAGE_BYTES.set(used_bytes, feed_id=feed_id)
+            storage_used = sum(usage.values())
+            log_params["storage_used"] = storage_used
+            if storage_used <= self._storage_budget:
+                logger.debug("Storage usage is within budget.", extra=log_params)
+                return 0, 0
+            candidates = (
+                await self._download_db.get_downloads_to_prune_by_storage_budget(
+                    self._storage_budget
+                )
+            )
+        except DatabaseOperationError as e:
+            raise PruneError(
+                message="Failed to identify downloads over the storage budget."
+            ) from e
+
+        if not candidates:
+            logger.warning(
+                "Storage budget exceeded by the newest download of each feed alone.",
+                extra=log_params,
+            )
+            return 0, 0
+
+        archived_count, files_deleted_count = await self._prune_across_feeds(
+            candidates, log_params
+        )
+
+        logger.info(
+            "Pruned downloads to fit the storage budget.",
             extra={
                 **log_params,
                 "archived_count": archived_count,
@@ -422,7 +611,9 @@ class Pruner:
 
         This method disables a feed by setting is_enabled=False and archives
         all downloads associated with the feed regardless of their current status.
-        Files for DOWNLOADED items are deleted from the filesystem.
+        Downloads go through the same batched path as retention pruning: files
+        for DOWNLOADED items are deleted concurrently and the records are
+        archived with one bulk update.
 
         Args:
             feed_id: The unique identifier of the feed to archive.
@@ -432,7 +623,8 @@ class Pruner:
             downloads archived and the number of files successfully deleted.
 
         Raises:
-            PruneError: If feed disabling or download archiving fails.
+            PruneError: If a media file cannot be deleted, or feed disabling or
+                download archiving fails. The feed is left enabled.
         """
         log_params: dict[str, Any] = {"feed_id": feed_id}
         logger.debug("Starting feed archival process.", extra=log_params)
@@ -459,16 +651,15 @@ class Pruner:
                 extra={**log_params, "downloads_count": len(all_downloads)},
             )
 
-            archived_count = 0
-            files_deleted_count = 0
-
-            for download in all_downloads:
-                file_deleted = await self._process_single_download_for_pruning(
-                    download, feed_id
+            archived_count, files_deleted_count = await self._prune_downloads(
+                feed_id, [_prune_candidate(download) for download in all_downloads]
+            )
+            # Keep the feed enabled so archiving it again retries the leftovers
+            if archived_count < len(all_downloads):
+                raise PruneError(
+                    message="Failed to delete files of some downloads during feed archival.",
+                    feed_id=feed_id,
                 )
-                archived_count += 1
-                if file_deleted:
-                    files_deleted_count += 1
 
             # Delete feed image
             try:
@@ -1,9 +1,11 @@
 from .app_state_db import AppStateDatabase
 from .download_db import DownloadDatabase
 from .feed_db import FeedDatabase
+from .remote_probe_db import RemoteProbeDatabase
 
 __all__ = [
     "AppStateDatabase",
     "DownloadDatabase",
     "FeedDatabase",
+    "RemoteProbeDatabase",
 ]
@@ -5,6 +5,7 @@ import logging
 
 from sqlalchemy import update
 from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col
 
 from .decorators import handle_db_errors
@@ -31,14 +32,16 @@ class AppStateDatabase:
             when: The timestamp to persist. Defaults to current UTC time.
         """
         ts = when or datetime.now(UTC)
-        async with self._db.session() as session:
-            stmt = insert(AppState).values(id="global", last_yt_dlp_update=ts)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=[AppState.id],
-                set_={"last_yt_dlp_update": ts},
-            )
+        stmt = insert(AppState).values(id="global", last_yt_dlp_update=ts)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AppState.id],
+            set_={"last_yt_dlp_update": ts},
+        )
+
+        async def _write(session: AsyncSession) -> None:
             await session.execute(stmt)
-            await session.commit()
+
+        await self._db.write(_write)
 
     @handle_db_errors("get app state")
     async def get_last_yt_dlp_update(self) -> datetime | None:
@@ -60,14 +63,15 @@ class AppStateDatabase:
         now = datetime.now(UTC)
         cutoff = now - min_interval
 
-        async with self._db.session() as session:
-            stmt = (
-                update(AppState)
-                .where(col(AppState.id) == "global")
-                .where(col(AppState.last_yt_dlp_update) <= cutoff)
-                .values(last_yt_dlp_update=now)
-            )
+        stmt = (
+            update(AppState)
+            .where(col(AppState.id) == "global")
+            .where(col(AppState.last_yt_dlp_update) <= cutoff)
+            .values(last_yt_dlp_update=now)
+        )
+
+        async def _write(session: AsyncSession) -> bool:
             result = await session.execute(stmt)
-            await session.commit()
-            cursor_result = self._db.as_cursor_result(result)
-            return cursor_result.rowcount > 0
+            return self._db.as_cursor_result(result).rowcount > 0
+
+        return await self._db.write(_write)
@@ -3,12 +3,14 @@
 from collections.abc import Awaitable, Callable
 from functools import wraps
 import inspect
+import time
 from types import NoneType, UnionType
 from typing import Any, Union, cast, get_args, get_origin, get_type_hints
 
 from sqlalchemy.exc import SQLAlchemyError
 
 from ..exceptions import DatabaseOperationError
+from ..metrics.instruments import DB_OPERATION_ERRORS, DB_OPERATION_SECONDS
 
 
 def _resolve_single_annotation(cls: type, attr_name: str) -> Any:
@@ -166,7 +168,8 @@ def _base_db_error_handler[**P, T](
     """A generalized, internal decorator for handling database errors.
 
     It validates and extracts multiple IDs based on a dictionary of paths and
-    injects them into the raised DatabaseOperationError.
+    injects them into the raised DatabaseOperationError. Every call is timed
+    and recorded in the database operation latency metric under ``operation``.
 
     Args:
         operation: Description of the operation for error messages.
@@ -209,12 +212,18 @@ def _base_db_error_handler[**P, T](
                         f"Failed to extract IDs {id_paths} in {func.__name__}"
                     ) from e
 
+            started = time.perf_counter()
             try:
                 return await func(*args, **kwargs)
             except SQLAlchemyError as e:
+                DB_OPERATION_ERRORS.inc(operation=operation)
                 raise DatabaseOperationError(
                     f"Failed to {operation}", **extracted_ids
                 ) from e
+            finally:
+                DB_OPERATION_SECONDS.observe(
+                    time.perf_counter() - started, operation=operation
+                )
 
         return wrapper
 
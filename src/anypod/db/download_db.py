@@ -5,25 +5,97 @@ including the Download dataclass, DownloadStatus enum, and DownloadDatabase
 class for all database interactions.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable
 from contextlib import asynccontextmanager
-from datetime import datetime
+from dataclasses import fields
+from datetime import UTC, datetime
 import logging
 from typing import Any
 
-from sqlalchemy import and_, delete, func, update
+from sqlalchemy import Row, and_, delete, func, or_, select as select_columns, update
 from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.elements import ColumnElement, KeyedColumnElement
+from sqlalchemy.sql.selectable import Subquery
 from sqlmodel import col, select
 
 from ..exceptions import DatabaseOperationError, DownloadNotFoundError, NotFoundError
-from .decorators import handle_download_db_errors, handle_feed_db_errors
+from .decorators import (
+    handle_db_errors,
+    handle_download_db_errors,
+    handle_feed_db_errors,
+)
 from .sqlalchemy_core import SqlalchemyCore
-from .types import Download, DownloadStatus, TranscriptSource
+from .types import (
+    Download,
+    DownloadCompletion,
+    DownloadStatus,
+    Feed,
+    PruneCandidate,
+    TranscriptSource,
+)
 
 logger = logging.getLogger(__name__)
 
+# Ids per UPDATE when archiving in bulk, well below SQLite's parameter limit
+_ARCHIVE_CHUNK_SIZE = 500
+
+_PRUNE_CANDIDATE_FIELDS = tuple(field.name for field in fields(PruneCandidate))
+
+
+def _prune_candidate_columns() -> list[Any]:
+    """Return the download columns loaded for prune candidates."""
+    return [col(getattr(Download, name)) for name in _PRUNE_CANDIDATE_FIELDS]
+
+
+def _candidate_columns_of(subquery: Subquery) -> list[KeyedColumnElement[Any]]:
+    """Return the prune candidate columns of a subquery that selects them."""
+    return [subquery.c[name] for name in _PRUNE_CANDIDATE_FIELDS]
+
+
+def _to_prune_candidates(rows: Iterable[Row[Any]]) -> list[PruneCandidate]:
+    """Build prune candidates from rows selecting the candidate columns."""
+    # _asdict() is Row's public named-tuple API despite the underscore
+    return [PruneCandidate(**row._asdict()) for row in rows]  # pyright: ignore[reportPrivateUsage]
+
+
+def _ranked_for_pruning(*where: ColumnElement[bool]) -> Subquery:
+    """Number prunable downloads newest first within each feed.
+
+    ARCHIVED and SKIPPED downloads are left out. The position counts back
+    from the end of an ascending ``ROW_NUMBER()``, which equals numbering by
+    ``published DESC`` but lets SQLite read ``idx_feed_published`` in order
+    across several feeds instead of sorting into a temporary B-tree.
+
+    Args:
+        where: Extra filters, such as restricting to one feed.
+
+    Returns:
+        Subquery with the candidate columns, ``published`` and ``position``.
+    """
+    by_feed = col(Download.feed_id)
+    position = (
+        func.count().over(partition_by=by_feed)
+        - func.row_number().over(partition_by=by_feed, order_by=col(Download.published))
+        + 1
+    )
+    columns: list[Any] = [
+        *_prune_candidate_columns(),
+        col(Download.published),
+        position.label("position"),
+    ]
+    return (
+        select_columns(*columns)
+        .where(
+            col(Download.status).notin_(
+                [DownloadStatus.ARCHIVED, DownloadStatus.SKIPPED]
+            ),
+            *where,
+        )
+        .subquery()
+    )
+
 
 class DownloadDatabase:
     """Manage all database operations for downloads.
@@ -81,18 +153,18 @@ class DownloadDatabase:
             "status": str(download.status),
         }
         logger.debug("Attempting to upsert download record.", extra=log_params)
-        async with self._db.session() as session:
-            data = download.model_dump_for_insert()
+        data = download.model_dump_for_insert()
 
-            stmt = insert(Download).values(**data)
-            # Update all columns except primary keys on conflict
-            data.pop("feed_id", None)
-            data.pop("id", None)
-            stmt = stmt.on_conflict_do_update(
-                index_elements=["feed_id", "id"], set_=data
-            )
+        stmt = insert(Download).values(**data)
+        # Update all columns except primary keys on conflict
+        data.pop("feed_id", None)
+        data.pop("id", None)
+        stmt = stmt.on_conflict_do_update(index_elements=["feed_id", "id"], set_=data)
+
+        async def _write(session: AsyncSession) -> None:
             await session.execute(stmt)
-            await session.commit()
+
+        await self._db.write(_write)
         logger.debug("Upsert download record execution complete.", extra=log_params)
 
     @handle_download_db_errors(
@@ -123,15 +195,16 @@ class DownloadDatabase:
         data.pop("feed_id", None)
         data.pop("id", None)
 
-        async with self._db.session() as session:
-            stmt = (
-                update(Download)
-                .where(
-                    col(Download.feed_id) == download.feed_id,
-                    col(Download.id) == download.id,
-                )
-                .values(**data)
+        stmt = (
+            update(Download)
+            .where(
+                col(Download.feed_id) == download.feed_id,
+                col(Download.id) == download.id,
             )
+            .values(**data)
+        )
+
+        async def _write(session: AsyncSession) -> None:
             result = await session.execute(stmt)
             match self._db.as_cursor_result(result).rowcount:
                 case 0:
@@ -141,7 +214,7 @@ class DownloadDatabase:
                         download_id=download.id,
                     )
                 case 1:
-                    await session.commit()
+                    pass
                 case _ as row_count:
                     raise DatabaseOperationError(
                         f"Update affected {row_count} rows, expected 1.",
@@ -149,6 +222,7 @@ class DownloadDatabase:
                         download_id=download.id,
                     )
 
+        await self._db.write(_write)
         logger.debug("Update download record complete.", extra=log_params)
 
     # --- Status Transition Methods ---
@@ -176,35 +250,37 @@ class DownloadDatabase:
         }
         logger.debug("Attempting to mark as QUEUED from UPCOMING.", extra=log_params)
 
-        async with self._db.session() as session:
-            stmt = (
-                update(Download)
-                .where(
-                    and_(
-                        col(Download.feed_id) == feed_id,
-                        col(Download.id) == download_id,
-                        col(Download.status) == DownloadStatus.UPCOMING,
-                    )
-                )
-                .values(
-                    status=DownloadStatus.QUEUED,
+        stmt = (
+            update(Download)
+            .where(
+                and_(
+                    col(Download.feed_id) == feed_id,
+                    col(Download.id) == download_id,
+                    col(Download.status) == DownloadStatus.UPCOMING,
                 )
             )
-            res = await session.execute(stmt)
+            .values(
+                status=DownloadStatus.QUEUED,
+            )
+        )
 
+        async def _write(session: AsyncSession) -> None:
+            res = await session.execute(stmt)
             match self._db.as_cursor_result(res).rowcount:
                 case 0:
                     raise DownloadNotFoundError(
                         "Download not found.", feed_id=feed_id, download_id=download_id
                     )
                 case 1:
-                    await session.commit()
+                    pass
                 case _ as row_count:
                     raise DatabaseOperationError(
                         f"Update affected {row_count} rows, expected 1.",
                         feed_id=feed_id,
                         download_id=download_id,
                     )
+
+        await self._db.write(_write)
         logger.debug("Download marked as QUEUED from UPCOMING.", extra=log_params)
 
     @handle_feed_db_errors("requeue downloads")
@@ -267,31 +343,32 @@ class DownloadDatabase:
         }
         logger.debug("Attempting to re-queue downloads.", extra=log_params)
 
-        async with self._db.session() as session:
-            stmt = (
-                update(Download)
-                .where(*where_clauses)
-                .values(
-                    status=DownloadStatus.QUEUED,
-                    retries=0,
-                    last_error=None,
-                )
+        stmt = (
+            update(Download)
+            .where(*where_clauses)
+            .values(
+                status=DownloadStatus.QUEUED,
+                retries=0,
+                last_error=None,
             )
-            result = await session.execute(stmt)
-            cursor_result = self._db.as_cursor_result(result)
+        )
 
-            if expected_count is not None and expected_count != cursor_result.rowcount:
+        async def _write(session: AsyncSession) -> int:
+            result = await session.execute(stmt)
+            rowcount = self._db.as_cursor_result(result).rowcount
+            if expected_count is not None and expected_count != rowcount:
                 raise DatabaseOperationError(
-                    f"Expected to requeue {expected_count} downloads but only {cursor_result.rowcount} were updated. "
+                    f"Expected to requeue {expected_count} downloads but only {rowcount} were updated. "
                     f"Some downloads may not exist or may not have the expected status. Rolling back changes.",
                 )
-            await session.commit()
+            return rowcount
 
+        count_requeued = await self._db.write(_write)
         logger.debug(
             "Downloads requeued.",
-            extra={**log_params, "count_requeued": cursor_result.rowcount},
+            extra={**log_params, "count_requeued": count_requeued},
         )
-        return cursor_result.rowcount
+        return count_requeued
 
     @handle_download_db_errors("mark download as DOWNLOADED")
     async def mark_as_downloaded(
@@ -320,26 +397,27 @@ class DownloadDatabase:
         """
         log_params = {"feed_id": feed_id, "download_id": download_id}
         logger.debug("Attempting to mark as DOWNLOADED.", extra=log_params)
-        async with self._db.session() as session:
-            values: dict[str, object] = {
-                "status": DownloadStatus.DOWNLOADED,
-                "retries": 0,
-                "last_error": None,
-                "ext": ext,
-                "filesize": filesize,
-            }
-            if duration is not None:
-                values["duration"] = duration
-
-            stmt = (
-                update(Download)
-                .where(
-                    col(Download.feed_id) == feed_id,
-                    col(Download.id) == download_id,
-                    col(Download.status) == DownloadStatus.QUEUED,
-                )
-                .values(**values)
+        values: dict[str, object] = {
+            "status": DownloadStatus.DOWNLOADED,
+            "retries": 0,
+            "last_error": None,
+            "ext": ext,
+            "filesize": filesize,
+        }
+        if duration is not None:
+            values["duration"] = duration
+
+        stmt = (
+            update(Download)
+            .where(
+                col(Download.feed_id) == feed_id,
+                col(Download.id) == download_id,
+                col(Download.status) == DownloadStatus.QUEUED,
             )
+            .values(**values)
+        )
+
+        async def _write(session: AsyncSession) -> None:
             result = await session.execute(stmt)
             match self._db.as_cursor_result(result).rowcount:
                 case 0:
@@ -347,7 +425,7 @@ class DownloadDatabase:
                         "Download not found.", feed_id=feed_id, download_id=download_id
                     )
                 case 1:
-                    await session.commit()
+                    pass
                 case _ as row_count:
                     raise DatabaseOperationError(
                         f"Update affected {row_count} rows, expected 1.",
@@ -355,8 +433,75 @@ class DownloadDatabase:
                         download_id=download_id,
                     )
 
+        await self._db.write(_write)
         logger.debug("Download marked as DOWNLOADED.", extra=log_params)
 
+    @handle_download_db_errors("finalize download")
+    async def finalize_download(
+        self, feed_id: str, download_id: str, completion: DownloadCompletion
+    ) -> None:
+        """Mark a QUEUED download as DOWNLOADED along with all of its artifacts.
+
+        Media metadata, logs, thumbnail and transcript fields are written in one
+        UPDATE, so readers never observe a partially finalized row. Resets
+        retries to 0 and last_error to NULL. Transcript fields are left
+        untouched when ``completion.transcript_ext`` is None.
+
+        Args:
+            feed_id: The feed identifier.
+            download_id: The download identifier.
+            completion: Artifact metadata gathered from the finished download.
+
+        Raises:
+            DownloadNotFoundError: If the download is not found or is not QUEUED.
+            DatabaseOperationError: If the database operation fails.
+        """
+        log_params = {"feed_id": feed_id, "download_id": download_id}
+        logger.debug("Attempting to finalize download.", extra=log_params)
+
+        values: dict[str, object] = {
+            "status": DownloadStatus.DOWNLOADED,
+            "retries": 0,
+            "last_error": None,
+            "ext": completion.ext,
+            "mime_type": completion.mime_type,
+            "filesize": completion.filesize,
+            "download_logs": completion.download_logs,
+            "thumbnail_ext": completion.thumbnail_ext,
+        }
+        if completion.duration is not None:
+            values["duration"] = completion.duration
+        if completion.transcript_ext is not None:
+            values["transcript_ext"] = completion.transcript_ext
+            values["transcript_lang"] = completion.transcript_lang
+            values["transcript_source"] = completion.transcript_source
+        if completion.content_key is not None:
+            values["content_key"] = completion.content_key
+
+        stmt = (
+            update(Download)
+            .where(
+                col(Download.feed_id) == feed_id,
+                col(Download.id) == download_id,
+                col(Download.status) == DownloadStatus.QUEUED,
+            )
+            .values(**values)
+        )
+
+        async def _write(session: AsyncSession) -> None:
+            result = await session.execute(stmt)
+            try:
+                self._db.assert_exactly_one_row_affected(
+                    result, feed_id=feed_id, download_id=download_id
+                )
+            except NotFoundError as e:
+                raise DownloadNotFoundError(
+                    "Download not found.", feed_id=feed_id, download_id=download_id
+                ) from e
+
+        await self._db.write(_write)
+        logger.debug("Download finalized.", extra=log_params)
+
     @handle_download_db_errors("set download logs")
     async def set_download_logs(
         self, feed_id: str, download_id: str, logs: str
@@ -375,15 +520,16 @@ class DownloadDatabase:
         log_params = {"feed_id": feed_id, "download_id": download_id}
         logger.debug("Updating stored download logs.", extra=log_params)
 
-        async with self._db.session() as session:
-            stmt = (
-                update(Download)
-                .where(
-                    col(Download.feed_id) == feed_id,
-                    col(Download.id) == download_id,
-                )
-                .values(download_logs=logs)
+        stmt = (
+            update(Download)
+            .where(
+                col(Download.feed_id) == feed_id,
+                col(Download.id) == download_id,
             )
+            .values(download_logs=logs)
+        )
+
+        async def _write(session: AsyncSession) -> None:
             result = await session.execute(stmt)
             match self._db.as_cursor_result(result).rowcount:
                 case 0:
@@ -391,7 +537,7 @@ class DownloadDatabase:
                         "Download not found.", feed_id=feed_id, download_id=download_id
                     )
                 case 1:
-                    await session.commit()
+                    pass
                 case _ as row_count:
                     raise DatabaseOperationError(
                         f"Update affected {row_count} rows, expected 1.",
@@ -399,6 +545,7 @@ class DownloadDatabase:
                         download_id=download_id,
                     )
 
+        await self._db.write(_write)
         logger.debug("Download logs updated.", extra=log_params)
 
     @handle_download_db_errors("set thumbnail extension for download")
@@ -422,15 +569,16 @@ class DownloadDatabase:
             "thumbnail_ext": thumbnail_ext,
         }
         logger.debug("Attempting to set thumbnail extension.", extra=log_params)
-        async with self._db.session() as session:
-            stmt = (
-                update(Download)
-                .where(
-                    col(Download.feed_id) == feed_id,
-                    col(Download.id) == download_id,
-                )
-                .values(thumbnail_ext=thumbnail_ext)
+        stmt = (
+            update(Download)
+            .where(
+                col(Download.feed_id) == feed_id,
+                col(Download.id) == download_id,
             )
+            .values(thumbnail_ext=thumbnail_ext)
+        )
+
+        async def _write(session: AsyncSession) -> None:
             result = await session.execute(stmt)
             try:
                 self._db.assert_exactly_one_row_affected(
@@ -440,7 +588,8 @@ class DownloadDatabase:
                 raise DownloadNotFoundError(
                     "Download not found.", feed_id=feed_id, download_id=download_id
                 ) from e
-            await session.commit()
+
+        await self._db.write(_write)
         logger.debug("Thumbnail extension updated.", extra=log_params)
 
     @handle_download_db_errors("set transcript metadata for download")
@@ -474,19 +623,20 @@ class DownloadDatabase:
             "transcript_source": str(transcript_source) if transcript_source else None,
         }
         logger.debug("Attempting to set transcript metadata.", extra=log_params)
-        async with self._db.session() as session:
-            stmt = (
-                update(Download)
-                .where(
-                    col(Download.feed_id) == feed_id,
-                    col(Download.id) == download_id,
-                )
-                .values(
-                    transcript_ext=transcript_ext,
-                    transcript_lang=transcript_lang,
-                    transcript_source=transcript_source,
-                )
+        stmt = (
+            update(Download)
+            .where(
+                col(Download.feed_id) == feed_id,
+                col(Download.id) == download_id,
             )
+            .values(
+                transcript_ext=transcript_ext,
+                transcript_lang=transcript_lang,
+                transcript_source=transcript_source,
+            )
+        )
+
+        async def _write(session: AsyncSession) -> None:
             result = await session.execute(stmt)
             try:
                 self._db.assert_exactly_one_row_affected(
@@ -496,7 +646,8 @@ class DownloadDatabase:
                 raise DownloadNotFoundError(
                     "Download not found.", feed_id=feed_id, download_id=download_id
                 ) from e
-            await session.commit()
+
+        await self._db.write(_write)
         logger.debug("Transcript metadata updated.", extra=log_params)
 
     @handle_download_db_errors("mark download as SKIPPED")
@@ -515,17 +666,18 @@ class DownloadDatabase:
         """
         log_params = {"feed_id": feed_id, "download_id": download_id}
         logger.debug("Attempting to mark as SKIPPED.", extra=log_params)
-        async with self._db.session() as session:
-            stmt = (
-                update(Download)
-                .where(
-                    col(Download.feed_id) == feed_id,
-                    col(Download.id) == download_id,
-                )
-                .values(
-                    status=DownloadStatus.SKIPPED,
-                )
+        stmt = (
+            update(Download)
+            .where(
+                col(Download.feed_id) == feed_id,
+                col(Download.id) == download_id,
+            )
+            .values(
+                status=DownloadStatus.SKIPPED,
             )
+        )
+
+        async def _write(session: AsyncSession) -> None:
             result = await session.execute(stmt)
             try:
                 self._db.assert_exactly_one_row_affected(
@@ -535,7 +687,8 @@ class DownloadDatabase:
                 raise DownloadNotFoundError(
                     "Download not found.", feed_id=feed_id, download_id=download_id
                 ) from e
-            await session.commit()
+
+        await self._db.write(_write)
         logger.debug("Download marked as SKIPPED.", extra=log_params)
 
     @handle_download_db_errors("mark download as ARCHIVED")
@@ -554,18 +707,19 @@ class DownloadDatabase:
         """
         log_params = {"feed_id": feed_id, "download_id": download_id}
         logger.debug("Attempting to mark as ARCHIVED.", extra=log_params)
-        async with self._db.session() as session:
-            stmt = (
-                update(Download)
-                .where(
-                    col(Download.feed_id) == feed_id,
-                    col(Download.id) == download_id,
-                )
-                .values(
-                    status=DownloadStatus.ARCHIVED,
-                    thumbnail_ext=None,
-                )
+        stmt = (
+            update(Download)
+            .where(
+                col(Download.feed_id) == feed_id,
+                col(Download.id) == download_id,
             )
+            .values(
+                status=DownloadStatus.ARCHIVED,
+                thumbnail_ext=None,
+            )
+        )
+
+        async def _write(session: AsyncSession) -> None:
             result = await session.execute(stmt)
             try:
                 self._db.assert_exactly_one_row_affected(
@@ -575,9 +729,59 @@ class DownloadDatabase:
                 raise DownloadNotFoundError(
                     "Download not found.", feed_id=feed_id, download_id=download_id
                 ) from e
-            await session.commit()
+
+        await self._db.write(_write)
         logger.debug("Download marked as ARCHIVED.", extra=log_params)
 
+    @handle_feed_db_errors("mark downloads as ARCHIVED")
+    async def archive_downloads(self, feed_id: str, download_ids: list[str]) -> int:
+        """Archive several downloads of a feed in a single transaction.
+
+        Behaves like ``archive_download`` for each id. The ids are split into
+        chunks to stay below SQLite's bound parameter limit, but every chunk
+        is written in the same transaction.
+
+        Args:
+            feed_id: The feed identifier.
+            download_ids: Identifiers of the downloads to archive.
+
+        Returns:
+            Number of downloads archived; ids that do not exist are ignored.
+
+        Raises:
+            DatabaseOperationError: If the database operation fails.
+        """
+        if not download_ids:
+            return 0
+        log_params = {"feed_id": feed_id, "download_count": len(download_ids)}
+        logger.debug("Attempting to mark downloads as ARCHIVED.", extra=log_params)
+        stmts = [
+            update(Download)
+            .where(
+                col(Download.feed_id) == feed_id,
+                col(Download.id).in_(download_ids[i : i + _ARCHIVE_CHUNK_SIZE]),
+            )
+            .values(
+                status=DownloadStatus.ARCHIVED,
+                thumbnail_ext=None,
+            )
+            for i in range(0, len(download_ids), _ARCHIVE_CHUNK_SIZE)
+        ]
+
+        async def _write(session: AsyncSession) -> int:
+            archived = 0
+            for stmt in stmts:
+                result = await session.execute(stmt)
+                archived += self._db.as_cursor_result(result).rowcount
+            return archived
+
+        archived_count = await self._db.write(_write)
+        logger.debug(
+            "Downloads marked as ARCHIVED.",
+            extra={**log_params, "archived_count": archived_count},
+        )
+        return archived_count
+
     @handle_download_db_errors("bump retry count")
     async def bump_retries(
         self,
@@ -606,7 +810,8 @@ class DownloadDatabase:
         """
         log_params = {"feed_id": feed_id, "download_id": download_id}
         logger.debug("Attempting to bump retries.", extra=log_params)
-        async with self._db.session() as session:
+
+        async def _write(session: AsyncSession) -> tuple[int, DownloadStatus, bool]:
             download = await session.get(Download, (feed_id, download_id))
             if not download:
                 raise DownloadNotFoundError(
@@ -645,86 +850,306 @@ class DownloadDatabase:
             download.last_error = error_message
 
             session.add(download)
-            await session.commit()
             return (
                 download.retries,
                 download.status,
                 transitioned_to_error,
             )
 
+        return await self._db.write(_write)
+
     # --- Query Methods ---
 
-    @handle_feed_db_errors("get downloads to prune by keep_last")
-    async def get_downloads_to_prune_by_keep_last(
-        self, feed_id: str, keep_last: int
-    ) -> list[Download]:
-        """Identify downloads to prune based on 'keep_last' rule.
+    @handle_feed_db_errors("get prune candidates")
+    async def get_prune_candidates(
+        self, feed_id: str, keep_last: int | None, since: datetime | None
+    ) -> list[PruneCandidate]:
+        """Identify downloads to prune under the 'keep_last' and 'since' rules.
 
-        Returns downloads that exceed the keep_last limit, excluding
-        downloads with status ARCHIVED or SKIPPED.
+        Both rules are evaluated by one query: downloads are numbered newest
+        first within the feed, and a download is a candidate if its position
+        is beyond ``keep_last`` or it was published before ``since``.
+        Downloads with status ARCHIVED or SKIPPED are excluded.
 
         Args:
             feed_id: The feed identifier.
-            keep_last: The number of most recent downloads to keep.
+            keep_last: Number of most recent downloads to keep (None or less
+                than 1 to ignore).
+            since: Cutoff datetime (timezone-aware UTC), or None to ignore.
 
         Returns:
-            List of Download objects that should be pruned.
+            Key columns of the downloads that should be pruned.
 
         Raises:
             DatabaseOperationError: If the database query fails.
         """
-        if keep_last <= 0:
+        ranked = _ranked_for_pruning(col(Download.feed_id) == feed_id)
+        rules: list[ColumnElement[bool]] = []
+        if keep_last is not None and keep_last > 0:
+            rules.append(ranked.c.position > keep_last)
+        if since is not None:
+            rules.append(ranked.c.published < since)
+        if not rules:
             return []
 
+        async with self._db.session() as session:
+            stmt = select(*_candidate_columns_of(ranked)).where(or_(*rules))
+            results = await session.execute(stmt)
+            return _to_prune_candidates(results.all())
+
+    @handle_db_errors("get prune candidates for all feeds")
+    async def get_prune_candidates_for_all_feeds(self) -> list[PruneCandidate]:
+        """Identify downloads to prune across every enabled feed at once.
+
+        Applies the same rules as ``get_prune_candidates``, using the
+        'keep_last' and 'since' values stored on each feed row.
+
+        Returns:
+            Key columns of the downloads that should be pruned, from any feed.
+
+        Raises:
+            DatabaseOperationError: If the database query fails.
+        """
+        ranked = _ranked_for_pruning()
         async with self._db.session() as session:
             stmt = (
-                select(Download)
+                select(*_candidate_columns_of(ranked))
+                .join(Feed, col(Feed.id) == ranked.c.feed_id)
                 .where(
-                    col(Download.feed_id) == feed_id,
-                    col(Download.status).notin_(
-                        [DownloadStatus.ARCHIVED, DownloadStatus.SKIPPED]
+                    col(Feed.is_enabled).is_(True),
+                    or_(
+                        and_(
+                            col(Feed.keep_last) > 0,
+                            ranked.c.position > col(Feed.keep_last),
+                        ),
+                        ranked.c.published < col(Feed.since),
                     ),
                 )
-                .order_by(col(Download.published).desc())
-                .offset(keep_last)
             )
             results = await session.execute(stmt)
-            return list(results.scalars().all())
+            return _to_prune_candidates(results.all())
 
-    @handle_feed_db_errors("get downloads to prune by since")
-    async def get_downloads_to_prune_by_since(
-        self, feed_id: str, since: datetime
-    ) -> list[Download]:
-        """Identify downloads published before the 'since' datetime (UTC).
+    @handle_feed_db_errors("get downloads to prune by size")
+    async def get_downloads_to_prune_by_size(
+        self, feed_id: str, max_bytes: int
+    ) -> list[PruneCandidate]:
+        """Identify DOWNLOADED downloads beyond a feed's storage limit.
 
-        Returns downloads published before the given datetime, excluding
-        downloads with status ARCHIVED or SKIPPED. The 'since' parameter
-        must be a timezone-aware datetime object in UTC.
+        Downloads are kept newest first while their combined file size fits
+        in ``max_bytes``; everything older is returned. The newest download
+        is always kept, even if it alone exceeds the limit. Sizes are the
+        recorded file sizes, so media shared with another feed through a
+        hardlink counts in full here too.
 
         Args:
             feed_id: The feed identifier.
-            since: The cutoff datetime (must be timezone-aware UTC).
+            max_bytes: Total media size the feed may keep.
+
+        Returns:
+            Key columns of the downloads that should be pruned, in no
+            particular order.
+
+        Raises:
+            DatabaseOperationError: If the database query fails.
+        """
+        # Newest first without a tiebreaker, the order idx_feed_status_published
+        # already stores, so neither window needs a sort
+        newest_first = col(Download.published).desc()
+        columns: list[Any] = [
+            *_prune_candidate_columns(),
+            func.sum(Download.filesize)
+            .over(order_by=newest_first, rows=(None, 0))
+            .label("running_bytes"),
+            func.row_number().over(order_by=newest_first).label("position"),
+        ]
+        ranked = (
+            select_columns(*columns)
+            .where(
+                col(Download.feed_id) == feed_id,
+                col(Download.status) == DownloadStatus.DOWNLOADED,
+            )
+            .subquery()
+        )
+        async with self._db.session() as session:
+            stmt = select(*_candidate_columns_of(ranked)).where(
+                ranked.c.running_bytes > max_bytes, ranked.c.position > 1
+            )
+            results = await session.execute(stmt)
+            return _to_prune_candidates(results.all())
+
+    @handle_db_errors("get downloads to prune by storage budget")
+    async def get_downloads_to_prune_by_storage_budget(
+        self, budget_bytes: int
+    ) -> list[PruneCandidate]:
+        """Identify DOWNLOADED downloads beyond a storage budget shared by all feeds.
+
+        Each feed's newest download is always kept and counted first; the
+        remaining downloads fill what is left of the budget newest first,
+        regardless of feed. Everything that does not fit is returned.
+
+        The budget is compared with recorded file sizes, so a file that
+        several feeds share through hardlinks counts once per feed and the
+        space actually used on disk never exceeds the budget.
+
+        Args:
+            budget_bytes: Total media size all feeds together may keep.
+
+        Returns:
+            Key columns of the downloads that should be pruned, in no
+            particular order.
+
+        Raises:
+            DatabaseOperationError: If the database query fails.
+        """
+        per_feed_columns: list[Any] = [
+            *_prune_candidate_columns(),
+            col(Download.filesize),
+            col(Download.published),
+            func.row_number()
+            .over(
+                partition_by=col(Download.feed_id),
+                order_by=col(Download.published).desc(),
+            )
+            .label("feed_position"),
+        ]
+        per_feed = (
+            select_columns(*per_feed_columns)
+            .where(col(Download.status) == DownloadStatus.DOWNLOADED)
+            .subquery()
+        )
+        ranked_columns: list[Any] = [
+            *_candidate_columns_of(per_feed),
+            per_feed.c.feed_position,
+            func.sum(per_feed.c.filesize)
+            .over(
+                # Each feed's newest download first, then everything newest first
+                order_by=[
+                    per_feed.c.feed_position > 1,
+                    per_feed.c.published.desc(),
+                    per_feed.c.feed_id,
+                    per_feed.c.id,
+                ],
+                rows=(None, 0),
+            )
+            .label("running_bytes"),
+        ]
+        ranked = select_columns(*ranked_columns).subquery()
+        async with self._db.session() as session:
+            stmt = select(*_candidate_columns_of(ranked)).where(
+                ranked.c.running_bytes > budget_bytes,
+                ranked.c.feed_position > 1,
+            )
+            results = await session.execute(stmt)
+            return _to_prune_candidates(results.all())
+
+    @handle_db_errors("get storage usage")
+    async def get_storage_usage(self) -> dict[str, int]:
+        """Sum the media size of DOWNLOADED downloads per feed.
+
+        This is the logical size each feed references: a file shared by
+        several feeds through hardlinks is counted once for every feed, so
+        the total can exceed the space the files take on disk.
 
         Returns:
-            List of Download objects that should be pruned.
+            Bytes of downloaded media keyed by feed id; feeds without
+            downloaded media are omitted.
 
         Raises:
             DatabaseOperationError: If the database query fails.
         """
         async with self._db.session() as session:
             stmt = (
-                select(Download)
-                .where(
-                    col(Download.feed_id) == feed_id,
-                    col(Download.published) < since,
-                    col(Download.status).notin_(
-                        [DownloadStatus.ARCHIVED, DownloadStatus.SKIPPED]
-                    ),
-                )
-                .order_by(col(Download.published).desc())
+                select(col(Download.feed_id), func.sum(Download.filesize))
+                .where(col(Download.status) == DownloadStatus.DOWNLOADED)
+                .group_by(col(Download.feed_id))
             )
             results = await session.execute(stmt)
-            return list(results.scalars().all())
+            return {feed_id: int(total or 0) for feed_id, total in results.all()}
+
+    @handle_db_errors("get stored file keys")
+    async def get_stored_file_keys(self) -> list[PruneCandidate]:
+        """Load the file key columns of every download that is not archived.
+
+        This reads the whole table in one pass so that a sweep of the data
+        directories can check each file against an in-memory key set.
+
+        Returns:
+            Key columns of all non-ARCHIVED downloads in every feed.
+
+        Raises:
+            DatabaseOperationError: If the database query fails.
+        """
+        async with self._db.session() as session:
+            stmt = select_columns(*_prune_candidate_columns()).where(
+                col(Download.status) != DownloadStatus.ARCHIVED
+            )
+            results = await session.execute(stmt)
+            return _to_prune_candidates(results.all())
+
+    @handle_feed_db_errors("get downloads by content key", "exclude_feed_id")
+    async def get_downloaded_by_content_key(
+        self, content_key: str, exclude_feed_id: str
+    ) -> list[Download]:
+        """Retrieve DOWNLOADED downloads in other feeds sharing a content key.
+
+        Args:
+            content_key: The media fingerprint to match.
+            exclude_feed_id: Feed whose downloads are left out of the result.
+
+        Returns:
+            Matching downloads, most recently downloaded first.
+
+        Raises:
+            DatabaseOperationError: If the database query fails.
+        """
+        async with self._db.session() as session:
+            stmt = select(Download).where(
+                col(Download.content_key) == content_key,
+                col(Download.feed_id) != exclude_feed_id,
+                col(Download.status) == DownloadStatus.DOWNLOADED,
+            )
+            results = await session.execute(stmt)
+            downloads = results.scalars().all()
+        # Only a handful of feeds share a key, so sort here rather than in SQLite
+        return sorted(
+            downloads,
+            key=lambda d: d.downloaded_at or datetime.min.replace(tzinfo=UTC),
+            reverse=True,
+        )
+
+    @handle_db_errors("get duplicate downloads")
+    async def get_duplicate_downloads(self) -> list[Download]:
+        """Retrieve DOWNLOADED downloads that may hold the same media file.
+
+        Downloads are possible duplicates when another DOWNLOADED row in a
+        different feed has the same id, extension and file size.
+
+        Returns:
+            Possible duplicates ordered so that each group is contiguous.
+
+        Raises:
+            DatabaseOperationError: If the database query fails.
+        """
+        other = aliased(Download)
+        same_file_elsewhere = (
+            select(other.id)
+            .where(
+                col(other.id) == col(Download.id),
+                col(other.feed_id) != col(Download.feed_id),
+                col(other.status) == DownloadStatus.DOWNLOADED,
+                col(other.ext) == col(Download.ext),
+                col(other.filesize) == col(Download.filesize),
+            )
+            .exists()
+        )
+        async with self._db.session() as session:
+            stmt = select(Download).where(
+                col(Download.status) == DownloadStatus.DOWNLOADED,
+                same_file_elsewhere,
+            )
+            results = await session.execute(stmt)
+            downloads = results.scalars().all()
+        return sorted(downloads, key=lambda d: (d.id, d.ext, d.filesize, d.feed_id))
 
     @handle_download_db_errors("retrieve download by ID")
     async def get_download_by_id(self, feed_id: str, download_id: str) -> Download:
@@ -771,24 +1196,25 @@ class DownloadDatabase:
         log_params = {"feed_id": feed_id, "download_id": download_id}
         logger.debug("Attempting to delete download.", extra=log_params)
 
-        async with self._db.session() as session:
-            stmt = (
-                delete(Download)
-                .where(
-                    col(Download.feed_id) == feed_id,
-                    col(Download.id) == download_id,
-                )
-                .returning(Download)
+        stmt = (
+            delete(Download)
+            .where(
+                col(Download.feed_id) == feed_id,
+                col(Download.id) == download_id,
             )
+            .returning(Download)
+        )
+
+        async def _write(session: AsyncSession) -> Download:
             result = await session.execute(stmt)
             deleted = result.scalars().first()
-            await session.commit()
-
-        if not deleted:
-            raise DownloadNotFoundError(
-                "Download not found.", feed_id=feed_id, download_id=download_id
-            )
+            if not deleted:
+                raise DownloadNotFoundError(
+                    "Download not found.", feed_id=feed_id, download_id=download_id
+                )
+            return deleted
 
+        deleted = await self._db.write(_write)
         logger.debug("Download deleted successfully.", extra=log_params)
         return deleted
 
@@ -857,7 +1283,8 @@ class DownloadDatabase:
     ) -> int:
         """Count downloads with one or more specific statuses.
 
-        Can be filtered by a specific feed.
+        Reads the per-status counters that triggers maintain on the feed table,
+        so the cost scales with the number of feeds rather than downloads.
 
         Args:
             status_to_filter: Single status or list of statuses to count.
@@ -877,14 +1304,20 @@ class DownloadDatabase:
 
         match status_to_filter:
             case DownloadStatus() as s:
-                status_where_clause = col(Download.status) == s
+                statuses = [s]
             case list() as ss:
-                status_where_clause = col(Download.status).in_(ss)
+                statuses = list(dict.fromkeys(ss))
+        if not statuses:
+            return 0
+
+        counter_sum = Feed.status_count_column(statuses[0])
+        for status in statuses[1:]:
+            counter_sum = counter_sum + Feed.status_count_column(status)
 
         async with self._db.session() as session:
-            stmt = select(func.count(col(Download.id))).where(status_where_clause)
+            stmt = select(func.coalesce(func.sum(counter_sum), 0))
             if feed_id:
-                stmt = stmt.where(col(Download.feed_id) == feed_id)
+                stmt = stmt.where(col(Feed.id) == feed_id)
 
             result = await session.execute(stmt)
             count = result.scalar_one_or_none()
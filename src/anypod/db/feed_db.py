@@ -4,13 +4,13 @@ This module provides the Feed dataclass and related enums for feed-related
 database operations.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 import logging
 from typing import Any
 
-from sqlalchemy import update
+from sqlalchemy import Row, func, update
 from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col, select
@@ -19,7 +19,13 @@ from ..config.types import PodcastCategories, PodcastType
 from ..exceptions import FeedNotFoundError, NotFoundError
 from .decorators import handle_db_errors, handle_feed_db_errors
 from .sqlalchemy_core import SqlalchemyCore
-from .types import Feed, SourceType
+from .types import (
+    Download,
+    DownloadStatus,
+    Feed,
+    SourceType,
+    StatusCounterMismatch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -66,16 +72,18 @@ class FeedDatabase:
         """
         log_params = {"feed_id": feed.id}
         logger.debug("Attempting to upsert feed record.", extra=log_params)
-        async with self._db.session() as session:
-            data = feed.model_dump_for_insert()
+        data = feed.model_dump_for_insert()
+
+        stmt = insert(Feed).values(**data)
 
-            stmt = insert(Feed).values(**data)
+        # Don't include primary keys in the update
+        data.pop("id", None)
+        stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=data)
 
-            # Don't include primary keys in the update
-            data.pop("id", None)
-            stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=data)
+        async def _write(session: AsyncSession) -> None:
             await session.execute(stmt)
-            await session.commit()
+
+        await self._db.write(_write)
         logger.debug("Upsert feed record execution complete.", extra=log_params)
 
     @handle_feed_db_errors("get feed by ID")
@@ -143,22 +151,24 @@ class FeedDatabase:
         """
         log_params = {"feed_id": feed_id}
         logger.debug("Attempting to mark sync success for feed.", extra=log_params)
-        async with self._db.session() as session:
-            stmt = (
-                update(Feed)
-                .where(col(Feed.id) == feed_id)
-                .values(
-                    last_successful_sync=sync_time or datetime.now(UTC),
-                    consecutive_failures=0,
-                )
+        stmt = (
+            update(Feed)
+            .where(col(Feed.id) == feed_id)
+            .values(
+                last_successful_sync=sync_time or datetime.now(UTC),
+                consecutive_failures=0,
             )
+        )
+
+        async def _write(session: AsyncSession) -> None:
             try:
                 self._db.assert_exactly_one_row_affected(
                     await session.execute(stmt), feed_id=feed_id
                 )
             except NotFoundError as e:
                 raise FeedNotFoundError("Feed not found.", feed_id=feed_id) from e
-            await session.commit()
+
+        await self._db.write(_write)
         logger.debug("Feed sync success marked.", extra=log_params)
 
     @handle_feed_db_errors("mark sync failure")
@@ -177,23 +187,24 @@ class FeedDatabase:
         """
         log_params = {"feed_id": feed_id}
         logger.debug("Attempting to mark sync failure for feed.", extra=log_params)
-        async with self._db.session() as session:
-            stmt = (
-                update(Feed)
-                .where(col(Feed.id) == feed_id)
-                .values(
-                    last_failed_sync=sync_time or datetime.now(UTC),
-                    consecutive_failures=col(Feed.consecutive_failures) + 1,
-                )
+        stmt = (
+            update(Feed)
+            .where(col(Feed.id) == feed_id)
+            .values(
+                last_failed_sync=sync_time or datetime.now(UTC),
+                consecutive_failures=col(Feed.consecutive_failures) + 1,
             )
+        )
 
+        async def _write(session: AsyncSession) -> None:
             try:
                 self._db.assert_exactly_one_row_affected(
                     await session.execute(stmt), feed_id=feed_id
                 )
             except NotFoundError as e:
                 raise FeedNotFoundError("Feed not found.", feed_id=feed_id) from e
-            await session.commit()
+
+        await self._db.write(_write)
         logger.warning("Feed sync failure marked.", extra=log_params)
 
     @handle_feed_db_errors("mark RSS generated")
@@ -209,21 +220,23 @@ class FeedDatabase:
         """
         log_params = {"feed_id": feed_id}
         logger.debug("Attempting to mark RSS generated for feed.", extra=log_params)
-        async with self._db.session() as session:
-            stmt = (
-                update(Feed)
-                .where(col(Feed.id) == feed_id)
-                .values(
-                    last_rss_generation=datetime.now(UTC),
-                )
+        stmt = (
+            update(Feed)
+            .where(col(Feed.id) == feed_id)
+            .values(
+                last_rss_generation=datetime.now(UTC),
             )
+        )
+
+        async def _write(session: AsyncSession) -> None:
             try:
                 self._db.assert_exactly_one_row_affected(
                     await session.execute(stmt), feed_id=feed_id
                 )
             except NotFoundError as e:
                 raise FeedNotFoundError("Feed not found.", feed_id=feed_id) from e
-            await session.commit()
+
+        await self._db.write(_write)
         logger.debug("RSS generation marked for feed.", extra=log_params)
 
     @handle_feed_db_errors("set feed enabled")
@@ -240,18 +253,23 @@ class FeedDatabase:
         """
         log_params = {"feed_id": feed_id, "enabled": enabled}
         logger.debug("Attempting to set feed enabled status.", extra=log_params)
-        async with self._db.session() as session:
-            values: dict[str, Any] = {"is_enabled": enabled}
-            if not enabled:
-                values["image_ext"] = None
-            stmt = update(Feed).where(col(Feed.id) == feed_id).values(**values)
+        values: dict[str, Any] = {"is_enabled": enabled}
+        if not enabled:
+            values["image_ext"] = None
+            values["image_etag"] = None
+            values["image_last_modified"] = None
+            values["image_content_hash"] = None
+        stmt = update(Feed).where(col(Feed.id) == feed_id).values(**values)
+
+        async def _write(session: AsyncSession) -> None:
             try:
                 self._db.assert_exactly_one_row_affected(
                     await session.execute(stmt), feed_id=feed_id
                 )
             except NotFoundError as e:
                 raise FeedNotFoundError("Feed not found.", feed_id=feed_id) from e
-            await session.commit()
+
+        await self._db.write(_write)
         logger.debug("Feed enabled status updated.", extra=log_params)
 
     @handle_feed_db_errors("update feed metadata")
@@ -334,13 +352,104 @@ class FeedDatabase:
 
         log_params = {"feed_id": feed_id, "updated_fields": list(updates.keys())}
         logger.debug("Attempting to update feed metadata.", extra=log_params)
-        async with self._db.session() as session:
-            stmt = update(Feed).where(col(Feed.id) == feed_id).values(**updates)
+        stmt = update(Feed).where(col(Feed.id) == feed_id).values(**updates)
+
+        async def _write(session: AsyncSession) -> None:
             try:
                 self._db.assert_exactly_one_row_affected(
                     await session.execute(stmt), feed_id=feed_id
                 )
             except NotFoundError as e:
                 raise FeedNotFoundError("Feed not found.", feed_id=feed_id) from e
-            await session.commit()
+
+        await self._db.write(_write)
         logger.debug("Feed metadata updated.", extra=log_params)
+
+    # --- Maintenance ---
+
+    @handle_db_errors("check status counters")
+    async def check_status_counters(
+        self, repair: bool = False
+    ) -> list[StatusCounterMismatch]:
+        """Compare the trigger-maintained status counters against a recount.
+
+        Both sides are read in one transaction, so the comparison sees a
+        consistent snapshot even while downloads are changing.
+
+        Args:
+            repair: If True, recompute every counter of each mismatched feed.
+
+        Returns:
+            Mismatches found before any repair, ordered by feed and status.
+
+        Raises:
+            DatabaseOperationError: If the database operation fails.
+        """
+        statuses = list(DownloadStatus)
+        actual_stmt = select(
+            col(Download.feed_id), col(Download.status), func.count()
+        ).group_by(col(Download.feed_id), col(Download.status))
+        stored_stmt = (
+            select(col(Feed.id))
+            .add_columns(*(Feed.status_count_column(s) for s in statuses))
+            .order_by(col(Feed.id))
+        )
+
+        async with self._db.session() as session:
+            actual: dict[tuple[str, DownloadStatus], int] = {
+                (feed_id, status): count
+                for feed_id, status, count in (await session.execute(actual_stmt))
+            }
+            stored_rows: Sequence[Row[Any]] = (await session.execute(stored_stmt)).all()
+
+        mismatches: list[StatusCounterMismatch] = []
+        for row in stored_rows:
+            feed_id: str = row[0]
+            for status, stored in zip(statuses, row[1:], strict=True):
+                expected = actual.get((feed_id, status), 0)
+                if stored != expected:
+                    mismatches.append(
+                        StatusCounterMismatch(
+                            feed_id=feed_id,
+                            status=status,
+                            stored=stored,
+                            actual=expected,
+                        )
+                    )
+
+        if mismatches:
+            logger.warning(
+                "Feed status counters disagree with download table.",
+                extra={"mismatch_count": len(mismatches), "repair": repair},
+            )
+            if repair:
+                await self._recount_status_counters(
+                    sorted({m.feed_id for m in mismatches})
+                )
+        return mismatches
+
+    async def _recount_status_counters(self, feed_ids: list[str]) -> None:
+        """Recompute every status counter for the given feeds from downloads.
+
+        Args:
+            feed_ids: Feeds whose counters should be rebuilt.
+        """
+        recount = {
+            Feed.status_count_column(status): select(func.count())
+            .select_from(Download)
+            .where(
+                col(Download.feed_id) == col(Feed.id),
+                col(Download.status) == status,
+            )
+            .scalar_subquery()
+            for status in DownloadStatus
+        }
+        stmt = update(Feed).where(col(Feed.id).in_(feed_ids)).values(recount)
+
+        async def _write(session: AsyncSession) -> None:
+            await session.execute(stmt)
+
+        await self._db.write(_write)
+        logger.info(
+            "Feed status counters recomputed.", extra={"feed_count": len(feed_ids)}
+        )
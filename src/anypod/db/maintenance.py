@@ -0,0 +1,224 @@
+"""Periodic SQLite housekeeping and online backups.
+
+Nothing in normal operation shrinks the database file, refreshes planner
+statistics, or resets the WAL, and ``download_logs`` churn leaves a steady
+stream of free pages behind. :class:`DatabaseMaintenance` bundles those chores
+into a single run that the scheduler triggers during quiet periods. Each run
+also drops cached remote probes whose download was deleted or archived, which
+would otherwise accumulate forever.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+import logging
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+import aiofiles.os
+import aiosqlite
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..exceptions import DatabaseOperationError, FileOperationError
+from .remote_probe_db import RemoteProbeDatabase
+from .sqlalchemy_core import SqlalchemyCore
+from .types import MaintenanceResult
+
+logger = logging.getLogger(__name__)
+
+AUTO_VACUUM_INCREMENTAL = 2
+
+# Probes are written while a feed syncs, before their download row exists
+PROBE_RETENTION = timedelta(days=1)
+
+
+class DatabaseMaintenance:
+    """Run vacuum, checkpoint, statistics and backup tasks against the database.
+
+    Statements are issued on a raw driver connection in autocommit mode, since
+    ``VACUUM`` and ``wal_checkpoint`` cannot run inside the transaction that
+    SQLAlchemy sessions open.
+
+    Attributes:
+        _db: Core database providing the engine.
+        _backup_path: Destination of the snapshot, or None to skip backups.
+        _remote_probe_db: Probe cache to prune, or None to leave it alone.
+        _vacuum_page_limit: Maximum free pages to reclaim per run (0 means all).
+        _analysis_limit: Row sample size used by ``PRAGMA optimize``.
+    """
+
+    def __init__(
+        self,
+        db_core: SqlalchemyCore,
+        backup_path: Path | None = None,
+        remote_probe_db: RemoteProbeDatabase | None = None,
+        vacuum_page_limit: int = 0,
+        analysis_limit: int = 400,
+    ) -> None:
+        self._db = db_core
+        self._backup_path = backup_path
+        self._remote_probe_db = remote_probe_db
+        self._vacuum_page_limit = vacuum_page_limit
+        self._analysis_limit = analysis_limit
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncGenerator[aiosqlite.Connection]:
+        """Check out a pooled connection and expose its aiosqlite driver.
+
+        Yields:
+            The underlying aiosqlite connection, outside of any transaction.
+
+        Raises:
+            DatabaseOperationError: If a connection cannot be obtained.
+        """
+        try:
+            async with self._db.engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                driver = raw.driver_connection
+                if not isinstance(driver, aiosqlite.Connection):
+                    raise DatabaseOperationError("Unexpected database driver.")
+                yield driver
+        except SQLAlchemyError as e:
+            raise DatabaseOperationError("Failed to acquire connection.") from e
+
+    @staticmethod
+    async def _pragma(conn: aiosqlite.Connection, statement: str) -> list[Any]:
+        # Drain every row so multi-step pragmas like incremental_vacuum finish
+        async with conn.execute(statement) as cursor:
+            return list(await cursor.fetchall())
+
+    async def _reclaim_free_pages(self, conn: aiosqlite.Connection) -> int:
+        """Return free pages to the filesystem.
+
+        Databases created before maintenance existed use ``auto_vacuum=NONE``;
+        they are rebuilt once with a full ``VACUUM`` so later runs can reclaim
+        space incrementally without rewriting the whole file.
+
+        Args:
+            conn: Autocommit driver connection.
+
+        Returns:
+            Number of pages released.
+        """
+        (free_before,) = (await self._pragma(conn, "PRAGMA freelist_count"))[0]
+        (auto_vacuum,) = (await self._pragma(conn, "PRAGMA auto_vacuum"))[0]
+        if auto_vacuum != AUTO_VACUUM_INCREMENTAL:
+            logger.info("Enabling incremental auto-vacuum; rebuilding database.")
+            await self._pragma(conn, "PRAGMA auto_vacuum = INCREMENTAL")
+            await self._pragma(conn, "VACUUM")
+        else:
+            await self._pragma(
+                conn, f"PRAGMA incremental_vacuum({self._vacuum_page_limit})"
+            )
+        (free_after,) = (await self._pragma(conn, "PRAGMA freelist_count"))[0]
+        return max(free_before - free_after, 0)
+
+    async def _checkpoint(self, conn: aiosqlite.Connection) -> bool:
+        """Copy the WAL into the database file and truncate it.
+
+        Args:
+            conn: Autocommit driver connection.
+
+        Returns:
+            True if the WAL was fully checkpointed and truncated.
+        """
+        busy, _, _ = (await self._pragma(conn, "PRAGMA wal_checkpoint(TRUNCATE)"))[0]
+        if busy:
+            logger.warning(
+                "WAL checkpoint could not complete; readers are still active."
+            )
+        return not busy
+
+    async def _optimize(self, conn: aiosqlite.Connection) -> None:
+        """Refresh query planner statistics where they are stale.
+
+        Args:
+            conn: Autocommit driver connection.
+        """
+        await self._pragma(conn, f"PRAGMA analysis_limit = {self._analysis_limit}")
+        await self._pragma(conn, "PRAGMA optimize")
+
+    async def run(self) -> MaintenanceResult:
+        """Prune stale probes, vacuum, checkpoint and analyze, then take a backup.
+
+        Returns:
+            MaintenanceResult describing what was done.
+
+        Raises:
+            DatabaseOperationError: If a maintenance statement fails.
+            FileOperationError: If the backup file cannot be written.
+        """
+        logger.debug("Starting database maintenance.")
+        probes_deleted = 0
+        if self._remote_probe_db is not None:
+            # Before vacuuming, so the freed pages are reclaimed in this run
+            probes_deleted = await self._remote_probe_db.delete_stale(
+                datetime.now(UTC) - PROBE_RETENTION
+            )
+        async with self._connection() as conn:
+            try:
+                pages_reclaimed = await self._reclaim_free_pages(conn)
+                checkpoint_complete = await self._checkpoint(conn)
+                await self._optimize(conn)
+            except sqlite3.Error as e:
+                raise DatabaseOperationError("Database maintenance failed.") from e
+
+        if self._backup_path is not None:
+            await self.backup(self._backup_path)
+
+        result = MaintenanceResult(
+            pages_reclaimed=pages_reclaimed,
+            checkpoint_complete=checkpoint_complete,
+            backup_path=self._backup_path,
+            probes_deleted=probes_deleted,
+        )
+        logger.info("Database maintenance completed.", extra=result.summary_dict())
+        return result
+
+    async def backup(self, dest: Path) -> None:
+        """Write a consistent snapshot of the live database to ``dest``.
+
+        Uses the SQLite online backup API in a single step. Under WAL this only
+        holds a read snapshot, so writers are never blocked, and the copy runs
+        on the driver's worker thread rather than the event loop. The snapshot
+        is written beside ``dest`` and renamed into place so a crash never
+        leaves a partial backup behind.
+
+        Args:
+            dest: Path of the snapshot file to create or replace.
+
+        Raises:
+            DatabaseOperationError: If the backup fails.
+            FileOperationError: If the snapshot cannot be written or moved.
+        """
+        tmp_path = dest.with_name(f"{dest.name}.tmp")
+        try:
+            await aiofiles.os.makedirs(dest.parent, exist_ok=True)
+        except OSError as e:
+            raise FileOperationError(
+                "Failed to create backup directory.", file_name=str(dest.parent)
+            ) from e
+
+        try:
+            target = await asyncio.to_thread(
+                sqlite3.connect, tmp_path, check_same_thread=False
+            )
+            try:
+                async with self._connection() as conn:
+                    await conn.backup(target)
+                # Make the snapshot a self-contained file rather than a WAL database
+                await asyncio.to_thread(target.execute, "PRAGMA journal_mode = DELETE")
+            finally:
+                await asyncio.to_thread(target.close)
+        except sqlite3.Error as e:
+            raise DatabaseOperationError("Database backup failed.") from e
+
+        try:
+            await aiofiles.os.replace(tmp_path, dest)
+        except OSError as e:
+            raise FileOperationError(
+                "Failed to move database backup into place.", file_name=str(dest)
+            ) from e
+        logger.debug("Database backup written.", extra={"backup_path": str(dest)})
@@ -0,0 +1,117 @@
+"""Database access layer for cached remote media probe results."""
+
+from datetime import UTC, datetime
+import logging
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col, select
+
+from .decorators import handle_db_errors
+from .sqlalchemy_core import SqlalchemyCore
+from .types import Download, DownloadStatus, RemoteProbe
+
+logger = logging.getLogger(__name__)
+
+
+class RemoteProbeDatabase:
+    """Persist durations probed from remote media URLs.
+
+    Lets handlers skip re-probing posts whose media has not changed since the
+    last time it was seen.
+
+    Attributes:
+        _db: Core SQLAlchemy database manager.
+    """
+
+    def __init__(self, db_core: SqlalchemyCore):
+        self._db = db_core
+
+    @handle_db_errors("get remote probe duration")
+    async def get_duration(
+        self, feed_id: str, download_id: str, media_fingerprint: str
+    ) -> int | None:
+        """Return the cached duration if the media is unchanged.
+
+        Args:
+            feed_id: The feed identifier.
+            download_id: The download identifier.
+            media_fingerprint: Fingerprint of the media URL about to be probed.
+
+        Returns:
+            Cached duration in seconds, or None if missing or the media changed.
+        """
+        async with self._db.session() as session:
+            probe = await session.get(RemoteProbe, (feed_id, download_id))
+        if probe is None or probe.media_fingerprint != media_fingerprint:
+            return None
+        return probe.duration
+
+    @handle_db_errors("upsert remote probe duration")
+    async def upsert_duration(
+        self,
+        feed_id: str,
+        download_id: str,
+        media_fingerprint: str,
+        duration: int,
+    ) -> None:
+        """Store the probed duration for a download's media.
+
+        Args:
+            feed_id: The feed identifier.
+            download_id: The download identifier.
+            media_fingerprint: Fingerprint of the probed media URL.
+            duration: Probed duration in seconds.
+        """
+        values = {
+            "media_fingerprint": media_fingerprint,
+            "duration": duration,
+            "probed_at": datetime.now(UTC),
+        }
+        stmt = insert(RemoteProbe).values(
+            feed_id=feed_id, download_id=download_id, **values
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RemoteProbe.feed_id, RemoteProbe.download_id],
+            set_=values,
+        )
+
+        async def _write(session: AsyncSession) -> None:
+            await session.execute(stmt)
+
+        await self._db.write(_write)
+
+    @handle_db_errors("delete stale remote probes")
+    async def delete_stale(self, probed_before: datetime) -> int:
+        """Delete probes whose download was deleted or archived.
+
+        Probes are written before their download exists, so only rows probed
+        before ``probed_before`` are considered.
+
+        Args:
+            probed_before: Keep probes taken at or after this time.
+
+        Returns:
+            Number of probes deleted.
+        """
+        live_download = (
+            select(Download.id)
+            .where(
+                col(Download.feed_id) == RemoteProbe.feed_id,
+                col(Download.id) == RemoteProbe.download_id,
+                col(Download.status) != DownloadStatus.ARCHIVED,
+            )
+            .exists()
+        )
+        stmt = delete(RemoteProbe).where(
+            col(RemoteProbe.probed_at) < probed_before, ~live_download
+        )
+
+        async def _write(session: AsyncSession) -> int:
+            result = await session.execute(stmt)
+            return self._db.as_cursor_result(result).rowcount
+
+        deleted = await self._db.write(_write)
+        logger.debug("Deleted stale remote probes.", extra={"probes_deleted": deleted})
+        return deleted
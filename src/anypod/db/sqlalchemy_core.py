@@ -8,7 +8,7 @@ import sqlite3
 from typing import Any
 
 from sqlalchemy import event
-from sqlalchemy.engine import CursorResult, Engine, Result
+from sqlalchemy.engine import Connection, CursorResult, Engine, Result
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -18,14 +18,29 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import ConnectionPoolEntry
 
 from ..exceptions import DatabaseOperationError, NotFoundError
+from .write_queue import WriteOperation, WriteQueue
 
 logger = logging.getLogger(__name__)
 
 
 class SqlalchemyCore:
-    """Core wrapper for SQLAlchemy async operations."""
-
-    def __init__(self, db_dir: Path) -> None:
+    """Core wrapper for SQLAlchemy async operations.
+
+    Reads use short-lived sessions from :meth:`session`. Writes go through
+    :meth:`write`, which hands them to a single writer task that group-commits
+    operations arriving close together.
+
+    Attributes:
+        engine: The async SQLAlchemy engine.
+        async_session_maker: Factory for async sessions bound to ``engine``.
+    """
+
+    def __init__(
+        self,
+        db_dir: Path,
+        write_coalesce_window: float = 0.002,
+        write_max_batch_size: int = 64,
+    ) -> None:
         db_path = db_dir / "anypod.db"
         db_url = f"sqlite+aiosqlite:///{db_path.resolve()}"
         # Simple setup for low-volume service
@@ -41,6 +56,16 @@ class SqlalchemyCore:
         self.async_session_maker = async_sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
+        # pysqlite only emits BEGIN before DML, which makes an outermost SAVEPOINT
+        # commit on release; take over transaction control so batched writes can
+        # nest one SAVEPOINT per operation inside a single transaction.
+        event.listen(self.engine.sync_engine, "connect", _disable_pysqlite_autobegin)
+        event.listen(self.engine.sync_engine, "begin", _emit_begin)
+        self._write_queue = WriteQueue(
+            self.async_session_maker,
+            coalesce_window=write_coalesce_window,
+            max_batch_size=write_max_batch_size,
+        )
 
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession]:
@@ -55,8 +80,24 @@ class SqlalchemyCore:
         async with self.async_session_maker() as session:
             yield session
 
+    async def write[T](self, operation: WriteOperation[T]) -> T:
+        """Execute a write operation through the single-writer queue.
+
+        The operation receives a session whose transaction is shared with other
+        writes in the same batch. It must not call ``commit``; raising rolls
+        back only this operation's changes.
+
+        Args:
+            operation: Coroutine function performing the write on the given session.
+
+        Returns:
+            The value returned by ``operation`` once its batch has committed.
+        """
+        return await self._write_queue.submit(operation)
+
     async def close(self) -> None:
-        """Close the database engine and all its connections."""
+        """Flush queued writes, then close the engine and all its connections."""
+        await self._write_queue.close()
         await self.engine.dispose()
 
     @staticmethod
@@ -104,6 +145,16 @@ class SqlalchemyCore:
                 )
 
 
+def _disable_pysqlite_autobegin(
+    dbapi_connection: sqlite3.Connection, _connection_record: ConnectionPoolEntry
+) -> None:
+    dbapi_connection.isolation_level = None
+
+
+def _emit_begin(conn: Connection) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
 @event.listens_for(Engine, "connect")
 def _(
     dbapi_connection: sqlite3.Connection, _connection_record: ConnectionPoolEntry
@@ -2,16 +2,26 @@
 
 from .app_state import AppState
 from .download import Download
+from .download_completion import DownloadCompletion
 from .download_status import DownloadStatus
 from .feed import Feed
+from .maintenance_result import MaintenanceResult
+from .prune_candidate import PruneCandidate
+from .remote_probe import RemoteProbe
 from .source_type import SourceType
+from .status_counter_mismatch import StatusCounterMismatch
 from .transcript_source import TranscriptSource
 
 __all__ = [
     "AppState",
     "Download",
+    "DownloadCompletion",
     "DownloadStatus",
     "Feed",
+    "MaintenanceResult",
+    "PruneCandidate",
+    "RemoteProbe",
     "SourceType",
+    "StatusCounterMismatch",
     "TranscriptSource",
 ]
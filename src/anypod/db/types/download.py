@@ -41,6 +41,9 @@ class Download(SQLModel, table=True):
             description: Optional description of the download.
             quality_info: Optional quality information for the download.
             playlist_index: Optional 1-based index of item within a multi-attachment post.
+            content_key: Optional fingerprint of the media and the yt-dlp
+                arguments it was downloaded with; downloads in different
+                feeds with the same key can share one file.
 
         Transcript Metadata:
             transcript_ext: File extension of the transcript (e.g., "vtt", "srt").
@@ -103,6 +106,7 @@ class Download(SQLModel, table=True):
     description: str | None = None
     quality_info: str | None = None
     playlist_index: int | None = None
+    content_key: str | None = None
 
     # Transcript metadata
     transcript_ext: str | None = None
@@ -132,10 +136,26 @@ class Download(SQLModel, table=True):
 
     feed: Feed = Relationship(back_populates="downloads")
 
-    # Composite indexes
+    # Composite indexes, plus partial indexes for the cross-feed work queues
     __table_args__ = (
-        Index("idx_feed_status", "feed_id", "status"),
+        Index("idx_feed_status_published", "feed_id", "status", text("published DESC")),
         Index("idx_feed_published", "feed_id", "published"),
+        Index("idx_download_content_key", "content_key"),
+        Index(
+            "idx_download_queued",
+            text("published DESC"),
+            sqlite_where=text("status = 'QUEUED'"),
+        ),
+        Index(
+            "idx_download_upcoming",
+            text("published DESC"),
+            sqlite_where=text("status = 'UPCOMING'"),
+        ),
+        Index(
+            "idx_download_error",
+            text("published DESC"),
+            sqlite_where=text("status = 'ERROR'"),
+        ),
     )
 
     # --- Class Helpers -----------------------------------------------------
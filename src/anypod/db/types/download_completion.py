@@ -0,0 +1,38 @@
+"""Artifact metadata recorded when a media download completes."""
+
+from dataclasses import dataclass
+
+from .transcript_source import TranscriptSource
+
+
+@dataclass(frozen=True, slots=True)
+class DownloadCompletion:
+    """Everything a finished media download writes back to its row.
+
+    Gathered by the downloader once the media file, thumbnail, and transcript
+    are on disk so the row can move to DOWNLOADED in a single statement.
+
+    Attributes:
+        ext: Extension of the final media file.
+        mime_type: MIME type of the final media file.
+        filesize: Size of the media file in bytes.
+        duration: Probed duration in seconds, or None to keep the stored value.
+        download_logs: Combined yt-dlp stdout/stderr output.
+        thumbnail_ext: Hosted thumbnail extension, or None if no thumbnail exists.
+        transcript_ext: Transcript file extension, or None to keep stored transcript fields.
+        transcript_lang: Transcript language code.
+        transcript_source: Origin of the transcript.
+        content_key: Fingerprint for sharing the media file across feeds, or
+            None to keep the stored value.
+    """
+
+    ext: str
+    mime_type: str
+    filesize: int
+    duration: int | None
+    download_logs: str
+    thumbnail_ext: str | None
+    transcript_ext: str | None = None
+    transcript_lang: str | None = None
+    transcript_source: TranscriptSource | None = None
+    content_key: str | None = None
@@ -16,10 +16,12 @@ from sqlalchemy import (
     TypeDecorator,
     text,
 )
+from sqlalchemy.orm import Mapped
 from sqlalchemy.sql.schema import FetchedValue
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship, SQLModel, col
 
 from ...config.types import PodcastCategories, PodcastType
+from .download_status import DownloadStatus
 from .source_type import SourceType
 from .timezone_aware_datetime import SQLITE_DATETIME_NOW, TimezoneAwareDatetime
 from .transcript_source import TranscriptSource
@@ -95,6 +97,11 @@ class Feed(SQLModel, table=True):
 
         Download Tracking:
             total_downloads: Total number of downloads for this feed.
+            upcoming_count: Number of UPCOMING downloads (trigger-maintained).
+            queued_count: Number of QUEUED downloads (trigger-maintained).
+            error_count: Number of ERROR downloads (trigger-maintained).
+            skipped_count: Number of SKIPPED downloads (trigger-maintained).
+            archived_count: Number of ARCHIVED downloads (trigger-maintained).
 
         Retention Policies:
             since: Only process downloads published after this date (UTC).
@@ -108,6 +115,10 @@ class Feed(SQLModel, table=True):
             author: Feed author.
             author_email: Feed author email.
             remote_image_url: URL to feed image.
+            image_ext: Extension of the hosted feed image, if one is stored.
+            image_etag: ETag of the directly downloaded feed image.
+            image_last_modified: Last-Modified of the directly downloaded feed image.
+            image_content_hash: SHA-256 of the directly downloaded image bytes.
             category: List of podcast categories.
             podcast_type: Podcast type.
             explicit: Explicit content flag.
@@ -182,6 +193,33 @@ class Feed(SQLModel, table=True):
         """Read-only property for total downloads."""
         return self.total_downloads_internal
 
+    # Maintained by SQLite triggers on the download table; never written by the app
+    upcoming_count: int = Field(
+        default=0,
+        exclude=True,
+        sa_column=Column(Integer, nullable=False, server_default="0"),
+    )
+    queued_count: int = Field(
+        default=0,
+        exclude=True,
+        sa_column=Column(Integer, nullable=False, server_default="0"),
+    )
+    error_count: int = Field(
+        default=0,
+        exclude=True,
+        sa_column=Column(Integer, nullable=False, server_default="0"),
+    )
+    skipped_count: int = Field(
+        default=0,
+        exclude=True,
+        sa_column=Column(Integer, nullable=False, server_default="0"),
+    )
+    archived_count: int = Field(
+        default=0,
+        exclude=True,
+        sa_column=Column(Integer, nullable=False, server_default="0"),
+    )
+
     # ------------------------------------------------ retention policies
     since: datetime | None = Field(
         default=None, sa_column=Column(TimezoneAwareDatetime)
@@ -204,6 +242,9 @@ class Feed(SQLModel, table=True):
     author_email: str = "notifications@thurstons.house"
     remote_image_url: str | None = None
     image_ext: str | None = None
+    image_etag: str | None = None
+    image_last_modified: str | None = None
+    image_content_hash: str | None = None
     category: PodcastCategories = Field(
         default_factory=lambda: PodcastCategories("TV & Film"),
         sa_column=Column(
@@ -248,3 +289,27 @@ class Feed(SQLModel, table=True):
         dump.pop("total_downloads", None)
         dump.pop("total_downloads_internal", None)
         return dump
+
+    @staticmethod
+    def status_count_column(status: DownloadStatus) -> Mapped[int]:
+        """Return the trigger-maintained counter column for a download status.
+
+        Args:
+            status: The download status to look up.
+
+        Returns:
+            The feed column holding the number of downloads in that status.
+        """
+        match status:
+            case DownloadStatus.UPCOMING:
+                return col(Feed.upcoming_count)
+            case DownloadStatus.QUEUED:
+                return col(Feed.queued_count)
+            case DownloadStatus.DOWNLOADED:
+                return col(Feed.total_downloads_internal)
+            case DownloadStatus.ERROR:
+                return col(Feed.error_count)
+            case DownloadStatus.SKIPPED:
+                return col(Feed.skipped_count)
+            case DownloadStatus.ARCHIVED:
+                return col(Feed.archived_count)
@@ -0,0 +1,30 @@
+"""Outcome of a scheduled database maintenance run."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True, slots=True)
+class MaintenanceResult:
+    """What a single :class:`DatabaseMaintenance` run accomplished.
+
+    Attributes:
+        pages_reclaimed: Free pages returned to the filesystem by vacuuming.
+        checkpoint_complete: Whether the WAL was fully checkpointed and truncated.
+        backup_path: Snapshot written during this run, or None if backups are off.
+        probes_deleted: Cached remote probes dropped with their downloads.
+    """
+
+    pages_reclaimed: int
+    checkpoint_complete: bool
+    backup_path: Path | None
+    probes_deleted: int = 0
+
+    def summary_dict(self) -> dict[str, int | bool | str | None]:
+        """Return a dictionary summary suitable for logging."""
+        return {
+            "pages_reclaimed": self.pages_reclaimed,
+            "checkpoint_complete": self.checkpoint_complete,
+            "backup_path": str(self.backup_path) if self.backup_path else None,
+            "probes_deleted": self.probes_deleted,
+        }
@@ -0,0 +1,32 @@
+"""Key columns locating a download's files on disk."""
+
+from dataclasses import dataclass
+
+from .download_status import DownloadStatus
+
+
+@dataclass(frozen=True, slots=True)
+class PruneCandidate:
+    """The columns the pruner needs to delete a download's files and archive it.
+
+    Prune queries and the orphan file sweep load these instead of full
+    ``Download`` rows so that large result sets do not load descriptions,
+    logs and other metadata.
+
+    Attributes:
+        feed_id: The feed the download belongs to.
+        id: The download identifier.
+        status: Current status; only DOWNLOADED items have files to delete.
+        ext: Extension of the media file.
+        thumbnail_ext: Hosted thumbnail extension, or None if there is none.
+        transcript_lang: Transcript language code, or None.
+        transcript_ext: Transcript file extension, or None.
+    """
+
+    feed_id: str
+    id: str
+    status: DownloadStatus
+    ext: str
+    thumbnail_ext: str | None = None
+    transcript_lang: str | None = None
+    transcript_ext: str | None = None
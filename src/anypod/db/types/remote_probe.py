@@ -0,0 +1,32 @@
+# pyright: reportUnknownVariableType=false, reportUnknownMemberType=false
+# TODO: drop once SQLModel ships Field(Column[Any]) fix (fastapi/sqlmodel#797)
+
+"""Cached durations of remotely probed media."""
+
+from datetime import datetime
+
+from sqlalchemy import Column
+from sqlmodel import Field, SQLModel
+
+from .timezone_aware_datetime import TimezoneAwareDatetime
+
+
+class RemoteProbe(SQLModel, table=True):
+    """ORM model caching the duration probed from a remote media URL.
+
+    Rows are written before the download itself exists, so there is no
+    foreign key to the download table.
+
+    Attributes:
+        feed_id: The feed identifier.
+        download_id: The download identifier.
+        media_fingerprint: Stable fingerprint of the probed media URL.
+        duration: Probed duration in seconds.
+        probed_at: When the media was probed (UTC).
+    """
+
+    feed_id: str = Field(primary_key=True)
+    download_id: str = Field(primary_key=True)
+    media_fingerprint: str
+    duration: int = Field(gt=0)
+    probed_at: datetime = Field(sa_column=Column(TimezoneAwareDatetime, nullable=False))
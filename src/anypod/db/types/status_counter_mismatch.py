@@ -0,0 +1,22 @@
+"""Discrepancy between a feed's stored status counter and its downloads."""
+
+from dataclasses import dataclass
+
+from .download_status import DownloadStatus
+
+
+@dataclass(frozen=True, slots=True)
+class StatusCounterMismatch:
+    """A feed counter that disagrees with a recount of the download table.
+
+    Attributes:
+        feed_id: The feed whose counter drifted.
+        status: The download status the counter tracks.
+        stored: Value currently stored on the feed row.
+        actual: Number of downloads in that status.
+    """
+
+    feed_id: str
+    status: DownloadStatus
+    stored: int
+    actual: int
@@ -0,0 +1,243 @@
+"""Single-writer queue that group-commits database write operations.
+
+SQLite only supports one writer at a time, so every mutation issued by the
+database layers is funneled through a single background task. Operations that
+arrive within a short coalescing window share one transaction and one commit,
+while each operation runs inside its own SAVEPOINT so a failure only rolls back
+that caller's changes.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+type WriteOperation[T] = Callable[[AsyncSession], Awaitable[T]]
+
+
+@dataclass(frozen=True)
+class _PendingWrite:
+    """A write operation waiting for the writer task.
+
+    Attributes:
+        operation: Coroutine function executed against the shared session.
+        future: Future resolved with the operation's result or error.
+    """
+
+    operation: WriteOperation[Any]
+    future: asyncio.Future[Any]
+
+
+def _drain(queue: asyncio.Queue[_PendingWrite | None]) -> list[_PendingWrite]:
+    """Remove and return every write still waiting in a queue.
+
+    Args:
+        queue: The queue to empty.
+
+    Returns:
+        The queued writes, without stop sentinels.
+    """
+    pending: list[_PendingWrite] = []
+    while not queue.empty():
+        item = queue.get_nowait()
+        if item is not None:
+            pending.append(item)
+    return pending
+
+
+def _fail_unresolved(pending: Iterable[_PendingWrite], error: BaseException) -> None:
+    """Resolve the futures of writes that did not complete with an error.
+
+    Cancellation is propagated by cancelling the futures, since a
+    CancelledError cannot be set as a future's exception.
+
+    Args:
+        pending: The writes whose callers are still waiting.
+        error: The error that stopped them.
+    """
+    for write in pending:
+        if write.future.done():
+            continue
+        if isinstance(error, asyncio.CancelledError):
+            write.future.cancel()
+        else:
+            write.future.set_exception(error)
+
+
+class WriteQueue:
+    """Serialize database writes through one task and commit them in groups.
+
+    Callers submit an operation that receives an :class:`AsyncSession`. The
+    operation must not commit; the queue commits once per batch and then
+    resolves each caller's future with its own result or exception.
+
+    The writer task is started lazily on the first submission so the queue
+    binds to whichever event loop is running at that time.
+
+    Attributes:
+        _session_maker: Factory for the session shared by a batch.
+        _coalesce_window: Seconds to wait for additional writes after the first.
+        _max_batch_size: Upper bound on operations committed together.
+        _queue: Pending operations, or None before the writer starts.
+        _task: The running writer task, if any.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        coalesce_window: float = 0.002,
+        max_batch_size: int = 64,
+    ) -> None:
+        self._session_maker = session_maker
+        self._coalesce_window = coalesce_window
+        self._max_batch_size = max_batch_size
+        self._queue: asyncio.Queue[_PendingWrite | None] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def _ensure_started(self) -> asyncio.Queue[_PendingWrite | None]:
+        """Start the writer task if it is not already running.
+
+        Returns:
+            The queue feeding the running writer task.
+        """
+        if self._queue is None or self._task is None or self._task.done():
+            if self._queue is not None:
+                # A writer cancelled before it first ran never drained its queue
+                _fail_unresolved(_drain(self._queue), asyncio.CancelledError())
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(self._queue))
+        return self._queue
+
+    async def submit[T](self, operation: WriteOperation[T]) -> T:
+        """Queue a write operation and wait for its batch to commit.
+
+        If the caller is cancelled before the writer picks up the operation it
+        is skipped; once executing, it is committed with the rest of its batch.
+
+        Args:
+            operation: Coroutine function performing the write on the given session.
+
+        Returns:
+            The value returned by ``operation``.
+
+        Raises:
+            Exception: Whatever ``operation`` raised, or the error raised while
+                committing its batch.
+            asyncio.CancelledError: If the writer task was cancelled before the
+                batch committed.
+        """
+        queue = self._ensure_started()
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        queue.put_nowait(_PendingWrite(operation=operation, future=future))
+        return await future
+
+    async def _collect_batch(
+        self, queue: asyncio.Queue[_PendingWrite | None], first: _PendingWrite
+    ) -> tuple[list[_PendingWrite], bool]:
+        """Gather writes that arrive within the coalescing window.
+
+        Args:
+            queue: The queue to drain.
+            first: The write that opened this batch.
+
+        Returns:
+            Tuple of (batch, stop_requested).
+        """
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._coalesce_window
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - loop.time()
+            try:
+                if remaining > 0:
+                    item = await asyncio.wait_for(queue.get(), remaining)
+                else:
+                    item = queue.get_nowait()
+            except TimeoutError, asyncio.QueueEmpty:
+                break
+            except BaseException as e:
+                _fail_unresolved(batch, e)
+                raise
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _commit_batch(self, batch: list[_PendingWrite]) -> None:
+        """Run a batch of writes in one transaction and resolve their futures.
+
+        Args:
+            batch: The writes to execute together.
+        """
+        results: list[tuple[_PendingWrite, Any]] = []
+        try:
+            async with self._session_maker() as session:
+                for pending in batch:
+                    if pending.future.done():
+                        continue
+                    try:
+                        async with session.begin_nested():
+                            result = await pending.operation(session)
+                    except Exception as e:  # surfaced to the submitting caller
+                        if not pending.future.done():
+                            pending.future.set_exception(e)
+                        continue
+                    results.append((pending, result))
+                await session.commit()
+        except Exception as e:
+            logger.error(
+                "Failed to commit batched database writes.",
+                extra={"batch_size": len(batch)},
+                exc_info=e,
+            )
+            _fail_unresolved(batch, e)
+            return
+        except BaseException as e:
+            # Cancellation must not leave the batch's callers waiting forever
+            _fail_unresolved(batch, e)
+            raise
+
+        for pending, result in results:
+            if not pending.future.done():
+                pending.future.set_result(result)
+        logger.debug(
+            "Committed batched database writes.",
+            extra={"batch_size": len(batch), "committed": len(results)},
+        )
+
+    async def _run(self, queue: asyncio.Queue[_PendingWrite | None]) -> None:
+        """Consume the queue until a stop sentinel is received.
+
+        Args:
+            queue: The queue this writer task owns.
+        """
+        stop_requested = False
+        try:
+            while not stop_requested:
+                first = await queue.get()
+                if first is None:
+                    break
+                batch, stop_requested = await self._collect_batch(queue, first)
+                await self._commit_batch(batch)
+        except BaseException as e:
+            _fail_unresolved(_drain(queue), e)
+            raise
+
+        # Writes submitted while the stop sentinel was in flight still get committed
+        leftovers = _drain(queue)
+        if leftovers:
+            await self._commit_batch(leftovers)
+
+    async def close(self) -> None:
+        """Flush pending writes and stop the writer task."""
+        if self._queue is None or self._task is None or self._task.done():
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+        self._queue = None
@@ -0,0 +1,152 @@
+"""Admission control for media downloads based on free disk space.
+
+yt-dlp writes partial files into the data volume as it downloads, so a
+download started on a nearly full disk fails only after it has used up the
+remaining space, at which point serving and the database suffer too.
+:class:`DiskSpaceGuard` checks free space before each media download, sets
+aside the download's expected size while it runs so that concurrent
+downloads do not all claim the same headroom, and refuses new downloads
+while the free space would drop below a watermark.
+"""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+import logging
+import os
+from pathlib import Path
+
+from .db.types import Download
+from .metrics.instruments import DISK_FREE_BYTES, DISK_RESERVED_BYTES
+
+logger = logging.getLogger(__name__)
+
+# Handlers store 0, or a placeholder of 1, when the size is not known upfront
+_UNKNOWN_FILESIZE_MAX = 1
+
+
+class DiskSpaceGuard:
+    """Reserve disk space for downloads and report low-space mode.
+
+    Attributes:
+        _path: Directory on the data volume to check with ``statvfs``.
+        _min_free_bytes: Free space that must remain after a download.
+        _default_estimate: Size assumed for downloads of unknown size.
+        _reserved_bytes: Space set aside for downloads in progress.
+        _low_space: Whether the last check refused a download.
+    """
+
+    def __init__(self, path: Path, min_free_bytes: int, default_estimate: int):
+        self._path = path
+        self._min_free_bytes = min_free_bytes
+        self._default_estimate = default_estimate
+        self._reserved_bytes = 0
+        self._low_space = False
+        logger.debug(
+            "DiskSpaceGuard initialized.",
+            extra={
+                "path": str(path),
+                "min_free_bytes": min_free_bytes,
+                "default_estimate": default_estimate,
+            },
+        )
+
+    @property
+    def low_space(self) -> bool:
+        """Whether the last admission check deferred a download for lack of space."""
+        return self._low_space
+
+    @property
+    def reserved_bytes(self) -> int:
+        """Space set aside for downloads in progress."""
+        return self._reserved_bytes
+
+    def free_bytes(self) -> int | None:
+        """Return the space available to unprivileged writers on the volume.
+
+        Returns:
+            Free bytes, or None if the volume cannot be inspected.
+        """
+        try:
+            stats = os.statvfs(self._path)
+        except OSError as e:
+            logger.warning(
+                "Failed to read free disk space.",
+                extra={"path": str(self._path)},
+                exc_info=e,
+            )
+            return None
+        free = stats.f_bavail * stats.f_frsize
+        DISK_FREE_BYTES.set(free)
+        return free
+
+    def is_low_on_space(self) -> bool:
+        """Check the volume now for free space below the watermark.
+
+        Unlike ``low_space``, which only changes when a download asks for
+        admission, this reads the free space again and subtracts the space
+        reserved by downloads in progress.
+
+        Returns:
+            Whether less than the watermark is left; False if the volume
+            cannot be inspected.
+        """
+        free = self.free_bytes()
+        return free is not None and free - self._reserved_bytes < self._min_free_bytes
+
+    def estimate_size(self, download: Download) -> int:
+        """Return the space a download is expected to need.
+
+        Args:
+            download: The queued download.
+
+        Returns:
+            The reported file size, or the default estimate if it is unknown.
+        """
+        if download.filesize > _UNKNOWN_FILESIZE_MAX:
+            return download.filesize
+        return self._default_estimate
+
+    @contextmanager
+    def reserve(self, download: Download) -> Generator[bool]:
+        """Set aside space for a download while it runs.
+
+        Yields False, reserving nothing, when the download would leave less
+        than the watermark free after accounting for downloads already in
+        progress. If free space cannot be determined the download is admitted.
+
+        Args:
+            download: The queued download.
+
+        Yields:
+            Whether the download may start.
+        """
+        estimate = self.estimate_size(download)
+        free = self.free_bytes()
+        if (
+            free is not None
+            and free - self._reserved_bytes - estimate < self._min_free_bytes
+        ):
+            if not self._low_space:
+                logger.warning(
+                    "Disk space low; deferring downloads.",
+                    extra={
+                        "free_bytes": free,
+                        "reserved_bytes": self._reserved_bytes,
+                        "estimated_bytes": estimate,
+                        "min_free_bytes": self._min_free_bytes,
+                    },
+                )
+            self._low_space = True
+            yield False
+            return
+
+        if self._low_space:
+            logger.info("Disk space recovered; resuming downloads.")
+        self._low_space = False
+        self._reserved_bytes += estimate
+        DISK_RESERVED_BYTES.set(self._reserved_bytes)
+        try:
+            yield True
+        finally:
+            self._reserved_bytes -= estimate
+            DISK_RESERVED_BYTES.set(self._reserved_bytes)
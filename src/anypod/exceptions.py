@@ -345,6 +345,18 @@ class ImageDownloadError(AnypodError):
         self.url = url
 
 
+class ImageProcessingError(AnypodError):
+    """Raised when an image cannot be identified, converted or resized.
+
+    Attributes:
+        path: The image file associated with the error.
+    """
+
+    def __init__(self, message: str, path: str | None = None):
+        super().__init__(message)
+        self.path = path
+
+
 class SchedulerError(AnypodError):
     """Base class for scheduler-related errors.
 
@@ -3,49 +3,71 @@
 Currently used to convert arbitrary images to JPG using MJPEG encoder.
 """
 
-import asyncio
 from pathlib import Path
 
 from .exceptions import FFmpegError
+from .subprocess_runner import SubprocessOperation, SubprocessRunner
 
 
 class FFmpeg:
     """Run ffmpeg commands for media processing.
 
     Provides minimal helpers for specific conversions needed by the codebase.
+
+    Attributes:
+        _runner: Runner bounding each ffmpeg invocation.
     """
 
+    def __init__(self, runner: SubprocessRunner | None = None) -> None:
+        self._runner = runner or SubprocessRunner()
+
     async def _run(self, *args: str) -> tuple[int, bytes, bytes]:
         try:
-            process = await asyncio.create_subprocess_exec(
-                "ffmpeg",
-                *args,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            result = await self._runner.run(
+                SubprocessOperation.FFMPEG, ["ffmpeg", *args]
             )
         except FileNotFoundError as e:
             raise FFmpegError("ffmpeg executable not found") from e
+        except TimeoutError as e:
+            raise FFmpegError("ffmpeg timed out and was stopped") from e
         except OSError as e:
             raise FFmpegError("Failed to execute ffmpeg") from e
 
-        try:
-            stdout, stderr = await process.communicate()
-        except asyncio.CancelledError:
-            # Ensure subprocess cleanup on cancellation
-            process.kill()
-            raise
+        return result.returncode, result.stdout, result.stderr
 
-        return process.returncode or 0, stdout or b"", stderr or b""
-
-    async def convert_image_to_jpg(self, input_path: Path, output_path: Path) -> None:
+    async def convert_image_to_jpg(
+        self,
+        input_path: Path,
+        output_path: Path,
+        max_dimension: int | None = None,
+        max_width: int | None = None,
+    ) -> None:
         """Convert an image file to a JPG using ffmpeg (MJPEG).
 
+        Args:
+            input_path: Image to convert.
+            output_path: Destination of the JPG.
+            max_dimension: If given, scale the image down so neither side
+                exceeds this many pixels, preserving the aspect ratio.
+            max_width: If given, scale the image down to at most this many
+                pixels wide, preserving the aspect ratio.
+
         Raises:
             FFmpegError: When conversion fails.
         """
+        scale: list[str] = []
+        if max_dimension is not None:
+            scale = [
+                "-vf",
+                f"scale='min(iw,{max_dimension})':'min(ih,{max_dimension})'"
+                ":force_original_aspect_ratio=decrease",
+            ]
+        elif max_width is not None:
+            scale = ["-vf", f"scale='min(iw,{max_width})':-2"]
         rc, _, stderr = await self._run(
             "-i",
             str(input_path),
+            *scale,
             "-f",
             "mjpeg",
             "-y",
@@ -2,18 +2,147 @@
 
 Provides centralized helpers for:
 - Determining if an image file is JPG (MJPEG) using local file paths
+- Probing local media files in a single pass (duration, bitrate, streams,
+  chapters)
 - Extracting media duration (in seconds) from local files or remote URLs
 
 All methods are implemented using asyncio subprocess execution to avoid
 blocking the event loop.
 """
 
-import asyncio
+from dataclasses import dataclass
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from .exceptions import FFProbeError
+from .subprocess_runner import SubprocessOperation, SubprocessRunner
+
+
+@dataclass(frozen=True, slots=True)
+class MediaStream:
+    """One stream of a probed media file.
+
+    Attributes:
+        index: Stream index within the container.
+        codec_type: Stream kind (``audio``, ``video``, ``subtitle``, ...).
+        codec_name: Codec short name, e.g. ``aac`` or ``h264``.
+        bit_rate: Stream bitrate in bits per second, if reported.
+        channels: Audio channel count, if an audio stream.
+        sample_rate: Audio sample rate in Hz, if an audio stream.
+        width: Frame width in pixels, if a video stream.
+        height: Frame height in pixels, if a video stream.
+    """
+
+    index: int
+    codec_type: str | None
+    codec_name: str | None
+    bit_rate: int | None = None
+    channels: int | None = None
+    sample_rate: int | None = None
+    width: int | None = None
+    height: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class MediaChapter:
+    """A chapter marker of a probed media file.
+
+    Attributes:
+        start: Chapter start in seconds.
+        end: Chapter end in seconds.
+        title: Chapter title, if present.
+    """
+
+    start: float
+    end: float
+    title: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class MediaProbe:
+    """Structured result of probing a media file.
+
+    Attributes:
+        duration: Container duration in seconds, if reported.
+        bit_rate: Overall bitrate in bits per second, if reported.
+        format_name: Container format name(s) as reported by ffprobe.
+        streams: Streams in container order.
+        chapters: Chapter markers in order.
+    """
+
+    duration: float | None
+    bit_rate: int | None
+    format_name: str | None
+    streams: tuple[MediaStream, ...] = ()
+    chapters: tuple[MediaChapter, ...] = ()
+
+    @property
+    def duration_seconds(self) -> int:
+        """Return the duration truncated to whole seconds, 0 if unknown."""
+        return int(self.duration) if self.duration is not None else 0
+
+    @property
+    def has_video(self) -> bool:
+        """Return whether any stream is video (cover art excluded)."""
+        return any(
+            stream.codec_type == "video" and stream.codec_name != "mjpeg"
+            for stream in self.streams
+        )
+
+    @classmethod
+    def from_ffprobe_json(cls, data: dict[str, Any]) -> MediaProbe:
+        """Build a probe result from ``ffprobe -print_format json`` output.
+
+        Args:
+            data: Parsed JSON with ``format``, ``streams`` and ``chapters``.
+
+        Returns:
+            MediaProbe with every field ffprobe reported.
+        """
+        fmt: dict[str, Any] = data.get("format") or {}
+        stream_data: list[dict[str, Any]] = data.get("streams") or []
+        chapter_data: list[dict[str, Any]] = data.get("chapters") or []
+        streams = tuple(
+            MediaStream(
+                index=_as_int(stream.get("index")) or 0,
+                codec_type=stream.get("codec_type"),
+                codec_name=stream.get("codec_name"),
+                bit_rate=_as_int(stream.get("bit_rate")),
+                channels=_as_int(stream.get("channels")),
+                sample_rate=_as_int(stream.get("sample_rate")),
+                width=_as_int(stream.get("width")),
+                height=_as_int(stream.get("height")),
+            )
+            for stream in stream_data
+        )
+        chapters = tuple(
+            MediaChapter(
+                start=_as_float(chapter.get("start_time")) or 0.0,
+                end=_as_float(chapter.get("end_time")) or 0.0,
+                title=cast(dict[str, Any], chapter.get("tags") or {}).get("title"),
+            )
+            for chapter in chapter_data
+        )
+        return cls(
+            duration=_as_float(fmt.get("duration")),
+            bit_rate=_as_int(fmt.get("bit_rate")),
+            format_name=fmt.get("format_name"),
+            streams=streams,
+            chapters=chapters,
+        )
+
+
+def _as_float(value: Any) -> float | None:
+    try:
+        return float(value)
+    except TypeError, ValueError:
+        return None
+
+
+def _as_int(value: Any) -> int | None:
+    number = _as_float(value)
+    return int(number) if number is not None else None
 
 
 class FFProbe:
@@ -22,8 +151,14 @@ class FFProbe:
     This class provides minimal, focused helpers that wrap common ffprobe
     invocations used throughout the codebase. It does not attempt to be an
     exhaustive interface to ffprobe.
+
+    Attributes:
+        _runner: Runner bounding each ffprobe invocation.
     """
 
+    def __init__(self, runner: SubprocessRunner | None = None) -> None:
+        self._runner = runner or SubprocessRunner()
+
     async def _run(self, *args: str) -> tuple[int, bytes, bytes]:
         """Execute ffprobe with the given arguments.
 
@@ -34,29 +169,21 @@ class FFProbe:
             Tuple of (returncode, stdout, stderr).
 
         Raises:
-            FileNotFoundError: When ffprobe is not installed/available in PATH.
-            OSError: When the subprocess fails to execute.
+            FFProbeError: When ffprobe is not installed, fails to execute, or
+                exceeds its timeout.
         """
         try:
-            process = await asyncio.create_subprocess_exec(
-                "ffprobe",
-                *args,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
+            result = await self._runner.run(
+                SubprocessOperation.FFPROBE, ["ffprobe", *args]
             )
         except FileNotFoundError as e:
             raise FFProbeError("ffprobe executable not found") from e
+        except TimeoutError as e:
+            raise FFProbeError("ffprobe timed out and was stopped") from e
         except OSError as e:
             raise FFProbeError("Failed to execute ffprobe") from e
 
-        try:
-            stdout, stderr = await process.communicate()
-        except asyncio.CancelledError:
-            # Ensure subprocess cleanup on cancellation
-            process.kill()
-            raise
-
-        return process.returncode or 0, stdout or b"", stderr or b""
+        return result.returncode, result.stdout, result.stderr
 
     async def is_jpg_file(self, file_path: Path) -> bool:
         """Return True if the file's first stream is MJPEG (JPG).
@@ -149,9 +276,51 @@ class FFProbe:
         except ValueError as e:
             raise FFProbeError("Failed to parse duration output", stderr=text) from e
 
+    async def probe(self, file_path: Path) -> MediaProbe:
+        """Probe a local media file for format, streams and chapters.
+
+        A single ffprobe run gathers everything.
+
+        Args:
+            file_path: Local filesystem path to a media file.
+
+        Returns:
+            MediaProbe describing the file.
+
+        Raises:
+            FFProbeError: When ffprobe fails or its output cannot be parsed.
+        """
+        rc, stdout, stderr = await self._run(
+            "-v",
+            "error",
+            "-print_format",
+            "json",
+            "-show_format",
+            "-show_streams",
+            "-show_chapters",
+            str(file_path),
+        )
+        if rc != 0:
+            raise FFProbeError(
+                "ffprobe failed (probe)",
+                stderr=stderr.decode() if stderr else None,
+            )
+        try:
+            data: dict[str, Any] = json.loads(stdout.decode())
+        except json.JSONDecodeError as e:
+            raise FFProbeError(
+                "Failed to parse ffprobe JSON output (probe)",
+                stderr=stdout.decode(),
+            ) from e
+
+        return MediaProbe.from_ffprobe_json(data)
+
     async def get_duration_seconds_from_file(self, file_path: Path) -> int:
         """Return media duration in seconds from a local file; raises on failure."""
-        return await self._duration_seconds(str(file_path), headers=None)
+        result = await self.probe(file_path)
+        if result.duration is None:
+            raise FFProbeError("ffprobe returned empty duration output")
+        return result.duration_seconds
 
     async def get_duration_seconds_from_url(
         self, url: str, headers: dict[str, str] | None = None
@@ -6,6 +6,7 @@ operations. Notably does not handle file creation, as that is done by yt-dlp.
 """
 
 from collections.abc import AsyncIterator
+from contextlib import suppress
 import logging
 from pathlib import Path
 
@@ -36,14 +37,21 @@ class FileManager:
             extra={"base_download_path": str(self._paths.base_data_dir)},
         )
 
-    async def delete_download_file(self, feed: str, download_id: str, ext: str) -> None:
+    async def delete_download_file(self, feed: str, download_id: str, ext: str) -> bool:
         """Deletes a download file from the filesystem.
 
+        Media shared with other feeds is stored as hardlinks, so the data is
+        only released once the last link is removed.
+
         Args:
             feed: The name of the feed.
             download_id: The unique identifier for the download.
             ext: File extension without the leading dot.
 
+        Returns:
+            True if this was the last link to the data and its space was
+            freed, False if other feeds still reference the file.
+
         Raises:
             FileNotFoundError: If the file does not exist or is not a regular file.
             FileOperationError: If an OS-level error occurs during file deletion, or if feed/download identifiers are invalid.
@@ -64,15 +72,143 @@ class FileManager:
 
         if not await aiofiles.os.path.isfile(file_path):
             raise FileNotFoundError(f"Download file not found: {file_path}")
-        else:
-            try:
-                await aiofiles.os.remove(file_path)
-                logger.debug("File unlinked successfully.", extra=log_params)
-            except OSError as e:
-                raise FileOperationError(
-                    "Failed to delete download file.",
-                    file_name=f"{download_id}.{ext}",
-                ) from e
+        try:
+            link_count = (await aiofiles.os.stat(file_path)).st_nlink
+            await aiofiles.os.remove(file_path)
+        except OSError as e:
+            raise FileOperationError(
+                "Failed to delete download file.",
+                file_name=f"{download_id}.{ext}",
+            ) from e
+        logger.debug(
+            "File unlinked successfully.",
+            extra={**log_params, "remaining_links": link_count - 1},
+        )
+        return link_count <= 1
+
+    async def _link_file(self, source: Path, dest: Path) -> None:
+        """Make ``dest`` a hardlink of ``source``, replacing any existing file.
+
+        The link is created under a temporary name and renamed into place so
+        readers of ``dest`` never see a missing or partial file.
+
+        Raises:
+            FileNotFoundError: If ``source`` does not exist.
+            FileOperationError: If the link cannot be created, e.g. because
+                the paths are on different filesystems.
+        """
+        tmp_path = dest.with_name(f".{dest.name}.link")
+        try:
+            # Clear a link left behind by an interrupted earlier attempt
+            with suppress(FileNotFoundError):
+                await aiofiles.os.remove(tmp_path)
+            await aiofiles.os.link(source, tmp_path)
+        except FileNotFoundError:
+            raise
+        except OSError as e:
+            raise FileOperationError("Failed to link file.", file_name=str(dest)) from e
+        try:
+            await aiofiles.os.replace(tmp_path, dest)
+        except OSError as e:
+            with suppress(OSError):
+                await aiofiles.os.remove(tmp_path)
+            raise FileOperationError(
+                "Failed to move linked file into place.", file_name=str(dest)
+            ) from e
+        logger.debug(
+            "File linked.", extra={"source_path": str(source), "file_path": str(dest)}
+        )
+
+    async def link_download_file(
+        self, source_feed: str, target_feed: str, download_id: str, ext: str
+    ) -> None:
+        """Share a download file stored for one feed with another feed.
+
+        Args:
+            source_feed: Feed that already stores the file.
+            target_feed: Feed that should reference the same file.
+            download_id: The unique identifier for the download.
+            ext: File extension without the leading dot.
+
+        Raises:
+            FileNotFoundError: If the source file does not exist.
+            FileOperationError: If the link cannot be created or the
+                identifiers are invalid.
+        """
+        try:
+            source = await self._paths.media_file_path(source_feed, download_id, ext)
+            dest = await self._paths.media_file_path(target_feed, download_id, ext)
+        except ValueError as e:
+            raise FileOperationError(
+                "Invalid feed or download identifier.",
+                feed_id=target_feed,
+                download_id=download_id,
+            ) from e
+        await self._link_file(source, dest)
+
+    async def link_image(
+        self, source_feed: str, target_feed: str, download_id: str, ext: str
+    ) -> None:
+        """Share a download's image stored for one feed with another feed.
+
+        Args:
+            source_feed: Feed that already stores the image.
+            target_feed: Feed that should reference the same image.
+            download_id: The unique identifier for the download.
+            ext: File extension without the leading dot.
+
+        Raises:
+            FileNotFoundError: If the source image does not exist.
+            FileOperationError: If the link cannot be created or the
+                identifiers are invalid.
+        """
+        try:
+            source = await self._paths.image_path(source_feed, download_id, ext)
+            dest = await self._paths.image_path(target_feed, download_id, ext)
+        except ValueError as e:
+            raise FileOperationError(
+                "Invalid feed or download identifier.",
+                feed_id=target_feed,
+                download_id=download_id,
+            ) from e
+        await self._link_file(source, dest)
+
+    async def link_transcript(
+        self,
+        source_feed: str,
+        target_feed: str,
+        download_id: str,
+        lang: str,
+        ext: str,
+    ) -> None:
+        """Share a transcript stored for one feed with another feed.
+
+        Args:
+            source_feed: Feed that already stores the transcript.
+            target_feed: Feed that should reference the same transcript.
+            download_id: The unique identifier for the download.
+            lang: Language code (e.g., "en").
+            ext: File extension without the leading dot (e.g., "vtt").
+
+        Raises:
+            FileNotFoundError: If the source transcript does not exist.
+            FileOperationError: If the link cannot be created or the
+                identifiers are invalid.
+        """
+        try:
+            source = await self._paths.transcript_path(
+                source_feed, download_id, lang, ext
+            )
+            dest = await self._paths.transcript_path(
+                target_feed, download_id, lang, ext
+            )
+        except ValueError as e:
+            raise FileOperationError(
+                "Invalid feed or download identifier.",
+                feed_id=target_feed,
+                download_id=download_id,
+            ) from e
+        await self._link_file(source, dest)
 
     async def get_download_file_path(
         self, feed: str, download_id: str, ext: str
@@ -0,0 +1,67 @@
+"""Application-wide HTTP client for outbound requests (feed artwork).
+
+A single :class:`httpx.AsyncClient` is created at startup and shared, so
+connections to the same image hosts are kept alive and reused instead of
+paying a TCP and TLS handshake for every request. HTTP/2 is negotiated when
+the optional ``h2`` package is installed (``httpx[http2]``).
+"""
+
+from importlib.util import find_spec
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 30.0
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 10.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+
+def http2_available() -> bool:
+    """Return whether the optional HTTP/2 dependency is installed."""
+    return find_spec("h2") is not None
+
+
+def create_http_client(
+    timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> httpx.AsyncClient:
+    """Create the shared, pooled HTTP client.
+
+    The caller owns the client and must close it with ``aclose()``.
+
+    Args:
+        timeout: Read, write and pool timeout in seconds. Connecting is capped
+            at the smaller of this and 10 seconds.
+        max_connections: Maximum number of open connections across all hosts.
+
+    Returns:
+        Configured AsyncClient that follows redirects.
+    """
+    http2 = http2_available()
+    client = httpx.AsyncClient(
+        http2=http2,
+        follow_redirects=True,
+        timeout=httpx.Timeout(
+            timeout, connect=min(timeout, DEFAULT_CONNECT_TIMEOUT_SECONDS)
+        ),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(
+                max_connections, DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    logger.debug(
+        "HTTP client created.",
+        extra={
+            "http2": http2,
+            "timeout_seconds": timeout,
+            "max_connections": max_connections,
+        },
+    )
+    return client
@@ -0,0 +1,198 @@
+"""On-demand resized copies of hosted artwork with an LRU disk budget.
+
+Episode thumbnails are often 1280x720 or larger, yet most clients only show
+them as small tiles in an episode list. Resized copies are generated the
+first time a width is requested (``/images/...jpg?w=300``), stored under the
+image cache directory and evicted least-recently-used once the cache exceeds
+its byte budget.
+"""
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+import aiofiles.os
+
+from .exceptions import ImageProcessingError
+from .image_pipeline import ImagePipeline
+from .path_manager import PathManager
+
+logger = logging.getLogger(__name__)
+
+# RSS 2.0 caps the channel <image> width at 144 pixels
+RSS_CHANNEL_IMAGE_WIDTH = 144
+DERIVATIVE_WIDTHS = (RSS_CHANNEL_IMAGE_WIDTH, 300, 600, 1000)
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _scan_cache_dir(cache_dir: Path) -> list[tuple[Path, int]]:
+    """List cached derivatives oldest first; runs in a worker thread."""
+    try:
+        entries = [
+            (Path(entry.path), entry.stat())
+            for entry in os.scandir(cache_dir)
+            if entry.is_file() and entry.name.endswith(".jpg")
+        ]
+    except FileNotFoundError:
+        return []
+    entries.sort(key=lambda item: item[1].st_mtime_ns)
+    return [(path, stat.st_size) for path, stat in entries]
+
+
+class ImageDerivativeCache:
+    """Generate, cache and evict resized JPG copies of hosted images.
+
+    Requested widths are snapped up to the nearest supported width so the
+    number of distinct derivatives per image stays bounded. Derivatives are
+    keyed by the source path, size and modification time, so replacing an
+    image makes its old derivatives unreachable; they age out of the LRU.
+
+    Attributes:
+        _cache_dir: Directory holding the derivative files.
+        _pipeline: Image pipeline used to resize images.
+        _max_bytes: Byte budget for all derivatives combined.
+        _widths: Supported derivative widths in ascending order.
+        _entries: Derivative sizes in least- to most-recently-used order.
+        _total_bytes: Sum of the sizes in ``_entries``.
+        _loaded: Whether ``_entries`` has been populated from disk.
+        _pending: In-flight generations keyed by destination path.
+    """
+
+    def __init__(
+        self,
+        paths: PathManager,
+        pipeline: ImagePipeline,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        widths: tuple[int, ...] = DERIVATIVE_WIDTHS,
+    ) -> None:
+        self._cache_dir = paths.base_image_cache_dir
+        self._pipeline = pipeline
+        self._max_bytes = max_bytes
+        self._widths = tuple(sorted(widths))
+        self._entries: OrderedDict[Path, int] = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._pending: dict[Path, asyncio.Task[Path]] = {}
+        logger.debug(
+            "ImageDerivativeCache initialized.",
+            extra={"cache_dir": str(self._cache_dir), "max_bytes": max_bytes},
+        )
+
+    def snap_width(self, width: int) -> int | None:
+        """Return the smallest supported width at least ``width`` wide.
+
+        Args:
+            width: Requested width in pixels.
+
+        Returns:
+            The supported width to serve, or None if the request is wider
+            than every derivative and the original should be served.
+        """
+        return next((w for w in self._widths if w >= width), None)
+
+    async def get(self, source: Path, width: int) -> Path:
+        """Return the path of ``source`` resized to (a snapped) ``width``.
+
+        Args:
+            source: Stored JPG image.
+            width: Requested width in pixels.
+
+        Returns:
+            Path to the cached derivative, or ``source`` itself when the
+            requested width exceeds every supported derivative width.
+
+        Raises:
+            ImageProcessingError: If the source cannot be read or resized.
+        """
+        snapped = self.snap_width(width)
+        if snapped is None:
+            return source
+        await self._ensure_loaded()
+        dest = await self._derivative_path(source, snapped)
+
+        if dest in self._entries:
+            self._entries.move_to_end(dest)
+            return dest
+
+        task = self._pending.get(dest)
+        if task is None:
+            task = asyncio.create_task(self._generate(source, dest, snapped))
+            self._pending[dest] = task
+            task.add_done_callback(lambda _: self._pending.pop(dest, None))
+        # Shield so one client disconnecting does not cancel the others' wait
+        return await asyncio.shield(task)
+
+    async def _derivative_path(self, source: Path, width: int) -> Path:
+        try:
+            stat = await aiofiles.os.stat(source)
+        except OSError as e:
+            raise ImageProcessingError("Failed to stat image", path=str(source)) from e
+        key = f"{source}:{stat.st_size}:{stat.st_mtime_ns}:{width}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return self._cache_dir / f"{digest}-w{width}.jpg"
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            for path, size in await asyncio.to_thread(_scan_cache_dir, self._cache_dir):
+                self._entries[path] = size
+                self._total_bytes += size
+            self._loaded = True
+            logger.debug(
+                "Image derivative cache loaded.",
+                extra={
+                    "entries": len(self._entries),
+                    "total_bytes": self._total_bytes,
+                },
+            )
+
+    async def _generate(self, source: Path, dest: Path, width: int) -> Path:
+        tmp_path = dest.with_suffix(".tmp")
+        try:
+            await aiofiles.os.makedirs(self._cache_dir, exist_ok=True)
+            await self._pipeline.resize_jpg(source, tmp_path, width)
+            await aiofiles.os.replace(tmp_path, dest)
+            size = (await aiofiles.os.stat(dest)).st_size
+        except OSError as e:
+            raise ImageProcessingError(
+                "Failed to store resized image", path=str(source)
+            ) from e
+        finally:
+            if await aiofiles.os.path.exists(tmp_path):
+                await aiofiles.os.remove(tmp_path)
+
+        self._entries[dest] = size
+        self._total_bytes += size
+        logger.debug(
+            "Image derivative generated.",
+            extra={"source": str(source), "width": width, "size": size},
+        )
+        await self._evict(keep=dest)
+        return dest
+
+    async def _evict(self, keep: Path) -> None:
+        """Remove least-recently-used derivatives until within budget."""
+        while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+            path, size = next(iter(self._entries.items()))
+            if path == keep:
+                self._entries.move_to_end(path)
+                continue
+            del self._entries[path]
+            self._total_bytes -= size
+            try:
+                await aiofiles.os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(
+                    "Failed to evict image derivative.",
+                    extra={"path": str(path)},
+                    exc_info=e,
+                )
@@ -1,5 +1,8 @@
 """Image downloading functionality for feed and download thumbnails."""
 
+from dataclasses import dataclass
+import hashlib
+from http import HTTPStatus
 import logging
 from pathlib import Path
 
@@ -8,14 +11,57 @@ import aiofiles.os
 import httpx
 
 from .db.types import SourceType
-from .exceptions import FFmpegError, FFProbeError, ImageDownloadError, YtdlpApiError
+from .exceptions import ImageDownloadError, ImageProcessingError, YtdlpApiError
 from .ffmpeg import FFmpeg
 from .ffprobe import FFProbe
+from .image_pipeline import ImagePipeline
 from .path_manager import PathManager
 from .ytdlp_wrapper import YtdlpWrapper
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_IMAGE_BYTES = 20 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ImageValidators:
+    """HTTP validators and content hash of a stored feed image.
+
+    Attributes:
+        etag: ETag returned with the image, sent back as If-None-Match.
+        last_modified: Last-Modified returned with the image, sent back as
+            If-Modified-Since.
+        content_hash: SHA-256 hex digest of the downloaded image bytes.
+    """
+
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the request headers that make a fetch conditional."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(frozen=True, slots=True)
+class DirectImageResult:
+    """Outcome of a direct feed image download.
+
+    Attributes:
+        ext: Extension of the stored image (e.g., "jpg").
+        validators: Validators and content hash to keep for the next fetch.
+        changed: Whether the stored image file was replaced.
+    """
+
+    ext: str
+    validators: ImageValidators
+    changed: bool
+
 
 class ImageDownloader:
     """Handle downloading and storing images for feeds and downloads.
@@ -24,9 +70,16 @@ class ImageDownloader:
     directly via HTTP or through yt-dlp, always storing them as JPG format
     in the appropriate directory structure.
 
+    Direct downloads go through a shared, pooled HTTP client and are streamed
+    to disk, so an image is never held in memory as a whole.
+
     Attributes:
         _paths: PathManager instance for coordinating file paths.
         _ytdlp_wrapper: YtdlpWrapper for yt-dlp based downloads.
+        _http_client: Shared HTTP client used for direct downloads, owned
+            and closed by the caller.
+        _max_image_bytes: Largest image body accepted from a direct download.
+        _image_pipeline: Converts and resizes downloaded images to JPG.
     """
 
     def __init__(
@@ -35,45 +88,142 @@ class ImageDownloader:
         ytdlp_wrapper: YtdlpWrapper,
         ffprobe: FFProbe,
         ffmpeg: FFmpeg,
+        http_client: httpx.AsyncClient,
+        max_image_bytes: int = DEFAULT_MAX_IMAGE_BYTES,
+        image_pipeline: ImagePipeline | None = None,
     ):
         self._paths = paths
         self._ytdlp_wrapper = ytdlp_wrapper
-        self._ffprobe = ffprobe
-        self._ffmpeg = ffmpeg
+        self._http_client = http_client
+        self._max_image_bytes = max_image_bytes
+        self._image_pipeline = image_pipeline or ImagePipeline(ffprobe, ffmpeg)
         logger.debug("ImageDownloader initialized.")
 
-    async def _convert_to_jpg(
-        self, input_path: Path, output_path: Path, feed_id: str, url: str
+    def _check_declared_size(
+        self, response: httpx.Response, feed_id: str, url: str
     ) -> None:
-        """Convert an image file to JPG format using ffmpeg.
+        """Reject a response whose Content-Length exceeds the size cap.
+
+        Raises:
+            ImageDownloadError: If the declared size is above the cap.
+        """
+        content_length = response.headers.get("Content-Length")
+        if (
+            content_length is not None
+            and content_length.isdigit()
+            and int(content_length) > self._max_image_bytes
+        ):
+            raise ImageDownloadError(
+                "Image exceeds maximum allowed size",
+                feed_id=feed_id,
+                url=url,
+            )
+
+    async def _stream_to_file(
+        self,
+        url: str,
+        tmp_path: Path,
+        feed_id: str,
+        headers: dict[str, str],
+    ) -> ImageValidators | None:
+        """Stream an image body to a temporary file, enforcing the size cap.
 
         Args:
-            input_path: Path to the input image file.
-            output_path: Path where the JPG output should be saved.
+            url: Image URL to download.
+            tmp_path: Temporary file to write the body to.
+            feed_id: Feed identifier for error context.
+            headers: Extra request headers, such as conditional validators.
+
+        Returns:
+            Validators and content hash of the new body, or None if the server
+            answered 304 Not Modified.
+
+        Raises:
+            ImageDownloadError: If the request fails, the image exceeds the
+                size cap, or the file cannot be written.
+        """
+        digest = hashlib.sha256()
+        try:
+            async with self._http_client.stream(
+                "GET", url, headers=headers
+            ) as response:
+                if headers and response.status_code == HTTPStatus.NOT_MODIFIED:
+                    return None
+                response.raise_for_status()
+                self._check_declared_size(response, feed_id, url)
+                received = 0
+                async with aiofiles.open(tmp_path, "wb") as file:
+                    async for chunk in response.aiter_bytes():
+                        received += len(chunk)
+                        if received > self._max_image_bytes:
+                            raise ImageDownloadError(
+                                "Image exceeds maximum allowed size",
+                                feed_id=feed_id,
+                                url=url,
+                            )
+                        digest.update(chunk)
+                        await file.write(chunk)
+        except httpx.HTTPError as e:
+            raise ImageDownloadError(
+                "HTTP request failed for image download",
+                feed_id=feed_id,
+                url=url,
+            ) from e
+        except OSError as e:
+            raise ImageDownloadError(
+                "Failed to write temporary image file",
+                feed_id=feed_id,
+                url=url,
+            ) from e
+        return ImageValidators(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=digest.hexdigest(),
+        )
+
+    async def _store_as_jpg(
+        self, tmp_path: Path, final_path: Path, feed_id: str, url: str
+    ) -> None:
+        """Move a downloaded image into place, converting it to JPG if needed.
+
+        Args:
+            tmp_path: Temporary file holding the downloaded image.
+            final_path: Destination path of the JPG image.
             feed_id: Feed identifier for error context.
             url: Image URL for error context.
 
         Raises:
-            ImageDownloadError: If conversion fails.
+            ImageDownloadError: If the image cannot be converted or moved.
         """
         try:
-            await self._ffmpeg.convert_image_to_jpg(input_path, output_path)
-        except FFmpegError as e:
+            await self._image_pipeline.to_jpg(tmp_path, final_path)
+        except ImageProcessingError as e:
             raise ImageDownloadError(
                 "Image conversion to JPG failed",
                 feed_id=feed_id,
                 url=url,
             ) from e
 
-    async def download_feed_image_direct(self, feed_id: str, url: str) -> str:
+    async def download_feed_image_direct(
+        self,
+        feed_id: str,
+        url: str,
+        cached: ImageValidators | None = None,
+    ) -> DirectImageResult:
         """Download feed image directly via HTTP.
 
+        When validators of the currently stored image are given, the request
+        is conditional: a 304 response, or a body whose hash matches the
+        stored image, leaves the file untouched and skips conversion.
+
         Args:
             feed_id: Feed identifier for storage path.
             url: Image URL to download.
+            cached: Validators of the stored image. ETag and Last-Modified
+                must only be given when they were returned for this URL.
 
         Returns:
-            Extension string (e.g., "jpg").
+            DirectImageResult with the extension and validators to store.
 
         Raises:
             ImageDownloadError: If the image cannot be downloaded or stored.
@@ -91,56 +241,27 @@ class ImageDownloader:
                 url=url,
             ) from e
 
+        # Validators only describe a file that still exists
+        if cached is not None and not await aiofiles.os.path.exists(final_path):
+            cached = None
+
         # Create temporary file path for initial download
         tmp_path = await self._paths.tmp_file(feed_id)
 
-        # Download the image
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, follow_redirects=True)
-                response.raise_for_status()
-            except httpx.HTTPError as e:
-                raise ImageDownloadError(
-                    "HTTP request failed for image download",
-                    feed_id=feed_id,
-                    url=url,
-                ) from e
-
-            # Write the image data to temporary file
-            try:
-                async with aiofiles.open(tmp_path, "wb") as file:
-                    await file.write(response.content)
-            except OSError as e:
-                raise ImageDownloadError(
-                    "Failed to write temporary image file",
-                    feed_id=feed_id,
-                    url=url,
-                ) from e
-
         try:
-            # Check if already JPG format
-            try:
-                is_jpg = await self._ffprobe.is_jpg_file(tmp_path)
-            except FFProbeError as e:
-                raise ImageDownloadError(
-                    "Format detection failed",
-                    feed_id=feed_id,
-                    url=url,
-                ) from e
-
-            if is_jpg:
-                # Already JPG, just move the file
-                try:
-                    await aiofiles.os.replace(tmp_path, final_path)
-                except OSError as e:
-                    raise ImageDownloadError(
-                        "Failed to move JPG file to final location",
-                        feed_id=feed_id,
-                        url=url,
-                    ) from e
-            else:
-                # Convert to JPG format
-                await self._convert_to_jpg(tmp_path, final_path, feed_id, url)
+            # Stream inside the try so a partial body is cleaned up on failure
+            fetched = await self._stream_to_file(
+                url, tmp_path, feed_id, cached.conditional_headers() if cached else {}
+            )
+            if fetched is None:
+                assert cached is not None  # 304 only follows a conditional request
+                logger.debug("Feed image not modified.", extra=log_params)
+                return DirectImageResult(ext="jpg", validators=cached, changed=False)
+            if cached is not None and cached.content_hash == fetched.content_hash:
+                logger.debug("Feed image content unchanged.", extra=log_params)
+                return DirectImageResult(ext="jpg", validators=fetched, changed=False)
+
+            await self._store_as_jpg(tmp_path, final_path, feed_id, url)
         finally:
             # Clean up temporary file
             try:
@@ -152,7 +273,7 @@ class ImageDownloader:
                     extra={"feed_id": feed_id, "tmp_path": str(tmp_path)},
                 )
 
-        return "jpg"
+        return DirectImageResult(ext="jpg", validators=fetched, changed=True)
 
     async def download_feed_image_ytdlp(
         self,
@@ -0,0 +1,237 @@
+# pyright: reportMissingImports=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportUnknownParameterType=false
+# Pillow is an optional dependency; it is untyped here when not installed
+
+"""Format detection, JPG conversion and resizing for artwork.
+
+Podcast apps expect JPG artwork of at most 3000 pixels per side. Image
+formats are recognised from their leading bytes. When Pillow is installed,
+conversion and downscaling run in a worker thread; otherwise undetected
+formats are checked with ffprobe and conversions go through ffmpeg.
+"""
+
+import asyncio
+from enum import StrEnum
+from importlib.util import find_spec
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import aiofiles
+import aiofiles.os
+
+from .exceptions import FFmpegError, FFProbeError, ImageProcessingError
+from .ffmpeg import FFmpeg
+from .ffprobe import FFProbe
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DIMENSION = 3000
+JPEG_QUALITY = 90
+_SNIFF_BYTES = 16
+
+
+class ImageFormat(StrEnum):
+    """Image formats recognised from their magic bytes."""
+
+    JPEG = "jpeg"
+    PNG = "png"
+    GIF = "gif"
+    WEBP = "webp"
+    BMP = "bmp"
+    AVIF = "avif"
+
+
+def sniff_image_format(header: bytes) -> ImageFormat | None:
+    """Identify an image format from the first bytes of the file.
+
+    Args:
+        header: At least the first 16 bytes of the image.
+
+    Returns:
+        The detected ImageFormat, or None if the bytes are not recognised.
+    """
+    if header.startswith(b"\xff\xd8\xff"):
+        return ImageFormat.JPEG
+    if header.startswith(b"\x89PNG\r\n\x1a\n"):
+        return ImageFormat.PNG
+    if header[:6] in (b"GIF87a", b"GIF89a"):
+        return ImageFormat.GIF
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ImageFormat.WEBP
+    if header[4:12] in (b"ftypavif", b"ftypavis"):
+        return ImageFormat.AVIF
+    if header.startswith(b"BM"):
+        return ImageFormat.BMP
+    return None
+
+
+def pillow_available() -> bool:
+    """Return whether the optional Pillow dependency is installed."""
+    return find_spec("PIL") is not None
+
+
+def _flatten_to_rgb(image: Image.Image) -> Image.Image:
+    """Return an RGB copy of an image, flattening transparency onto white."""
+    from PIL import Image
+
+    if image.mode in ("RGBA", "LA", "P"):
+        rgba = image.convert("RGBA")
+        output = Image.new("RGB", rgba.size, "white")
+        output.paste(rgba, mask=rgba.getchannel("A"))
+        return output
+    return image.convert("RGB")
+
+
+def _transcode_to_jpg(source: Path, dest: Path, max_dimension: int) -> None:
+    """Convert and downscale an image with Pillow; runs in a worker thread."""
+    from PIL import Image
+
+    try:
+        with Image.open(source) as image:
+            if image.format == "JPEG" and max(image.size) <= max_dimension:
+                if source != dest:
+                    source.replace(dest)
+                return
+            output = _flatten_to_rgb(image)
+        output.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+        output.save(dest, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        raise ImageProcessingError(
+            "Failed to convert image to JPG", path=str(source)
+        ) from e
+
+
+def _resize_to_width(source: Path, dest: Path, width: int) -> None:
+    """Write a JPG of an image scaled down to ``width``; runs in a worker thread."""
+    from PIL import Image
+
+    try:
+        with Image.open(source) as image:
+            output = _flatten_to_rgb(image)
+        # thumbnail() never upscales, so narrow sources are re-encoded as-is
+        output.thumbnail((width, output.height), Image.Resampling.LANCZOS)
+        output.save(dest, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        raise ImageProcessingError("Failed to resize image", path=str(source)) from e
+
+
+class ImagePipeline:
+    """Turn downloaded artwork into a JPG no larger than the configured size.
+
+    Attributes:
+        _ffprobe: Format detection for images whose bytes are not recognised.
+        _ffmpeg: Conversion when Pillow is unavailable.
+        _max_dimension: Longest side, in pixels, artwork is scaled down to.
+        _in_process: Whether Pillow converts images in a worker thread.
+    """
+
+    def __init__(
+        self,
+        ffprobe: FFProbe,
+        ffmpeg: FFmpeg,
+        max_dimension: int = DEFAULT_MAX_DIMENSION,
+        in_process: bool | None = None,
+    ) -> None:
+        self._ffprobe = ffprobe
+        self._ffmpeg = ffmpeg
+        self._max_dimension = max_dimension
+        self._in_process = pillow_available() if in_process is None else in_process
+        logger.debug(
+            "ImagePipeline initialized.",
+            extra={"in_process": self._in_process, "max_dimension": max_dimension},
+        )
+
+    @property
+    def in_process(self) -> bool:
+        """Return whether images are converted in-process with Pillow."""
+        return self._in_process
+
+    async def is_jpg(self, path: Path) -> bool:
+        """Return True if the file is a JPG image.
+
+        Args:
+            path: Image file to inspect.
+
+        Returns:
+            True if the file is a JPG.
+
+        Raises:
+            ImageProcessingError: If the file cannot be read or probed.
+        """
+        try:
+            async with aiofiles.open(path, "rb") as file:
+                header = await file.read(_SNIFF_BYTES)
+        except OSError as e:
+            raise ImageProcessingError("Failed to read image", path=str(path)) from e
+        detected = sniff_image_format(header)
+        if detected is not None:
+            return detected == ImageFormat.JPEG
+        try:
+            return await self._ffprobe.is_jpg_file(path)
+        except FFProbeError as e:
+            raise ImageProcessingError(
+                "Image format detection failed", path=str(path)
+            ) from e
+
+    async def to_jpg(self, source: Path, dest: Path) -> None:
+        """Store an image as a JPG at ``dest``, scaling it down if oversized.
+
+        A JPG that needs no resizing is moved rather than re-encoded. Without
+        Pillow, JPGs are never resized. ``source`` may equal ``dest``.
+
+        Args:
+            source: Downloaded image.
+            dest: Destination of the JPG.
+
+        Raises:
+            ImageProcessingError: If the image cannot be converted or moved.
+        """
+        if self._in_process:
+            await asyncio.to_thread(
+                _transcode_to_jpg, source, dest, self._max_dimension
+            )
+            return
+
+        if await self.is_jpg(source):
+            if source != dest:
+                try:
+                    await aiofiles.os.replace(source, dest)
+                except OSError as e:
+                    raise ImageProcessingError(
+                        "Failed to move JPG image", path=str(source)
+                    ) from e
+            return
+        try:
+            await self._ffmpeg.convert_image_to_jpg(
+                source, dest, max_dimension=self._max_dimension
+            )
+        except FFmpegError as e:
+            raise ImageProcessingError(
+                "Failed to convert image to JPG", path=str(source)
+            ) from e
+
+    async def resize_jpg(self, source: Path, dest: Path, width: int) -> None:
+        """Write a JPG copy of ``source`` scaled down to ``width`` pixels wide.
+
+        The aspect ratio is preserved and images are never scaled up.
+
+        Args:
+            source: Image to resize.
+            dest: Destination of the resized JPG.
+            width: Maximum width of the output in pixels.
+
+        Raises:
+            ImageProcessingError: If the image cannot be resized.
+        """
+        if self._in_process:
+            await asyncio.to_thread(_resize_to_width, source, dest, width)
+            return
+        try:
+            await self._ffmpeg.convert_image_to_jpg(source, dest, max_width=width)
+        except FFmpegError as e:
+            raise ImageProcessingError(
+                "Failed to resize image", path=str(source)
+            ) from e
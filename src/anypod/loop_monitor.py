@@ -0,0 +1,261 @@
+"""Event-loop responsiveness monitoring.
+
+Anypod serves HTTP, drives subprocesses and talks to SQLite from a single
+event loop, so any CPU-bound work that runs inline delays every other task.
+:class:`LoopLagMonitor` measures that delay directly: it repeatedly sleeps for
+a fixed interval and records how late the loop woke it up. When enabled it
+also times every callback the loop executes and reports the ones that hold
+the loop longer than a threshold, named after the coroutine they belong to.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+import contextlib
+from dataclasses import dataclass
+import logging
+import math
+import time
+from typing import Any, cast
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class LoopLagStats:
+    """Summary of recent event-loop lag samples.
+
+    Attributes:
+        samples: Number of samples in the window.
+        p50_ms: Median lag in milliseconds.
+        p99_ms: 99th percentile lag in milliseconds.
+        max_ms: Largest lag in the window in milliseconds.
+    """
+
+    samples: int
+    p50_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass(slots=True)
+class SlowCallbackStats:
+    """Aggregate of slow executions attributed to one callback.
+
+    Attributes:
+        count: Number of executions over the threshold.
+        total_ms: Combined duration of those executions in milliseconds.
+        max_ms: Longest single execution in milliseconds.
+    """
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class LoopLagMonitor:
+    """Sample event-loop lag and report callbacks that block the loop.
+
+    Slow-callback reporting is opt-in because it wraps the private
+    ``asyncio.Handle._run``, which every callback and task step on the default
+    event loop goes through. The wrapper is installed by :meth:`start` and
+    removed by :meth:`stop`; only one monitor may have it installed at a time.
+    If the running Python has no ``Handle._run``, only lag is sampled.
+
+    Attributes:
+        _interval: Seconds between samples.
+        _warn_threshold: Lag in seconds above which a warning is logged.
+        _slow_callback_threshold: Callback duration in seconds considered slow.
+        _summary_interval: Seconds between summary log lines.
+        _trace_slow_callbacks: Whether to time callbacks while running.
+        _samples: Most recent lag samples in seconds.
+        _slow_callbacks: Slow execution stats keyed by callback name.
+        _task: The running sampler task, if any.
+        _original_handle_run: ``Handle._run`` before the wrapper was installed.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.25,
+        window: int = 240,
+        warn_threshold: float = 0.1,
+        slow_callback_threshold: float = 0.1,
+        summary_interval: float = 300.0,
+        trace_slow_callbacks: bool = False,
+    ) -> None:
+        self._interval = interval
+        self._warn_threshold = warn_threshold
+        self._slow_callback_threshold = slow_callback_threshold
+        self._summary_interval = summary_interval
+        self._trace_slow_callbacks = trace_slow_callbacks
+        self._samples: deque[float] = deque(maxlen=window)
+        self._slow_callbacks: dict[str, SlowCallbackStats] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._original_handle_run: Callable[[asyncio.Handle], None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return whether the sampler task is active."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling on the running loop, timing callbacks if enabled."""
+        if self.running:
+            return
+        if self._trace_slow_callbacks:
+            self._install_callback_timer()
+        self._task = asyncio.create_task(self._run(), name="loop-lag-monitor")
+        logger.debug(
+            "Event loop lag monitor started.",
+            extra={
+                "interval_seconds": self._interval,
+                "slow_callback_tracing": self._original_handle_run is not None,
+                "slow_callback_threshold_ms": self._slow_callback_threshold * 1000,
+            },
+        )
+
+    async def stop(self) -> None:
+        """Stop sampling and remove the slow-callback wrapper."""
+        self._uninstall_callback_timer()
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def record(self, lag: float) -> None:
+        """Record one lag sample, warning if it exceeds the threshold.
+
+        Args:
+            lag: How late the loop ran the timer, in seconds.
+        """
+        self._samples.append(lag)
+        if lag > self._warn_threshold:
+            logger.warning(
+                "Event loop lag exceeded threshold.",
+                extra={
+                    "lag_ms": round(lag * 1000, 1),
+                    "threshold_ms": round(self._warn_threshold * 1000, 1),
+                },
+            )
+
+    def record_slow_callback(self, callback: str, duration: float) -> None:
+        """Record a callback execution that exceeded the slow threshold.
+
+        Args:
+            callback: Name of the coroutine or function that ran.
+            duration: How long it held the loop, in seconds.
+        """
+        duration_ms = duration * 1000
+        stats = self._slow_callbacks.setdefault(callback, SlowCallbackStats())
+        stats.count += 1
+        stats.total_ms += duration_ms
+        stats.max_ms = max(stats.max_ms, duration_ms)
+        logger.warning(
+            "Slow event loop callback.",
+            extra={"callback": callback, "duration_ms": round(duration_ms, 1)},
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_summary = loop.time() + self._summary_interval
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            now = loop.time()
+            self.record(max(now - expected, 0.0))
+            if now >= next_summary:
+                next_summary = now + self._summary_interval
+                self._log_summary()
+
+    def _log_summary(self) -> None:
+        stats = self.stats()
+        logger.debug(
+            "Event loop lag summary.",
+            extra={
+                "samples": stats.samples,
+                "p50_ms": round(stats.p50_ms, 1),
+                "p99_ms": round(stats.p99_ms, 1),
+                "max_ms": round(stats.max_ms, 1),
+                "slow_callback_count": sum(
+                    s.count for s in self._slow_callbacks.values()
+                ),
+            },
+        )
+
+    def stats(self) -> LoopLagStats:
+        """Summarize the samples currently in the window.
+
+        Returns:
+            LoopLagStats for the window; all zeros if nothing was sampled yet.
+        """
+        if not self._samples:
+            return LoopLagStats(samples=0, p50_ms=0.0, p99_ms=0.0, max_ms=0.0)
+        ordered = sorted(self._samples)
+        return LoopLagStats(
+            samples=len(ordered),
+            p50_ms=_percentile(ordered, 0.50) * 1000,
+            p99_ms=_percentile(ordered, 0.99) * 1000,
+            max_ms=ordered[-1] * 1000,
+        )
+
+    def slow_callbacks(self) -> dict[str, SlowCallbackStats]:
+        """Return slow-callback stats ordered by total blocked time, worst first.
+
+        Returns:
+            Mapping of callback name to a copy of its stats.
+        """
+        ranked = sorted(
+            self._slow_callbacks.items(),
+            key=lambda item: item[1].total_ms,
+            reverse=True,
+        )
+        return {
+            name: SlowCallbackStats(s.count, s.total_ms, s.max_ms) for name, s in ranked
+        }
+
+    def _install_callback_timer(self) -> None:
+        if self._original_handle_run is not None:
+            return
+        if not hasattr(asyncio.Handle, "_run"):
+            logger.warning(
+                "asyncio.Handle._run is unavailable; slow callback reporting is disabled."
+            )
+            return
+        original = asyncio.Handle._run  # type: ignore[attr-defined]
+        threshold = self._slow_callback_threshold
+
+        def _timed_run(handle: asyncio.Handle) -> None:
+            callback = handle._callback  # type: ignore[attr-defined]
+            start = time.perf_counter()
+            try:
+                original(handle)
+            finally:
+                duration = time.perf_counter() - start
+                if duration > threshold:
+                    self.record_slow_callback(_describe_callback(callback), duration)
+
+        self._original_handle_run = original
+        asyncio.Handle._run = _timed_run  # type: ignore[method-assign]
+
+    def _uninstall_callback_timer(self) -> None:
+        if self._original_handle_run is None:
+            return
+        asyncio.Handle._run = self._original_handle_run  # type: ignore[method-assign]
+        self._original_handle_run = None
+
+
+def _describe_callback(callback: Any) -> str:
+    """Name a loop callback, resolving task steps to their coroutine."""
+    owner = getattr(callback, "__self__", None)
+    if isinstance(owner, asyncio.Task):
+        coro = cast(asyncio.Task[Any], owner).get_coro()
+        return getattr(coro, "__qualname__", None) or repr(coro)
+    return getattr(callback, "__qualname__", None) or repr(callback)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of an already sorted list."""
+    rank = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[rank]
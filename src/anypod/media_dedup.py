@@ -0,0 +1,279 @@
+"""Share identical media files between feeds instead of storing them twice.
+
+The same video often appears in more than one feed, for example a channel
+feed and a curated playlist feed. Each download records a content key derived
+from the video and the yt-dlp arguments it was fetched with; when another
+feed has already downloaded media with the same key, its files are hardlinked
+into place rather than downloaded again. Hardlinks leave reference counting
+to the filesystem: pruning one feed's copy only unlinks that feed's path and
+the data is released once no feed references it.
+
+Feeds are processed one at a time under the scheduler's feed semaphore, so
+a later feed always finds the media an earlier feed stored.
+
+A deduplication pass also links together byte-identical files that were
+downloaded before content keys existed.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import hashlib
+import itertools
+import json
+import logging
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiofiles.os
+
+from .db.download_db import DownloadDatabase
+from .db.types import Download, DownloadCompletion
+from .exceptions import DatabaseOperationError, FileOperationError
+from .file_manager import FileManager
+from .metrics.instruments import MEDIA_REUSED
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def _normalize_source_url(url: str) -> str:
+    """Return ``url`` with case-insensitive parts lowered and noise removed.
+
+    The scheme and host are lowercased, the fragment is dropped and query
+    parameters are sorted, so trivially different spellings of one URL match.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, "")
+    )
+
+
+def media_content_key(download: Download, yt_args: list[str]) -> str:
+    """Return the fingerprint identifying a download's media file.
+
+    Two downloads share a key when they refer to the same video (id and
+    normalized source URL) and were fetched with the same yt-dlp arguments,
+    which determine the selected format and any post-processing.
+
+    Args:
+        download: The download being fetched.
+        yt_args: The feed's yt-dlp arguments.
+
+    Returns:
+        Hex digest identifying the media file.
+    """
+    payload = json.dumps(
+        [download.id, _normalize_source_url(download.source_url), yt_args]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _hash_file(path: Path) -> str:
+    """Return the SHA-256 of a file; runs in a worker thread."""
+    digest = hashlib.sha256()
+    with path.open("rb") as file:
+        while chunk := file.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class DedupResult:
+    """Outcome of a deduplication pass over stored media.
+
+    Attributes:
+        files_linked: Number of duplicate files replaced by hardlinks.
+        bytes_saved: Disk space released by the replaced files.
+    """
+
+    files_linked: int = 0
+    bytes_saved: int = 0
+
+
+class MediaDeduplicator:
+    """Reuse and hardlink media files that several feeds store.
+
+    Attributes:
+        _download_db: Database manager for download record operations.
+        _file_manager: File manager for file system operations.
+    """
+
+    def __init__(self, download_db: DownloadDatabase, file_manager: FileManager):
+        self._download_db = download_db
+        self._file_manager = file_manager
+        logger.debug("MediaDeduplicator initialized.")
+
+    async def reuse_existing(
+        self, download: Download, content_key: str, transcript_lang: str | None
+    ) -> DownloadCompletion | None:
+        """Link media another feed already downloaded into this feed.
+
+        The media file is linked along with its thumbnail and, if it is in
+        the requested language, its transcript.
+
+        Args:
+            download: The queued download to satisfy.
+            content_key: The download's media fingerprint.
+            transcript_lang: Transcript language configured for the feed.
+
+        Returns:
+            Completion metadata copied from the shared download, or None if
+            no reusable file exists and the media must be downloaded.
+        """
+        log_params: dict[str, Any] = {
+            "feed_id": download.feed_id,
+            "download_id": download.id,
+        }
+        try:
+            candidates = await self._download_db.get_downloaded_by_content_key(
+                content_key, exclude_feed_id=download.feed_id
+            )
+        except DatabaseOperationError as e:
+            logger.warning(
+                "Failed to look up shared media; downloading instead.",
+                extra=log_params,
+                exc_info=e,
+            )
+            return None
+
+        for source in candidates:
+            try:
+                await self._file_manager.link_download_file(
+                    source.feed_id, download.feed_id, download.id, source.ext
+                )
+            except (FileNotFoundError, FileOperationError) as e:
+                logger.debug(
+                    "Shared media file unusable.",
+                    extra={**log_params, "source_feed_id": source.feed_id},
+                    exc_info=e,
+                )
+                continue
+            logger.info(
+                "Reused media downloaded by another feed.",
+                extra={**log_params, "source_feed_id": source.feed_id},
+            )
+            MEDIA_REUSED.inc(feed_id=download.feed_id)
+            return await self._link_artifacts(
+                source, download, content_key, transcript_lang
+            )
+        return None
+
+    async def _link_artifacts(
+        self,
+        source: Download,
+        download: Download,
+        content_key: str,
+        transcript_lang: str | None,
+    ) -> DownloadCompletion:
+        thumbnail_ext = None
+        if source.thumbnail_ext:
+            try:
+                await self._file_manager.link_image(
+                    source.feed_id, download.feed_id, download.id, source.thumbnail_ext
+                )
+                thumbnail_ext = source.thumbnail_ext
+            except (FileNotFoundError, FileOperationError) as e:
+                logger.debug("Shared thumbnail unusable.", exc_info=e)
+
+        transcript_ext = None
+        if (
+            transcript_lang is not None
+            and source.transcript_lang == transcript_lang
+            and source.transcript_ext
+        ):
+            try:
+                await self._file_manager.link_transcript(
+                    source.feed_id,
+                    download.feed_id,
+                    download.id,
+                    transcript_lang,
+                    source.transcript_ext,
+                )
+                transcript_ext = source.transcript_ext
+            except (FileNotFoundError, FileOperationError) as e:
+                logger.debug("Shared transcript unusable.", exc_info=e)
+
+        return DownloadCompletion(
+            ext=source.ext,
+            mime_type=source.mime_type,
+            filesize=source.filesize,
+            duration=source.duration,
+            download_logs=f"Media shared with feed '{source.feed_id}'.",
+            thumbnail_ext=thumbnail_ext,
+            transcript_ext=transcript_ext,
+            transcript_lang=transcript_lang if transcript_ext else None,
+            transcript_source=source.transcript_source if transcript_ext else None,
+            content_key=content_key,
+        )
+
+    async def deduplicate_existing(self) -> DedupResult:
+        """Replace identical media files stored by several feeds with hardlinks.
+
+        Candidates are DOWNLOADED rows with the same id, extension and size in
+        different feeds; files are only linked when their contents hash equal.
+        Files that already share an inode are skipped without hashing.
+
+        Returns:
+            Number of files linked and bytes released.
+
+        Raises:
+            DatabaseOperationError: If candidates cannot be loaded.
+        """
+        downloads = await self._download_db.get_duplicate_downloads()
+        files_linked = 0
+        bytes_saved = 0
+        for _, group in itertools.groupby(
+            downloads, key=lambda d: (d.id, d.ext, d.filesize)
+        ):
+            linked, saved = await self._deduplicate_group(list(group))
+            files_linked += linked
+            bytes_saved += saved
+
+        result = DedupResult(files_linked=files_linked, bytes_saved=bytes_saved)
+        logger.info(
+            "Media deduplication pass completed.",
+            extra={"files_linked": files_linked, "bytes_saved": bytes_saved},
+        )
+        return result
+
+    async def _deduplicate_group(self, group: list[Download]) -> tuple[int, int]:
+        """Link every file in a candidate group that matches the first one."""
+        keeper: tuple[Download, Path, int] | None = None
+        keeper_hash: str | None = None
+        files_linked = 0
+        bytes_saved = 0
+        for download in group:
+            try:
+                path = await self._file_manager.get_download_file_path(
+                    download.feed_id, download.id, download.ext
+                )
+                stat = await aiofiles.os.stat(path)
+                if keeper is None:
+                    keeper = (download, path, stat.st_ino)
+                    continue
+                source, keeper_path, keeper_inode = keeper
+                if stat.st_ino == keeper_inode:
+                    continue
+                # Only hash once a copy on a different inode turns up
+                if keeper_hash is None:
+                    keeper_hash = await asyncio.to_thread(_hash_file, keeper_path)
+                if await asyncio.to_thread(_hash_file, path) != keeper_hash:
+                    continue
+                await self._file_manager.link_download_file(
+                    source.feed_id, download.feed_id, download.id, download.ext
+                )
+            except (OSError, FileOperationError) as e:
+                logger.warning(
+                    "Skipping media file during deduplication.",
+                    extra={"feed_id": download.feed_id, "download_id": download.id},
+                    exc_info=e,
+                )
+                continue
+            files_linked += 1
+            # Space is only released if no other path still links the old file
+            if stat.st_nlink == 1:
+                bytes_saved += stat.st_size
+        return files_linked, bytes_saved
@@ -0,0 +1,19 @@
+from .histogram import DEFAULT_DURATION_BUCKETS, Histogram, HistogramSnapshot
+from .registry import (
+    CONTENT_TYPE,
+    Counter,
+    Gauge,
+    LabeledHistogram,
+    MetricsRegistry,
+)
+
+__all__ = [
+    "CONTENT_TYPE",
+    "DEFAULT_DURATION_BUCKETS",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "HistogramSnapshot",
+    "LabeledHistogram",
+    "MetricsRegistry",
+]
@@ -0,0 +1,91 @@
+"""Fixed-bucket histograms for in-process timing metrics."""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import dataclass
+import math
+
+# Seconds; spans sub-second DB work up to multi-minute downloads
+DEFAULT_DURATION_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    900.0,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSnapshot:
+    """Point-in-time copy of a histogram.
+
+    Attributes:
+        buckets: Cumulative observation counts keyed by upper bound, ending with "+Inf".
+        count: Total number of observations.
+        sum: Sum of all observed values.
+    """
+
+    buckets: dict[str, int]
+    count: int
+    sum: float
+
+
+class Histogram:
+    """Count observations into cumulative upper-bound buckets.
+
+    Bucket semantics match Prometheus: an observation is counted in every
+    bucket whose upper bound is greater than or equal to it.
+
+    Attributes:
+        _bounds: Sorted finite upper bounds.
+        _counts: Per-bucket (non-cumulative) counts, with a trailing +Inf bucket.
+        _sum: Sum of all observed values.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS) -> None:
+        self._bounds = sorted(b for b in buckets if not math.isinf(b))
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+
+    @property
+    def bounds(self) -> list[float]:
+        """Return the finite bucket upper bounds."""
+        return list(self._bounds)
+
+    def observe(self, value: float) -> None:
+        """Record a single observation.
+
+        Args:
+            value: The observed value.
+        """
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Return cumulative bucket counts, total count and sum.
+
+        Returns:
+            HistogramSnapshot of the current state.
+        """
+        buckets: dict[str, int] = {}
+        running = 0
+        for bound, count in zip(self._bounds, self._counts, strict=False):
+            running += count
+            buckets[_format_bound(bound)] = running
+        running += self._counts[-1]
+        buckets["+Inf"] = running
+        return HistogramSnapshot(buckets=buckets, count=running, sum=self._sum)
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
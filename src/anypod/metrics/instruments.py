@@ -0,0 +1,105 @@
+"""Process-wide metrics exported on the admin ``/metrics`` endpoint."""
+
+from .registry import MetricsRegistry
+
+# Bytes per second; 64 KiB/s through 256 MiB/s in factors of four
+THROUGHPUT_BUCKETS: tuple[float, ...] = tuple(float(64 * 1024 * 4**i) for i in range(7))
+
+REGISTRY = MetricsRegistry()
+
+YTDLP_RUN_SECONDS = REGISTRY.histogram(
+    "anypod_ytdlp_run_duration_seconds",
+    "Wall-clock duration of yt-dlp subprocess runs.",
+    ["operation"],
+)
+YTDLP_RUNS = REGISTRY.counter(
+    "anypod_ytdlp_runs_total",
+    "yt-dlp subprocess runs by exit code.",
+    ["operation", "exit_code"],
+)
+
+COORDINATOR_PHASE_SECONDS = REGISTRY.histogram(
+    "anypod_coordinator_phase_duration_seconds",
+    "Wall-clock duration of DataCoordinator phases.",
+    ["phase"],
+)
+COORDINATOR_PHASE_CPU_SECONDS = REGISTRY.histogram(
+    "anypod_coordinator_phase_cpu_seconds",
+    "Event loop thread CPU time spent during DataCoordinator phases.",
+    ["phase"],
+)
+
+DOWNLOAD_BYTES = REGISTRY.counter(
+    "anypod_download_bytes_total",
+    "Bytes of media downloaded.",
+    ["feed_id"],
+)
+DOWNLOAD_THROUGHPUT = REGISTRY.histogram(
+    "anypod_download_throughput_bytes_per_second",
+    "Average throughput of each completed media download.",
+    buckets=THROUGHPUT_BUCKETS,
+)
+DOWNLOADS_DEFERRED = REGISTRY.counter(
+    "anypod_downloads_deferred_total",
+    "Queued downloads postponed without using a retry.",
+    ["reason"],
+)
+DISK_FREE_BYTES = REGISTRY.gauge(
+    "anypod_disk_free_bytes",
+    "Free space on the data volume at the last admission check.",
+)
+DISK_RESERVED_BYTES = REGISTRY.gauge(
+    "anypod_disk_reserved_bytes",
+    "Space set aside for media downloads in progress.",
+)
+FEED_STORAGE_BYTES = REGISTRY.gauge(
+    "anypod_feed_storage_bytes",
+    "Size of downloaded media per feed at the last storage budget check.",
+    ["feed_id"],
+)
+PRUNE_FAILURES = REGISTRY.counter(
+    "anypod_prune_failures_total",
+    "Pruned downloads left unarchived because their files could not be deleted.",
+    ["feed_id"],
+)
+PARTIAL_BYTES_SALVAGED = REGISTRY.counter(
+    "anypod_partial_bytes_salvaged_total",
+    "Bytes of interrupted downloads kept at startup for yt-dlp to resume.",
+    ["feed_id"],
+)
+ORPHAN_FILES_DELETED = REGISTRY.counter(
+    "anypod_orphan_files_deleted_total",
+    "Files deleted by the orphan sweep because no download references them.",
+)
+ORPHAN_BYTES_RECLAIMED = REGISTRY.counter(
+    "anypod_orphan_bytes_reclaimed_total",
+    "Disk space released by the orphan sweep.",
+)
+MEDIA_REUSED = REGISTRY.counter(
+    "anypod_media_reused_total",
+    "Media downloads satisfied by linking a copy another feed stored.",
+    ["feed_id"],
+)
+
+DB_OPERATION_SECONDS = REGISTRY.histogram(
+    "anypod_db_operation_duration_seconds",
+    "Latency of database operations.",
+    ["operation"],
+)
+DB_OPERATION_ERRORS = REGISTRY.counter(
+    "anypod_db_operation_errors_total",
+    "Database operations that raised a SQLAlchemy error.",
+    ["operation"],
+)
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "anypod_http_request_duration_seconds",
+    "Time from request receipt to response start, by route template.",
+    ["method", "route", "status"],
+)
+
+SCHEDULER_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "anypod_scheduler_queue_wait_seconds",
+    "Time a scheduled job waited for the feed processing semaphore.",
+    ["job"],
+)
@@ -0,0 +1,315 @@
+"""Labeled counters, gauges and histograms rendered in the Prometheus text format.
+
+Only the small subset of the exposition format Anypod needs is implemented:
+counters, gauges and histograms with string labels. All updates happen on the event
+loop thread, so no locking is required.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+import math
+
+from .histogram import DEFAULT_DURATION_BUCKETS, Histogram, HistogramSnapshot
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+type LabelValues = tuple[str, ...]
+
+
+class _Metric(ABC):
+    """Shared naming, help text and label handling for metric families.
+
+    Attributes:
+        name: Metric family name.
+        documentation: Help text shown in the exposition output.
+        labelnames: Names of the labels every sample carries.
+    """
+
+    kind: str = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _label_values(self, labels: dict[str, str]) -> LabelValues:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError("Label names do not match the metric definition.")
+        return tuple(labels[name] for name in self.labelnames)
+
+    def _label_text(self, values: LabelValues, extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape_label_value(value)}"'
+            for name, value in zip(self.labelnames, values, strict=True)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]:
+        """Yield the sample lines of this family, without the header."""
+
+    def render(self) -> str:
+        """Render this family with its HELP and TYPE header lines.
+
+        Returns:
+            The family in Prometheus text exposition format.
+        """
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+            *self._samples(),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set.
+
+    Attributes:
+        _values: Current value keyed by label values.
+    """
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for a label set.
+
+        Args:
+            amount: Non-negative amount to add.
+            **labels: Value for each of the metric's label names.
+
+        Raises:
+            ValueError: If the amount is negative or the labels do not match.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase.")
+        key = self._label_values(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for a label set.
+
+        Args:
+            **labels: Value for each of the metric's label names.
+
+        Returns:
+            The counter value, or 0.0 if it was never incremented.
+        """
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        for values, value in self._values.items():
+            yield f"{self.name}{self._label_text(values)} {_format_value(value)}"
+
+
+class Gauge(_Metric):
+    """Value per label set that can go up and down.
+
+    Attributes:
+        _values: Current value keyed by label values.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for a label set.
+
+        Args:
+            value: The new value.
+            **labels: Value for each of the metric's label names.
+
+        Raises:
+            ValueError: If the labels do not match.
+        """
+        self._values[self._label_values(labels)] = value
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for a label set.
+
+        Args:
+            **labels: Value for each of the metric's label names.
+
+        Returns:
+            The gauge value, or 0.0 if it was never set.
+        """
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        for values, value in self._values.items():
+            yield f"{self.name}{self._label_text(values)} {_format_value(value)}"
+
+
+class LabeledHistogram(_Metric):
+    """A :class:`Histogram` per label set.
+
+    Attributes:
+        _buckets: Bucket upper bounds shared by every label set.
+        _histograms: Histogram keyed by label values.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._buckets = tuple(buckets)
+        self._histograms: dict[LabelValues, Histogram] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record an observation for a label set.
+
+        Args:
+            value: The observed value.
+            **labels: Value for each of the metric's label names.
+
+        Raises:
+            ValueError: If the labels do not match.
+        """
+        key = self._label_values(labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram(self._buckets)
+        histogram.observe(value)
+
+    def snapshot(self, **labels: str) -> HistogramSnapshot | None:
+        """Return the histogram for a label set.
+
+        Args:
+            **labels: Value for each of the metric's label names.
+
+        Returns:
+            HistogramSnapshot, or None if nothing was observed for the labels.
+        """
+        histogram = self._histograms.get(self._label_values(labels))
+        return histogram.snapshot() if histogram else None
+
+    def _samples(self) -> Iterator[str]:
+        for values, histogram in self._histograms.items():
+            snapshot = histogram.snapshot()
+            for bound, count in snapshot.buckets.items():
+                labels = self._label_text(values, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {count}"
+            labels = self._label_text(values)
+            yield f"{self.name}_sum{labels} {_format_value(snapshot.sum)}"
+            yield f"{self.name}_count{labels} {snapshot.count}"
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together.
+
+    Attributes:
+        _metrics: Registered families keyed by name.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register[M: _Metric](self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError("Metric name is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a counter.
+
+        Args:
+            name: Metric name, conventionally ending in ``_total``.
+            documentation: Help text.
+            labelnames: Names of the labels every sample carries.
+
+        Returns:
+            The registered Counter.
+
+        Raises:
+            ValueError: If the name is already registered.
+        """
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Create and register a gauge.
+
+        Args:
+            name: Metric name, conventionally suffixed with its unit.
+            documentation: Help text.
+            labelnames: Names of the labels every sample carries.
+
+        Returns:
+            The registered Gauge.
+
+        Raises:
+            ValueError: If the name is already registered.
+        """
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_DURATION_BUCKETS,
+    ) -> LabeledHistogram:
+        """Create and register a histogram.
+
+        Args:
+            name: Metric name, conventionally suffixed with its unit.
+            documentation: Help text.
+            labelnames: Names of the labels every sample carries.
+            buckets: Bucket upper bounds.
+
+        Returns:
+            The registered LabeledHistogram.
+
+        Raises:
+            ValueError: If the name is already registered.
+        """
+        return self._register(
+            LabeledHistogram(name, documentation, labelnames, buckets)
+        )
+
+    def render(self) -> str:
+        """Render every registered family.
+
+        Returns:
+            All metrics in Prometheus text exposition format.
+        """
+        return "".join(metric.render() for metric in self._metrics.values())
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
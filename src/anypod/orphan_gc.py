@@ -0,0 +1,275 @@
+"""Delete files in the data directories that no download references.
+
+Crashes, interrupted downloads and manual edits of the database can leave
+media files, thumbnails, transcripts and yt-dlp temporary files behind that
+nothing will ever serve or clean up. :class:`OrphanFileCollector` loads the
+file keys of every download in a single query and then walks the per-feed
+media, thumbnail, transcript and temporary directories with ``os.scandir``
+in a worker thread, deleting regular files that are not in the key set and
+have not changed for a grace period.
+
+Each run examines a bounded number of directory entries and remembers where
+it stopped, so large volumes are swept across several runs instead of in
+one long pass. The cursor is kept in memory; after a restart the sweep
+starts again from the beginning.
+
+Temporary files of a QUEUED download that has a resume marker are kept:
+they belong to an interrupted download that its next attempt continues
+(see :mod:`anypod.partial_recovery`). Feed-level images, feed XML and the
+resized image cache are not swept; they are owned by their feeds and by the
+cache's own size limit.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import timedelta
+import logging
+import os
+from pathlib import Path
+import stat
+import time
+
+from .db.download_db import DownloadDatabase
+from .db.types import DownloadStatus, PruneCandidate
+from .metrics.instruments import ORPHAN_BYTES_RECLAIMED, ORPHAN_FILES_DELETED
+from .partial_recovery import RESUME_MARKER_SUFFIX
+from .path_manager import PathManager
+
+logger = logging.getLogger(__name__)
+
+# Position of an entry in sweep order: (directory index, feed id, file name)
+type _SweepPosition = tuple[int, str, str]
+
+# Referenced file names per directory, as (feed_id, file name) pairs
+type _FileKeys = dict[str, set[tuple[str, str]]]
+
+# Downloads that are still QUEUED, as (feed_id, download id) pairs
+type _QueuedIds = set[tuple[str, str]]
+
+
+@dataclass(frozen=True, slots=True)
+class OrphanSweepResult:
+    """What a single :class:`OrphanFileCollector` run accomplished.
+
+    Attributes:
+        entries_scanned: Directory entries examined during this run.
+        files_deleted: Unreferenced files removed.
+        bytes_reclaimed: Disk space released by the removed files.
+        complete: Whether the run reached the end of the last directory.
+    """
+
+    entries_scanned: int = 0
+    files_deleted: int = 0
+    bytes_reclaimed: int = 0
+    complete: bool = True
+
+    def summary_dict(self) -> dict[str, int | bool]:
+        """Return a dictionary summary suitable for logging."""
+        return {
+            "entries_scanned": self.entries_scanned,
+            "files_deleted": self.files_deleted,
+            "bytes_reclaimed": self.bytes_reclaimed,
+            "complete": self.complete,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class _SweptDirectory:
+    """A data directory holding one subdirectory per feed.
+
+    Attributes:
+        name: Label used for metrics and logs.
+        base: Directory containing the per-feed directories.
+        subdir: Directory within each feed directory to sweep, if any.
+    """
+
+    name: str
+    base: Path
+    subdir: str | None = None
+
+
+def _file_keys(downloads: list[PruneCandidate]) -> _FileKeys:
+    """Return the file names each download may own, grouped by directory."""
+    keys: _FileKeys = {"media": set(), "images": set(), "transcripts": set()}
+    for download in downloads:
+        keys["media"].add((download.feed_id, f"{download.id}.{download.ext}"))
+        if download.thumbnail_ext:
+            keys["images"].add(
+                (download.feed_id, f"{download.id}.{download.thumbnail_ext}")
+            )
+        if download.transcript_lang and download.transcript_ext:
+            name = f"{download.id}.{download.transcript_lang}.{download.transcript_ext}"
+            keys["transcripts"].add((download.feed_id, name))
+    return keys
+
+
+def _awaits_resumption(path: Path, feed_id: str, queued: _QueuedIds) -> bool:
+    """Return whether a tmp file belongs to an interrupted QUEUED download.
+
+    yt-dlp names a download's temporary files after its id followed by a
+    dot, and the resume marker sits next to them; ids may contain dots, so
+    every prefix ending before a dot is tried.
+    """
+    name = path.name
+    dot = name.find(".")
+    while dot > 0:
+        download_id = name[:dot]
+        marker = path.with_name(f"{download_id}{RESUME_MARKER_SUFFIX}")
+        if (feed_id, download_id) in queued and marker.exists():
+            return True
+        dot = name.find(".", dot + 1)
+    return False
+
+
+def _sorted_names(directory: Path, *, dirs: bool) -> list[str]:
+    """List the subdirectory or non-directory names in ``directory``, sorted."""
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                entry.name
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False) == dirs
+            )
+    except FileNotFoundError:
+        return []
+
+
+class OrphanFileCollector:
+    """Incrementally sweep the data directories for unreferenced files.
+
+    Attributes:
+        _download_db: Database manager for download record operations.
+        _directories: Directories swept, in sweep order.
+        _grace_period: Minimum time since a file last changed before deletion.
+        _batch_size: Directory entries examined per run.
+        _cursor: Last entry examined by the previous run, or None to start over.
+    """
+
+    def __init__(
+        self,
+        download_db: DownloadDatabase,
+        paths: PathManager,
+        grace_period: timedelta,
+        batch_size: int,
+    ):
+        self._download_db = download_db
+        self._directories = (
+            _SweptDirectory("media", paths.base_data_dir),
+            _SweptDirectory("images", paths.base_images_dir, "downloads"),
+            _SweptDirectory("transcripts", paths.base_transcripts_dir),
+            _SweptDirectory("tmp", paths.base_tmp_dir),
+        )
+        self._grace_period = grace_period
+        self._batch_size = batch_size
+        self._cursor: _SweepPosition | None = None
+        logger.debug(
+            "OrphanFileCollector initialized.",
+            extra={
+                "grace_period_seconds": grace_period.total_seconds(),
+                "batch_size": batch_size,
+            },
+        )
+
+    async def run(self) -> OrphanSweepResult:
+        """Sweep the next batch of directory entries.
+
+        The key set is loaded before the walk starts. A file written after
+        that point is still protected by the grace period, which is measured
+        against the later of its modification and status-change times.
+
+        Returns:
+            Counts for this run and whether the sweep wrapped around.
+
+        Raises:
+            DatabaseOperationError: If the download keys cannot be loaded.
+        """
+        downloads = await self._download_db.get_stored_file_keys()
+        keys = _file_keys(downloads)
+        queued = {
+            (download.feed_id, download.id)
+            for download in downloads
+            if download.status == DownloadStatus.QUEUED
+        }
+        cutoff = time.time() - self._grace_period.total_seconds()
+        result, self._cursor = await asyncio.to_thread(
+            self._sweep, keys, queued, cutoff, self._cursor
+        )
+        ORPHAN_FILES_DELETED.inc(result.files_deleted)
+        ORPHAN_BYTES_RECLAIMED.inc(result.bytes_reclaimed)
+        logger.info("Orphan file sweep completed.", extra=result.summary_dict())
+        return result
+
+    def _walk(
+        self, after: _SweepPosition | None
+    ) -> Iterator[tuple[_SweepPosition, Path]]:
+        """Yield files in sweep order, starting after ``after``."""
+        for index, directory in enumerate(self._directories):
+            if after is not None and index < after[0]:
+                continue
+            for feed_id in _sorted_names(directory.base, dirs=True):
+                if after is not None and (index, feed_id) < after[:2]:
+                    continue
+                feed_dir = directory.base / feed_id
+                if directory.subdir:
+                    feed_dir /= directory.subdir
+                for name in _sorted_names(feed_dir, dirs=False):
+                    position = (index, feed_id, name)
+                    if after is None or position > after:
+                        yield position, feed_dir / name
+
+    def _sweep(
+        self,
+        keys: _FileKeys,
+        queued: _QueuedIds,
+        cutoff: float,
+        cursor: _SweepPosition | None,
+    ) -> tuple[OrphanSweepResult, _SweepPosition | None]:
+        """Examine up to a batch of entries; runs in a worker thread.
+
+        Returns:
+            The run's result and the cursor for the next run.
+        """
+        scanned = deleted = reclaimed = 0
+        for position, path in self._walk(cursor):
+            if scanned >= self._batch_size:
+                return (
+                    OrphanSweepResult(scanned, deleted, reclaimed, complete=False),
+                    cursor,
+                )
+            scanned += 1
+            cursor = position
+            directory = self._directories[position[0]].name
+            if position[1:] in keys.get(directory, ()):
+                continue
+            if directory == "tmp" and _awaits_resumption(path, position[1], queued):
+                continue
+            try:
+                st = path.lstat()
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                if max(st.st_mtime, st.st_ctime) > cutoff:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(
+                    "Failed to delete orphaned file.",
+                    extra={"path": str(path)},
+                    exc_info=e,
+                )
+                continue
+            deleted += 1
+            # Space is only released once no other hardlink remains
+            if st.st_nlink == 1:
+                reclaimed += st.st_size
+            logger.debug(
+                "Deleted orphaned file.",
+                extra={
+                    "directory": directory,
+                    "path": str(path),
+                    "size_bytes": st.st_size,
+                },
+            )
+        return OrphanSweepResult(scanned, deleted, reclaimed, complete=True), None
@@ -0,0 +1,286 @@
+"""Resume media downloads that were interrupted by a restart.
+
+yt-dlp writes media into the feed's tmp directory as ``.part`` files, along
+with finished streams that are waiting to be merged, and only moves the
+result into the media directory once it is complete. When the process is
+killed mid-download these files stay behind and the download stays QUEUED.
+yt-dlp picks them up again with ``--continue``, but that is only safe when
+the retry selects the same format: resuming with different yt-dlp arguments
+would append another format's bytes to the partial file.
+
+Before each media download the Downloader writes a resume marker into the
+tmp directory holding the download's media content key, which covers the
+video and the feed's yt-dlp arguments. At startup,
+:class:`PartialDownloadRecovery` inventories the tmp directories and keeps
+the files of downloads that are still QUEUED with an unchanged content key,
+so their next attempt continues where it stopped. Files of downloads that
+finished, disappeared or changed arguments are deleted, as are partial files
+without a marker, which cannot be validated.
+"""
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+
+from .config import FeedConfig
+from .db.download_db import DownloadDatabase
+from .db.types import Download, DownloadStatus
+from .exceptions import DownloadNotFoundError, FileOperationError
+from .media_dedup import media_content_key
+from .metrics.instruments import PARTIAL_BYTES_SALVAGED
+from .path_manager import PathManager
+
+logger = logging.getLogger(__name__)
+
+# Suffix of the file recording the content key of an interrupted download
+RESUME_MARKER_SUFFIX = ".resume"
+
+type _SizedPath = tuple[Path, int]
+
+
+@dataclass(frozen=True, slots=True)
+class RecoveryResult:
+    """Outcome of the startup recovery pass over the tmp directories.
+
+    Attributes:
+        downloads_resumable: Interrupted downloads whose files were kept.
+        bytes_salvaged: Size of the files kept for yt-dlp to resume.
+        files_removed: Stale partial files and markers deleted.
+        bytes_discarded: Size of the partial files deleted.
+    """
+
+    downloads_resumable: int = 0
+    bytes_salvaged: int = 0
+    files_removed: int = 0
+    bytes_discarded: int = 0
+
+
+def _is_partial(name: str) -> bool:
+    """Return whether a tmp file name belongs to an unfinished yt-dlp download."""
+    return ".part" in name or name.endswith(".ytdl")
+
+
+def _feed_dirs(base_tmp_dir: Path) -> list[Path]:
+    """List the per-feed tmp directories; runs in a worker thread."""
+    try:
+        with os.scandir(base_tmp_dir) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _inventory(
+    feed_tmp_dir: Path,
+) -> tuple[dict[str, list[_SizedPath]], list[_SizedPath]]:
+    """Group a feed's tmp files by the marker of the download that owns them.
+
+    Runs in a worker thread. A file belongs to a marked download when its
+    name starts with the download id followed by a dot, as yt-dlp's output
+    template produces.
+
+    Returns:
+        Files of each marked download keyed by download id, and partial files
+        that no marker owns.
+    """
+    sizes: dict[str, int] = {}
+    with os.scandir(feed_tmp_dir) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                sizes[entry.name] = entry.stat(follow_symlinks=False).st_size
+
+    owned: dict[str, list[_SizedPath]] = {
+        name.removesuffix(RESUME_MARKER_SUFFIX): []
+        for name in sizes
+        if name.endswith(RESUME_MARKER_SUFFIX)
+    }
+    unowned: list[_SizedPath] = []
+    for name, size in sizes.items():
+        if name.endswith(RESUME_MARKER_SUFFIX):
+            continue
+        # Prefer the longest id in case one id is a prefix of another
+        owner = max(
+            (d for d in owned if name.startswith(f"{d}.")), key=len, default=None
+        )
+        if owner is not None:
+            owned[owner].append((feed_tmp_dir / name, size))
+        elif _is_partial(name):
+            unowned.append((feed_tmp_dir / name, size))
+    return owned, unowned
+
+
+def _remove(paths: list[Path]) -> int:
+    """Delete files, returning how many were removed; runs in a worker thread."""
+    removed = 0
+    for path in paths:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning(
+                "Failed to delete stale partial file.",
+                extra={"path": str(path)},
+                exc_info=e,
+            )
+            continue
+        removed += 1
+    return removed
+
+
+class PartialDownloadRecovery:
+    """Record resumable media downloads and recover them after a restart.
+
+    Attributes:
+        _download_db: Database manager for download record operations.
+        _paths: PathManager locating the feed tmp directories.
+    """
+
+    def __init__(self, download_db: DownloadDatabase, paths: PathManager):
+        self._download_db = download_db
+        self._paths = paths
+        logger.debug("PartialDownloadRecovery initialized.")
+
+    async def _marker_path(self, download: Download) -> Path:
+        """Return the resume marker path of a download in its feed's tmp dir."""
+        tmp_dir = await self._paths.feed_tmp_dir(download.feed_id)
+        return tmp_dir / f"{download.id}{RESUME_MARKER_SUFFIX}"
+
+    async def mark_started(self, download: Download, content_key: str) -> None:
+        """Record that a media download is about to write partial files.
+
+        Failures are logged and ignored; without a marker the partial files
+        are discarded instead of resumed after a restart.
+
+        Args:
+            download: The download about to be fetched.
+            content_key: The download's media fingerprint.
+        """
+        try:
+            marker = await self._marker_path(download)
+            async with aiofiles.open(marker, "w") as f:
+                await f.write(content_key)
+        except (OSError, FileOperationError) as e:
+            logger.warning(
+                "Failed to write resume marker.",
+                extra={"feed_id": download.feed_id, "download_id": download.id},
+                exc_info=e,
+            )
+
+    async def mark_finished(self, download: Download) -> None:
+        """Remove the resume marker of a completed media download.
+
+        Args:
+            download: The download whose media is now in place.
+        """
+        try:
+            await aiofiles.os.remove(await self._marker_path(download))
+        except FileNotFoundError:
+            pass
+        except (OSError, FileOperationError) as e:
+            logger.warning(
+                "Failed to remove resume marker.",
+                extra={"feed_id": download.feed_id, "download_id": download.id},
+                exc_info=e,
+            )
+
+    async def _is_resumable(
+        self,
+        feed_id: str,
+        download_id: str,
+        marker: Path,
+        feed_config: FeedConfig | None,
+    ) -> bool:
+        """Return whether a marked download's files can be resumed safely.
+
+        Raises:
+            DatabaseOperationError: If the download cannot be looked up.
+        """
+        if feed_config is None or not feed_config.enabled:
+            return False
+        try:
+            download = await self._download_db.get_download_by_id(feed_id, download_id)
+        except DownloadNotFoundError:
+            return False
+        if download.status != DownloadStatus.QUEUED:
+            return False
+        try:
+            async with aiofiles.open(marker) as f:
+                recorded_key = await f.read()
+        except OSError:
+            return False
+        return recorded_key == media_content_key(download, feed_config.yt_args)
+
+    async def recover(self, feed_configs: dict[str, FeedConfig]) -> RecoveryResult:
+        """Keep resumable partial downloads and delete the rest.
+
+        Must run before any download starts, since files of downloads in
+        progress would otherwise be judged as interrupted.
+
+        Args:
+            feed_configs: Current feed configurations, used to check that a
+                download's yt-dlp arguments did not change.
+
+        Returns:
+            Counts of the downloads kept and files removed.
+
+        Raises:
+            DatabaseOperationError: If a download cannot be looked up.
+            OSError: If a tmp directory cannot be listed.
+        """
+        resumable = 0
+        salvaged = 0
+        discard: list[_SizedPath] = []
+        feed_dirs = await asyncio.to_thread(_feed_dirs, self._paths.base_tmp_dir)
+        for feed_dir in feed_dirs:
+            feed_id = feed_dir.name
+            owned, unowned = await asyncio.to_thread(_inventory, feed_dir)
+            discard.extend(unowned)
+            for download_id, files in owned.items():
+                marker = feed_dir / f"{download_id}{RESUME_MARKER_SUFFIX}"
+                if not await self._is_resumable(
+                    feed_id, download_id, marker, feed_configs.get(feed_id)
+                ):
+                    discard.extend(files)
+                    discard.append((marker, 0))
+                    continue
+                if not files:
+                    continue
+                kept_bytes = sum(size for _, size in files)
+                resumable += 1
+                salvaged += kept_bytes
+                PARTIAL_BYTES_SALVAGED.inc(kept_bytes, feed_id=feed_id)
+                logger.debug(
+                    "Keeping interrupted download for resumption.",
+                    extra={
+                        "feed_id": feed_id,
+                        "download_id": download_id,
+                        "partial_bytes": kept_bytes,
+                    },
+                )
+
+        files_removed = await asyncio.to_thread(_remove, [path for path, _ in discard])
+        result = RecoveryResult(
+            downloads_resumable=resumable,
+            bytes_salvaged=salvaged,
+            files_removed=files_removed,
+            bytes_discarded=sum(size for _, size in discard),
+        )
+        logger.info(
+            "Partial download recovery completed.",
+            extra={
+                "downloads_resumable": result.downloads_resumable,
+                "bytes_salvaged": result.bytes_salvaged,
+                "files_removed": result.files_removed,
+                "bytes_discarded": result.bytes_discarded,
+            },
+        )
+        return result
@@ -45,6 +45,11 @@ class PathManager:
         """Return the directory used for image files."""
         return self._base_data_dir / "images"
 
+    @property
+    def base_image_cache_dir(self) -> Path:
+        """Return the directory used for resized image derivatives."""
+        return self._base_data_dir / "cache" / "images"
+
     @property
     def base_transcripts_dir(self) -> Path:
         """Return the directory used for transcript files."""
@@ -393,13 +398,20 @@ class PathManager:
 
         return urljoin(self.feed_media_url(feed_id), f"{download_id}.{ext}")
 
-    def image_url(self, feed_id: str, download_id: str | None, ext: str) -> str:
+    def image_url(
+        self,
+        feed_id: str,
+        download_id: str | None,
+        ext: str,
+        width: int | None = None,
+    ) -> str:
         """Return the HTTP URL for an image file.
 
         Args:
             feed_id: Unique identifier for the feed.
             download_id: Unique identifier for the download, or None for feed-level images.
             ext: File extension without the leading dot.
+            width: If given, request a copy resized to this width (``?w=``).
 
         Returns:
             Complete URL for accessing the image file via HTTP.
@@ -413,12 +425,15 @@ class PathManager:
         if download_id is not None and (not download_id or not download_id.strip()):
             raise ValueError("download_id cannot be empty or whitespace-only")
 
+        query = "" if width is None else f"?w={width}"
         if download_id is None:
             # Feed-level image
-            return urljoin(self._base_url, f"/images/{feed_id}.{ext}")
+            return urljoin(self._base_url, f"/images/{feed_id}.{ext}{query}")
         else:
             # Download-level image
-            return urljoin(self._base_url, f"/images/{feed_id}/{download_id}.{ext}")
+            return urljoin(
+                self._base_url, f"/images/{feed_id}/{download_id}.{ext}{query}"
+            )
 
     async def image_path(self, feed_id: str, download_id: str | None, ext: str) -> Path:
         """Return the full file system path for an image file.
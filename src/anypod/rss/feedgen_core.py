@@ -13,6 +13,7 @@ from feedgen.feed import FeedGenerator  # type: ignore
 
 from ..db.types import Download, Feed, SourceType
 from ..exceptions import RSSGenerationError
+from ..image_derivatives import RSS_CHANNEL_IMAGE_WIDTH
 from ..mimetypes import mimetypes
 from ..path_manager import PathManager
 from .podcast_extension import Podcast, PodcastEntryExtension
@@ -94,8 +95,14 @@ class FeedgenCore:
                     "Invalid feed identifier for image URL", feed_id=feed_id
                 ) from e
             fg.podcast.itunes_image(hosted_feed_image_url)  # type: ignore
+            # The RSS <image> element is limited to 144px; serve a resized copy
+            channel_image_url = hosted_feed_image_url
+            if feed.image_ext == "jpg":
+                channel_image_url = paths.image_url(
+                    feed_id, None, feed.image_ext, width=RSS_CHANNEL_IMAGE_WIDTH
+                )
             fg.image(  # type: ignore
-                url=hosted_feed_image_url,
+                url=channel_image_url,
                 title=feed.title,
                 link=self._source_url,
                 description=f"Artwork for {feed.title}",
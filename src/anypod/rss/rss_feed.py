@@ -4,6 +4,9 @@ This module provides the RSSFeedGenerator class for creating RSS podcast
 feeds from download metadata and persisting the XML to disk for serving, including integration with the feedgen library.
 """
 
+import asyncio
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
 import logging
 
 import aiofiles.os
@@ -23,18 +26,26 @@ class RSSFeedGenerator:
     Manages RSS feed generation using feedgen with podcast extensions and
     persists the resulting XML to disk for serving by the HTTP layer.
 
+    Rendering is CPU-bound and holds the GIL, so it runs on ``render_executor``
+    instead of the event loop. Pass a ProcessPoolExecutor to keep large feeds
+    from stalling HTTP serving; None uses the loop's default thread pool. If a
+    worker dies and breaks the pool, rendering falls back to threads.
+
     Attributes:
         _download_db: Database manager for querying download data.
         _paths: Path manager for resolving URLs and download paths.
+        _render_executor: Executor that renders feed XML.
     """
 
     def __init__(
         self,
         download_db: DownloadDatabase,
         paths: PathManager,
+        render_executor: Executor | None = None,
     ):
         self._download_db = download_db
         self._paths = paths
+        self._render_executor = render_executor
         logger.debug("RSSFeedGenerator initialized.")
 
     async def _get_feed_downloads(self, feed_id: str) -> list[Download]:
@@ -88,15 +99,20 @@ class RSSFeedGenerator:
         )
 
         downloads = await self._get_feed_downloads(feed_id)
-        feed_xml = (
-            FeedgenCore(
-                paths=self._paths,
-                feed_id=feed_id,
-                feed=feed,
+        render_args = (self._paths, feed_id, feed, downloads)
+        try:
+            feed_xml = await asyncio.get_running_loop().run_in_executor(
+                self._render_executor, _render_feed_xml, *render_args
             )
-            .with_downloads(downloads)
-            .xml()
-        )
+        except BrokenProcessPool as e:
+            # A broken pool rejects every later submission, so stop using it
+            logger.error(
+                "RSS render worker terminated unexpectedly, rendering in threads from now on.",
+                extra={"feed_id": feed_id},
+                exc_info=e,
+            )
+            self._render_executor = None
+            feed_xml = await asyncio.to_thread(_render_feed_xml, *render_args)
         # Persist RSS XML to disk atomically
         try:
             tmp_path = await self._paths.tmp_file(feed_id)
@@ -117,3 +133,27 @@ class RSSFeedGenerator:
                 "num_episodes": len(downloads),
             },
         )
+
+
+def _render_feed_xml(
+    paths: PathManager, feed_id: str, feed: Feed, downloads: list[Download]
+) -> bytes:
+    """Render RSS XML for a feed.
+
+    Module-level so it can be pickled and run in a worker process. The feed and
+    download rows arrive as detached, fully loaded copies.
+
+    Args:
+        paths: Path manager for resolving URLs.
+        feed_id: The feed identifier.
+        feed: Feed database object containing metadata.
+        downloads: Downloads to include, sorted newest first.
+
+    Returns:
+        RSS feed as UTF-8 encoded XML bytes.
+    """
+    return (
+        FeedgenCore(paths=paths, feed_id=feed_id, feed=feed)
+        .with_downloads(downloads)
+        .xml()
+    )
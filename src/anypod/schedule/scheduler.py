@@ -11,13 +11,21 @@ import logging
 import time
 
 from ..config import FeedConfig
+from ..config.types import CronExpression
 from ..data_coordinator import DataCoordinator
 from ..data_coordinator.types import ProcessingResults
+from ..db.maintenance import DatabaseMaintenance
+from ..db.types import MaintenanceResult
 from ..logging_config import set_context_id
+from ..metrics.instruments import SCHEDULER_QUEUE_WAIT_SECONDS
+from ..orphan_gc import OrphanFileCollector, OrphanSweepResult
 from .apscheduler_core import APSchedulerCore
 
 logger = logging.getLogger(__name__)
 
+DB_MAINTENANCE_JOB_ID = "db_maintenance"
+ORPHAN_GC_JOB_ID = "orphan_gc"
+
 
 class FeedScheduler:
     """Manage scheduled feed processing using APScheduler.
@@ -26,6 +34,12 @@ class FeedScheduler:
     for periodic feed processing, including job lifecycle management,
     graceful shutdown, and event monitoring.
 
+    When a DatabaseMaintenance instance and schedule are supplied, a database
+    maintenance job is scheduled alongside the feeds. It shares the feed
+    semaphore so it only runs while no feed is being processed. An orphan
+    file sweep is scheduled the same way when an OrphanFileCollector and
+    schedule are supplied.
+
     Attributes:
         _scheduler: APSchedulerCore instance.
         _global_feed_semaphore: Global semaphore to limit concurrent feed processing.
@@ -37,6 +51,10 @@ class FeedScheduler:
         feed_configs: dict[str, FeedConfig],
         data_coordinator: DataCoordinator,
         feed_semaphore: asyncio.Semaphore | None = None,
+        db_maintenance: DatabaseMaintenance | None = None,
+        maintenance_schedule: CronExpression | None = None,
+        orphan_collector: OrphanFileCollector | None = None,
+        orphan_gc_schedule: CronExpression | None = None,
     ):
         self._scheduler = APSchedulerCore()
         self._feed_semaphore = feed_semaphore or asyncio.Semaphore(1)
@@ -60,10 +78,36 @@ class FeedScheduler:
                 feed_semaphore=self._feed_semaphore,
             )
 
+        if db_maintenance is not None and maintenance_schedule is not None:
+            self._scheduler.schedule_job(
+                job_id=DB_MAINTENANCE_JOB_ID,
+                cron_expression=maintenance_schedule,
+                jitter=0,
+                callback=FeedScheduler._run_db_maintenance,
+                db_maintenance=db_maintenance,
+                feed_semaphore=self._feed_semaphore,
+            )
+
+        if orphan_collector is not None and orphan_gc_schedule is not None:
+            self._scheduler.schedule_job(
+                job_id=ORPHAN_GC_JOB_ID,
+                cron_expression=orphan_gc_schedule,
+                jitter=0,
+                callback=FeedScheduler._run_orphan_gc,
+                orphan_collector=orphan_collector,
+                feed_semaphore=self._feed_semaphore,
+            )
+
         # Register event listeners
         self._scheduler.add_job_completed_listener(
             ProcessingResults, self._job_completed_callback
         )
+        self._scheduler.add_job_completed_listener(
+            MaintenanceResult, self._maintenance_completed_callback
+        )
+        self._scheduler.add_job_completed_listener(
+            OrphanSweepResult, self._orphan_gc_completed_callback
+        )
         self._scheduler.add_job_failed_listener(self._job_failed_callback)
         self._scheduler.add_job_missed_listener(self._job_missed_callback)
 
@@ -122,6 +166,8 @@ class FeedScheduler:
         feed_ids: list[str] = []
 
         for job_id in job_ids:
+            if job_id in (DB_MAINTENANCE_JOB_ID, ORPHAN_GC_JOB_ID):
+                continue
             feed_id = self._job_to_feed_id(job_id)
             feed_ids.append(feed_id or f"<invalid job id: {job_id}>")
 
@@ -186,7 +232,11 @@ class FeedScheduler:
         )
 
         # Execute the main feed processing logic with global rate limiting
+        queued_at = time.perf_counter()
         async with feed_semaphore:
+            SCHEDULER_QUEUE_WAIT_SECONDS.observe(
+                time.perf_counter() - queued_at, job=feed_id
+            )
             logger.debug(
                 "Acquired global feed processing semaphore.",
                 extra={
@@ -195,6 +245,50 @@ class FeedScheduler:
             )
             return await data_coordinator.process_feed(feed_id, feed_config)
 
+    @staticmethod
+    async def _run_db_maintenance(
+        db_maintenance: DatabaseMaintenance,
+        feed_semaphore: asyncio.Semaphore,
+    ) -> MaintenanceResult:
+        """Run database maintenance once no feed is being processed.
+
+        Args:
+            db_maintenance: The DatabaseMaintenance instance.
+            feed_semaphore: The global feed processing semaphore.
+
+        Returns:
+            MaintenanceResult from the maintenance run.
+        """
+        set_context_id(f"{DB_MAINTENANCE_JOB_ID}-{int(time.time())}")
+        queued_at = time.perf_counter()
+        async with feed_semaphore:
+            SCHEDULER_QUEUE_WAIT_SECONDS.observe(
+                time.perf_counter() - queued_at, job=DB_MAINTENANCE_JOB_ID
+            )
+            return await db_maintenance.run()
+
+    @staticmethod
+    async def _run_orphan_gc(
+        orphan_collector: OrphanFileCollector,
+        feed_semaphore: asyncio.Semaphore,
+    ) -> OrphanSweepResult:
+        """Run an orphan file sweep once no feed is being processed.
+
+        Args:
+            orphan_collector: The OrphanFileCollector instance.
+            feed_semaphore: The global feed processing semaphore.
+
+        Returns:
+            OrphanSweepResult from the sweep.
+        """
+        set_context_id(f"{ORPHAN_GC_JOB_ID}-{int(time.time())}")
+        queued_at = time.perf_counter()
+        async with feed_semaphore:
+            SCHEDULER_QUEUE_WAIT_SECONDS.observe(
+                time.perf_counter() - queued_at, job=ORPHAN_GC_JOB_ID
+            )
+            return await orphan_collector.run()
+
     @staticmethod
     def _job_completed_callback(
         job_id: str, scheduled_run_time: datetime, retval: ProcessingResults
@@ -225,6 +319,46 @@ class FeedScheduler:
                 extra=log_params,
             )
 
+    @staticmethod
+    def _maintenance_completed_callback(
+        job_id: str, scheduled_run_time: datetime, retval: MaintenanceResult
+    ) -> None:
+        """Handle database maintenance job completion events.
+
+        Args:
+            job_id: The job identifier.
+            scheduled_run_time: The scheduled run time of the job.
+            retval: The MaintenanceResult from the job execution.
+        """
+        logger.debug(
+            "Scheduled database maintenance job completed.",
+            extra={
+                "job_id": job_id,
+                "scheduled_run_time": scheduled_run_time.isoformat(),
+                **retval.summary_dict(),
+            },
+        )
+
+    @staticmethod
+    def _orphan_gc_completed_callback(
+        job_id: str, scheduled_run_time: datetime, retval: OrphanSweepResult
+    ) -> None:
+        """Handle orphan file sweep completion events.
+
+        Args:
+            job_id: The job identifier.
+            scheduled_run_time: The scheduled run time of the job.
+            retval: The OrphanSweepResult from the job execution.
+        """
+        logger.debug(
+            "Scheduled orphan file sweep completed.",
+            extra={
+                "job_id": job_id,
+                "scheduled_run_time": scheduled_run_time.isoformat(),
+                **retval.summary_dict(),
+            },
+        )
+
     @staticmethod
     def _job_failed_callback(
         job_id: str, scheduled_run_time: datetime, exception: Exception
@@ -8,6 +8,7 @@ from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 import logging
 from pathlib import Path
+import time
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exception_handlers import http_exception_handler
@@ -20,11 +21,15 @@ from ..config import FeedConfig
 from ..data_coordinator import DataCoordinator
 from ..db.download_db import DownloadDatabase
 from ..db.feed_db import FeedDatabase
+from ..disk_space import DiskSpaceGuard
 from ..file_manager import FileManager
+from ..image_derivatives import ImageDerivativeCache
+from ..loop_monitor import LoopLagMonitor
 from ..manual_feed_runner import ManualFeedRunner
 from ..manual_submission_service import ManualSubmissionService
+from ..metrics.instruments import HTTP_REQUEST_SECONDS
 from ..ytdlp_wrapper import YtdlpWrapper
-from .routers import admin, health, static
+from .routers import admin, health, metrics, static
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +72,36 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """Middleware to record request latency by route template."""
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        """Time the request until its response starts.
+
+        The route template (e.g. ``/media/{feed_id}/{filename}``) is used as
+        the label rather than the raw path to keep metric cardinality bounded.
+
+        Args:
+            request: The incoming HTTP request.
+            call_next: The next middleware or endpoint to call.
+
+        Returns:
+            The HTTP response.
+        """
+        started = time.perf_counter()
+        response = await call_next(request)
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(response.status_code),
+        )
+        return response
+
+
 async def log_http_exception(request: Request, exc: Exception) -> Response:
     """Log HTTPExceptions before returning them to the client.
 
@@ -111,6 +146,9 @@ def create_app(
     cookies_path: Path | None = None,
     shutdown_callback: Callable[[], Awaitable[None]] | None = None,
     include_admin: bool = False,
+    loop_monitor: LoopLagMonitor | None = None,
+    image_cache: ImageDerivativeCache | None = None,
+    disk_space_guard: DiskSpaceGuard | None = None,
 ) -> FastAPI:
     """Create and configure a FastAPI application instance.
 
@@ -129,6 +167,9 @@ def create_app(
         cookies_path: Path to cookies.txt file for authentication.
         shutdown_callback: Optional callback function for graceful shutdown.
         include_admin: When true, mount admin routes on this app (single-server mode).
+        loop_monitor: Event loop monitor reported by the admin diagnostics endpoint.
+        image_cache: Cache of resized images served for ``?w=`` requests.
+        disk_space_guard: Download admission control reported by health checks.
 
     Returns:
         Configured FastAPI application instance.
@@ -160,8 +201,9 @@ def create_app(
     #     allow_headers=["Accept", "Accept-Language", "Content-Type"],
     # )
 
-    # Add custom logging middleware
+    # Add custom logging and metrics middleware
     app.add_middleware(LoggingMiddleware)
+    app.add_middleware(MetricsMiddleware)
 
     # Register exception handlers
     app.add_exception_handler(HTTPException, log_http_exception)
@@ -176,14 +218,19 @@ def create_app(
     app.state.manual_feed_runner = manual_feed_runner
     app.state.manual_submission_service = manual_submission_service
     app.state.cookies_path = cookies_path
+    app.state.loop_monitor = loop_monitor
+    app.state.image_cache = image_cache
+    app.state.disk_space_guard = disk_space_guard
 
     # Include public routers
     app.include_router(static.router, tags=["static"])
     app.include_router(health.router, tags=["health"])  # /api/health on public server
 
-    # Include admin router in single-server mode
+    # Include admin router in single-server mode; metrics move under /admin so
+    # the same path gating protects them
     if include_admin:
         app.include_router(admin.router, tags=["admin"])
+        app.include_router(metrics.router, prefix="/admin", tags=["metrics"])
 
     logger.debug("FastAPI application created successfully")
 
@@ -200,12 +247,14 @@ def create_admin_app(
     manual_feed_runner: ManualFeedRunner,
     manual_submission_service: ManualSubmissionService,
     cookies_path: Path | None = None,
+    loop_monitor: LoopLagMonitor | None = None,
+    disk_space_guard: DiskSpaceGuard | None = None,
 ) -> FastAPI:
     """Create and configure the admin FastAPI application instance.
 
     The admin app exposes private administration endpoints and should be bound
     to a private interface/port (e.g., 127.0.0.1). It intentionally includes
-    only the admin router.
+    only the admin, metrics and health routers.
 
     Args:
         rss_generator: The RSS feed generator instance.
@@ -218,6 +267,8 @@ def create_admin_app(
         manual_feed_runner: The manual feed runner instance.
         manual_submission_service: Service for manual submission metadata fetches.
         cookies_path: Path to cookies.txt file for authentication.
+        loop_monitor: Event loop monitor reported by the admin diagnostics endpoint.
+        disk_space_guard: Download admission control reported by health checks.
 
     Returns:
         Configured FastAPI application instance for admin APIs.
@@ -228,8 +279,9 @@ def create_admin_app(
         version="0.1.0",
     )
 
-    # Reuse logging middleware for consistency
+    # Reuse logging and metrics middleware for consistency
     app.add_middleware(LoggingMiddleware)
+    app.add_middleware(MetricsMiddleware)
 
     # Register exception handlers
     app.add_exception_handler(HTTPException, log_http_exception)
@@ -244,9 +296,12 @@ def create_admin_app(
     app.state.manual_feed_runner = manual_feed_runner
     app.state.manual_submission_service = manual_submission_service
     app.state.cookies_path = cookies_path
+    app.state.loop_monitor = loop_monitor
+    app.state.disk_space_guard = disk_space_guard
 
-    # Include admin and health routers
+    # Include admin, metrics and health routers
     app.include_router(admin.router, tags=["admin"])
+    app.include_router(metrics.router, tags=["metrics"])
     app.include_router(health.router, tags=["health"])
 
     logger.debug("FastAPI admin application created successfully")
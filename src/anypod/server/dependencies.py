@@ -13,7 +13,10 @@ from anypod.config import FeedConfig
 from anypod.data_coordinator import DataCoordinator
 from anypod.db.download_db import DownloadDatabase
 from anypod.db.feed_db import FeedDatabase
+from anypod.disk_space import DiskSpaceGuard
 from anypod.file_manager import FileManager
+from anypod.image_derivatives import ImageDerivativeCache
+from anypod.loop_monitor import LoopLagMonitor
 from anypod.manual_feed_runner import ManualFeedRunner
 from anypod.manual_submission_service import ManualSubmissionService
 from anypod.ytdlp_wrapper import YtdlpWrapper
@@ -129,6 +132,42 @@ def get_cookies_path(request: Request) -> Path | None:
     return request.app.state.cookies_path
 
 
+def get_loop_monitor(request: Request) -> LoopLagMonitor | None:
+    """Return the event loop monitor, if one is running.
+
+    Args:
+        request: Incoming FastAPI request.
+
+    Returns:
+        LoopLagMonitor from ``app.state`` or ``None`` when not configured.
+    """
+    return request.app.state.loop_monitor
+
+
+def get_image_cache(request: Request) -> ImageDerivativeCache | None:
+    """Return the resized image cache, if one is configured.
+
+    Args:
+        request: Incoming FastAPI request.
+
+    Returns:
+        ImageDerivativeCache from ``app.state`` or ``None`` when not configured.
+    """
+    return request.app.state.image_cache
+
+
+def get_disk_space_guard(request: Request) -> DiskSpaceGuard | None:
+    """Return the download disk space guard, if one is configured.
+
+    Args:
+        request: Incoming FastAPI request.
+
+    Returns:
+        DiskSpaceGuard from ``app.state`` or ``None`` when not configured.
+    """
+    return request.app.state.disk_space_guard
+
+
 FileManagerDep = Annotated[FileManager, Depends(get_file_manager)]
 # RSS feed serving no longer depends on RSSFeedGenerator; feeds are served from disk
 FeedDatabaseDep = Annotated[FeedDatabase, Depends(get_feed_database)]
@@ -142,3 +181,6 @@ ManualSubmissionServiceDep = Annotated[
     Depends(get_manual_submission_service),
 ]
 CookiesPathDep = Annotated[Path | None, Depends(get_cookies_path)]
+LoopMonitorDep = Annotated[LoopLagMonitor | None, Depends(get_loop_monitor)]
+ImageCacheDep = Annotated[ImageDerivativeCache | None, Depends(get_image_cache)]
+DiskSpaceGuardDep = Annotated[DiskSpaceGuard | None, Depends(get_disk_space_guard)]
@@ -12,7 +12,8 @@ from typing import Any
 from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import AwareDatetime, BaseModel, Field
 
-from ...db.types import Download, DownloadStatus
+from ...data_coordinator.phase_timings import PhaseTimingSnapshot
+from ...db.types import Download, DownloadStatus, StatusCounterMismatch
 from ...exceptions import (
     DatabaseOperationError,
     DownloadNotFoundError,
@@ -23,6 +24,8 @@ from ...exceptions import (
     ManualSubmissionUnavailableError,
     RSSGenerationError,
 )
+from ...loop_monitor import LoopLagStats, SlowCallbackStats
+from ...ytdlp_wrapper.core import DownloadProgress
 from ..dependencies import (
     CookiesPathDep,
     DataCoordinatorDep,
@@ -30,8 +33,10 @@ from ..dependencies import (
     FeedConfigsDep,
     FeedDatabaseDep,
     FileManagerDep,
+    LoopMonitorDep,
     ManualFeedRunnerDep,
     ManualSubmissionServiceDep,
+    YtdlpWrapperDep,
 )
 from ..validation import ValidatedFeedId
 
@@ -750,3 +755,111 @@ async def delete_download(
         },
     )
     return Response(status_code=204)
+
+
+class StatusCounterCheckResponse(BaseModel):
+    """Response model for the feed status counter consistency check.
+
+    Attributes:
+        consistent: True when every counter matched a recount of downloads.
+        repaired: True when mismatched counters were recomputed.
+        mismatches: Counters that disagreed with the download table.
+    """
+
+    consistent: bool
+    repaired: bool
+    mismatches: list[StatusCounterMismatch]
+
+
+@router.post("/db/status-counters/check", response_model=StatusCounterCheckResponse)
+async def check_status_counters(
+    feed_db: FeedDatabaseDep,
+    repair: bool = Query(
+        default=False,
+        description="Recompute counters for feeds whose values have drifted.",
+    ),
+) -> StatusCounterCheckResponse:
+    """Verify the trigger-maintained per-status counters on every feed.
+
+    Args:
+        feed_db: Feed database dependency.
+        repair: Whether to recompute mismatched counters.
+
+    Returns:
+        StatusCounterCheckResponse listing any mismatches found.
+
+    Raises:
+        HTTPException: 500 on database errors.
+    """
+    logger.debug("Admin status counter check requested.", extra={"repair": repair})
+
+    try:
+        mismatches = await feed_db.check_status_counters(repair=repair)
+    except DatabaseOperationError as e:
+        raise HTTPException(status_code=500, detail="Database error") from e
+
+    return StatusCounterCheckResponse(
+        consistent=not mismatches,
+        repaired=repair and bool(mismatches),
+        mismatches=mismatches,
+    )
+
+
+class DiagnosticsResponse(BaseModel):
+    """Response model for event loop and pipeline timing diagnostics.
+
+    Attributes:
+        loop_lag: Recent event loop lag percentiles, or None if not monitored.
+        slow_callbacks: Callbacks that blocked the loop, worst total time first.
+        phases: Wall and CPU time histograms per DataCoordinator phase.
+    """
+
+    loop_lag: LoopLagStats | None
+    slow_callbacks: dict[str, SlowCallbackStats]
+    phases: dict[str, PhaseTimingSnapshot]
+
+
+@router.get("/diagnostics", response_model=DiagnosticsResponse)
+async def get_diagnostics(
+    data_coordinator: DataCoordinatorDep,
+    loop_monitor: LoopMonitorDep,
+) -> DiagnosticsResponse:
+    """Report what is keeping the event loop busy.
+
+    Args:
+        data_coordinator: Data coordinator dependency.
+        loop_monitor: Event loop monitor dependency.
+
+    Returns:
+        DiagnosticsResponse with loop lag, slow callbacks and phase timings.
+    """
+    return DiagnosticsResponse(
+        loop_lag=loop_monitor.stats() if loop_monitor else None,
+        slow_callbacks=loop_monitor.slow_callbacks() if loop_monitor else {},
+        phases=data_coordinator.phase_timings.snapshot(),
+    )
+
+
+class DownloadProgressResponse(BaseModel):
+    """Response model for in-flight media download progress.
+
+    Attributes:
+        downloads: Progress of every running media download, oldest first.
+    """
+
+    downloads: list[DownloadProgress]
+
+
+@router.get("/downloads/progress", response_model=DownloadProgressResponse)
+async def get_download_progress(
+    ytdlp_wrapper: YtdlpWrapperDep,
+) -> DownloadProgressResponse:
+    """Report live progress of media downloads that are currently running.
+
+    Args:
+        ytdlp_wrapper: yt-dlp wrapper dependency.
+
+    Returns:
+        DownloadProgressResponse with bytes, speed and ETA per download.
+    """
+    return DownloadProgressResponse(downloads=ytdlp_wrapper.progress_tracker.active())
@@ -10,6 +10,8 @@ from typing import Literal
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from ..dependencies import DiskSpaceGuardDep
+
 router = APIRouter(prefix="/api")
 
 
@@ -30,16 +32,22 @@ class HealthResponse(BaseModel):
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+async def health_check(disk_space_guard: DiskSpaceGuardDep) -> HealthResponse:
     """Check the health status of the Anypod service.
 
-    Returns basic health information including status and timestamp.
+    Returns basic health information including status and timestamp. The
+    service reports itself degraded while the data volume has less free
+    space than downloads require, checked on every request.
+
+    Args:
+        disk_space_guard: Download admission control, if configured.
 
     Returns:
         Health status response.
     """
+    low_space = disk_space_guard is not None and disk_space_guard.is_low_on_space()
     return HealthResponse(
-        status="healthy",
+        status="degraded" if low_space else "healthy",
         timestamp=datetime.now(UTC),
         service="anypod",
         version="0.1.0",
@@ -0,0 +1,22 @@
+"""Prometheus metrics router for the admin server.
+
+Exposes the process-wide metrics registry in the Prometheus text format. Like
+the admin router, it is meant for trusted scrapers only.
+"""
+
+from fastapi import APIRouter, Response
+
+from ...metrics import CONTENT_TYPE
+from ...metrics.instruments import REGISTRY
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=Response)
+async def get_metrics() -> Response:
+    """Render all registered metrics for a Prometheus scrape.
+
+    Returns:
+        Plain-text response in the Prometheus exposition format.
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
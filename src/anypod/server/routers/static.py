@@ -2,17 +2,25 @@
 
 import html
 import logging
+from pathlib import Path
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import FileResponse, Response
 
 from ...db.types import DownloadStatus
-from ...exceptions import DatabaseOperationError, FileOperationError
+from ...exceptions import (
+    DatabaseOperationError,
+    FileOperationError,
+    ImageProcessingError,
+)
+from ...image_derivatives import ImageDerivativeCache
 from ...mimetypes import mimetypes
 from ..dependencies import (
     DownloadDatabaseDep,
     FeedDatabaseDep,
     FileManagerDep,
+    ImageCacheDep,
 )
 from ..validation import ValidatedExtension, ValidatedFeedId, ValidatedFilename
 
@@ -20,6 +28,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+ImageWidthQuery = Annotated[
+    int | None, Query(alias="w", ge=1, description="Serve a resized copy this wide")
+]
+
 
 def _generate_directory_listing(
     title: str, links: list[tuple[str, str]], parent_path: str | None = None
@@ -79,6 +91,43 @@ def _generate_directory_listing(
 </html>"""
 
 
+async def _image_response(
+    file_path: Path,
+    ext: str,
+    width: int | None,
+    image_cache: ImageDerivativeCache | None,
+) -> FileResponse:
+    """Build the response for a stored image, resizing it if requested.
+
+    A resized copy is only produced for JPG images. If resizing fails the
+    original image is served instead.
+
+    Args:
+        file_path: Path of the stored image.
+        ext: The file extension of the image file.
+        width: Requested width in pixels, or None for the original.
+        image_cache: Cache of resized images, or None if disabled.
+
+    Returns:
+        File response with image content.
+    """
+    if width is not None and image_cache is not None and ext == "jpg":
+        try:
+            file_path = await image_cache.get(file_path, width)
+        except ImageProcessingError as e:
+            logger.warning(
+                "Failed to resize image, serving original.",
+                extra={"path": str(file_path), "width": width},
+                exc_info=e,
+            )
+
+    return FileResponse(
+        path=file_path,
+        media_type=mimetypes.guess_type(f"file.{ext}")[0],
+        headers={"Cache-Control": "public, max-age=86400"},  # 24 hours
+    )
+
+
 @router.api_route("/feeds/{feed_id}.xml", methods=["GET", "HEAD"])
 async def serve_feed(
     feed_id: ValidatedFeedId,
@@ -279,6 +328,8 @@ async def serve_feed_image(
     feed_id: ValidatedFeedId,
     ext: ValidatedExtension,
     file_manager: FileManagerDep,
+    image_cache: ImageCacheDep,
+    w: ImageWidthQuery = None,
 ) -> FileResponse:
     """Serve feed-level image file.
 
@@ -286,6 +337,8 @@ async def serve_feed_image(
         feed_id: The unique identifier for the feed.
         ext: The file extension of the image file.
         file_manager: The file manager dependency.
+        image_cache: Cache of resized images.
+        w: Optional width to resize the image to.
 
     Returns:
         File response with image content.
@@ -302,11 +355,7 @@ async def serve_feed_image(
     except FileOperationError as e:
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
-    return FileResponse(
-        path=file_path,
-        media_type=mimetypes.guess_type(f"file.{ext}")[0],
-        headers={"Cache-Control": "public, max-age=86400"},  # 24 hours
-    )
+    return await _image_response(file_path, ext, w, image_cache)
 
 
 @router.api_route("/images/{feed_id}/{filename}.{ext}", methods=["GET", "HEAD"])
@@ -315,6 +364,8 @@ async def serve_download_image(
     filename: ValidatedFilename,
     ext: ValidatedExtension,
     file_manager: FileManagerDep,
+    image_cache: ImageCacheDep,
+    w: ImageWidthQuery = None,
 ) -> FileResponse:
     """Serve download-level image file.
 
@@ -323,6 +374,8 @@ async def serve_download_image(
         filename: The download identifier (filename without extension).
         ext: The file extension of the image file.
         file_manager: The file manager dependency.
+        image_cache: Cache of resized images.
+        w: Optional width to resize the image to.
 
     Returns:
         File response with image content.
@@ -341,11 +394,7 @@ async def serve_download_image(
     except FileOperationError as e:
         raise HTTPException(status_code=500, detail="Internal server error") from e
 
-    return FileResponse(
-        path=file_path,
-        media_type=mimetypes.guess_type(f"file.{ext}")[0],
-        headers={"Cache-Control": "public, max-age=86400"},  # 24 hours
-    )
+    return await _image_response(file_path, ext, w, image_cache)
 
 
 @router.api_route(
@@ -14,8 +14,11 @@ from ..config import AppSettings, FeedConfig
 from ..data_coordinator import DataCoordinator
 from ..db.download_db import DownloadDatabase
 from ..db.feed_db import FeedDatabase
+from ..disk_space import DiskSpaceGuard
 from ..file_manager import FileManager
+from ..image_derivatives import ImageDerivativeCache
 from ..logging_config import LOGGING_CONFIG
+from ..loop_monitor import LoopLagMonitor
 from ..manual_feed_runner import ManualFeedRunner
 from ..manual_submission_service import ManualSubmissionService
 from ..ytdlp_wrapper import YtdlpWrapper
@@ -37,6 +40,9 @@ def create_server(
     cookies_path: Path | None,
     shutdown_callback: Callable[[], Awaitable[None]] | None = None,
     include_admin: bool = False,
+    loop_monitor: LoopLagMonitor | None = None,
+    image_cache: ImageDerivativeCache | None = None,
+    disk_space_guard: DiskSpaceGuard | None = None,
 ) -> uvicorn.Server:
     """Create and configure a uvicorn HTTP server with FastAPI app.
 
@@ -53,6 +59,9 @@ def create_server(
         cookies_path: Path to cookies.txt file for authentication.
         shutdown_callback: Optional callback to execute during shutdown.
         include_admin: When true, mount admin routes on the main app (single-server mode).
+        loop_monitor: Event loop monitor reported by the admin diagnostics endpoint.
+        image_cache: Cache of resized images served for ``?w=`` requests.
+        disk_space_guard: Download admission control reported by health checks.
 
     Returns:
         Configured uvicorn server ready to run.
@@ -70,6 +79,9 @@ def create_server(
         cookies_path=cookies_path,
         shutdown_callback=shutdown_callback,
         include_admin=include_admin,
+        loop_monitor=loop_monitor,
+        image_cache=image_cache,
+        disk_space_guard=disk_space_guard,
     )
 
     # Configure proxy settings based on trusted_proxies
@@ -111,6 +123,8 @@ def create_admin_server(
     manual_submission_service: ManualSubmissionService,
     feed_configs: dict[str, FeedConfig],
     cookies_path: Path | None,
+    loop_monitor: LoopLagMonitor | None = None,
+    disk_space_guard: DiskSpaceGuard | None = None,
 ) -> uvicorn.Server:
     """Create and configure a uvicorn HTTP server for the admin FastAPI app.
 
@@ -125,6 +139,8 @@ def create_admin_server(
         manual_submission_service: Service for manual submission metadata lookups.
         feed_configs: The feed configurations.
         cookies_path: Path to cookies.txt file for authentication.
+        loop_monitor: Event loop monitor reported by the admin diagnostics endpoint.
+        disk_space_guard: Download admission control reported by health checks.
 
     Returns:
         Configured uvicorn server ready to run the admin app.
@@ -140,6 +156,8 @@ def create_admin_server(
         manual_feed_runner=manual_feed_runner,
         manual_submission_service=manual_submission_service,
         cookies_path=cookies_path,
+        loop_monitor=loop_monitor,
+        disk_space_guard=disk_space_guard,
     )
 
     config = uvicorn.Config(
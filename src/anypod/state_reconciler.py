@@ -25,7 +25,7 @@ from .exceptions import (
     YtdlpError,
 )
 from .file_manager import FileManager
-from .image_downloader import ImageDownloader
+from .image_downloader import ImageDownloader, ImageValidators
 from .metadata import merge_feed_metadata
 from .ytdlp_wrapper import YtdlpWrapper
 
@@ -34,6 +34,29 @@ logger = logging.getLogger(__name__)
 MIN_SYNC_DATE = datetime(2005, 1, 1, tzinfo=UTC)
 
 
+def _stored_image_validators(feed: Feed | None, url: str) -> ImageValidators | None:
+    """Return validators of a feed's stored image for a direct fetch of url.
+
+    ETag and Last-Modified belong to the URL that returned them, so they are
+    only reused for the same URL; the content hash applies to any URL.
+    """
+    if feed is None or feed.image_ext is None or feed.image_content_hash is None:
+        return None
+    if feed.remote_image_url != url:
+        return ImageValidators(content_hash=feed.image_content_hash)
+    return ImageValidators(
+        etag=feed.image_etag,
+        last_modified=feed.image_last_modified,
+        content_hash=feed.image_content_hash,
+    )
+
+
+def _set_image_validators(feed: Feed, validators: ImageValidators | None) -> None:
+    feed.image_etag = validators.etag if validators else None
+    feed.image_last_modified = validators.last_modified if validators else None
+    feed.image_content_hash = validators.content_hash if validators else None
+
+
 class StateReconciler:
     """Manage state reconciliation between configuration and database.
 
@@ -182,10 +205,12 @@ class StateReconciler:
         )
 
         if feed_config.is_manual:
-            image_ext = await self._download_manual_image_override(feed_id, feed_config)
+            image_ext = await self._download_manual_image_override(
+                feed_id, feed_config, new_feed
+            )
         else:
             image_ext = await self._download_initial_feed_image(
-                feed_id, feed_config, fetched_feed, cookies_path
+                feed_id, feed_config, fetched_feed, new_feed, cookies_path
             )
 
         if image_ext:
@@ -203,23 +228,61 @@ class StateReconciler:
                 feed_id=feed_id,
             ) from e
 
+    async def _download_direct_image(
+        self,
+        feed_id: str,
+        url: str,
+        target: Feed,
+        existing_feed: Feed | None = None,
+    ) -> str:
+        """Download a feed image over HTTP, revalidating the stored copy.
+
+        The validators of the resulting image are recorded on ``target``.
+
+        Args:
+            feed_id: The feed identifier.
+            url: Image URL to download.
+            target: Feed that will be persisted with the image.
+            existing_feed: Feed as currently stored, if any.
+
+        Returns:
+            Extension of the stored image.
+
+        Raises:
+            ImageDownloadError: If the image cannot be downloaded or stored.
+        """
+        result = await self._image_downloader.download_feed_image_direct(
+            feed_id, url, cached=_stored_image_validators(existing_feed, url)
+        )
+        _set_image_validators(target, result.validators)
+        return result.ext
+
     async def _download_manual_image_override(
         self,
         feed_id: str,
         feed_config: FeedConfig,
+        target: Feed,
         existing_feed: Feed | None = None,
     ) -> str | None:
-        """Download image override for manual feeds, if configured."""
+        """Download image override for manual feeds, if configured.
+
+        An unchanged URL is only fetched again when the stored image was
+        downloaded directly, since the request is then conditional.
+        """
         override_url = feed_config.metadata.image_url if feed_config.metadata else None
         if not override_url:
             return None
 
-        if existing_feed and existing_feed.remote_image_url == override_url:
+        if (
+            existing_feed
+            and existing_feed.remote_image_url == override_url
+            and existing_feed.image_content_hash is None
+        ):
             return existing_feed.image_ext
 
         try:
-            result = await self._image_downloader.download_feed_image_direct(
-                feed_id, override_url
+            result = await self._download_direct_image(
+                feed_id, override_url, target, existing_feed
             )
         except ImageDownloadError as e:
             logger.warning(
@@ -240,6 +303,7 @@ class StateReconciler:
         feed_id: str,
         feed_config: FeedConfig,
         fetched_feed: Feed,
+        target: Feed,
         cookies_path: Path | None,
     ) -> str | None:
         """Download the image for newly created scheduled feeds."""
@@ -247,8 +311,8 @@ class StateReconciler:
         override_url = feed_config.metadata.image_url if feed_config.metadata else None
         if override_url:
             try:
-                image_ext = await self._image_downloader.download_feed_image_direct(
-                    feed_id, override_url
+                image_ext = await self._download_direct_image(
+                    feed_id, override_url, target
                 )
             except ImageDownloadError as e:
                 logger.warning(
@@ -541,6 +605,16 @@ class StateReconciler:
                 )
                 should_download = True
                 download_by_ytdlp = True
+            # Override unchanged: revalidate an image that was fetched directly
+            case (str() as old_url, str() as new_url, _) if (
+                old_url == new_url and db_feed.image_content_hash is not None
+            ):
+                logger.debug(
+                    "Image URL override unchanged - will revalidate stored image.",
+                    extra={**log_params, "image_url": new_url},
+                )
+                should_download = True
+                download_by_ytdlp = False
             case _:
                 return None
 
@@ -558,13 +632,14 @@ class StateReconciler:
                         user_yt_cli_args=feed_config.yt_args,
                         cookies_path=cookies_path,
                     )
-
+                    if result:
+                        # yt-dlp images carry no validators
+                        _set_image_validators(updated_feed, None)
                 else:
                     # config_image_url is guaranteed to be defined due to match statement
                     assert config_image_url is not None
-                    result = await self._image_downloader.download_feed_image_direct(
-                        feed_id,
-                        config_image_url,
+                    result = await self._download_direct_image(
+                        feed_id, config_image_url, updated_feed, db_feed
                     )
             except ImageDownloadError as e:
                 logger.warning(
@@ -997,7 +1072,7 @@ class StateReconciler:
 
         if feed_config.is_manual:
             new_image_ext = await self._download_manual_image_override(
-                feed_id, feed_config, existing_feed=db_feed
+                feed_id, feed_config, updated_feed, existing_feed=db_feed
             )
         else:
             new_image_ext = await self._handle_image_url_changes(
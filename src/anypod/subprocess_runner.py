@@ -0,0 +1,213 @@
+"""Shared runner for external tool subprocesses (yt-dlp, ffprobe, ffmpeg).
+
+Every subprocess is started in its own session so that it and anything it
+spawns (yt-dlp launches ffmpeg, for example) form one process group. On
+timeout or cancellation the whole group is killed, so no orphaned children
+keep running in the background. Optional resource limits are applied to the
+child right after it starts.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, Mapping, Sequence
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from enum import StrEnum
+import logging
+import os
+import resource
+import signal
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class SubprocessOperation(StrEnum):
+    """Kinds of subprocess run, each with its own wall-clock timeout."""
+
+    YTDLP_METADATA = "ytdlp_metadata"
+    YTDLP_DOWNLOAD = "ytdlp_download"
+    FFPROBE = "ffprobe"
+    FFMPEG = "ffmpeg"
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceLimits:
+    """Resource limits applied to every subprocess.
+
+    Attributes:
+        max_memory_bytes: Address-space limit (``RLIMIT_AS``), or None for no limit.
+        nice: Scheduling niceness added to the child, or None to inherit.
+        ionice_class: I/O scheduling class (1 realtime, 2 best-effort, 3 idle),
+            or None to inherit.
+    """
+
+    max_memory_bytes: int | None = None
+    nice: int | None = None
+    ionice_class: int | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SubprocessResult:
+    """Outcome of a completed subprocess.
+
+    Attributes:
+        returncode: Process exit code.
+        stdout: Captured standard output.
+        stderr: Captured standard error.
+        duration_seconds: Wall-clock time from start to exit.
+    """
+
+    returncode: int
+    stdout: bytes
+    stderr: bytes
+    duration_seconds: float
+
+
+class SubprocessRunner:
+    """Start, time, bound and clean up external tool subprocesses.
+
+    Attributes:
+        _timeouts: Wall-clock timeout in seconds keyed by operation.
+        _limits: Resource limits applied to every child.
+    """
+
+    def __init__(
+        self,
+        timeouts: Mapping[SubprocessOperation, float] | None = None,
+        limits: ResourceLimits | None = None,
+    ) -> None:
+        self._timeouts: dict[SubprocessOperation, float] = dict(timeouts or {})
+        self._limits = limits or ResourceLimits()
+
+    def timeout_for(self, operation: SubprocessOperation) -> float | None:
+        """Return the wall-clock timeout for an operation.
+
+        Args:
+            operation: Kind of subprocess run.
+
+        Returns:
+            Timeout in seconds, or None if the operation is unbounded.
+        """
+        return self._timeouts.get(operation)
+
+    def _command(self, cmd: Sequence[str]) -> list[str]:
+        # The stdlib has no ioprio_set, so I/O class is set through ionice(1)
+        if self._limits.ionice_class is not None:
+            return ["ionice", "-c", str(self._limits.ionice_class), *cmd]
+        return list(cmd)
+
+    def _apply_limits(self, pid: int) -> None:
+        """Apply limits to a freshly started child.
+
+        Limits are set from the parent rather than in ``preexec_fn``, which is
+        unsafe while other threads are running. They are inherited by anything
+        the child spawns afterwards.
+        """
+        limits = self._limits
+        try:
+            if limits.max_memory_bytes is not None:
+                resource.prlimit(
+                    pid,
+                    resource.RLIMIT_AS,
+                    (limits.max_memory_bytes, limits.max_memory_bytes),
+                )
+            if limits.nice is not None:
+                os.setpriority(os.PRIO_PROCESS, pid, limits.nice)
+        except OSError as e:
+            logger.warning(
+                "Failed to apply subprocess resource limits.",
+                extra={"pid": pid},
+                exc_info=e,
+            )
+
+    @staticmethod
+    def kill(process: asyncio.subprocess.Process) -> None:
+        """Kill the process and every process in its group.
+
+        Args:
+            process: Process started by this runner.
+        """
+        if process.returncode is not None:
+            return
+        with suppress(ProcessLookupError):
+            os.killpg(process.pid, signal.SIGKILL)
+
+    @asynccontextmanager
+    async def open(
+        self, operation: SubprocessOperation, cmd: Sequence[str], **kwargs: Any
+    ) -> AsyncGenerator[asyncio.subprocess.Process]:
+        """Start a subprocess and guarantee it is reaped.
+
+        The block is bounded by the operation's timeout. If the block raises,
+        times out or is cancelled, the process group is killed. The process is
+        always waited for before the context exits.
+
+        Args:
+            operation: Kind of subprocess run, selecting its timeout.
+            cmd: Executable and arguments.
+            **kwargs: Passed to :func:`asyncio.create_subprocess_exec`.
+
+        Yields:
+            The running process.
+
+        Raises:
+            FileNotFoundError: If the executable does not exist.
+            OSError: If the process cannot be started.
+            TimeoutError: If the operation's timeout elapses.
+        """
+        started = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            *self._command(cmd), start_new_session=True, **kwargs
+        )
+        self._apply_limits(process.pid)
+        try:
+            async with asyncio.timeout(self.timeout_for(operation)):
+                yield process
+        except BaseException:
+            self.kill(process)
+            raise
+        finally:
+            await process.wait()
+            logger.debug(
+                "Subprocess finished.",
+                extra={
+                    "operation": str(operation),
+                    "exit_code": process.returncode,
+                    "duration_seconds": round(time.perf_counter() - started, 3),
+                },
+            )
+
+    async def run(
+        self, operation: SubprocessOperation, cmd: Sequence[str], **kwargs: Any
+    ) -> SubprocessResult:
+        """Run a subprocess to completion, capturing its output.
+
+        Args:
+            operation: Kind of subprocess run, selecting its timeout.
+            cmd: Executable and arguments.
+            **kwargs: Passed to :func:`asyncio.create_subprocess_exec`.
+
+        Returns:
+            SubprocessResult with exit code, output and duration.
+
+        Raises:
+            FileNotFoundError: If the executable does not exist.
+            OSError: If the process cannot be started.
+            TimeoutError: If the operation's timeout elapses.
+        """
+        started = time.perf_counter()
+        async with self.open(
+            operation,
+            cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            **kwargs,
+        ) as process:
+            stdout, stderr = await process.communicate()
+        return SubprocessResult(
+            returncode=process.returncode or 0,
+            stdout=stdout or b"",
+            stderr=stderr or b"",
+            duration_seconds=time.perf_counter() - started,
+        )
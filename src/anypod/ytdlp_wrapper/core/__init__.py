@@ -1,9 +1,13 @@
 from .args import YtdlpArgs
 from .core import YtdlpCore, YtdlpRunResult
 from .info import YtdlpInfo
+from .progress import DownloadProgress, DownloadProgressTracker, ProgressMonitor
 from .thumbnails import YtdlpThumbnail, YtdlpThumbnails
 
 __all__ = [
+    "DownloadProgress",
+    "DownloadProgressTracker",
+    "ProgressMonitor",
     "YtdlpArgs",
     "YtdlpCore",
     "YtdlpInfo",
@@ -40,11 +40,14 @@ class YtdlpArgs:
         self._quiet = False
         self._no_warnings = False
         self._no_progress = False
+        self._newline = False
+        self._progress_template: str | None = None
         self._dump_single_json = False
         self._dump_json = False
 
         # Download control
         self._skip_download = False
+        self._continue_partial = False
 
         # Playlist control
         self._flat_playlist = False
@@ -107,11 +110,34 @@ class YtdlpArgs:
         self._no_progress = True
         return self
 
+    def newline(self) -> YtdlpArgs:
+        """Print each progress update on its own line."""
+        self._newline = True
+        return self
+
+    def progress_template(self, template: str) -> YtdlpArgs:
+        """Set the ``--progress-template`` used for progress lines.
+
+        Args:
+            template: yt-dlp progress template, optionally prefixed with a type
+                such as ``download:``.
+
+        Returns:
+            The builder instance for chaining.
+        """
+        self._progress_template = template
+        return self
+
     def skip_download(self) -> YtdlpArgs:
         """Extract metadata only, don't download media."""
         self._skip_download = True
         return self
 
+    def continue_partial(self) -> YtdlpArgs:
+        """Resume partially downloaded files, overriding ``--no-continue``."""
+        self._continue_partial = True
+        return self
+
     def flat_playlist(self) -> YtdlpArgs:
         """Extract playlist metadata without individual entries."""
         self._flat_playlist = True
@@ -407,6 +433,10 @@ class YtdlpArgs:
             cmd.append("--no-warnings")
         if self._no_progress:
             cmd.append("--no-progress")
+        if self._newline:
+            cmd.append("--newline")
+        if self._progress_template is not None:
+            cmd.extend(["--progress-template", self._progress_template])
         if self._dump_single_json:
             cmd.append("--dump-single-json")
         if self._dump_json:
@@ -415,6 +445,8 @@ class YtdlpArgs:
         # Download control
         if self._skip_download:
             cmd.append("--skip-download")
+        if self._continue_partial:
+            cmd.append("--continue")
 
         # Playlist control
         if self._flat_playlist:
@@ -4,10 +4,14 @@ import asyncio
 from dataclasses import dataclass
 import json
 import logging
+import time
 
 from ...exceptions import YtdlpApiError
+from ...metrics.instruments import YTDLP_RUN_SECONDS, YTDLP_RUNS
+from ...subprocess_runner import SubprocessOperation, SubprocessRunner
 from .args import YtdlpArgs
 from .info import YtdlpInfo
+from .progress import PROGRESS_TEMPLATE, ProgressMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,9 @@ def _format_run_output(stdout: str, stderr: str) -> str:
     return "\n\n".join(sections)
 
 
+# Generous per-line buffer so long yt-dlp output lines never overrun readline
+_STREAM_LIMIT = 16 * 1024 * 1024
+
 _DNS_RESOLUTION_ERROR_MARKERS = ("[Errno -3] Temporary failure in name resolution",)
 
 
@@ -43,6 +50,50 @@ def _looks_like_dns_resolution_error(stderr: str) -> bool:
     return any(marker in stderr for marker in _DNS_RESOLUTION_ERROR_MARKERS)
 
 
+def _record_run(operation: str, started: float, exit_code: int | None) -> None:
+    """Export the duration and exit code of a finished yt-dlp subprocess."""
+    YTDLP_RUN_SECONDS.observe(time.perf_counter() - started, operation=operation)
+    YTDLP_RUNS.inc(operation=operation, exit_code=str(exit_code))
+
+
+async def _watch_throughput(
+    proc: asyncio.subprocess.Process, progress: ProgressMonitor
+) -> None:
+    """Kill the process once the monitor reports a stalled download."""
+    while proc.returncode is None:
+        await asyncio.sleep(progress.check_interval)
+        if progress.check_stalled():
+            SubprocessRunner.kill(proc)
+            return
+
+
+async def _communicate_with_progress(
+    proc: asyncio.subprocess.Process, progress: ProgressMonitor
+) -> tuple[bytes, bytes]:
+    """Read output line by line, feeding progress lines to the monitor.
+
+    Progress lines are consumed rather than returned so that stored download
+    logs are not flooded with them.
+
+    Returns:
+        Tuple of (stdout without progress lines, stderr).
+    """
+    if proc.stdout is None or proc.stderr is None:
+        raise RuntimeError("Subprocess output is not piped.")
+    stderr_task = asyncio.create_task(proc.stderr.read())
+    watchdog = asyncio.create_task(_watch_throughput(proc, progress))
+    output: list[bytes] = []
+    try:
+        async for line in proc.stdout:
+            if not progress.update(line.decode("utf-8", errors="replace")):
+                output.append(line)
+        stderr = await stderr_task
+    finally:
+        watchdog.cancel()
+        stderr_task.cancel()
+    return b"".join(output), stderr
+
+
 @dataclass(frozen=True, slots=True)
 class YtdlpRunResult[T]:
     """Container for yt-dlp subprocess payloads and raw log output."""
@@ -52,16 +103,74 @@ class YtdlpRunResult[T]:
 
 
 class YtdlpCore:
-    """Static methods for core yt-dlp operations.
+    """Core yt-dlp operations run as bounded subprocesses.
 
     Provides a clean interface to yt-dlp functionality including option
     parsing, metadata extraction, and media downloading with proper
     error handling and conversion to application-specific exceptions.
+
+    Attributes:
+        _runner: Runner bounding every yt-dlp subprocess.
     """
 
-    @staticmethod
+    def __init__(self, runner: SubprocessRunner | None = None) -> None:
+        self._runner = runner or SubprocessRunner()
+
+    async def _run(
+        self,
+        operation: SubprocessOperation,
+        metric_operation: str,
+        cmd: list[str],
+        url: str,
+        progress: ProgressMonitor | None = None,
+    ) -> tuple[int | None, bytes, bytes]:
+        """Run yt-dlp under the shared runner and record its outcome.
+
+        Args:
+            operation: Runner operation selecting the wall-clock timeout.
+            metric_operation: Operation label for the exported metrics.
+            cmd: Full yt-dlp command line.
+            url: URL being processed, for error context.
+            progress: Optional monitor fed with progress lines from stdout.
+
+        Returns:
+            Tuple of (returncode, stdout, stderr).
+
+        Raises:
+            YtdlpApiError: If yt-dlp is missing or exceeds its timeout.
+        """
+        started = time.perf_counter()
+        spawned: asyncio.subprocess.Process | None = None
+        try:
+            async with self._runner.open(
+                operation,
+                cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                limit=_STREAM_LIMIT,
+            ) as proc:
+                spawned = proc
+                if progress is None:
+                    stdout, stderr = await proc.communicate()
+                else:
+                    stdout, stderr = await _communicate_with_progress(proc, progress)
+            return proc.returncode, stdout, stderr
+        except FileNotFoundError as e:
+            raise YtdlpApiError(
+                message="yt-dlp executable not found. Please ensure yt-dlp is installed and in PATH.",
+                url=url,
+            ) from e
+        except TimeoutError as e:
+            raise YtdlpApiError(
+                message="yt-dlp exceeded its time limit and was stopped.",
+                url=url,
+            ) from e
+        finally:
+            if spawned is not None:
+                _record_run(metric_operation, started, spawned.returncode)
+
     async def extract_playlist_info(
-        args: YtdlpArgs, url: str
+        self, args: YtdlpArgs, url: str
     ) -> YtdlpRunResult[YtdlpInfo]:
         """Extract playlist metadata without downloading media.
 
@@ -89,30 +198,14 @@ class YtdlpCore:
             "Running yt-dlp for playlist metadata extraction", extra={"cmd": cmd}
         )
 
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-        except FileNotFoundError as e:
-            raise YtdlpApiError(
-                message="yt-dlp executable not found. Please ensure yt-dlp is installed and in PATH.",
-                url=url,
-            ) from e
-
-        try:
-            stdout, stderr = await proc.communicate()
-        except asyncio.CancelledError:
-            proc.kill()
-            raise
-        finally:
-            await proc.wait()
+        returncode, stdout, stderr = await self._run(
+            SubprocessOperation.YTDLP_METADATA, "playlist_info", cmd, url
+        )
 
         logger.debug(
             "yt-dlp process completed.",
             extra={
-                "exit_code": proc.returncode,
+                "exit_code": returncode,
                 "stdout_length": len(stdout) if stdout else 0,
                 "stderr_length": len(stderr) if stderr else 0,
                 "has_stdout": bool(stdout),
@@ -123,9 +216,9 @@ class YtdlpCore:
         stderr_text = stderr.decode("utf-8", errors="replace") if stderr else ""
         combined_logs = _format_run_output(stdout_text, stderr_text)
 
-        if proc.returncode != 0 and proc.returncode != 101:
+        if returncode != 0 and returncode != 101:
             raise YtdlpApiError(
-                message=f"yt-dlp completed with error {proc.returncode}: {stderr_text}",
+                message=f"yt-dlp completed with error {returncode}: {stderr_text}",
                 url=url,
                 logs=combined_logs,
             )
@@ -150,9 +243,8 @@ class YtdlpCore:
             logs=combined_logs,
         )
 
-    @staticmethod
     async def extract_downloads_info(
-        args: YtdlpArgs, url: str
+        self, args: YtdlpArgs, url: str
     ) -> YtdlpRunResult[list[YtdlpInfo]]:
         """Extract download metadata without downloading media content.
 
@@ -175,30 +267,14 @@ class YtdlpCore:
             "Running yt-dlp for filtered downloads extraction", extra={"cmd": cmd}
         )
 
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-        except FileNotFoundError as e:
-            raise YtdlpApiError(
-                message="yt-dlp executable not found. Please ensure yt-dlp is installed and in PATH.",
-                url=url,
-            ) from e
-
-        try:
-            stdout, stderr = await proc.communicate()
-        except asyncio.CancelledError:
-            proc.kill()
-            raise
-        finally:
-            await proc.wait()
+        returncode, stdout, stderr = await self._run(
+            SubprocessOperation.YTDLP_METADATA, "downloads_info", cmd, url
+        )
 
         logger.debug(
             "yt-dlp process completed.",
             extra={
-                "exit_code": proc.returncode,
+                "exit_code": returncode,
                 "stdout_length": len(stdout) if stdout else 0,
                 "stderr_length": len(stderr) if stderr else 0,
                 "has_stdout": bool(stdout),
@@ -221,7 +297,7 @@ class YtdlpCore:
                 logger.warning(f"Failed to parse JSON line: {stripped_line[:100]}")
                 continue
 
-        if proc.returncode != 0:
+        if returncode != 0:
             if stderr_text.strip():
                 for line in stderr_text.strip().splitlines():
                     clean_line = line.strip()
@@ -229,7 +305,7 @@ class YtdlpCore:
                         logger.warning(
                             f"yt-dlp error: ${clean_line}",
                             extra={
-                                "exit_code": proc.returncode,
+                                "exit_code": returncode,
                             },
                         )
             if _looks_like_dns_resolution_error(stderr_text):
@@ -241,67 +317,64 @@ class YtdlpCore:
                     url=url,
                     logs=combined_logs,
                 )
-            if not entries and proc.returncode != 101:  # 101 == filtered out
+            if not entries and returncode != 101:  # 101 == filtered out
                 logger.warning(
                     "yt-dlp completed with errors and extracted no entries.",
                     extra={
-                        "exit_code": proc.returncode,
+                        "exit_code": returncode,
                         "url": url,
                     },
                 )
 
         return YtdlpRunResult(payload=entries, logs=combined_logs)
 
-    @staticmethod
-    async def download(args: YtdlpArgs, url: str) -> str:
+    async def download(
+        self, args: YtdlpArgs, url: str, progress: ProgressMonitor | None = None
+    ) -> str:
         """Download media from a URL using yt-dlp subprocess.
 
+        When a progress monitor is given, yt-dlp prints one progress line per
+        update which is fed to the monitor as it arrives, and the process is
+        killed if the monitor declares the download stalled.
+
         Args:
             args: YtdlpArgs object containing command-line arguments for yt-dlp.
             url: URL to download media from.
+            progress: Optional monitor receiving live progress for this download.
 
         Returns:
             Combined stdout/stderr log text emitted by yt-dlp.
 
         Raises:
-            YtdlpApiError: If download fails or returns a non-zero exit code.
+            YtdlpApiError: If download fails, stalls, or returns a non-zero exit code.
         """
         # Build subprocess command:
-        cli_cmd_prefix = args.no_warnings().no_progress().to_list()
+        if progress is None:
+            args = args.no_progress()
+        else:
+            args = args.newline().progress_template(PROGRESS_TEMPLATE)
+        cli_cmd_prefix = args.no_warnings().to_list()
         cmd = [*cli_cmd_prefix, url]
 
         logger.debug("Running yt-dlp for download", extra={"cmd": cmd})
 
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-        except FileNotFoundError as e:
-            raise YtdlpApiError(
-                message="yt-dlp executable not found. Please ensure yt-dlp is installed and in PATH.",
-                url=url,
-            ) from e
-
-        try:
-            stdout, stderr = await proc.communicate()
-        except asyncio.CancelledError:
-            # Ensure subprocess cleanup on cancellation
-            proc.kill()
-            raise
-        finally:
-            await proc.wait()
+        returncode, stdout, stderr = await self._run(
+            SubprocessOperation.YTDLP_DOWNLOAD, "download", cmd, url, progress
+        )
 
         stdout_text = stdout.decode("utf-8", errors="replace") if stdout else ""
         stderr_text = stderr.decode("utf-8", errors="replace") if stderr else ""
         combined_logs = _format_run_output(stdout_text, stderr_text)
 
-        if proc.returncode != 0:
+        if progress is not None and progress.stalled:
+            raise YtdlpApiError(
+                message="Download stalled below the minimum throughput and was stopped.",
+                url=url,
+                logs=combined_logs or None,
+            )
+        if returncode != 0:
             raise YtdlpApiError(
-                message=(
-                    f"Download failed with exit code {proc.returncode}: {stderr_text}"
-                ),
+                message=(f"Download failed with exit code {returncode}: {stderr_text}"),
                 url=url,
                 logs=combined_logs or None,
             )
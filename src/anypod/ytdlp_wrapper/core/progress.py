@@ -0,0 +1,269 @@
+"""Live progress tracking and stall detection for yt-dlp media downloads.
+
+yt-dlp is asked to print one machine-readable line per progress update via
+``--progress-template``. :class:`ProgressMonitor` parses those lines for a
+single download and decides whether its throughput has fallen below the
+configured floor; :class:`DownloadProgressTracker` keeps the monitors of all
+in-flight downloads so they can be reported by the admin API.
+"""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_PREFIX = "[anypod-progress]"
+PROGRESS_TEMPLATE = (
+    f"download:{PROGRESS_PREFIX} %(progress.status)s %(progress.downloaded_bytes)s "
+    "%(progress.total_bytes)s %(progress.total_bytes_estimate)s "
+    "%(progress.speed)s %(progress.eta)s"
+)
+_MISSING = "NA"
+
+
+@dataclass(frozen=True, slots=True)
+class DownloadProgress:
+    """Point-in-time progress of one media download.
+
+    Attributes:
+        feed_id: Feed the download belongs to.
+        download_id: Identifier of the download.
+        status: Last yt-dlp status (``starting``, ``downloading``, ``finished``).
+        downloaded_bytes: Bytes received for the file currently downloading.
+        total_bytes: Expected size of the current file, exact or estimated.
+        transferred_bytes: Bytes received across every file of this download.
+        speed_bps: Current speed reported by yt-dlp in bytes per second.
+        eta_seconds: Estimated seconds until the current file completes.
+        elapsed_seconds: Seconds since the download started.
+    """
+
+    feed_id: str
+    download_id: str
+    status: str
+    downloaded_bytes: int
+    total_bytes: int | None
+    transferred_bytes: int
+    speed_bps: float | None
+    eta_seconds: float | None
+    elapsed_seconds: float
+
+
+class ProgressMonitor:
+    """Follow the progress lines of one yt-dlp download.
+
+    Media is often fetched as several files (e.g. separate video and audio
+    streams); ``downloaded_bytes`` restarts for each, so completed files are
+    accumulated into the total transferred.
+
+    The throughput floor is only enforced while yt-dlp reports that it is
+    downloading, so metadata extraction and post-processing (merging,
+    thumbnail conversion) are never treated as a stall.
+
+    Attributes:
+        feed_id: Feed the download belongs to.
+        download_id: Identifier of the download.
+        min_speed: Throughput floor in bytes per second; 0 disables it.
+        stall_window: Seconds throughput must stay below the floor.
+        check_interval: Seconds between stall checks.
+        stalled: Whether the download was declared stalled.
+        _started: Monotonic start time.
+        _status: Last yt-dlp status.
+        _downloaded: Bytes of the current file.
+        _completed: Bytes of files that already finished.
+        _total: Expected size of the current file.
+        _speed: Last reported speed.
+        _eta: Last reported ETA.
+        _window_start: Monotonic start of the current throughput window.
+        _window_bytes: Bytes transferred when the window started.
+    """
+
+    def __init__(
+        self,
+        feed_id: str,
+        download_id: str,
+        min_speed: float = 0,
+        stall_window: float = 300.0,
+        check_interval: float = 5.0,
+    ) -> None:
+        self.feed_id = feed_id
+        self.download_id = download_id
+        self.min_speed = min_speed
+        self.stall_window = stall_window
+        self.check_interval = check_interval
+        self.stalled = False
+        self._started = time.monotonic()
+        self._status = "starting"
+        self._downloaded = 0
+        self._completed = 0
+        self._total: int | None = None
+        self._speed: float | None = None
+        self._eta: float | None = None
+        self._window_start = self._started
+        self._window_bytes = 0
+
+    @property
+    def transferred_bytes(self) -> int:
+        """Return bytes received across all files of this download."""
+        return self._completed + self._downloaded
+
+    def update(self, line: str) -> bool:
+        """Apply a line of yt-dlp output if it is a progress line.
+
+        Args:
+            line: One line of yt-dlp stdout.
+
+        Returns:
+            True if the line was a progress line and has been consumed.
+        """
+        if not line.startswith(PROGRESS_PREFIX):
+            return False
+        fields = line[len(PROGRESS_PREFIX) :].split()
+        if len(fields) != 6:
+            return True
+        status, downloaded, total, estimate, speed, eta = fields
+        downloaded_bytes = _parse_int(downloaded) or 0
+        if downloaded_bytes < self._downloaded:
+            # A new file started; keep what the previous one transferred
+            self._completed += self._downloaded
+        self._status = status
+        self._downloaded = downloaded_bytes
+        self._total = _parse_int(total) or _parse_int(estimate)
+        self._speed = _parse_float(speed)
+        self._eta = _parse_float(eta)
+        return True
+
+    def check_stalled(self, now: float | None = None) -> bool:
+        """Decide whether throughput stayed below the floor for a full window.
+
+        Windows are consecutive: once one completes above the floor a new one
+        starts. While yt-dlp is not actively downloading the window restarts
+        on every check.
+
+        Args:
+            now: Monotonic time to evaluate at; defaults to the current time.
+
+        Returns:
+            True if the download should be considered stalled.
+        """
+        now = time.monotonic() if now is None else now
+        if self.min_speed <= 0 or self._status != "downloading":
+            self._restart_window(now)
+            return False
+        elapsed = now - self._window_start
+        if elapsed <= 0 or elapsed < self.stall_window:
+            return False
+        rate = (self.transferred_bytes - self._window_bytes) / elapsed
+        if rate < self.min_speed:
+            self.stalled = True
+            logger.warning(
+                "Download throughput below floor; treating as stalled.",
+                extra={
+                    "feed_id": self.feed_id,
+                    "download_id": self.download_id,
+                    "bytes_per_second": round(rate, 1),
+                    "min_bytes_per_second": self.min_speed,
+                    "window_seconds": self.stall_window,
+                },
+            )
+            return True
+        self._restart_window(now)
+        return False
+
+    def _restart_window(self, now: float) -> None:
+        self._window_start = now
+        self._window_bytes = self.transferred_bytes
+
+    def snapshot(self) -> DownloadProgress:
+        """Return the current progress.
+
+        Returns:
+            DownloadProgress for this download.
+        """
+        return DownloadProgress(
+            feed_id=self.feed_id,
+            download_id=self.download_id,
+            status=self._status,
+            downloaded_bytes=self._downloaded,
+            total_bytes=self._total,
+            transferred_bytes=self.transferred_bytes,
+            speed_bps=self._speed,
+            eta_seconds=self._eta,
+            elapsed_seconds=time.monotonic() - self._started,
+        )
+
+
+class DownloadProgressTracker:
+    """Registry of in-flight media downloads and their throughput policy.
+
+    Attributes:
+        _min_speed: Throughput floor in bytes per second; 0 disables it.
+        _stall_window: Seconds throughput must stay below the floor.
+        _check_interval: Seconds between stall checks.
+        _active: Monitors of running downloads keyed by (feed_id, download_id).
+    """
+
+    def __init__(
+        self,
+        min_speed: float = 0,
+        stall_window: float = 300.0,
+        check_interval: float = 5.0,
+    ) -> None:
+        self._min_speed = min_speed
+        self._stall_window = stall_window
+        self._check_interval = check_interval
+        self._active: dict[tuple[str, str], ProgressMonitor] = {}
+
+    @contextmanager
+    def track(self, feed_id: str, download_id: str) -> Generator[ProgressMonitor]:
+        """Register a download for the duration of the block.
+
+        Args:
+            feed_id: Feed the download belongs to.
+            download_id: Identifier of the download.
+
+        Yields:
+            ProgressMonitor to hand to the yt-dlp runner.
+        """
+        monitor = ProgressMonitor(
+            feed_id,
+            download_id,
+            min_speed=self._min_speed,
+            stall_window=self._stall_window,
+            check_interval=self._check_interval,
+        )
+        key = (feed_id, download_id)
+        self._active[key] = monitor
+        try:
+            yield monitor
+        finally:
+            if self._active.get(key) is monitor:
+                del self._active[key]
+
+    def active(self) -> list[DownloadProgress]:
+        """Return the progress of every running download, oldest first.
+
+        Returns:
+            List of DownloadProgress snapshots.
+        """
+        return [monitor.snapshot() for monitor in self._active.values()]
+
+
+def _parse_int(value: str) -> int | None:
+    if value == _MISSING:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def _parse_float(value: str) -> float | None:
+    if value == _MISSING:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
@@ -1,3 +1,4 @@
+from .base_handler import SourceHandlerBase
 from .handler_selector import HandlerSelector
 from .patreon_handler import (
     PatreonHandler,
@@ -18,6 +19,7 @@ from .youtube_handler import (
 __all__ = [
     "HandlerSelector",
     "PatreonHandler",
+    "SourceHandlerBase",
     "TwitterHandler",
     "YoutubeHandler",
     "YtdlpPatreonDataError",
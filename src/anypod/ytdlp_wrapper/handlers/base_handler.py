@@ -18,8 +18,15 @@ class SourceHandlerBase(Protocol):
     Implementations of this protocol provide source-specific behavior for
     different media platforms, handling URL classification, option customization,
     and metadata parsing into Download objects.
+
+    Attributes:
+        io_bound_extraction: Whether ``extract_download_metadata`` may perform
+            I/O (e.g. remote probing). Such handlers have entries extracted
+            concurrently; pure parsing handlers are run inline.
     """
 
+    io_bound_extraction: bool
+
     async def determine_fetch_strategy(
         self,
         feed_id: str,
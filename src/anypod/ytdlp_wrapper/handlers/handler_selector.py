@@ -7,8 +7,10 @@ source-specific logic for metadata extraction and download configuration.
 
 from urllib.parse import urlparse
 
+from ...db import RemoteProbeDatabase
 from ...exceptions import YtdlpError
 from ...ffprobe import FFProbe
+from ..core import YtdlpCore
 from .base_handler import SourceHandlerBase
 from .patreon_handler import PatreonHandler
 from .twitter_handler import TwitterHandler
@@ -18,12 +20,23 @@ from .youtube_handler import YoutubeHandler
 class HandlerSelector:
     """Resolve source handlers based on URL hostnames."""
 
-    def __init__(self, ffprobe: FFProbe):
-        self._default_handler = YoutubeHandler()
+    def __init__(
+        self,
+        ffprobe: FFProbe,
+        ytdlp_core: YtdlpCore,
+        probe_cache: RemoteProbeDatabase | None = None,
+        max_concurrent_probes: int = 4,
+    ):
+        self._default_handler = YoutubeHandler(ytdlp_core)
         self._hostname_handlers = {
-            "patreon.com": PatreonHandler(ffprobe),
-            "x.com": TwitterHandler(),
-            "twitter.com": TwitterHandler(),
+            "patreon.com": PatreonHandler(
+                ffprobe,
+                ytdlp_core,
+                probe_cache=probe_cache,
+                max_concurrent_probes=max_concurrent_probes,
+            ),
+            "x.com": TwitterHandler(ytdlp_core),
+            "twitter.com": TwitterHandler(ytdlp_core),
         }
 
     def select(self, url: str) -> SourceHandlerBase:
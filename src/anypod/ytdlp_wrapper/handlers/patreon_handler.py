@@ -6,15 +6,20 @@ yt-dlp's extraction model: creator pages act like playlists and individual
 posts act like single videos.
 """
 
+import asyncio
 from collections.abc import Generator
 from contextlib import contextmanager
 from datetime import UTC, datetime
+import hashlib
 import logging
 from pathlib import Path
 from typing import Any, cast
+from urllib.parse import urlsplit
 
+from ...db import RemoteProbeDatabase
 from ...db.types import Download, DownloadStatus, Feed, SourceType, TranscriptSource
 from ...exceptions import (
+    DatabaseOperationError,
     FFProbeError,
     YtdlpApiError,
     YtdlpDataError,
@@ -31,6 +36,17 @@ logger = logging.getLogger(__name__)
 _PATREON_REFERER = "https://www.patreon.com"
 
 
+def _media_fingerprint(url: str) -> str:
+    """Fingerprint a media URL independently of its rotating signature.
+
+    Patreon CDN URLs carry short-lived tokens in the query string, so only the
+    scheme, host and path identify the underlying media file.
+    """
+    parts = urlsplit(url)
+    stable = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    return hashlib.sha256(stable.encode()).hexdigest()
+
+
 class YtdlpPatreonDataError(YtdlpDataError):
     """Raised when yt-dlp data extraction fails for Patreon.
 
@@ -377,10 +393,28 @@ class PatreonHandler:
     Implements the SourceHandlerBase protocol to provide Patreon-specific
     behavior for URL classification and metadata parsing into Download
     objects. No live/upcoming logic is applied for Patreon posts.
+
+    Attributes:
+        io_bound_extraction: Extraction may probe remote media with ffprobe.
+        _ffprobe: Probe used for posts that lack a duration.
+        _ytdlp_core: Runs the yt-dlp discovery and transcript calls.
+        _probe_cache: Persistent store of previously probed durations, if any.
+        _probe_semaphore: Bounds concurrent remote ffprobe runs.
     """
 
-    def __init__(self, ffprobe: FFProbe):
+    io_bound_extraction = True
+
+    def __init__(
+        self,
+        ffprobe: FFProbe,
+        ytdlp_core: YtdlpCore,
+        probe_cache: RemoteProbeDatabase | None = None,
+        max_concurrent_probes: int = 4,
+    ):
         self._ffprobe = ffprobe
+        self._ytdlp_core = ytdlp_core
+        self._probe_cache = probe_cache
+        self._probe_semaphore = asyncio.Semaphore(max_concurrent_probes)
 
     async def determine_fetch_strategy(
         self,
@@ -405,7 +439,7 @@ class PatreonHandler:
             base_args.skip_download().flat_playlist().referer("https://www.patreon.com")
         )
 
-        discovery_result = await YtdlpCore.extract_playlist_info(
+        discovery_result = await self._ytdlp_core.extract_playlist_info(
             discovery_args, initial_url
         )
         discovery_logs = discovery_result.logs
@@ -526,26 +560,69 @@ class PatreonHandler:
             "vcodec & vcodec != 'none' & ext != 'jpg' & ext != 'png' & ext != 'webp'"
         )
 
-    async def _probe_duration(self, feed_id: str, entry: PatreonEntry) -> int:
-        """Probe duration using entry URLs; raise wrapped error on failure.
+    @staticmethod
+    def _probe_candidate(entry: PatreonEntry) -> tuple[str | None, str | None]:
+        """Return the URL to probe and where it came from.
 
         Order of candidates:
         1) requested_download_urls[0]
         2) media_url
         3) first_format_url
         """
-        candidate_url: str | None = None
-        candidate_source: str | None = None
         if entry.requested_download_urls:
-            candidate_url = entry.requested_download_urls[0]
-            candidate_source = "requested_downloads"
-        elif entry.media_url:
-            candidate_url = entry.media_url
-            candidate_source = "media_url"
-        elif entry.first_format_url:
-            candidate_url = entry.first_format_url
-            candidate_source = "first_format_url"
+            return entry.requested_download_urls[0], "requested_downloads"
+        if entry.media_url:
+            return entry.media_url, "media_url"
+        if entry.first_format_url:
+            return entry.first_format_url, "first_format_url"
+        return None, None
+
+    async def _cached_duration(
+        self, feed_id: str, download_id: str, fingerprint: str
+    ) -> int | None:
+        """Look up a previously probed duration; cache errors count as a miss."""
+        if self._probe_cache is None:
+            return None
+        try:
+            return await self._probe_cache.get_duration(
+                feed_id, download_id, fingerprint
+            )
+        except DatabaseOperationError as e:
+            logger.warning(
+                "Failed to read probe cache; probing instead.",
+                extra={"feed_id": feed_id, "download_id": download_id},
+                exc_info=e,
+            )
+            return None
 
+    async def _store_duration(
+        self, feed_id: str, download_id: str, fingerprint: str, duration: int
+    ) -> None:
+        """Remember a probed duration; failures only cost a future re-probe."""
+        if self._probe_cache is None:
+            return
+        try:
+            await self._probe_cache.upsert_duration(
+                feed_id, download_id, fingerprint, duration
+            )
+        except DatabaseOperationError as e:
+            logger.warning(
+                "Failed to write probe cache.",
+                extra={"feed_id": feed_id, "download_id": download_id},
+                exc_info=e,
+            )
+
+    async def _probe_duration(self, feed_id: str, entry: PatreonEntry) -> int:
+        """Return the post's duration, probing its media URL if not cached.
+
+        A duration cached for the same post and media fingerprint is reused.
+        Otherwise ffprobe runs against the remote URL, with the number of
+        concurrent probes bounded, and the result is cached.
+
+        Raises:
+            YtdlpPatreonDataError: If no URL can be probed or probing fails.
+        """
+        candidate_url, candidate_source = self._probe_candidate(entry)
         if not candidate_url:
             raise YtdlpPatreonDataError(
                 "No media URL candidates found for duration probing.",
@@ -553,19 +630,25 @@ class PatreonHandler:
                 download_id=entry.download_id,
             )
 
+        fingerprint = _media_fingerprint(candidate_url)
+        cached = await self._cached_duration(feed_id, entry.download_id, fingerprint)
+        if cached is not None:
+            return cached
+
         try:
-            logger.debug(
-                "Probing duration with ffprobe.",
-                extra={
-                    "feed_id": feed_id,
-                    "download_id": entry.download_id,
-                    "candidate_source": candidate_source or "<unknown>",
-                    "candidate_url": candidate_url,
-                },
-            )
-            duration = await self._ffprobe.get_duration_seconds_from_url(
-                candidate_url, headers={"Referer": "https://www.patreon.com"}
-            )
+            async with self._probe_semaphore:
+                logger.debug(
+                    "Probing duration with ffprobe.",
+                    extra={
+                        "feed_id": feed_id,
+                        "download_id": entry.download_id,
+                        "candidate_source": candidate_source or "<unknown>",
+                        "candidate_url": candidate_url,
+                    },
+                )
+                duration = await self._ffprobe.get_duration_seconds_from_url(
+                    candidate_url, headers={"Referer": "https://www.patreon.com"}
+                )
         except FFProbeError as e:
             raise YtdlpPatreonDataError(
                 "Failed to probe duration from media URL.",
@@ -580,6 +663,7 @@ class PatreonHandler:
                 download_id=entry.download_id,
             )
 
+        await self._store_duration(feed_id, entry.download_id, fingerprint, duration)
         return duration
 
     async def extract_download_metadata(
@@ -748,7 +832,7 @@ class PatreonHandler:
             return False
 
         try:
-            await YtdlpCore.download(args, source_url)
+            await self._ytdlp_core.download(args, source_url)
         except YtdlpApiError as e:
             e.download_id = download_id
             e.url = source_url
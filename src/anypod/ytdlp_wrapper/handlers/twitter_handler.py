@@ -358,8 +358,17 @@ class TwitterHandler:
     Implements the SourceHandlerBase protocol to provide Twitter-specific
     behavior for URL classification and metadata parsing into Download
     objects. Twitter URLs are always single video posts.
+
+    Attributes:
+        io_bound_extraction: Extraction is pure parsing and needs no I/O.
+        _ytdlp_core: Runs the yt-dlp discovery and transcript calls.
     """
 
+    io_bound_extraction = False
+
+    def __init__(self, ytdlp_core: YtdlpCore):
+        self._ytdlp_core = ytdlp_core
+
     async def determine_fetch_strategy(
         self,
         feed_id: str,
@@ -383,7 +392,7 @@ class TwitterHandler:
         discovery_args = base_args.skip_download().flat_playlist()
 
         logger.debug("Performing discovery call.", extra=log_params)
-        discovery_result = await YtdlpCore.extract_playlist_info(
+        discovery_result = await self._ytdlp_core.extract_playlist_info(
             discovery_args, initial_url
         )
         discovery_logs = discovery_result.logs
@@ -674,7 +683,7 @@ class TwitterHandler:
             return False
 
         try:
-            await YtdlpCore.download(args, source_url)
+            await self._ytdlp_core.download(args, source_url)
         except YtdlpApiError as e:
             e.download_id = download_id
             e.url = source_url
@@ -493,8 +493,17 @@ class YoutubeHandler:
     Implements the SourceHandlerBase protocol to provide YouTube-specific
     behavior for URL classification, option customization, and metadata
     parsing into Download objects.
+
+    Attributes:
+        io_bound_extraction: Extraction is pure parsing and needs no I/O.
+        _ytdlp_core: Runs the yt-dlp discovery call.
     """
 
+    io_bound_extraction = False
+
+    def __init__(self, ytdlp_core: YtdlpCore):
+        self._ytdlp_core = ytdlp_core
+
     async def determine_fetch_strategy(
         self,
         feed_id: str,
@@ -524,7 +533,7 @@ class YoutubeHandler:
         discovery_args = base_args.skip_download().flat_playlist()
 
         logger.debug("Performing discovery call.", extra=log_params)
-        discovery_result = await YtdlpCore.extract_playlist_info(
+        discovery_result = await self._ytdlp_core.extract_playlist_info(
             discovery_args, initial_url
         )
         discovery_logs = discovery_result.logs
@@ -3,6 +3,7 @@
 from dataclasses import dataclass
 from pathlib import Path
 
+from ...ffprobe import MediaProbe
 from .transcript_info import TranscriptInfo
 
 
@@ -14,8 +15,10 @@ class DownloadedMedia:
         file_path: Path to the downloaded media file.
         logs: Combined stdout/stderr logs from the download process.
         transcript: Transcript metadata if a transcript was downloaded, None otherwise.
+        probe: ffprobe result from verifying the file, None if not probed.
     """
 
     file_path: Path
     logs: str
     transcript: TranscriptInfo | None
+    probe: MediaProbe | None = None
@@ -5,6 +5,7 @@ for metadata fetching and media downloading, integrating with source-specific
 handlers for different platforms.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from pathlib import Path
@@ -15,21 +16,25 @@ import aiofiles.os
 from ..db.app_state_db import AppStateDatabase
 from ..db.types import Download, Feed, SourceType, TranscriptSource
 from ..exceptions import (
-    FFmpegError,
     FFProbeError,
     FileOperationError,
+    ImageProcessingError,
     YtdlpApiError,
     YtdlpDownloadFilteredOutError,
 )
 from ..ffmpeg import FFmpeg
-from ..ffprobe import FFProbe
+from ..ffprobe import FFProbe, MediaProbe
+from ..image_pipeline import ImagePipeline
 from ..path_manager import PathManager
-from .core import YtdlpArgs, YtdlpCore
-from .handlers import HandlerSelector
+from .core import DownloadProgressTracker, YtdlpArgs, YtdlpCore, YtdlpInfo
+from .handlers import HandlerSelector, SourceHandlerBase
 from .types import DownloadedMedia, TranscriptInfo
 
 logger = logging.getLogger(__name__)
 
+# Entries extracted at once for handlers whose extraction performs I/O
+_EXTRACTION_CONCURRENCY = 16
+
 
 class YtdlpWrapper:
     """Wrapper around yt-dlp for fetching and parsing metadata and downloading media.
@@ -45,6 +50,9 @@ class YtdlpWrapper:
         _yt_channel: YouTube channel (stable, nightly) for yt-dlp self-updates.
         _yt_update_freq: Minimum interval between yt-dlp self-updates.
         _handler_selector: Resolves which source handler should process a URL.
+        _ytdlp_core: Runs yt-dlp under the configured subprocess limits.
+        _progress_tracker: Live progress and throughput floor for media downloads.
+        _image_pipeline: Converts and resizes downloaded thumbnails to JPG.
     """
 
     def __init__(
@@ -57,6 +65,9 @@ class YtdlpWrapper:
         ffmpeg: FFmpeg,
         ffprobe: FFProbe,
         handler_selector: HandlerSelector,
+        ytdlp_core: YtdlpCore,
+        progress_tracker: DownloadProgressTracker | None = None,
+        image_pipeline: ImagePipeline | None = None,
     ):
         self._paths = paths
         self._pot_provider_url = pot_provider_url if pot_provider_url else None
@@ -66,6 +77,9 @@ class YtdlpWrapper:
         self._ffmpeg = ffmpeg
         self._ffprobe = ffprobe
         self._handler_selector = handler_selector
+        self._ytdlp_core = ytdlp_core
+        self._progress_tracker = progress_tracker or DownloadProgressTracker()
+        self._image_pipeline = image_pipeline or ImagePipeline(ffprobe, ffmpeg)
         logger.debug(
             "YtdlpWrapper initialized.",
             extra={
@@ -77,6 +91,11 @@ class YtdlpWrapper:
             },
         )
 
+    @property
+    def progress_tracker(self) -> DownloadProgressTracker:
+        """Return the tracker holding progress of in-flight media downloads."""
+        return self._progress_tracker
+
     async def _update_to(self, args: YtdlpArgs) -> YtdlpArgs:
         """Apply --update-to if allowed by rate limiter and record timestamp."""
         if await self._app_state_db.update_yt_dlp_timestamp_if_stale(
@@ -235,7 +254,9 @@ class YtdlpWrapper:
             "Acquiring playlist metadata.",
             extra=log_config,
         )
-        playlist_result = await YtdlpCore.extract_playlist_info(info_args, resolved_url)
+        playlist_result = await self._ytdlp_core.extract_playlist_info(
+            info_args, resolved_url
+        )
         if playlist_result.logs:
             logger.debug(
                 "yt-dlp playlist metadata logs.",
@@ -257,18 +278,29 @@ class YtdlpWrapper:
 
         return extracted_feed
 
+    def _thumbnail_conversion(self, args: YtdlpArgs) -> YtdlpArgs:
+        """Let yt-dlp convert thumbnails unless they are converted in-process."""
+        if self._image_pipeline.in_process:
+            return args
+        return args.convert_thumbnails("jpg")
+
     async def _convert_thumbnail_to_jpg_if_needed(
-        self, feed_id: str, log_config: dict[str, Any]
+        self,
+        feed_id: str,
+        log_config: dict[str, Any],
+        download_id: str | None = None,
     ) -> str | None:
-        """Convert downloaded thumbnail to JPG if needed.
+        """Convert a downloaded thumbnail to JPG if needed.
 
         WORKAROUND: yt-dlp ignores --convert-thumbnails for playlist thumbnails.
-        This function finds the downloaded file and converts it to JPG using ffmpeg.
-        Remove this when yt-dlp fixes playlist thumbnail conversion.
+        Remove the feed-thumbnail use when yt-dlp fixes playlist thumbnail
+        conversion. Download thumbnails come through here when they are
+        converted in-process instead of by yt-dlp; JPGs are then also resized.
 
         Args:
             feed_id: The feed identifier.
             log_config: Logging context dictionary.
+            download_id: The download identifier, or None for the feed thumbnail.
 
         Returns:
             "jpg" if successful, None if failed.
@@ -277,7 +309,7 @@ class YtdlpWrapper:
         downloaded_ext = None
         downloaded_path = None
         for ext in ["jpg", "png", "webp"]:
-            path = await self._paths.image_path(feed_id, None, ext)
+            path = await self._paths.image_path(feed_id, download_id, ext)
             if await aiofiles.os.path.isfile(path):
                 downloaded_ext = ext
                 downloaded_path = path
@@ -285,23 +317,24 @@ class YtdlpWrapper:
 
         if not downloaded_path or not downloaded_ext:
             logger.warning(
-                "Feed thumbnail download appeared to succeed but file not found.",
+                "Thumbnail download appeared to succeed but file not found.",
                 extra=log_config,
             )
             return None
 
         # Convert to JPG if needed (required for podcast players)
-        if downloaded_ext != "jpg":
+        if downloaded_ext != "jpg" or self._image_pipeline.in_process:
             try:
-                jpg_path = await self._paths.image_path(feed_id, None, "jpg")
-                await self._ffmpeg.convert_image_to_jpg(downloaded_path, jpg_path)
-                # Remove the original non-JPG file
-                await aiofiles.os.remove(downloaded_path)
+                jpg_path = await self._paths.image_path(feed_id, download_id, "jpg")
+                await self._image_pipeline.to_jpg(downloaded_path, jpg_path)
+                if downloaded_path != jpg_path:
+                    # Remove the original non-JPG file
+                    await aiofiles.os.remove(downloaded_path)
                 logger.debug(
-                    "Feed thumbnail converted to JPG.",
+                    "Thumbnail converted to JPG.",
                     extra={**log_config, "original_ext": downloaded_ext},
                 )
-            except (FFmpegError, ValueError, OSError) as e:
+            except (ImageProcessingError, ValueError, OSError) as e:
                 logger.warning(
                     "Failed to convert thumbnail to JPG.",
                     extra={**log_config, "original_ext": downloaded_ext},
@@ -309,7 +342,7 @@ class YtdlpWrapper:
                 )
                 return None
 
-        logger.debug("Feed thumbnail downloaded successfully.", extra=log_config)
+        logger.debug("Thumbnail downloaded successfully.", extra=log_config)
         return "jpg"
 
     async def download_feed_thumbnail(
@@ -354,11 +387,10 @@ class YtdlpWrapper:
         feed_tmp_dir = await self._paths.feed_tmp_dir(feed_id)
 
         # Base args for thumbnail download
-        thumb_args = (
+        thumb_args = self._thumbnail_conversion(
             YtdlpArgs(user_yt_cli_args)
             .skip_download()
             .write_thumbnail()
-            .convert_thumbnails("jpg")
             .paths_temp(feed_tmp_dir)
         )
         thumb_args = await self._update_to(thumb_args)
@@ -380,7 +412,7 @@ class YtdlpWrapper:
         if cookies_path:
             thumb_args = thumb_args.cookies(cookies_path)
 
-        await YtdlpCore.download(thumb_args, resolved_url)
+        await self._ytdlp_core.download(thumb_args, resolved_url)
 
         # Convert thumbnail to JPG if needed (yt-dlp bug workaround)
         return await self._convert_thumbnail_to_jpg_if_needed(feed_id, log_config)
@@ -418,11 +450,10 @@ class YtdlpWrapper:
 
         logger.debug("Downloading thumbnail for existing download.", extra=log_params)
 
-        thumb_args = (
+        thumb_args = self._thumbnail_conversion(
             YtdlpArgs(user_yt_cli_args)
             .skip_download()
             .write_thumbnail()
-            .convert_thumbnails("jpg")
             .paths_thumbnail(thumbnails_dir)
             .output_thumbnail(f"{download.id}.%(ext)s")
             .paths_pl_thumbnail(thumbnails_dir)
@@ -439,11 +470,72 @@ class YtdlpWrapper:
         if cookies_path:
             thumb_args = thumb_args.cookies(cookies_path)
 
-        logs = await YtdlpCore.download(thumb_args, download.source_url)
+        logs = await self._ytdlp_core.download(thumb_args, download.source_url)
+        if self._image_pipeline.in_process:
+            await self._convert_thumbnail_to_jpg_if_needed(
+                download.feed_id, log_params, download.id
+            )
 
         logger.debug("Thumbnail downloaded for existing download.", extra=log_params)
         return logs
 
+    @staticmethod
+    async def _extract_downloads(
+        handler: SourceHandlerBase,
+        feed_id: str,
+        ytdlp_infos: list[YtdlpInfo],
+        transcript_lang: str | None,
+        transcript_source_priority: list[TranscriptSource] | None,
+    ) -> list[Download]:
+        """Parse each yt-dlp entry into a Download, preserving entry order.
+
+        Handlers whose extraction is I/O bound have entries processed
+        concurrently, bounded by ``_EXTRACTION_CONCURRENCY``; others are parsed
+        inline. Entries filtered out by yt-dlp are skipped. Any other error is
+        raised for the earliest failing entry, as a sequential pass would.
+
+        Returns:
+            Parsed downloads in the same order as ``ytdlp_infos``.
+        """
+
+        async def _extract(ytdlp_info: YtdlpInfo) -> Download | None:
+            try:
+                return await handler.extract_download_metadata(
+                    feed_id,
+                    ytdlp_info,
+                    transcript_lang,
+                    transcript_source_priority,
+                )
+            except YtdlpDownloadFilteredOutError:
+                # Video was filtered out by yt-dlp, skip it
+                logger.debug(
+                    "Video filtered out by yt-dlp, skipping.",
+                    extra={"feed_id": feed_id},
+                )
+                return None
+
+        if not handler.io_bound_extraction or len(ytdlp_infos) < 2:
+            results = [await _extract(ytdlp_info) for ytdlp_info in ytdlp_infos]
+            return [download for download in results if download is not None]
+
+        semaphore = asyncio.Semaphore(_EXTRACTION_CONCURRENCY)
+
+        async def _bounded(ytdlp_info: YtdlpInfo) -> Download | None:
+            async with semaphore:
+                return await _extract(ytdlp_info)
+
+        outcomes = await asyncio.gather(
+            *(_bounded(ytdlp_info) for ytdlp_info in ytdlp_infos),
+            return_exceptions=True,
+        )
+        parsed: list[Download] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+            if outcome is not None:
+                parsed.append(outcome)
+        return parsed
+
     async def fetch_new_downloads_metadata(
         self,
         feed_id: str,
@@ -518,7 +610,7 @@ class YtdlpWrapper:
         handler = self._handler_selector.select(resolved_url)
         info_args = handler.prepare_downloads_info_args(info_args)
 
-        downloads_result = await YtdlpCore.extract_downloads_info(
+        downloads_result = await self._ytdlp_core.extract_downloads_info(
             info_args, resolved_url
         )
         if downloads_result.logs:
@@ -536,24 +628,13 @@ class YtdlpWrapper:
             )
             return []
 
-        # Parse all downloads from individual video infos
-        parsed_downloads: list[Download] = []
-        for ytdlp_info in ytdlp_infos:
-            try:
-                download = await handler.extract_download_metadata(
-                    feed_id,
-                    ytdlp_info,
-                    transcript_lang,
-                    transcript_source_priority,
-                )
-            except YtdlpDownloadFilteredOutError:
-                # Video was filtered out by yt-dlp, skip it
-                logger.debug(
-                    "Video filtered out by yt-dlp, skipping.",
-                    extra={"feed_id": feed_id},
-                )
-            else:
-                parsed_downloads.append(download)
+        parsed_downloads = await self._extract_downloads(
+            handler,
+            feed_id,
+            ytdlp_infos,
+            transcript_lang,
+            transcript_source_priority,
+        )
 
         logger.debug(
             "Successfully processed downloads metadata.",
@@ -747,25 +828,26 @@ class YtdlpWrapper:
         download: Download,
         downloaded_file: Path,
         download_logs: str,
-    ) -> None:
+    ) -> MediaProbe:
         """Verify that a downloaded media file is valid and uncorrupted.
 
-        Uses `ffprobe` to probe the file and extract duration. If the file cannot
-        be read or reports a non-positive duration, it is considered corrupt and
-        will be quarantined (deleted) with a `YtdlpApiError` raised.
+        Uses `ffprobe` to probe the file. If the file cannot be read or reports
+        a non-positive duration, it is considered corrupt and will be
+        quarantined (deleted) with a `YtdlpApiError` raised.
 
         Args:
             download: The `Download` object associated with the file.
             downloaded_file: Path to the downloaded media file to verify.
             download_logs: Combined stdout/stderr logs from the yt-dlp download attempt.
 
+        Returns:
+            The probe result, reused downstream so the file is probed only once.
+
         Raises:
             YtdlpApiError: If the file fails integrity checks (via `_handle_corrupt_download_file`).
         """
         try:
-            duration = await self._ffprobe.get_duration_seconds_from_file(
-                downloaded_file
-            )
+            probe = await self._ffprobe.probe(downloaded_file)
         except (FFProbeError, FileNotFoundError) as e:
             raise await self._handle_corrupt_download_file(
                 download,
@@ -774,13 +856,14 @@ class YtdlpWrapper:
                 download_logs,
             ) from e
 
-        if duration <= 0:
+        if probe.duration_seconds <= 0:
             raise await self._handle_corrupt_download_file(
                 download,
                 downloaded_file,
                 "Downloaded file is corrupt (ffprobe reported non-positive duration).",
                 download_logs,
             )
+        return probe
 
     async def download_media_to_file(
         self,
@@ -827,9 +910,8 @@ class YtdlpWrapper:
 
         # Inline download options
         thumbnails_dir = await self._paths.download_images_dir(download.feed_id)
-        download_args = (
+        download_args = self._thumbnail_conversion(
             YtdlpArgs(user_yt_cli_args)
-            .convert_thumbnails("jpg")
             .write_thumbnail()
             .paths_thumbnail(thumbnails_dir)
             .output_thumbnail(f"{download.id}.%(ext)s")
@@ -839,6 +921,8 @@ class YtdlpWrapper:
             .output(f"{download.id}.%(ext)s")
             .paths_temp(download_temp_dir)
             .paths_home(download_data_dir)
+            # Partial files left in the tmp dir are validated at startup
+            .continue_partial()
         )
 
         # Add subtitle/transcript options
@@ -874,7 +958,16 @@ class YtdlpWrapper:
 
         url_to_download = download.source_url
 
-        download_logs = await YtdlpCore.download(download_args, url_to_download)
+        with self._progress_tracker.track(download.feed_id, download.id) as progress:
+            download_logs = await self._ytdlp_core.download(
+                download_args, url_to_download, progress=progress
+            )
+
+        # yt-dlp left the thumbnail unconverted; convert it in-process
+        if self._image_pipeline.in_process:
+            await self._convert_thumbnail_to_jpg_if_needed(
+                download.feed_id, log_params, download.id
+            )
 
         downloaded_files = list(
             await aiofiles.os.wrap(download_data_dir.glob)(f"{download.id}.*")
@@ -907,7 +1000,7 @@ class YtdlpWrapper:
                 url=url_to_download,
             )
 
-        await self._verify_download_file_integrity(
+        probe = await self._verify_download_file_integrity(
             download,
             downloaded_file,
             download_logs,
@@ -956,4 +1049,5 @@ class YtdlpWrapper:
             file_path=downloaded_file,
             logs=download_logs,
             transcript=transcript,
+            probe=probe,
         )
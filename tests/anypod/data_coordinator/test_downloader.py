@@ -7,6 +7,7 @@ for processing items in the download queue, interacting with YtdlpWrapper for
 media fetching, FileManager for storage, and DownloadDatabase for status updates.
 """
 
+from contextlib import nullcontext
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, call, patch
@@ -18,15 +19,25 @@ from anypod.config.types import FeedMetadataOverrides
 from anypod.data_coordinator.downloader import Downloader
 from anypod.data_coordinator.types import ArtifactDownloadResult, DownloadArtifact
 from anypod.db import DownloadDatabase
-from anypod.db.types import Download, DownloadStatus, Feed, SourceType, TranscriptSource
+from anypod.db.types import (
+    Download,
+    DownloadCompletion,
+    DownloadStatus,
+    Feed,
+    SourceType,
+    TranscriptSource,
+)
+from anypod.disk_space import DiskSpaceGuard
 from anypod.exceptions import (
     DatabaseOperationError,
     DownloadError,
     FFProbeError,
     YtdlpApiError,
 )
-from anypod.ffprobe import FFProbe
+from anypod.ffprobe import FFProbe, MediaProbe
 from anypod.file_manager import FileManager
+from anypod.media_dedup import MediaDeduplicator, media_content_key
+from anypod.partial_recovery import PartialDownloadRecovery
 from anypod.ytdlp_wrapper import DownloadedMedia, TranscriptInfo, YtdlpWrapper
 
 # Mock Feed object for testing
@@ -57,6 +68,7 @@ def mock_download_db() -> MagicMock:
     mock.upsert_download = AsyncMock()
     mock.update_download = AsyncMock()
     mock.mark_as_downloaded = AsyncMock()
+    mock.finalize_download = AsyncMock()
     mock.bump_retries = AsyncMock()
     mock.set_download_logs = AsyncMock()
     mock.set_thumbnail_extension = AsyncMock()
@@ -92,7 +104,9 @@ def mock_ytdlp_wrapper() -> MagicMock:
 def mock_ffprobe() -> MagicMock:
     """Provides a mock FFProbe."""
     mock = MagicMock(spec=FFProbe)
-    mock.get_duration_seconds_from_file = AsyncMock(return_value=321)
+    mock.probe = AsyncMock(
+        return_value=MediaProbe(duration=321.5, bit_rate=None, format_name=None)
+    )
     return mock
 
 
@@ -160,25 +174,59 @@ async def test_handle_download_success_updates_db(
     mock_ffprobe: MagicMock,
     sample_download: Download,
 ):
-    """Tests that _handle_download_success updates download and calls upsert."""
+    """Tests that _handle_download_success finalizes the download in one call."""
     downloaded_file = Path("/path/to/downloaded_video.mp4")
     logs = "yt-dlp stdout/stderr"
 
     await downloader._handle_download_success(sample_download, downloaded_file, logs)
 
-    mock_ffprobe.get_duration_seconds_from_file.assert_awaited_once_with(
-        downloaded_file
+    mock_ffprobe.probe.assert_awaited_once_with(downloaded_file)
+    mock_download_db.update_download.assert_not_awaited()
+    mock_download_db.finalize_download.assert_awaited_once_with(
+        sample_download.feed_id,
+        sample_download.id,
+        DownloadCompletion(
+            ext="mp4",
+            mime_type="video/mp4",
+            filesize=1024,
+            duration=321,
+            download_logs=logs,
+            thumbnail_ext=None,
+        ),
     )
-    mock_download_db.update_download.assert_awaited_once()
-    updated = mock_download_db.update_download.call_args[0][0]
-    assert updated.status == DownloadStatus.DOWNLOADED
-    assert updated.ext == "mp4"
-    assert updated.mime_type == "video/mp4"
-    assert updated.filesize == 1024
-    assert updated.duration == 321
-    assert updated.retries == 0
-    assert updated.last_error is None
-    assert updated.download_logs == logs
+    assert sample_download.status == DownloadStatus.DOWNLOADED
+    assert sample_download.filesize == 1024
+    assert sample_download.duration == 321
+    assert sample_download.retries == 0
+    assert sample_download.last_error is None
+    assert sample_download.download_logs == logs
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("aiofiles.os.stat", new_callable=AsyncMock, return_value=MagicMock(st_size=1024))
+async def test_handle_download_success_includes_thumbnail_and_transcript(
+    _mock_stat: AsyncMock,
+    downloader: Downloader,
+    mock_download_db: MagicMock,
+    mock_file_manager: MagicMock,
+    sample_download: Download,
+):
+    """Thumbnail and transcript metadata are written with the media in one call."""
+    mock_file_manager.image_exists.return_value = True
+    transcript = TranscriptInfo(ext="vtt", lang="en", source=TranscriptSource.CREATOR)
+
+    await downloader._handle_download_success(
+        sample_download, Path("/path/to/downloaded_video.mp4"), "logs", transcript
+    )
+
+    completion = mock_download_db.finalize_download.call_args[0][2]
+    assert completion.thumbnail_ext == "jpg"
+    assert completion.transcript_ext == transcript.ext
+    assert completion.transcript_lang == transcript.lang
+    assert completion.transcript_source == transcript.source
+    assert sample_download.thumbnail_ext == "jpg"
+    assert sample_download.transcript_ext == transcript.ext
 
 
 @pytest.mark.unit
@@ -198,9 +246,9 @@ async def test_handle_download_success_updates_mime_type_from_final_file(
         sample_download, Path("/path/to/downloaded_video.mp4"), "logs"
     )
 
-    updated = mock_download_db.update_download.call_args[0][0]
-    assert updated.ext == "mp4"
-    assert updated.mime_type == "video/mp4"
+    completion = mock_download_db.finalize_download.call_args[0][2]
+    assert completion.ext == "mp4"
+    assert completion.mime_type == "video/mp4"
 
 
 @pytest.mark.unit
@@ -217,9 +265,9 @@ async def test_handle_download_success_uses_octet_stream_for_unknown_extension(
         sample_download, Path("/path/to/downloaded_video.unknownext"), "logs"
     )
 
-    updated = mock_download_db.update_download.call_args[0][0]
-    assert updated.ext == "unknownext"
-    assert updated.mime_type == "application/octet-stream"
+    completion = mock_download_db.finalize_download.call_args[0][2]
+    assert completion.ext == "unknownext"
+    assert completion.mime_type == "application/octet-stream"
 
 
 @pytest.mark.unit
@@ -235,7 +283,7 @@ async def test_handle_download_success_db_update_fails_raises_downloader_error(
     downloaded_file = Path("/path/to/downloaded_video.mp4")
     logs = "yt-dlp stdout/stderr"
     db_error = DatabaseOperationError("DB boom")
-    mock_download_db.update_download.side_effect = db_error
+    mock_download_db.finalize_download.side_effect = db_error
 
     with pytest.raises(DownloadError) as exc_info:
         await downloader._handle_download_success(
@@ -258,16 +306,39 @@ async def test_handle_download_success_handles_ffprobe_errors(
     sample_download: Download,
 ):
     """Even if ffprobe fails, downloading should still succeed with metadata fallback."""
-    mock_ffprobe.get_duration_seconds_from_file.side_effect = FFProbeError("probe boom")
+    mock_ffprobe.probe.side_effect = FFProbeError("probe boom")
     downloaded_file = Path("/path/to/downloaded_video.mp4")
     logs = "yt-dlp stdout/stderr"
     original_duration = sample_download.duration
 
     await downloader._handle_download_success(sample_download, downloaded_file, logs)
 
-    mock_download_db.update_download.assert_awaited_once()
-    updated = mock_download_db.update_download.call_args[0][0]
-    assert updated.duration == original_duration
+    mock_download_db.finalize_download.assert_awaited_once()
+    completion = mock_download_db.finalize_download.call_args[0][2]
+    assert completion.duration is None
+    assert sample_download.duration == original_duration
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("aiofiles.os.stat", new_callable=AsyncMock, return_value=MagicMock(st_size=1024))
+async def test_handle_download_success_reuses_verification_probe(
+    _mock_stat: AsyncMock,
+    downloader: Downloader,
+    mock_download_db: MagicMock,
+    mock_ffprobe: MagicMock,
+    sample_download: Download,
+):
+    """A probe taken during verification is reused instead of re-running ffprobe."""
+    probe = MediaProbe(duration=77.0, bit_rate=128000, format_name="mp3")
+
+    await downloader._handle_download_success(
+        sample_download, Path("/path/to/audio.mp3"), "logs", None, probe
+    )
+
+    mock_ffprobe.probe.assert_not_awaited()
+    completion = mock_download_db.finalize_download.call_args[0][2]
+    assert completion.duration == 77
 
 
 # --- Tests for _handle_download_failure ---
@@ -368,7 +439,61 @@ async def test_download_artifacts_all_success_flow(
         transcript_lang=sample_feed_config.transcript_lang,
     )
     mock_handle_success.assert_called_once_with(
-        sample_download, downloaded_path, logs, transcript
+        sample_download,
+        downloaded_path,
+        logs,
+        transcript,
+        None,
+        media_content_key(sample_download, sample_feed_config.yt_args),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_artifacts_reuses_shared_media(
+    mock_download_db: MagicMock,
+    mock_file_manager: MagicMock,
+    mock_ytdlp_wrapper: MagicMock,
+    mock_ffprobe: MagicMock,
+    sample_download: Download,
+    sample_feed_config: FeedConfig,
+):
+    """Media already stored by another feed is linked instead of downloaded."""
+    deduplicator = MagicMock(spec=MediaDeduplicator)
+    deduplicator.reuse_existing = AsyncMock(
+        return_value=DownloadCompletion(
+            ext="mp4",
+            mime_type="video/mp4",
+            filesize=4096,
+            duration=120,
+            download_logs="Media shared with feed 'other'.",
+            thumbnail_ext="jpg",
+            content_key="key",
+        )
+    )
+    downloader = Downloader(
+        mock_download_db,
+        mock_file_manager,
+        mock_ytdlp_wrapper,
+        mock_ffprobe,
+        media_deduplicator=deduplicator,
+    )
+
+    result = await downloader.download_artifacts(
+        sample_download, sample_feed_config, DownloadArtifact.ALL
+    )
+
+    assert result.media_downloaded is True
+    assert result.thumbnail_downloaded is True
+    mock_ytdlp_wrapper.download_media_to_file.assert_not_called()
+    mock_download_db.finalize_download.assert_awaited_once()
+    assert sample_download.status == DownloadStatus.DOWNLOADED
+    assert sample_download.filesize == 4096
+    assert sample_download.content_key == "key"
+    deduplicator.reuse_existing.assert_awaited_once_with(
+        sample_download,
+        media_content_key(sample_download, sample_feed_config.yt_args),
+        sample_feed_config.transcript_lang,
     )
 
 
@@ -444,6 +569,51 @@ async def test_download_artifacts_all_ytdlp_failure_returns_failure(
     )
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("succeeds", [True, False])
+@patch.object(Downloader, "_handle_download_success", new_callable=AsyncMock)
+async def test_download_artifacts_records_resume_marker(
+    _mock_handle_success: AsyncMock,
+    mock_download_db: MagicMock,
+    mock_file_manager: MagicMock,
+    mock_ytdlp_wrapper: MagicMock,
+    mock_ffprobe: MagicMock,
+    sample_download: Download,
+    sample_feed_config: FeedConfig,
+    succeeds: bool,
+):
+    """The resume marker is written first and only removed once media is in place."""
+    if succeeds:
+        mock_ytdlp_wrapper.download_media_to_file.return_value = DownloadedMedia(
+            file_path=Path("/final/video.mp4"), logs="", transcript=None
+        )
+    else:
+        mock_ytdlp_wrapper.download_media_to_file.side_effect = YtdlpApiError(
+            message="yt-dlp failed"
+        )
+    partial_recovery = MagicMock(spec=PartialDownloadRecovery)
+    downloader = Downloader(
+        mock_download_db,
+        mock_file_manager,
+        mock_ytdlp_wrapper,
+        mock_ffprobe,
+        partial_recovery=partial_recovery,
+    )
+
+    await downloader.download_artifacts(
+        sample_download, sample_feed_config, DownloadArtifact.ALL
+    )
+
+    partial_recovery.mark_started.assert_awaited_once_with(
+        sample_download, media_content_key(sample_download, sample_feed_config.yt_args)
+    )
+    if succeeds:
+        partial_recovery.mark_finished.assert_awaited_once_with(sample_download)
+    else:
+        partial_recovery.mark_finished.assert_not_called()
+
+
 # --- Tests for download_queued ---
 
 
@@ -514,6 +684,46 @@ async def test_download_queued_processes_items_and_counts_success(
     )
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch.object(Downloader, "download_artifacts", new_callable=AsyncMock)
+async def test_download_queued_defers_when_disk_space_low(
+    mock_download_artifacts: AsyncMock,
+    mock_download_db: MagicMock,
+    mock_file_manager: MagicMock,
+    mock_ytdlp_wrapper: MagicMock,
+    mock_ffprobe: MagicMock,
+    sample_feed_config: FeedConfig,
+    sample_download: Download,
+):
+    """Downloads refused by the disk guard stay queued without retries."""
+    download2 = sample_download.model_copy(update={"id": "test_dl_id_2"})
+    mock_download_db.get_downloads_by_status.return_value = [
+        sample_download,
+        download2,
+    ]
+    mock_download_artifacts.return_value = ArtifactDownloadResult(
+        media_downloaded=True, thumbnail_downloaded=True, transcript_downloaded=True
+    )
+    guard = MagicMock(spec=DiskSpaceGuard)
+    guard.reserve.side_effect = [nullcontext(True), nullcontext(False)]
+    downloader = Downloader(
+        mock_download_db,
+        mock_file_manager,
+        mock_ytdlp_wrapper,
+        mock_ffprobe,
+        disk_space_guard=guard,
+    )
+
+    success, failure = await downloader.download_queued("test_feed", sample_feed_config)
+
+    assert (success, failure) == (1, 0)
+    mock_download_artifacts.assert_awaited_once_with(
+        sample_download, sample_feed_config, DownloadArtifact.ALL, None
+    )
+    mock_download_db.bump_retries.assert_not_called()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 @patch.object(Downloader, "download_artifacts", new_callable=AsyncMock)
@@ -0,0 +1,57 @@
+"""Tests for the PhaseTimings per-phase histograms."""
+
+import asyncio
+import time
+
+import pytest
+
+from anypod.data_coordinator.phase_timings import PhaseTimings
+
+
+@pytest.mark.unit
+def test_snapshot_empty_before_any_phase():
+    """No phases are reported before anything is measured."""
+    assert PhaseTimings().snapshot() == {}
+
+
+@pytest.mark.unit
+def test_record_adds_to_phase_histograms():
+    """Recorded wall and CPU times go into separate histograms per phase."""
+    timings = PhaseTimings()
+
+    timings.record("download", wall_seconds=12.0, cpu_seconds=0.2)
+    timings.record("download", wall_seconds=8.0, cpu_seconds=0.1)
+    timings.record("prune", wall_seconds=0.05, cpu_seconds=0.01)
+    snapshot = timings.snapshot()
+
+    assert set(snapshot) == {"download", "prune"}
+    assert snapshot["download"].wall_seconds.count == 2
+    assert snapshot["download"].wall_seconds.sum == pytest.approx(20.0)
+    assert snapshot["download"].cpu_seconds.sum == pytest.approx(0.3)
+    assert snapshot["prune"].wall_seconds.count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_measure_separates_waiting_from_cpu():
+    """Awaiting counts toward wall time but not CPU time."""
+    timings = PhaseTimings()
+
+    with timings.measure("enqueue"):
+        await asyncio.sleep(0.1)
+    snapshot = timings.snapshot()["enqueue"]
+
+    assert snapshot.wall_seconds.sum >= 0.1
+    assert snapshot.cpu_seconds.sum < 0.05
+
+
+@pytest.mark.unit
+def test_measure_records_when_block_raises():
+    """A phase that raises is still timed."""
+    timings = PhaseTimings()
+
+    with pytest.raises(ValueError), timings.measure("rss_generation"):
+        time.sleep(0.01)
+        raise ValueError("boom")
+
+    assert timings.snapshot()["rss_generation"].wall_seconds.count == 1
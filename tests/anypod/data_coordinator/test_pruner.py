@@ -15,10 +15,9 @@ import pytest
 from anypod.data_coordinator.pruner import Pruner
 from anypod.db import DownloadDatabase
 from anypod.db.feed_db import FeedDatabase
-from anypod.db.types import Download, DownloadStatus
+from anypod.db.types import Download, DownloadStatus, PruneCandidate
 from anypod.exceptions import (
     DatabaseOperationError,
-    DownloadNotFoundError,
     FileOperationError,
     PruneError,
 )
@@ -40,12 +39,20 @@ def mock_feed_db() -> MagicMock:
 @pytest.fixture
 def mock_download_db() -> MagicMock:
     """Provides a mock DownloadDatabase."""
+
+    def _archive_downloads(_feed_id: str, download_ids: list[str]) -> int:
+        return len(download_ids)
+
     mock = MagicMock(spec=DownloadDatabase)
     # Mock async methods
     mock.get_downloads_by_status = AsyncMock()
-    mock.get_downloads_to_prune_by_keep_last = AsyncMock()
-    mock.get_downloads_to_prune_by_since = AsyncMock()
+    mock.get_prune_candidates = AsyncMock(return_value=[])
+    mock.get_prune_candidates_for_all_feeds = AsyncMock(return_value=[])
+    mock.get_downloads_to_prune_by_size = AsyncMock(return_value=[])
+    mock.get_downloads_to_prune_by_storage_budget = AsyncMock(return_value=[])
+    mock.get_storage_usage = AsyncMock(return_value={})
     mock.archive_download = AsyncMock()
+    mock.archive_downloads = AsyncMock(side_effect=_archive_downloads)
     mock.count_downloads_by_status = AsyncMock()
     return mock
 
@@ -149,6 +156,19 @@ def sample_skipped_item() -> Download:
 # --- Tests for Pruner._identify_prune_candidates ---
 
 
+def _candidate(download: Download) -> PruneCandidate:
+    """Return the prune candidate columns of a download."""
+    return PruneCandidate(
+        feed_id=download.feed_id,
+        id=download.id,
+        status=download.status,
+        ext=download.ext,
+        thumbnail_ext=download.thumbnail_ext,
+        transcript_lang=download.transcript_lang,
+        transcript_ext=download.transcript_ext,
+    )
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_identify_prune_candidates_keep_last_only(
@@ -157,22 +177,15 @@ async def test_identify_prune_candidates_keep_last_only(
     sample_downloaded_item: Download,
 ):
     """Tests _identify_prune_candidates with only keep_last rule."""
-    downloads_to_prune = [sample_downloaded_item]
-    mock_download_db.get_downloads_to_prune_by_keep_last.return_value = (
-        downloads_to_prune
-    )
+    candidate = _candidate(sample_downloaded_item)
+    mock_download_db.get_prune_candidates.return_value = [candidate]
 
     result = await pruner._identify_prune_candidates(
         "test_feed", keep_last=5, prune_before_date=None
     )
 
-    assert len(result) == 1
-    assert next(iter(result)) == sample_downloaded_item
-
-    mock_download_db.get_downloads_to_prune_by_keep_last.assert_awaited_once_with(
-        "test_feed", 5
-    )
-    mock_download_db.get_downloads_to_prune_by_since.assert_not_called()
+    assert result == {candidate}
+    mock_download_db.get_prune_candidates.assert_awaited_once_with("test_feed", 5, None)
 
 
 @pytest.mark.unit
@@ -183,56 +196,68 @@ async def test_identify_prune_candidates_date_only(
     sample_downloaded_item: Download,
 ):
     """Tests _identify_prune_candidates with only prune_before_date rule."""
-    downloads_to_prune = [sample_downloaded_item]
+    candidate = _candidate(sample_downloaded_item)
     cutoff_date = datetime.datetime(2023, 6, 1, tzinfo=datetime.UTC)
-    mock_download_db.get_downloads_to_prune_by_since.return_value = downloads_to_prune
+    mock_download_db.get_prune_candidates.return_value = [candidate]
 
     result = await pruner._identify_prune_candidates(
         "test_feed", keep_last=None, prune_before_date=cutoff_date
     )
 
-    assert len(result) == 1
-    assert any(item.content_equals(sample_downloaded_item) for item in result)
-
-    mock_download_db.get_downloads_to_prune_by_since.assert_awaited_once_with(
-        "test_feed", cutoff_date
+    assert result == {candidate}
+    mock_download_db.get_prune_candidates.assert_awaited_once_with(
+        "test_feed", None, cutoff_date
     )
-    mock_download_db.get_downloads_to_prune_by_keep_last.assert_not_called()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_identify_prune_candidates_both_rules_union(
+async def test_identify_prune_candidates_both_rules_single_query(
     pruner: Pruner,
     mock_download_db: MagicMock,
     sample_downloaded_item: Download,
     sample_queued_item: Download,
 ):
-    """Tests _identify_prune_candidates combines results from both rules."""
-    keep_last_results = [sample_downloaded_item]
-    date_results = [sample_downloaded_item, sample_queued_item]  # overlap + additional
+    """Tests keep_last and prune_before_date are evaluated by one query."""
+    candidates = [_candidate(sample_downloaded_item), _candidate(sample_queued_item)]
     cutoff_date = datetime.datetime(2023, 6, 1, tzinfo=datetime.UTC)
-
-    mock_download_db.get_downloads_to_prune_by_keep_last.return_value = (
-        keep_last_results
-    )
-    mock_download_db.get_downloads_to_prune_by_since.return_value = date_results
+    mock_download_db.get_prune_candidates.return_value = candidates
 
     result = await pruner._identify_prune_candidates(
         "test_feed", keep_last=3, prune_before_date=cutoff_date
     )
 
-    # Should be union: {sample_downloaded_item, sample_queued_item}
-    assert len(result) == 2
-    assert any(item.content_equals(sample_downloaded_item) for item in result)
-    assert any(item.content_equals(sample_queued_item) for item in result)
-    mock_download_db.get_downloads_to_prune_by_keep_last.assert_awaited_once_with(
-        "test_feed", 3
+    assert result == set(candidates)
+    mock_download_db.get_prune_candidates.assert_awaited_once_with(
+        "test_feed", 3, cutoff_date
     )
-    mock_download_db.get_downloads_to_prune_by_since.assert_awaited_once_with(
-        "test_feed", cutoff_date
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_identify_prune_candidates_unions_size_rule(
+    pruner: Pruner,
+    mock_download_db: MagicMock,
+    sample_downloaded_item: Download,
+    sample_queued_item: Download,
+):
+    """Tests candidates from the size rule are merged with the retention query."""
+    shared = _candidate(sample_downloaded_item)
+    mock_download_db.get_prune_candidates.return_value = [
+        shared,
+        _candidate(sample_queued_item),
+    ]
+    mock_download_db.get_downloads_to_prune_by_size.return_value = [
+        _candidate(sample_downloaded_item)
+    ]
+
+    result = await pruner._identify_prune_candidates(
+        "test_feed", keep_last=3, prune_before_date=None, max_bytes=1024
     )
 
+    assert len(result) == 2
+    assert shared in result
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -246,19 +271,19 @@ async def test_identify_prune_candidates_no_rules_returns_empty(
     )
 
     assert result == set()
-    mock_download_db.get_downloads_to_prune_by_keep_last.assert_not_called()
-    mock_download_db.get_downloads_to_prune_by_since.assert_not_called()
+    mock_download_db.get_prune_candidates.assert_not_called()
+    mock_download_db.get_downloads_to_prune_by_size.assert_not_called()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_identify_prune_candidates_keep_last_db_error_raises_prune_error(
+async def test_identify_prune_candidates_db_error_raises_prune_error(
     pruner: Pruner,
     mock_download_db: MagicMock,
 ):
-    """Tests _identify_prune_candidates raises PruneError on DB error for keep_last."""
+    """Tests _identify_prune_candidates raises PruneError on DB error."""
     db_error = DatabaseOperationError("DB fetch failed")
-    mock_download_db.get_downloads_to_prune_by_keep_last.side_effect = db_error
+    mock_download_db.get_prune_candidates.side_effect = db_error
 
     with pytest.raises(PruneError) as exc_info:
         await pruner._identify_prune_candidates(
@@ -458,366 +483,348 @@ async def test_handle_file_deletion_file_operation_error_raises_prune_error(
     assert exc_info.value.__cause__ is file_error
 
 
-# --- Tests for Pruner._archive_download ---
+# --- Tests for Pruner._delete_download_artifacts ---
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_archive_download_success(
+async def test_delete_download_artifacts_deletes_file_image_and_transcript(
     pruner: Pruner,
-    mock_download_db: MagicMock,
+    mock_file_manager: AsyncMock,
     sample_downloaded_item: Download,
 ):
-    """Tests _archive_download successfully archives download."""
-    await pruner._archive_download(sample_downloaded_item, "test_feed")
-
-    mock_download_db.archive_download.assert_awaited_once_with(
-        "test_feed", sample_downloaded_item.id
+    """Tests _delete_download_artifacts removes every file of a download."""
+    download_with_all = sample_downloaded_item.model_copy(
+        update={
+            "thumbnail_ext": "jpg",
+            "transcript_lang": "en",
+            "transcript_ext": "vtt",
+        }
     )
 
+    result = await pruner._delete_download_artifacts(
+        _candidate(download_with_all), "test_feed"
+    )
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_archive_download_db_error_raises_prune_error(
-    pruner: Pruner,
-    mock_download_db: MagicMock,
-    sample_downloaded_item: Download,
-):
-    """Tests _archive_download raises PruneError on DatabaseOperationError."""
-    db_error = DatabaseOperationError("Archive failed")
-    mock_download_db.archive_download.side_effect = db_error
-
-    with pytest.raises(PruneError) as exc_info:
-        await pruner._archive_download(sample_downloaded_item, "test_feed")
-
-    assert exc_info.value.feed_id == "test_feed"
-    assert exc_info.value.download_id == sample_downloaded_item.id
-    assert exc_info.value.__cause__ is db_error
+    assert result is True
+    mock_file_manager.delete_download_file.assert_called_once_with(
+        "test_feed", "test_dl_id_1", "mp4"
+    )
+    mock_file_manager.delete_image.assert_called_once_with(
+        "test_feed", "test_dl_id_1", "jpg"
+    )
+    mock_file_manager.delete_transcript.assert_called_once_with(
+        "test_feed", "test_dl_id_1", "en", "vtt"
+    )
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_archive_download_not_found_error_raises_prune_error(
+async def test_delete_download_artifacts_file_not_found_returns_false(
     pruner: Pruner,
-    mock_download_db: MagicMock,
+    mock_file_manager: AsyncMock,
     sample_downloaded_item: Download,
 ):
-    """Tests _archive_download raises PruneError on DownloadNotFoundError."""
-    not_found_error = DownloadNotFoundError("Download not found")
-    mock_download_db.archive_download.side_effect = not_found_error
-
-    with pytest.raises(PruneError) as exc_info:
-        await pruner._archive_download(sample_downloaded_item, "test_feed")
-
-    assert exc_info.value.feed_id == "test_feed"
-    assert exc_info.value.download_id == sample_downloaded_item.id
-    assert exc_info.value.__cause__ is not_found_error
+    """Tests _delete_download_artifacts returns False when the file is gone."""
+    mock_file_manager.delete_download_file.side_effect = FileNotFoundError(
+        "File not found"
+    )
 
+    result = await pruner._delete_download_artifacts(
+        _candidate(sample_downloaded_item), "test_feed"
+    )
 
-# --- Tests for Pruner._process_single_download_for_pruning ---
+    assert result is False
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_single_download_downloaded_file_deleted_successfully(
+async def test_delete_download_artifacts_transcript_error_continues(
     pruner: Pruner,
-    mock_download_db: MagicMock,
     mock_file_manager: AsyncMock,
     sample_downloaded_item: Download,
 ):
-    """Tests _process_single_download_for_pruning returns True when file is deleted."""
-    result = await pruner._process_single_download_for_pruning(
-        sample_downloaded_item, "test_feed"
+    """Tests _delete_download_artifacts tolerates a failed transcript deletion."""
+    download_with_transcript = sample_downloaded_item.model_copy(
+        update={"transcript_lang": "en", "transcript_ext": "vtt"}
+    )
+    mock_file_manager.delete_transcript.side_effect = FileOperationError(
+        "Permission denied"
     )
 
-    assert result is True
-    mock_file_manager.delete_download_file.assert_called_once_with(
-        "test_feed", "test_dl_id_1", "mp4"
+    result = await pruner._delete_download_artifacts(
+        _candidate(download_with_transcript), "test_feed"
     )
-    mock_download_db.archive_download.assert_awaited_once_with(
-        "test_feed", sample_downloaded_item.id
+
+    assert result is True
+    mock_file_manager.delete_transcript.assert_called_once_with(
+        "test_feed", "test_dl_id_1", "en", "vtt"
     )
 
 
+# --- Tests for Pruner.prune_feed_downloads ---
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_single_download_downloaded_file_not_found_returns_false(
+async def test_prune_feed_downloads_no_candidates_returns_zero_counts(
     pruner: Pruner,
     mock_download_db: MagicMock,
-    mock_file_manager: AsyncMock,
-    sample_downloaded_item: Download,
 ):
-    """Tests _process_single_download_for_pruning returns False when file not found."""
-    mock_file_manager.delete_download_file.side_effect = FileNotFoundError(
-        "File not found"
-    )
+    """Tests prune_feed_downloads returns (0,0) when no candidates are found."""
+    mock_download_db.get_prune_candidates.return_value = []
 
-    result = await pruner._process_single_download_for_pruning(
-        sample_downloaded_item, "test_feed"
+    archived_count, files_deleted_count = await pruner.prune_feed_downloads(
+        "test_feed", keep_last=5, prune_before_date=None
     )
 
-    assert result is False
-    mock_file_manager.delete_download_file.assert_called_once_with(
-        "test_feed", "test_dl_id_1", "mp4"
-    )
-    mock_download_db.archive_download.assert_awaited_once_with(
-        "test_feed", sample_downloaded_item.id
-    )
+    assert archived_count == 0
+    assert files_deleted_count == 0
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_single_download_non_downloaded_no_file_deletion(
+async def test_prune_feed_downloads_processes_candidates_and_counts(
     pruner: Pruner,
     mock_download_db: MagicMock,
     mock_file_manager: AsyncMock,
+    sample_downloaded_item: Download,
     sample_queued_item: Download,
 ):
-    """Tests _process_single_download_for_pruning skips file deletion for non-DOWNLOADED items."""
-    result = await pruner._process_single_download_for_pruning(
-        sample_queued_item, "test_feed"
-    )
+    """Tests prune_feed_downloads processes candidates and returns correct counts."""
+    candidates = [sample_downloaded_item, sample_queued_item]
+    mock_download_db.get_prune_candidates.return_value = candidates
 
-    assert result is False
-    mock_file_manager.delete_download_file.assert_not_called()
-    mock_download_db.archive_download.assert_awaited_once_with(
-        "test_feed", sample_queued_item.id
+    archived_count, files_deleted_count = await pruner.prune_feed_downloads(
+        "test_feed", keep_last=1, prune_before_date=None
     )
 
+    assert archived_count == 2  # Both items archived
+    assert files_deleted_count == 1  # Only DOWNLOADED item had file deleted
+    assert mock_file_manager.delete_download_file.call_count == 1
+    mock_download_db.archive_downloads.assert_awaited_once()
+    feed_id, archived_ids = mock_download_db.archive_downloads.await_args.args
+    assert feed_id == "test_feed"
+    assert sorted(archived_ids) == sorted(d.id for d in candidates)
+    mock_download_db.archive_download.assert_not_called()
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_single_download_upcoming_no_file_deletion(
+async def test_prune_feed_downloads_candidate_identification_error_raises_prune_error(
     pruner: Pruner,
     mock_download_db: MagicMock,
-    mock_file_manager: AsyncMock,
-    sample_upcoming_item: Download,
 ):
-    """Tests _process_single_download_for_pruning skips file deletion for UPCOMING items but archives them."""
-    result = await pruner._process_single_download_for_pruning(
-        sample_upcoming_item, "test_feed"
-    )
+    """Tests prune_feed_downloads raises PruneError on candidate identification failure."""
+    db_error = DatabaseOperationError("DB fetch failed")
+    mock_download_db.get_prune_candidates.side_effect = db_error
 
-    assert result is False
-    mock_file_manager.delete_download_file.assert_not_called()
-    mock_download_db.archive_download.assert_awaited_once_with(
-        "test_feed", sample_upcoming_item.id
-    )
+    with pytest.raises(PruneError) as exc_info:
+        await pruner.prune_feed_downloads(
+            "test_feed", keep_last=5, prune_before_date=None
+        )
+
+    assert exc_info.value.feed_id == "test_feed"
+    assert exc_info.value.__cause__ is db_error
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_single_download_downloaded_with_image_deletes_both(
+async def test_prune_feed_downloads_individual_failure_continues_processing(
     pruner: Pruner,
     mock_download_db: MagicMock,
     mock_file_manager: AsyncMock,
     sample_downloaded_item: Download,
+    sample_queued_item: Download,
 ):
-    """Tests _process_single_download_for_pruning deletes both file and image for DOWNLOADED items with thumbnail."""
-    download_with_image = sample_downloaded_item.model_copy(
-        update={"thumbnail_ext": "jpg"}
-    )
+    """Tests a download whose file cannot be deleted is left for the next prune."""
+    dl1 = sample_downloaded_item
+    dl2 = sample_downloaded_item.model_copy(update={"id": "fail_item"})
+    dl3 = sample_queued_item.model_copy(update={"id": "success_item"})
 
-    result = await pruner._process_single_download_for_pruning(
-        download_with_image, "test_feed"
-    )
+    candidates = [dl1, dl2, dl3]
+    mock_download_db.get_prune_candidates.return_value = candidates
 
-    assert result is True
-    mock_file_manager.delete_download_file.assert_called_once_with(
-        "test_feed", "test_dl_id_1", "mp4"
-    )
-    mock_file_manager.delete_image.assert_called_once_with(
-        "test_feed", "test_dl_id_1", "jpg"
-    )
-    mock_download_db.archive_download.assert_awaited_once_with(
-        "test_feed", download_with_image.id
+    def delete_side_effect(_feed_id: str, download_id: str, _ext: str) -> bool:
+        if download_id == "fail_item":
+            raise FileOperationError("Delete failed for fail_item")
+        return True
+
+    mock_file_manager.delete_download_file.side_effect = delete_side_effect
+
+    archived_count, files_deleted_count = await pruner.prune_feed_downloads(
+        "test_feed", keep_last=1, prune_before_date=None
     )
 
+    # dl1 and dl3 are archived, dl2 keeps its status so it is retried later
+    assert archived_count == 2
+    assert files_deleted_count == 1
+    _, archived_ids = mock_download_db.archive_downloads.await_args.args
+    assert sorted(archived_ids) == sorted([dl1.id, dl3.id])
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_single_download_downloaded_with_transcript_deletes_all(
+async def test_prune_feed_downloads_bulk_archive_error_raises_prune_error(
     pruner: Pruner,
     mock_download_db: MagicMock,
-    mock_file_manager: AsyncMock,
     sample_downloaded_item: Download,
 ):
-    """Tests _process_single_download_for_pruning deletes file, image, and transcript for DOWNLOADED items."""
-    download_with_all = sample_downloaded_item.model_copy(
-        update={
-            "thumbnail_ext": "jpg",
-            "transcript_lang": "en",
-            "transcript_ext": "vtt",
-        }
-    )
+    """Tests a failed bulk archive update surfaces as PruneError."""
+    db_error = DatabaseOperationError("Bulk archive failed")
+    mock_download_db.get_prune_candidates.return_value = [sample_downloaded_item]
+    mock_download_db.archive_downloads.side_effect = db_error
 
-    result = await pruner._process_single_download_for_pruning(
-        download_with_all, "test_feed"
-    )
+    with pytest.raises(PruneError) as exc_info:
+        await pruner.prune_feed_downloads(
+            "test_feed", keep_last=1, prune_before_date=None
+        )
 
-    assert result is True
-    mock_file_manager.delete_download_file.assert_called_once_with(
-        "test_feed", "test_dl_id_1", "mp4"
-    )
-    mock_file_manager.delete_image.assert_called_once_with(
-        "test_feed", "test_dl_id_1", "jpg"
-    )
-    mock_file_manager.delete_transcript.assert_called_once_with(
-        "test_feed", "test_dl_id_1", "en", "vtt"
-    )
-    mock_download_db.archive_download.assert_awaited_once_with(
-        "test_feed", download_with_all.id
-    )
+    assert exc_info.value.feed_id == "test_feed"
+    assert exc_info.value.__cause__ is db_error
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_single_download_transcript_deletion_error_continues(
+async def test_prune_feed_downloads_includes_size_candidates(
     pruner: Pruner,
     mock_download_db: MagicMock,
-    mock_file_manager: AsyncMock,
     sample_downloaded_item: Download,
 ):
-    """Tests _process_single_download_for_pruning continues archival when transcript deletion fails."""
-    download_with_transcript = sample_downloaded_item.model_copy(
-        update={"transcript_lang": "en", "transcript_ext": "vtt"}
-    )
-    mock_file_manager.delete_transcript.side_effect = FileOperationError(
-        "Permission denied"
-    )
+    """Downloads beyond max_bytes are pruned alongside the other rules."""
+    mock_download_db.get_downloads_to_prune_by_size.return_value = [
+        sample_downloaded_item
+    ]
 
-    result = await pruner._process_single_download_for_pruning(
-        download_with_transcript, "test_feed"
+    archived_count, files_deleted_count = await pruner.prune_feed_downloads(
+        "test_feed", keep_last=None, prune_before_date=None, max_bytes=1024
     )
 
-    # File deletion succeeded
-    assert result is True
-    mock_file_manager.delete_download_file.assert_called_once_with(
-        "test_feed", "test_dl_id_1", "mp4"
-    )
-    # Transcript deletion was attempted
-    mock_file_manager.delete_transcript.assert_called_once_with(
-        "test_feed", "test_dl_id_1", "en", "vtt"
-    )
-    # Download should still be archived despite transcript deletion failure
-    mock_download_db.archive_download.assert_awaited_once_with(
-        "test_feed", download_with_transcript.id
+    assert (archived_count, files_deleted_count) == (1, 1)
+    mock_download_db.get_downloads_to_prune_by_size.assert_awaited_once_with(
+        "test_feed", 1024
     )
+    mock_download_db.get_prune_candidates.assert_not_called()
+
+
+# --- Tests for Pruner.enforce_storage_budget ---
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_process_single_download_archive_error_raises_prune_error(
-    pruner: Pruner,
-    mock_download_db: MagicMock,
-    sample_queued_item: Download,
+async def test_enforce_storage_budget_without_budget_is_noop(
+    pruner: Pruner, mock_download_db: MagicMock
 ):
-    """Tests _process_single_download_for_pruning raises PruneError on archive failure."""
-    db_error = DatabaseOperationError("Archive failed")
-    mock_download_db.archive_download.side_effect = db_error
-
-    with pytest.raises(PruneError) as exc_info:
-        await pruner._process_single_download_for_pruning(
-            sample_queued_item, "test_feed"
-        )
-
-    assert exc_info.value.__cause__ is db_error
-
-
-# --- Tests for Pruner.prune_feed_downloads ---
+    """No queries run when no storage budget is configured."""
+    assert await pruner.enforce_storage_budget() == (0, 0)
+    mock_download_db.get_storage_usage.assert_not_called()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_prune_feed_downloads_no_candidates_returns_zero_counts(
-    pruner: Pruner,
+async def test_enforce_storage_budget_within_budget_skips_candidates(
+    mock_feed_db: MagicMock,
     mock_download_db: MagicMock,
+    mock_file_manager: AsyncMock,
 ):
-    """Tests prune_feed_downloads returns (0,0) when no candidates are found."""
-    mock_download_db.get_downloads_to_prune_by_keep_last.return_value = []
-    mock_download_db.get_downloads_to_prune_by_since.return_value = []
-
-    archived_count, files_deleted_count = await pruner.prune_feed_downloads(
-        "test_feed", keep_last=5, prune_before_date=None
+    """Usage under the budget avoids the candidate query."""
+    mock_download_db.get_storage_usage.return_value = {"a": 400, "b": 500}
+    pruner = Pruner(
+        mock_feed_db, mock_download_db, mock_file_manager, storage_budget=1000
     )
 
-    assert archived_count == 0
-    assert files_deleted_count == 0
+    assert await pruner.enforce_storage_budget() == (0, 0)
+    mock_download_db.get_downloads_to_prune_by_storage_budget.assert_not_called()
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_prune_feed_downloads_processes_candidates_and_counts(
-    pruner: Pruner,
+async def test_enforce_storage_budget_prunes_candidates(
+    mock_feed_db: MagicMock,
     mock_download_db: MagicMock,
     mock_file_manager: AsyncMock,
     sample_downloaded_item: Download,
-    sample_queued_item: Download,
 ):
-    """Tests prune_feed_downloads processes candidates and returns correct counts."""
-    candidates = [sample_downloaded_item, sample_queued_item]
-    mock_download_db.get_downloads_to_prune_by_keep_last.return_value = candidates
-
-    archived_count, files_deleted_count = await pruner.prune_feed_downloads(
-        "test_feed", keep_last=1, prune_before_date=None
+    """Candidates from every feed are deleted and archived in their own feed."""
+    other_feed_item = sample_downloaded_item.model_copy(
+        update={"feed_id": "other_feed", "id": "other"}
+    )
+    mock_download_db.get_storage_usage.return_value = {"test_feed": 800, "other": 800}
+    mock_download_db.get_downloads_to_prune_by_storage_budget.return_value = [
+        sample_downloaded_item,
+        other_feed_item,
+    ]
+    pruner = Pruner(
+        mock_feed_db, mock_download_db, mock_file_manager, storage_budget=1000
     )
 
-    assert archived_count == 2  # Both items archived
-    assert files_deleted_count == 1  # Only DOWNLOADED item had file deleted
-    assert mock_file_manager.delete_download_file.call_count == 1
-    assert mock_download_db.archive_download.call_count == 2
+    assert await pruner.enforce_storage_budget() == (2, 2)
+    mock_download_db.get_downloads_to_prune_by_storage_budget.assert_awaited_once_with(
+        1000
+    )
+    mock_download_db.archive_downloads.assert_any_await("other_feed", ["other"])
+    mock_download_db.archive_downloads.assert_any_await(
+        "test_feed", [sample_downloaded_item.id]
+    )
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_prune_feed_downloads_candidate_identification_error_raises_prune_error(
-    pruner: Pruner,
+async def test_enforce_storage_budget_db_error_raises_prune_error(
+    mock_feed_db: MagicMock,
     mock_download_db: MagicMock,
+    mock_file_manager: AsyncMock,
 ):
-    """Tests prune_feed_downloads raises PruneError on candidate identification failure."""
-    db_error = DatabaseOperationError("DB fetch failed")
-    mock_download_db.get_downloads_to_prune_by_keep_last.side_effect = db_error
+    """Failures loading usage or candidates surface as PruneError."""
+    mock_download_db.get_storage_usage.side_effect = DatabaseOperationError("boom")
+    pruner = Pruner(
+        mock_feed_db, mock_download_db, mock_file_manager, storage_budget=1000
+    )
 
-    with pytest.raises(PruneError) as exc_info:
-        await pruner.prune_feed_downloads(
-            "test_feed", keep_last=5, prune_before_date=None
-        )
+    with pytest.raises(PruneError):
+        await pruner.enforce_storage_budget()
 
-    assert exc_info.value.feed_id == "test_feed"
-    assert exc_info.value.__cause__ is db_error
+
+# --- Tests for Pruner.prune_all_feeds ---
 
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_prune_feed_downloads_individual_failure_continues_processing(
+async def test_prune_all_feeds_batches_candidates_per_feed(
     pruner: Pruner,
     mock_download_db: MagicMock,
     sample_downloaded_item: Download,
     sample_queued_item: Download,
 ):
-    """Tests prune_feed_downloads continues processing other items when one fails."""
-    dl1 = sample_downloaded_item
-    dl2 = sample_queued_item.model_copy(update={"id": "fail_item"})
-    dl3 = sample_downloaded_item.model_copy(update={"id": "success_item"})
+    """Candidates from the cross-feed query are archived with one update per feed."""
+    other = _candidate(sample_downloaded_item.model_copy(update={"feed_id": "other"}))
+    mock_download_db.get_prune_candidates_for_all_feeds.return_value = [
+        _candidate(sample_downloaded_item),
+        _candidate(sample_queued_item),
+        other,
+    ]
 
-    candidates = [dl1, dl2, dl3]
-    mock_download_db.get_downloads_to_prune_by_keep_last.return_value = candidates
+    assert await pruner.prune_all_feeds() == (3, 2)
+    assert mock_download_db.archive_downloads.await_count == 2
+    mock_download_db.archive_downloads.assert_any_await(
+        "test_feed", [sample_downloaded_item.id, sample_queued_item.id]
+    )
+    mock_download_db.archive_downloads.assert_any_await("other", [other.id])
 
-    # Make dl2 fail during archival, others succeed
-    def archive_side_effect(_feed_id: str, download_id: str) -> None:
-        if download_id == "fail_item":
-            raise DatabaseOperationError("Archive failed for fail_item")
 
-    mock_download_db.archive_download.side_effect = archive_side_effect
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_prune_all_feeds_db_error_raises_prune_error(
+    pruner: Pruner, mock_download_db: MagicMock
+):
+    """Failure of the cross-feed candidate query surfaces as PruneError."""
+    db_error = DatabaseOperationError("boom")
+    mock_download_db.get_prune_candidates_for_all_feeds.side_effect = db_error
 
-    archived_count, files_deleted_count = await pruner.prune_feed_downloads(
-        "test_feed", keep_last=1, prune_before_date=None
-    )
+    with pytest.raises(PruneError) as exc_info:
+        await pruner.prune_all_feeds()
 
-    # dl1 and dl3 succeed (2 archived, 2 files deleted), dl2 fails (logged but processing continues)
-    assert archived_count == 2
-    assert files_deleted_count == 2
-    assert mock_download_db.archive_download.call_count == 3  # All attempts made
+    assert exc_info.value.__cause__ is db_error
 
 
 # --- Tests for Pruner.archive_feed ---
@@ -857,14 +864,15 @@ async def test_archive_feed_success_with_downloads(
     assert archived_count == 3
     assert files_deleted_count == 1  # Only DOWNLOADED item had file deleted
 
-    # Verify archive_download was called for each download
-    assert mock_download_db.archive_download.call_count == 3
-    expected_calls = [
-        (("test_feed", sample_downloaded_item.id),),
-        (("test_feed", sample_queued_item.id),),
-        (("test_feed", sample_upcoming_item.id),),
-    ]
-    mock_download_db.archive_download.assert_has_calls(expected_calls, any_order=True)
+    # Verify all downloads were archived with one bulk update
+    mock_download_db.archive_downloads.assert_awaited_once()
+    feed_id, archived_ids = mock_download_db.archive_downloads.await_args.args
+    assert feed_id == "test_feed"
+    assert set(archived_ids) == {
+        sample_downloaded_item.id,
+        sample_queued_item.id,
+        sample_upcoming_item.id,
+    }
 
     # Verify file deletion only called for DOWNLOADED item
     mock_file_manager.delete_download_file.assert_called_once_with(
@@ -1011,6 +1019,7 @@ async def test_archive_feed_empty_feed_only_disables(
     pruner: Pruner,
     mock_download_db: MagicMock,
     mock_feed_db: MagicMock,
+    mock_file_manager: AsyncMock,
 ):
     """Tests archive_feed with no downloads only disables the feed."""
     # All status queries return empty lists
@@ -1021,8 +1030,8 @@ async def test_archive_feed_empty_feed_only_disables(
     assert archived_count == 0
     assert files_deleted_count == 0
 
-    # No archives or file deletions should occur
-    mock_download_db.archive_download.assert_not_called()
+    # No file deletions should occur
+    mock_file_manager.delete_download_file.assert_not_called()
 
     # total_downloads should not be recalculated for empty feed
     mock_download_db.count_downloads_by_status.assert_not_called()
@@ -1083,14 +1092,50 @@ async def test_archive_feed_file_deletion_error_continues_archival(
     assert files_deleted_count == 0  # File deletion failed
 
     # Download should still be archived
-    mock_download_db.archive_download.assert_awaited_once_with(
-        "test_feed", sample_downloaded_item.id
+    mock_download_db.archive_downloads.assert_awaited_once_with(
+        "test_feed", [sample_downloaded_item.id]
     )
 
     # Feed should still be disabled
     mock_feed_db.set_feed_enabled.assert_awaited_once_with("test_feed", False)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_archive_feed_media_deletion_failure_keeps_feed_enabled(
+    pruner: Pruner,
+    mock_download_db: MagicMock,
+    mock_feed_db: MagicMock,
+    mock_file_manager: AsyncMock,
+    sample_downloaded_item: Download,
+    sample_queued_item: Download,
+):
+    """Tests archive_feed raises PruneError and keeps the feed when a file stays."""
+
+    def get_downloads_by_status_fn(
+        status_to_filter: DownloadStatus, feed_id: str | None
+    ):
+        return {
+            DownloadStatus.DOWNLOADED: [sample_downloaded_item],
+            DownloadStatus.QUEUED: [sample_queued_item],
+        }.get(status_to_filter, [])
+
+    mock_download_db.get_downloads_by_status.side_effect = get_downloads_by_status_fn
+    mock_file_manager.delete_download_file.side_effect = FileOperationError(
+        "Permission denied"
+    )
+
+    with pytest.raises(PruneError) as exc_info:
+        await pruner.archive_feed("test_feed")
+
+    assert exc_info.value.feed_id == "test_feed"
+    # The other download is archived; the failed one is retried next time
+    mock_download_db.archive_downloads.assert_awaited_once_with(
+        "test_feed", [sample_queued_item.id]
+    )
+    mock_feed_db.set_feed_enabled.assert_not_called()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_archive_feed_feed_image_deletion_failure_raises_prune_error(
@@ -0,0 +1,46 @@
+"""Tests for the database error-handling decorators."""
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from anypod.db.decorators import handle_feed_db_errors
+from anypod.exceptions import DatabaseOperationError
+from anypod.metrics.instruments import DB_OPERATION_ERRORS, DB_OPERATION_SECONDS
+
+
+@handle_feed_db_errors("test decorated read")
+async def _read_feed(feed_id: str) -> str:
+    return feed_id
+
+
+@handle_feed_db_errors("test decorated failure")
+async def _fail_feed(feed_id: str) -> str:
+    raise OperationalError("SELECT 1", {}, Exception("locked"))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_decorated_call_records_latency():
+    """Successful calls are timed under their operation name."""
+    before = DB_OPERATION_SECONDS.snapshot(operation="test decorated read")
+
+    assert await _read_feed("feed_a") == "feed_a"
+
+    after = DB_OPERATION_SECONDS.snapshot(operation="test decorated read")
+    assert after is not None
+    assert after.count == (before.count if before else 0) + 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_decorated_failure_counts_error_and_latency():
+    """SQLAlchemy errors are counted and still timed before being wrapped."""
+    operation = "test decorated failure"
+    errors_before = DB_OPERATION_ERRORS.value(operation=operation)
+
+    with pytest.raises(DatabaseOperationError) as exc_info:
+        await _fail_feed("feed_b")
+
+    assert exc_info.value.feed_id == "feed_b"
+    assert DB_OPERATION_ERRORS.value(operation=operation) == errors_before + 1
+    assert DB_OPERATION_SECONDS.snapshot(operation=operation) is not None
@@ -15,7 +15,15 @@ from sqlmodel import col
 
 from anypod.db import DownloadDatabase, FeedDatabase
 from anypod.db.sqlalchemy_core import SqlalchemyCore
-from anypod.db.types import Download, DownloadStatus, Feed, SourceType
+from anypod.db.types import (
+    Download,
+    DownloadCompletion,
+    DownloadStatus,
+    Feed,
+    PruneCandidate,
+    SourceType,
+    TranscriptSource,
+)
 from anypod.exceptions import DatabaseOperationError, DownloadNotFoundError
 
 # --- Fixtures ---
@@ -408,6 +416,103 @@ async def test_status_transitions(
         )
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_finalize_download_writes_all_artifacts(
+    download_db: DownloadDatabase, sample_download_queued: Download
+):
+    """finalize_download stores media, thumbnail and transcript metadata together."""
+    await download_db.upsert_download(sample_download_queued)
+    completion = DownloadCompletion(
+        ext="m4a",
+        mime_type="audio/mp4",
+        filesize=2048,
+        duration=321,
+        download_logs="yt-dlp logs",
+        thumbnail_ext="jpg",
+        transcript_ext="vtt",
+        transcript_lang="en",
+        transcript_source=TranscriptSource.CREATOR,
+    )
+
+    await download_db.finalize_download(
+        sample_download_queued.feed_id, sample_download_queued.id, completion
+    )
+
+    stored = await download_db.get_download_by_id(
+        sample_download_queued.feed_id, sample_download_queued.id
+    )
+    assert stored.status == DownloadStatus.DOWNLOADED
+    assert stored.ext == completion.ext
+    assert stored.mime_type == completion.mime_type
+    assert stored.filesize == completion.filesize
+    assert stored.duration == completion.duration
+    assert stored.download_logs == completion.download_logs
+    assert stored.thumbnail_ext == completion.thumbnail_ext
+    assert stored.transcript_ext == completion.transcript_ext
+    assert stored.transcript_lang == completion.transcript_lang
+    assert stored.transcript_source == completion.transcript_source
+    assert stored.retries == 0
+    assert stored.last_error is None
+    assert stored.downloaded_at is not None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_finalize_download_keeps_optional_fields_when_absent(
+    download_db: DownloadDatabase, sample_download_queued: Download
+):
+    """A missing duration or transcript leaves the stored values untouched."""
+    sample_download_queued.transcript_source = TranscriptSource.AUTO
+    await download_db.upsert_download(sample_download_queued)
+    completion = DownloadCompletion(
+        ext="mp4",
+        mime_type="video/mp4",
+        filesize=1024,
+        duration=None,
+        download_logs="",
+        thumbnail_ext=None,
+    )
+
+    await download_db.finalize_download(
+        sample_download_queued.feed_id, sample_download_queued.id, completion
+    )
+
+    stored = await download_db.get_download_by_id(
+        sample_download_queued.feed_id, sample_download_queued.id
+    )
+    assert stored.duration == sample_download_queued.duration
+    assert stored.transcript_source == TranscriptSource.AUTO
+    assert stored.transcript_ext is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_finalize_download_requires_queued_status(
+    download_db: DownloadDatabase, sample_download_upcoming: Download
+):
+    """finalize_download refuses to finalize a download that is not QUEUED."""
+    await download_db.upsert_download(sample_download_upcoming)
+    completion = DownloadCompletion(
+        ext="mp4",
+        mime_type="video/mp4",
+        filesize=1024,
+        duration=60,
+        download_logs="",
+        thumbnail_ext=None,
+    )
+
+    with pytest.raises(DownloadNotFoundError):
+        await download_db.finalize_download(
+            sample_download_upcoming.feed_id, sample_download_upcoming.id, completion
+        )
+
+    stored = await download_db.get_download_by_id(
+        sample_download_upcoming.feed_id, sample_download_upcoming.id
+    )
+    assert stored.status == DownloadStatus.UPCOMING
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_set_thumbnail_extension_sets_and_clears(
@@ -785,333 +890,6 @@ async def test_bulk_requeue_requires_status(
         await download_db.requeue_downloads(feed_id, None)
 
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_downloads_to_prune_by_keep_last(
-    feed_db: FeedDatabase, download_db: DownloadDatabase
-):
-    """Test fetching downloads to prune based on 'keep_last'."""
-    base_time = datetime(2023, 1, 1, 12, 0, 0, tzinfo=UTC)
-    feed1_name = "prune_feed1"
-
-    # Create the feeds that downloads will reference
-    for feed_id in [feed1_name, "prune_feed2"]:
-        feed = Feed(
-            id=feed_id,
-            is_enabled=True,
-            source_type=SourceType.CHANNEL,
-            source_url=f"http://example.com/{feed_id}",
-            last_successful_sync=base_time,
-        )
-        await feed_db.upsert_feed(feed)
-
-    # Mix of statuses and published dates
-    dl_f1v1_dl_oldest = Download(
-        feed_id=feed1_name,
-        id="f1v1_dl_oldest",
-        published=base_time - timedelta(days=5),
-        status=DownloadStatus.DOWNLOADED,
-        source_url="url",
-        title="t1",
-        ext="mp4",
-        mime_type="video/mp4",
-        filesize=1024,
-        duration=1,
-    )
-    dl_f1v2_err_mid1 = Download(
-        feed_id=feed1_name,
-        id="f1v2_err_mid1",
-        published=base_time - timedelta(days=4),
-        status=DownloadStatus.ERROR,
-        source_url="url",
-        title="t2",
-        ext="mkv",
-        mime_type="video/x-matroska",
-        filesize=1024,
-        duration=1,
-    )
-    dl_f1v3_q_mid2 = Download(
-        feed_id=feed1_name,
-        id="f1v3_q_mid2",
-        published=base_time - timedelta(days=3),
-        status=DownloadStatus.QUEUED,
-        source_url="url",
-        title="t3",
-        ext="webm",
-        mime_type="video/webm",
-        filesize=1024,
-        duration=1,
-    )
-    dl_f1v4_dl_newest = Download(
-        feed_id=feed1_name,
-        id="f1v4_dl_newest",
-        published=base_time - timedelta(days=2),
-        status=DownloadStatus.DOWNLOADED,
-        source_url="url",
-        title="t4",
-        ext="mp4",
-        mime_type="video/mp4",
-        filesize=1024,
-        duration=1,
-    )
-    dl_f1v5_arch = Download(
-        feed_id=feed1_name,
-        id="f1v5_arch",
-        published=base_time - timedelta(days=1),
-        status=DownloadStatus.ARCHIVED,
-        source_url="url",
-        title="t5",
-        ext="mp3",
-        mime_type="audio/mpeg",
-        filesize=1024,
-        duration=1,
-    )
-    dl_f1v6_upcoming_older = Download(  # New UPCOMING download, older
-        feed_id=feed1_name,
-        id="f1v6_upcoming_older",
-        published=base_time - timedelta(days=6),  # Older than f1v1_dl_oldest
-        status=DownloadStatus.UPCOMING,
-        source_url="url",
-        title="t6_upcoming",
-        ext="mp4",
-        mime_type="video/mp4",
-        filesize=1024,
-        duration=1,
-    )
-    dl_f1v7_skipped = Download(
-        feed_id=feed1_name,
-        id="f1v7_skipped",
-        published=base_time - timedelta(days=7),  # Very old
-        status=DownloadStatus.SKIPPED,
-        source_url="url",
-        title="t7_skipped",
-        ext="mp4",
-        mime_type="video/mp4",
-        filesize=1024,
-        duration=1,
-    )
-    # download for another feed, should be ignored
-    dl_f2v1_dl = Download(
-        feed_id="prune_feed2",
-        id="f2v1_dl",
-        published=base_time - timedelta(days=3),
-        status=DownloadStatus.DOWNLOADED,
-        source_url="url",
-        title="t_f2",
-        ext="mp4",
-        mime_type="video/mp4",
-        filesize=1024,
-        duration=1,
-        discovered_at=base_time,
-        updated_at=base_time,
-    )
-    downloads_to_add = [
-        dl_f1v1_dl_oldest,
-        dl_f1v2_err_mid1,
-        dl_f1v3_q_mid2,
-        dl_f1v4_dl_newest,
-        dl_f1v5_arch,
-        dl_f2v1_dl,
-        dl_f1v6_upcoming_older,
-        dl_f1v7_skipped,
-    ]
-    for dl in downloads_to_add:
-        await download_db.upsert_download(dl)
-
-    # Keep 2: f1v4_dl_newest (kept), f1v3_q_mid2 (kept)
-    # Pruned: f1v2_err_mid1, f1v1_dl_oldest, f1v6_upcoming_older
-    # Ignored from pruning: f1v5_arch, f1v7_skipped
-    prune_keep2 = await download_db.get_downloads_to_prune_by_keep_last(
-        feed_id=feed1_name, keep_last=2
-    )
-    assert len(prune_keep2) == 3, (
-        "Should identify 3 downloads to prune (f1v1_dl_oldest, f1v2_err_mid1, f1v6_upcoming_older)"
-    )
-    pruned_ids_keep2 = sorted([row.id for row in prune_keep2])
-    assert "f1v7_skipped" not in pruned_ids_keep2, (
-        "SKIPPED download f1v7_skipped should NOT be in the prune list"
-    )
-    assert (
-        sorted(["f1v1_dl_oldest", "f1v2_err_mid1", "f1v6_upcoming_older"])
-        == pruned_ids_keep2
-    )
-
-    # Keep 5: All non-ARCHIVED and non-SKIPPED downloads are kept
-    # (f1v4_dl_newest, f1v3_q_mid2, f1v2_err_mid1, f1v1_dl_oldest, f1v6_upcoming_older)
-    # There are 5 such downloads. f1v5_arch and f1v7_skipped are ignored.
-    prune_keep5 = await download_db.get_downloads_to_prune_by_keep_last(
-        feed_id=feed1_name, keep_last=5
-    )
-    assert len(prune_keep5) == 0, (
-        "Should identify 0 if keep_last >= total non-ARCHIVED/non-SKIPPED downloads for feed"
-    )
-
-    prune_keep0 = await download_db.get_downloads_to_prune_by_keep_last(
-        feed_id=feed1_name, keep_last=0
-    )
-    assert len(prune_keep0) == 0, "Should return 0 if keep_last is 0"
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_get_downloads_to_prune_by_since(
-    feed_db: FeedDatabase, download_db: DownloadDatabase
-):
-    """Test fetching downloads to prune by 'since' date."""
-    base_time = datetime(2023, 1, 1, 12, 0, 0, tzinfo=UTC)
-    feed_id = "prune_since_feed"
-    other_feed_id = "other_feed"
-
-    # Create the feeds that downloads will reference
-    for feed_name in [feed_id, other_feed_id]:
-        feed = Feed(
-            id=feed_name,
-            is_enabled=True,
-            source_type=SourceType.CHANNEL,
-            source_url=f"http://example.com/{feed_name}",
-            last_successful_sync=base_time,
-        )
-        await feed_db.upsert_feed(feed)
-
-    dl_ps_v1_older_dl = Download(
-        feed_id=feed_id,
-        id="ps_v1_older_dl",
-        published=base_time - timedelta(days=5),
-        status=DownloadStatus.DOWNLOADED,
-        source_url="url",
-        title="t1",
-        ext="mp4",
-        mime_type="video/mp4",
-        filesize=1024,
-        duration=1,
-    )
-    dl_ps_v2_mid_err = Download(
-        feed_id=feed_id,
-        id="ps_v2_mid_err",
-        published=base_time - timedelta(days=2),
-        status=DownloadStatus.ERROR,
-        source_url="url",
-        title="t2",
-        ext="mkv",
-        mime_type="video/x-matroska",
-        filesize=1024,
-        duration=1,
-    )
-    dl_ps_v3_newer_q = Download(
-        feed_id=feed_id,
-        id="ps_v3_newer_q",
-        published=base_time + timedelta(days=1),
-        status=DownloadStatus.QUEUED,
-        source_url="url",
-        title="t3",
-        ext="webm",
-        mime_type="video/webm",
-        filesize=1024,
-        duration=1,
-    )
-    dl_ps_v4_arch = Download(
-        feed_id=feed_id,
-        id="ps_v4_arch",
-        published=base_time,
-        status=DownloadStatus.ARCHIVED,
-        source_url="url",
-        title="t4",
-        ext="mp3",
-        mime_type="audio/mpeg",
-        filesize=1024,
-        duration=1,
-    )
-    dl_ps_v5_upcoming_ancient = Download(  # New UPCOMING download, very old
-        feed_id=feed_id,
-        id="ps_v5_upcoming_ancient",
-        published=base_time - timedelta(days=10),  # Much older than cutoff
-        status=DownloadStatus.UPCOMING,
-        source_url="url",
-        title="t5_upcoming",
-        ext="mp4",
-        mime_type="video/mp4",
-        filesize=1024,
-        duration=1,
-    )
-    dl_ps_v6_skipped_ancient = Download(
-        feed_id=feed_id,
-        id="ps_v6_skipped_ancient",
-        published=base_time - timedelta(days=12),  # Much older than cutoff
-        status=DownloadStatus.SKIPPED,
-        source_url="url",
-        title="t6_skipped",
-        ext="mp4",
-        mime_type="video/mp4",
-        filesize=1024,
-        duration=1,
-    )
-
-    # download for another feed
-    dl_other_v1_older_dl = Download(
-        feed_id=other_feed_id,
-        id="other_v1_older_dl",
-        published=base_time - timedelta(days=5),
-        status=DownloadStatus.DOWNLOADED,
-        source_url="url",
-        title="t_other",
-        ext="mp4",
-        mime_type="video/mp4",
-        filesize=1024,
-        duration=1,
-    )
-    downloads_to_add = [
-        dl_ps_v1_older_dl,
-        dl_ps_v2_mid_err,
-        dl_ps_v3_newer_q,
-        dl_ps_v4_arch,
-        dl_ps_v5_upcoming_ancient,
-        dl_ps_v6_skipped_ancient,
-        dl_other_v1_older_dl,
-    ]
-    for dl in downloads_to_add:
-        await download_db.upsert_download(dl)
-
-    # Prune downloads older than 'base_time - 3 days' for feed_id
-    # Candidates for pruning (ignoring ARCHIVED and SKIPPED):
-    # - ps_v1_older_dl (day -5) -> YES
-    # - ps_v2_mid_err (day -2) -> NO (not older than day -3)
-    # - ps_v3_newer_q (day +1) -> NO
-    # - ps_v4_arch (day 0) -> NO (archived)
-    # - ps_v5_upcoming_ancient (day -10) -> YES
-    # - ps_v6_skipped_ancient (day -12) -> NO
-    since_cutoff_1 = base_time - timedelta(days=3)
-    pruned_1 = await download_db.get_downloads_to_prune_by_since(
-        feed_id=feed_id, since=since_cutoff_1
-    )
-    assert len(pruned_1) == 2
-    pruned_ids_1 = sorted([row.id for row in pruned_1])
-    assert pruned_ids_1 == sorted(["ps_v1_older_dl", "ps_v5_upcoming_ancient"])
-    assert "ps_v6_skipped_ancient" not in pruned_ids_1, (
-        "SKIPPED download should not be pruned by since_cutoff_1"
-    )
-
-    # Prune downloads older than 'base_time + 2 days' for feed_id
-    # Candidates for pruning (ignoring ARCHIVED and SKIPPED):
-    # - ps_v1_older_dl (day -5) -> YES
-    # - ps_v2_mid_err (day -2) -> YES
-    # - ps_v3_newer_q (day +1) -> YES
-    # - ps_v4_arch (day 0) -> NO (archived)
-    # - ps_v5_upcoming_ancient (day -10) -> YES
-    # - ps_v6_skipped_ancient (day -12) -> NO
-    since_cutoff_2 = base_time + timedelta(days=2)
-    pruned_2 = await download_db.get_downloads_to_prune_by_since(
-        feed_id=feed_id, since=since_cutoff_2
-    )
-    pruned_ids_2 = sorted([row.id for row in pruned_2])
-    assert len(pruned_2) == 4
-    assert pruned_ids_2 == sorted(
-        ["ps_v1_older_dl", "ps_v2_mid_err", "ps_v3_newer_q", "ps_v5_upcoming_ancient"]
-    )
-    assert "ps_v6_skipped_ancient" not in pruned_ids_2, (
-        "SKIPPED download should not be pruned by since_cutoff_2"
-    )
-
-
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_get_downloads_by_status(
@@ -2163,3 +1941,321 @@ async def test_total_downloads_computed_column(
     # Archive one downloaded item - should reduce count
     await download_db.archive_download(feed.id, "downloaded_video")
     assert (await feed_db.get_feed_by_id(feed.id)).total_downloads == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_status_counters_follow_download_lifecycle(
+    feed_db: FeedDatabase,
+    download_db: DownloadDatabase,
+    test_feed: Feed,
+    sample_download_upcoming: Download,
+):
+    """Per-status feed counters move with inserts, transitions, and deletes."""
+    feed_id = test_feed.id
+    download_id = sample_download_upcoming.id
+
+    async def counts() -> dict[DownloadStatus, int]:
+        return {
+            status: await download_db.count_downloads_by_status(status, feed_id)
+            for status in DownloadStatus
+        }
+
+    zeros = dict.fromkeys(DownloadStatus, 0)
+    assert await counts() == zeros
+
+    await download_db.upsert_download(sample_download_upcoming)
+    assert await counts() == {**zeros, DownloadStatus.UPCOMING: 1}
+
+    await download_db.mark_as_queued_from_upcoming(feed_id, download_id)
+    assert await counts() == {**zeros, DownloadStatus.QUEUED: 1}
+
+    await download_db.bump_retries(feed_id, download_id, "boom", 1)
+    assert await counts() == {**zeros, DownloadStatus.ERROR: 1}
+
+    await download_db.requeue_downloads(feed_id, download_id)
+    await download_db.skip_download(feed_id, download_id)
+    assert await counts() == {**zeros, DownloadStatus.SKIPPED: 1}
+
+    await download_db.delete_download(feed_id, download_id)
+    assert await counts() == zeros
+    assert await feed_db.check_status_counters() == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_count_downloads_by_status_unknown_feed_is_zero(
+    download_db: DownloadDatabase,
+):
+    """Counting for a feed that does not exist returns zero."""
+    count = await download_db.count_downloads_by_status(
+        [DownloadStatus.QUEUED, DownloadStatus.ERROR], feed_id="missing_feed"
+    )
+
+    assert count == 0
+
+
+async def _store_downloaded(
+    feed_db: FeedDatabase,
+    download_db: DownloadDatabase,
+    feed_id: str,
+    download_id: str,
+    filesize: int,
+    content_key: str | None = None,
+    published: datetime = datetime(2023, 1, 1, tzinfo=UTC),
+) -> None:
+    await feed_db.upsert_feed(
+        Feed(
+            id=feed_id,
+            is_enabled=True,
+            source_type=SourceType.CHANNEL,
+            source_url=f"http://example.com/{feed_id}",
+            last_successful_sync=datetime(2023, 1, 1, tzinfo=UTC),
+        )
+    )
+    await download_db.upsert_download(
+        Download(
+            feed_id=feed_id,
+            id=download_id,
+            source_url=f"http://example.com/{download_id}",
+            title=download_id,
+            published=published,
+            ext="mp4",
+            mime_type="video/mp4",
+            duration=60,
+            status=DownloadStatus.QUEUED,
+            filesize=0,
+        )
+    )
+    await download_db.finalize_download(
+        feed_id,
+        download_id,
+        DownloadCompletion(
+            ext="mp4",
+            mime_type="video/mp4",
+            filesize=filesize,
+            duration=60,
+            download_logs="",
+            thumbnail_ext=None,
+            content_key=content_key,
+        ),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_downloaded_by_content_key_excludes_own_feed(
+    feed_db: FeedDatabase, download_db: DownloadDatabase
+):
+    """Only DOWNLOADED rows from other feeds with the same key are returned."""
+    await _store_downloaded(feed_db, download_db, "feed_a", "vid", 100, "key")
+    await _store_downloaded(feed_db, download_db, "feed_b", "vid", 100, "key")
+    await _store_downloaded(feed_db, download_db, "feed_c", "vid", 100, "other")
+
+    matches = await download_db.get_downloaded_by_content_key("key", "feed_b")
+
+    assert [(d.feed_id, d.content_key) for d in matches] == [("feed_a", "key")]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_duplicate_downloads_groups_by_id_ext_and_size(
+    feed_db: FeedDatabase, download_db: DownloadDatabase
+):
+    """Rows sharing id, extension and size across feeds are returned together."""
+    await _store_downloaded(feed_db, download_db, "feed_a", "vid", 100)
+    await _store_downloaded(feed_db, download_db, "feed_b", "vid", 100)
+    await _store_downloaded(feed_db, download_db, "feed_c", "vid", 200)
+    await _store_downloaded(feed_db, download_db, "feed_a", "solo", 100)
+
+    duplicates = await download_db.get_duplicate_downloads()
+
+    assert [(d.feed_id, d.id) for d in duplicates] == [
+        ("feed_a", "vid"),
+        ("feed_b", "vid"),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_downloads_to_prune_by_size_keeps_newest_within_limit(
+    feed_db: FeedDatabase, download_db: DownloadDatabase
+):
+    """Older media beyond the size limit is returned; the newest is always kept."""
+    for day, size in [(1, 100), (2, 100), (3, 100), (4, 500)]:
+        await _store_downloaded(
+            feed_db,
+            download_db,
+            "feed_a",
+            f"d{day}",
+            size,
+            published=datetime(2023, 1, day, tzinfo=UTC),
+        )
+
+    over_limit = await download_db.get_downloads_to_prune_by_size("feed_a", 650)
+    assert {d.id for d in over_limit} == {"d2", "d1"}
+
+    tiny_limit = await download_db.get_downloads_to_prune_by_size("feed_a", 10)
+    assert {d.id for d in tiny_limit} == {"d3", "d2", "d1"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_downloads_to_prune_by_storage_budget_spans_feeds(
+    feed_db: FeedDatabase, download_db: DownloadDatabase
+):
+    """The oldest media of any feed is pruned, keeping each feed's newest."""
+    layout = [("feed_a", "a1", 1), ("feed_a", "a2", 3), ("feed_b", "b1", 2)]
+    for feed_id, download_id, day in layout:
+        await _store_downloaded(
+            feed_db,
+            download_db,
+            feed_id,
+            download_id,
+            100,
+            published=datetime(2023, 1, day, tzinfo=UTC),
+        )
+
+    assert await download_db.get_storage_usage() == {"feed_a": 200, "feed_b": 100}
+
+    candidates = await download_db.get_downloads_to_prune_by_storage_budget(250)
+    assert [(d.feed_id, d.id) for d in candidates] == [("feed_a", "a1")]
+
+    # Budget smaller than the per-feed floors prunes nothing more
+    candidates = await download_db.get_downloads_to_prune_by_storage_budget(50)
+    assert [(d.feed_id, d.id) for d in candidates] == [("feed_a", "a1")]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_archive_downloads_archives_only_given_feed_ids(
+    feed_db: FeedDatabase, download_db: DownloadDatabase
+):
+    """Bulk archival updates the listed downloads of one feed and skips unknown ids."""
+    for download_id in ("a", "b", "c"):
+        await _store_downloaded(feed_db, download_db, "feed_a", download_id, 100)
+    await _store_downloaded(feed_db, download_db, "feed_b", "a", 100)
+
+    archived = await download_db.archive_downloads("feed_a", ["a", "b", "missing"])
+
+    assert archived == 2
+    expected = {
+        ("feed_a", "a"): DownloadStatus.ARCHIVED,
+        ("feed_a", "b"): DownloadStatus.ARCHIVED,
+        ("feed_a", "c"): DownloadStatus.DOWNLOADED,
+        ("feed_b", "a"): DownloadStatus.DOWNLOADED,
+    }
+    for (feed_id, download_id), status in expected.items():
+        download = await download_db.get_download_by_id(feed_id, download_id)
+        assert download.status == status
+    assert await download_db.archive_downloads("feed_a", []) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_stored_file_keys_excludes_archived(
+    feed_db: FeedDatabase, download_db: DownloadDatabase
+):
+    """File keys cover every feed's downloads except archived ones."""
+    await _store_downloaded(feed_db, download_db, "feed_a", "a", 100)
+    await _store_downloaded(feed_db, download_db, "feed_a", "b", 100)
+    await _store_downloaded(feed_db, download_db, "feed_b", "a", 100)
+    await download_db.archive_download("feed_a", "b")
+
+    keys = await download_db.get_stored_file_keys()
+
+    assert sorted((k.feed_id, k.id, k.ext) for k in keys) == [
+        ("feed_a", "a", "mp4"),
+        ("feed_b", "a", "mp4"),
+    ]
+
+
+async def _set_feed_retention(
+    feed_db: FeedDatabase,
+    feed_id: str,
+    keep_last: int | None = None,
+    since: datetime | None = None,
+    is_enabled: bool = True,
+) -> None:
+    await feed_db.upsert_feed(
+        Feed(
+            id=feed_id,
+            is_enabled=is_enabled,
+            source_type=SourceType.CHANNEL,
+            source_url=f"http://example.com/{feed_id}",
+            last_successful_sync=datetime(2023, 1, 1, tzinfo=UTC),
+            keep_last=keep_last,
+            since=since,
+        )
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_prune_candidates_combines_keep_last_and_since(
+    feed_db: FeedDatabase, download_db: DownloadDatabase
+):
+    """One query returns the union of both rules, skipping SKIPPED downloads."""
+    for day in range(1, 5):
+        await _store_downloaded(
+            feed_db,
+            download_db,
+            "feed_a",
+            f"d{day}",
+            100,
+            published=datetime(2023, 1, day, tzinfo=UTC),
+        )
+    await download_db.skip_download("feed_a", "d1")
+
+    async def candidate_ids(keep_last: int | None, since: datetime | None) -> set[str]:
+        candidates = await download_db.get_prune_candidates("feed_a", keep_last, since)
+        return {c.id for c in candidates}
+
+    assert await candidate_ids(2, None) == {"d2"}
+    assert await candidate_ids(None, datetime(2023, 1, 4, tzinfo=UTC)) == {"d2", "d3"}
+    assert await candidate_ids(3, datetime(2023, 1, 3, tzinfo=UTC)) == {"d2"}
+    assert await candidate_ids(1, datetime(2023, 1, 1, tzinfo=UTC)) == {"d2", "d3"}
+    assert await candidate_ids(0, None) == set()
+    assert await candidate_ids(None, None) == set()
+
+    (candidate,) = await download_db.get_prune_candidates("feed_a", 2, None)
+    assert candidate == PruneCandidate(
+        feed_id="feed_a", id="d2", status=DownloadStatus.DOWNLOADED, ext="mp4"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_prune_candidates_for_all_feeds_uses_feed_retention(
+    feed_db: FeedDatabase, download_db: DownloadDatabase
+):
+    """Each enabled feed's stored keep_last and since rules are applied at once."""
+    layout = [
+        ("feed_a", "a1", 1),
+        ("feed_a", "a2", 2),
+        ("feed_a", "a3", 3),
+        ("feed_b", "b1", 1),
+        ("feed_b", "b2", 3),
+        ("feed_c", "c1", 1),
+        ("feed_c", "c2", 2),
+    ]
+    for feed_id, download_id, day in layout:
+        await _store_downloaded(
+            feed_db,
+            download_db,
+            feed_id,
+            download_id,
+            100,
+            published=datetime(2023, 1, day, tzinfo=UTC),
+        )
+    await _set_feed_retention(feed_db, "feed_a", keep_last=1)
+    await _set_feed_retention(feed_db, "feed_b", since=datetime(2023, 1, 2, tzinfo=UTC))
+    await _set_feed_retention(feed_db, "feed_c", keep_last=1, is_enabled=False)
+
+    candidates = await download_db.get_prune_candidates_for_all_feeds()
+
+    assert {(c.feed_id, c.id) for c in candidates} == {
+        ("feed_a", "a1"),
+        ("feed_a", "a2"),
+        ("feed_b", "b1"),
+    }
@@ -0,0 +1,404 @@
+# pyright: reportPrivateUsage=false
+
+"""Query-plan regression tests for DownloadDatabase.
+
+Every statement a DownloadDatabase method issues against the ``download`` table
+is captured and run through ``EXPLAIN QUERY PLAN``. A plan that falls back to a
+full table scan or a temporary sort means an index is missing or unusable.
+"""
+
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+import inspect
+from pathlib import Path
+from typing import Any
+
+from helpers.alembic import run_migrations
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from anypod.db import DownloadDatabase
+from anypod.db.sqlalchemy_core import SqlalchemyCore
+from anypod.db.types import (
+    Download,
+    DownloadCompletion,
+    DownloadStatus,
+    Feed,
+    SourceType,
+    TranscriptSource,
+)
+
+FEED_IDS = [f"feed_{i}" for i in range(5)]
+DOWNLOADS_PER_FEED = 200
+STATUSES = list(DownloadStatus)
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+TARGET_FEED = FEED_IDS[0]
+
+type DownloadDbCall = Callable[[DownloadDatabase], Awaitable[Any]]
+
+# --- Fixtures ---
+
+
+@pytest_asyncio.fixture
+async def db_core(tmp_path: Path) -> AsyncGenerator[SqlalchemyCore]:
+    """Provides a migrated, populated and analyzed SqlalchemyCore."""
+    run_migrations(tmp_path / "anypod.db")
+    core = SqlalchemyCore(db_dir=tmp_path)
+
+    async def _populate(session: AsyncSession) -> None:
+        session.add_all(_make_feed(feed_id) for feed_id in FEED_IDS)
+        await session.flush()
+        session.add_all(
+            _make_download(feed_id, i)
+            for feed_id in FEED_IDS
+            for i in range(DOWNLOADS_PER_FEED)
+        )
+        await session.flush()
+        await session.execute(text("ANALYZE"))
+
+    await core.write(_populate)
+    yield core
+    await core.close()
+
+
+def _make_feed(feed_id: str) -> Feed:
+    return Feed(
+        id=feed_id,
+        is_enabled=True,
+        source_type=SourceType.CHANNEL,
+        source_url=f"http://example.com/{feed_id}",
+        last_successful_sync=BASE_TIME,
+    )
+
+
+def _make_download(feed_id: str, i: int) -> Download:
+    return Download(
+        feed_id=feed_id,
+        id=_download_id(feed_id, i),
+        source_url=f"http://example.com/{feed_id}/{i}",
+        title=f"Video {i}",
+        published=BASE_TIME + timedelta(hours=i),
+        ext="mp4",
+        mime_type="video/mp4",
+        filesize=1024,
+        duration=60,
+        status=STATUSES[i % len(STATUSES)],
+        # Every feed carries the same videos, as overlapping feeds would
+        content_key=f"key_{i}",
+    )
+
+
+def _download_id(feed_id: str, i: int) -> str:
+    return f"{feed_id}_video_{i}"
+
+
+def _id_with_status(status: DownloadStatus) -> str:
+    """Return the id of a seeded download in TARGET_FEED with the given status."""
+    return _download_id(TARGET_FEED, STATUSES.index(status))
+
+
+@contextmanager
+def _capture_download_statements(
+    core: SqlalchemyCore,
+) -> Generator[list[tuple[str, Any]]]:
+    """Record SELECT/UPDATE/DELETE statements issued against the download table."""
+    statements: list[tuple[str, Any]] = []
+
+    def _on_execute(
+        _conn: Connection,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        _context: Any,
+        _executemany: bool,
+    ) -> None:
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if verb in ("SELECT", "UPDATE", "DELETE") and "download" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(core.engine.sync_engine, "before_cursor_execute", _on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(core.engine.sync_engine, "before_cursor_execute", _on_execute)
+
+
+async def _explain(core: SqlalchemyCore, statement: str, parameters: Any) -> list[str]:
+    async with core.engine.connect() as conn:
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        return [str(row.detail) for row in result]
+
+
+def _plan_problems(plan: list[str]) -> list[str]:
+    """Return plan steps that indicate a full scan or an unindexed sort."""
+    return [
+        step
+        for step in plan
+        if (step.startswith("SCAN download") and "INDEX" not in step)
+        or "USE TEMP B-TREE" in step
+    ]
+
+
+DOWNLOAD_DB_CALLS: list[tuple[str, DownloadDbCall]] = [
+    (
+        "upsert_download",
+        lambda db: db.upsert_download(_make_download(TARGET_FEED, 0)),
+    ),
+    (
+        "update_download",
+        lambda db: db.update_download(_make_download(TARGET_FEED, 0)),
+    ),
+    (
+        "mark_as_queued_from_upcoming",
+        lambda db: db.mark_as_queued_from_upcoming(
+            TARGET_FEED, _id_with_status(DownloadStatus.UPCOMING)
+        ),
+    ),
+    (
+        "requeue_downloads_targeted",
+        lambda db: db.requeue_downloads(
+            TARGET_FEED, _id_with_status(DownloadStatus.ERROR)
+        ),
+    ),
+    (
+        "requeue_downloads_bulk",
+        lambda db: db.requeue_downloads(
+            TARGET_FEED, None, from_status=DownloadStatus.ERROR
+        ),
+    ),
+    (
+        "mark_as_downloaded",
+        lambda db: db.mark_as_downloaded(
+            TARGET_FEED, _id_with_status(DownloadStatus.QUEUED), "mp4", 2048
+        ),
+    ),
+    (
+        "finalize_download",
+        lambda db: db.finalize_download(
+            TARGET_FEED,
+            _id_with_status(DownloadStatus.QUEUED),
+            DownloadCompletion(
+                ext="mp4",
+                mime_type="video/mp4",
+                filesize=2048,
+                duration=60,
+                download_logs="",
+                thumbnail_ext=None,
+            ),
+        ),
+    ),
+    (
+        "set_download_logs",
+        lambda db: db.set_download_logs(
+            TARGET_FEED, _download_id(TARGET_FEED, 0), "log"
+        ),
+    ),
+    (
+        "set_thumbnail_extension",
+        lambda db: db.set_thumbnail_extension(
+            TARGET_FEED, _download_id(TARGET_FEED, 0), "jpg"
+        ),
+    ),
+    (
+        "set_transcript_metadata",
+        lambda db: db.set_transcript_metadata(
+            TARGET_FEED,
+            _id_with_status(DownloadStatus.DOWNLOADED),
+            "vtt",
+            "en",
+            TranscriptSource.CREATOR,
+        ),
+    ),
+    (
+        "skip_download",
+        lambda db: db.skip_download(
+            TARGET_FEED, _id_with_status(DownloadStatus.QUEUED)
+        ),
+    ),
+    (
+        "archive_download",
+        lambda db: db.archive_download(
+            TARGET_FEED, _id_with_status(DownloadStatus.DOWNLOADED)
+        ),
+    ),
+    (
+        "archive_downloads",
+        lambda db: db.archive_downloads(
+            TARGET_FEED, [_download_id(TARGET_FEED, i) for i in range(10)]
+        ),
+    ),
+    (
+        "bump_retries",
+        lambda db: db.bump_retries(
+            TARGET_FEED, _id_with_status(DownloadStatus.QUEUED), "boom", 3
+        ),
+    ),
+    (
+        "get_prune_candidates",
+        lambda db: db.get_prune_candidates(
+            TARGET_FEED, 10, BASE_TIME + timedelta(days=10)
+        ),
+    ),
+    (
+        "get_prune_candidates_for_all_feeds",
+        lambda db: db.get_prune_candidates_for_all_feeds(),
+    ),
+    (
+        "get_downloads_to_prune_by_size",
+        lambda db: db.get_downloads_to_prune_by_size(TARGET_FEED, 10 * 1024),
+    ),
+    (
+        "get_storage_usage",
+        lambda db: db.get_storage_usage(),
+    ),
+    (
+        "get_downloads_to_prune_by_storage_budget",
+        lambda db: db.get_downloads_to_prune_by_storage_budget(10 * 1024),
+    ),
+    (
+        "get_stored_file_keys",
+        lambda db: db.get_stored_file_keys(),
+    ),
+    (
+        "get_downloaded_by_content_key",
+        lambda db: db.get_downloaded_by_content_key(
+            "key_0", exclude_feed_id=TARGET_FEED
+        ),
+    ),
+    (
+        "get_duplicate_downloads",
+        lambda db: db.get_duplicate_downloads(),
+    ),
+    (
+        "get_download_by_id",
+        lambda db: db.get_download_by_id(TARGET_FEED, _download_id(TARGET_FEED, 0)),
+    ),
+    (
+        "delete_download",
+        lambda db: db.delete_download(TARGET_FEED, _download_id(TARGET_FEED, 0)),
+    ),
+    *(
+        (
+            f"get_downloads_by_status_feed_{status.value.lower()}",
+            lambda db, status=status: db.get_downloads_by_status(
+                status, feed_id=TARGET_FEED
+            ),
+        )
+        for status in STATUSES
+    ),
+    *(
+        (
+            f"get_downloads_by_status_all_feeds_{status.value.lower()}",
+            lambda db, status=status: db.get_downloads_by_status(status, limit=50),
+        )
+        for status in (
+            DownloadStatus.QUEUED,
+            DownloadStatus.UPCOMING,
+            DownloadStatus.ERROR,
+        )
+    ),
+    (
+        "get_downloads_by_status_published_window",
+        lambda db: db.get_downloads_by_status(
+            DownloadStatus.ARCHIVED,
+            feed_id=TARGET_FEED,
+            published_after=BASE_TIME + timedelta(days=1),
+            published_before=BASE_TIME + timedelta(days=20),
+            limit=10,
+        ),
+    ),
+    (
+        "count_downloads_by_status_single",
+        lambda db: db.count_downloads_by_status(
+            DownloadStatus.DOWNLOADED, feed_id=TARGET_FEED
+        ),
+    ),
+    (
+        "count_downloads_by_status_multiple",
+        lambda db: db.count_downloads_by_status(
+            [DownloadStatus.QUEUED, DownloadStatus.ERROR], feed_id=TARGET_FEED
+        ),
+    ),
+    (
+        "count_downloads_by_status_all_feeds",
+        lambda db: db.count_downloads_by_status(DownloadStatus.QUEUED),
+    ),
+]
+
+# Plan steps a call may contain because it reads most of the table on purpose
+ACCEPTED_PLAN_STEPS: dict[str, str] = {
+    # Ranks media across all feeds, an order no per-feed index provides
+    "get_downloads_to_prune_by_storage_budget": "USE TEMP B-TREE FOR ORDER BY",
+    # Loads the file keys of every stored download in one pass
+    "get_stored_file_keys": "SCAN download",
+}
+
+# --- Tests ---
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("name", "call"),
+    [pytest.param(name, call, id=name) for name, call in DOWNLOAD_DB_CALLS],
+)
+async def test_download_queries_use_indexes(
+    db_core: SqlalchemyCore, name: str, call: DownloadDbCall
+):
+    """Statements issued by DownloadDatabase avoid full scans and temp sorts."""
+    download_db = DownloadDatabase(db_core)
+    accepted = ACCEPTED_PLAN_STEPS.get(name)
+
+    with _capture_download_statements(db_core) as statements:
+        await call(download_db)
+
+    for statement, parameters in statements:
+        plan = await _explain(db_core, statement, parameters)
+        problems = [
+            step
+            for step in _plan_problems(plan)
+            if accepted is None or not step.startswith(accepted)
+        ]
+        assert not problems, f"{statement}\n{plan}"
+
+
+@pytest.mark.unit
+def test_download_db_calls_cover_every_query():
+    """Each public DownloadDatabase coroutine has at least one plan check."""
+    call_names = [name for name, _ in DOWNLOAD_DB_CALLS]
+    methods = [
+        name
+        for name, _ in inspect.getmembers(DownloadDatabase, inspect.iscoroutinefunction)
+        if not name.startswith("_")
+    ]
+
+    # Variants of one method share its name as a prefix
+    missing = [
+        method
+        for method in methods
+        if not any(
+            name == method or name.startswith(f"{method}_") for name in call_names
+        )
+    ]
+    assert not missing, f"DOWNLOAD_DB_CALLS lacks entries for {missing}"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_status_count_reads_feed_counters(db_core: SqlalchemyCore):
+    """Counting a feed's downloads by status never touches the download table."""
+    download_db = DownloadDatabase(db_core)
+
+    with _capture_download_statements(db_core) as statements:
+        count = await download_db.count_downloads_by_status(
+            DownloadStatus.QUEUED, feed_id=TARGET_FEED
+        )
+
+    assert count == DOWNLOADS_PER_FEED // len(STATUSES) + 1
+    assert statements == []
@@ -10,11 +10,19 @@ import time
 from helpers.alembic import run_migrations
 import pytest
 import pytest_asyncio
+from sqlalchemy import update
+from sqlmodel import col
 
 from anypod.config.types import PodcastCategories
 from anypod.db import DownloadDatabase, FeedDatabase
 from anypod.db.sqlalchemy_core import SqlalchemyCore
-from anypod.db.types import Download, DownloadStatus, Feed, SourceType
+from anypod.db.types import (
+    Download,
+    DownloadStatus,
+    Feed,
+    SourceType,
+    StatusCounterMismatch,
+)
 from anypod.exceptions import FeedNotFoundError
 
 # --- Fixtures ---
@@ -428,6 +436,8 @@ async def test_set_feed_enabled(feed_db: FeedDatabase, sample_feed: Feed):
     # Set up feed as enabled with image extension
     sample_feed.is_enabled = True
     sample_feed.image_ext = "jpg"
+    sample_feed.image_etag = '"abc"'
+    sample_feed.image_content_hash = "deadbeef"
     await feed_db.upsert_feed(sample_feed)
 
     # Verify initial state
@@ -442,6 +452,8 @@ async def test_set_feed_enabled(feed_db: FeedDatabase, sample_feed: Feed):
     updated_feed = await feed_db.get_feed_by_id(sample_feed.id)
     assert updated_feed.is_enabled is False
     assert updated_feed.image_ext is None  # Should be cleared when disabled
+    assert updated_feed.image_etag is None
+    assert updated_feed.image_content_hash is None
 
     # Re-enable the feed
     await feed_db.set_feed_enabled(sample_feed.id, True)
@@ -685,3 +697,92 @@ async def test_total_downloads_property_mixed_statuses(
 
     # Should only count the 2 DOWNLOADED status downloads
     assert retrieved_feed.total_downloads == 2
+
+
+# --- Tests for FeedDatabase.check_status_counters ---
+
+
+def _queued_download(feed_id: str, download_id: str) -> Download:
+    return Download(
+        feed_id=feed_id,
+        id=download_id,
+        source_url=f"https://www.youtube.com/watch?v={download_id}",
+        title=download_id,
+        published=datetime(2023, 1, 1, tzinfo=UTC),
+        ext="mp4",
+        mime_type="video/mp4",
+        filesize=0,
+        duration=60,
+        status=DownloadStatus.QUEUED,
+    )
+
+
+async def _corrupt_queued_count(
+    db_core: SqlalchemyCore, feed_id: str, value: int
+) -> None:
+    async with db_core.session() as session:
+        await session.execute(
+            update(Feed).where(col(Feed.id) == feed_id).values(queued_count=value)
+        )
+        await session.commit()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_status_counters_consistent(
+    feed_db: FeedDatabase,
+    download_db: DownloadDatabase,
+    sample_feed: Feed,
+):
+    """Trigger-maintained counters match a recount of the download table."""
+    await feed_db.upsert_feed(sample_feed)
+    await download_db.upsert_download(_queued_download(sample_feed.id, "q1"))
+    await download_db.upsert_download(_queued_download(sample_feed.id, "q2"))
+
+    assert await feed_db.check_status_counters() == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_status_counters_reports_drift(
+    db_core: SqlalchemyCore,
+    feed_db: FeedDatabase,
+    download_db: DownloadDatabase,
+    sample_feed: Feed,
+):
+    """Drifted counters are reported and left untouched without repair."""
+    await feed_db.upsert_feed(sample_feed)
+    await download_db.upsert_download(_queued_download(sample_feed.id, "q1"))
+    await _corrupt_queued_count(db_core, sample_feed.id, 7)
+
+    mismatches = await feed_db.check_status_counters()
+
+    assert mismatches == [
+        StatusCounterMismatch(
+            feed_id=sample_feed.id,
+            status=DownloadStatus.QUEUED,
+            stored=7,
+            actual=1,
+        )
+    ]
+    assert (await feed_db.get_feed_by_id(sample_feed.id)).queued_count == 7
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_check_status_counters_repairs_drift(
+    db_core: SqlalchemyCore,
+    feed_db: FeedDatabase,
+    download_db: DownloadDatabase,
+    sample_feed: Feed,
+):
+    """Repair recomputes drifted counters from the download table."""
+    await feed_db.upsert_feed(sample_feed)
+    await download_db.upsert_download(_queued_download(sample_feed.id, "q1"))
+    await _corrupt_queued_count(db_core, sample_feed.id, 7)
+
+    mismatches = await feed_db.check_status_counters(repair=True)
+
+    assert len(mismatches) == 1
+    assert (await feed_db.get_feed_by_id(sample_feed.id)).queued_count == 1
+    assert await feed_db.check_status_counters() == []
@@ -0,0 +1,215 @@
+# pyright: reportPrivateUsage=false
+
+"""Tests for DatabaseMaintenance vacuum, checkpoint and backup runs."""
+
+from collections.abc import AsyncGenerator
+from contextlib import closing
+from datetime import UTC, datetime
+from pathlib import Path
+import sqlite3
+
+from helpers.alembic import run_migrations
+import pytest
+import pytest_asyncio
+from sqlalchemy import text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from anypod.db import FeedDatabase, RemoteProbeDatabase
+from anypod.db.maintenance import (
+    AUTO_VACUUM_INCREMENTAL,
+    PROBE_RETENTION,
+    DatabaseMaintenance,
+)
+from anypod.db.sqlalchemy_core import SqlalchemyCore
+from anypod.db.types import Feed, RemoteProbe, SourceType
+from anypod.exceptions import FileOperationError
+
+CHURN_ROWS = 100
+
+# --- Fixtures ---
+
+
+@pytest_asyncio.fixture
+async def db_core(tmp_path: Path) -> AsyncGenerator[SqlalchemyCore]:
+    """Provides a migrated SqlalchemyCore."""
+    run_migrations(tmp_path / "anypod.db")
+    core = SqlalchemyCore(db_dir=tmp_path)
+    yield core
+    await core.close()
+
+
+@pytest.fixture
+def backup_path(tmp_path: Path) -> Path:
+    """Provides the snapshot destination."""
+    return tmp_path / "backups" / "anypod.db"
+
+
+async def _churn(core: SqlalchemyCore) -> None:
+    """Insert and delete large rows so the database is left with free pages."""
+
+    async def _fill(session: AsyncSession) -> None:
+        await session.execute(text("CREATE TABLE IF NOT EXISTS churn (blob BLOB)"))
+        for _ in range(CHURN_ROWS):
+            await session.execute(text("INSERT INTO churn VALUES (randomblob(4000))"))
+
+    async def _empty(session: AsyncSession) -> None:
+        await session.execute(text("DELETE FROM churn"))
+
+    await core.write(_fill)
+    await core.write(_empty)
+
+
+async def _pragma(core: SqlalchemyCore, name: str) -> int:
+    async with core.engine.connect() as conn:
+        return (await conn.exec_driver_sql(f"PRAGMA {name}")).scalar_one()
+
+
+def _make_feed(feed_id: str) -> Feed:
+    return Feed(
+        id=feed_id,
+        is_enabled=True,
+        source_type=SourceType.CHANNEL,
+        source_url=f"http://example.com/{feed_id}",
+        last_successful_sync=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+
+# --- Tests for run ---
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_enables_incremental_vacuum_and_reclaims_pages(
+    db_core: SqlalchemyCore,
+):
+    """The first run converts the database to incremental auto-vacuum."""
+    await _churn(db_core)
+    assert await _pragma(db_core, "auto_vacuum") != AUTO_VACUUM_INCREMENTAL
+
+    result = await DatabaseMaintenance(db_core).run()
+
+    assert result.pages_reclaimed >= CHURN_ROWS
+    assert result.backup_path is None
+    assert await _pragma(db_core, "auto_vacuum") == AUTO_VACUUM_INCREMENTAL
+    assert await _pragma(db_core, "freelist_count") == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_incremental_vacuum_respects_page_limit(db_core: SqlalchemyCore):
+    """Later runs release at most vacuum_page_limit pages."""
+    maintenance = DatabaseMaintenance(db_core, vacuum_page_limit=10)
+    await maintenance.run()
+    await _churn(db_core)
+
+    result = await maintenance.run()
+
+    assert result.pages_reclaimed == 10
+    assert await _pragma(db_core, "freelist_count") >= CHURN_ROWS - 10
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_truncates_wal(db_core: SqlalchemyCore, tmp_path: Path):
+    """The WAL is checkpointed and truncated."""
+    await FeedDatabase(db_core).upsert_feed(_make_feed("wal_feed"))
+    wal_path = tmp_path / "anypod.db-wal"
+    assert wal_path.stat().st_size > 0
+
+    result = await DatabaseMaintenance(db_core).run()
+
+    assert result.checkpoint_complete
+    assert wal_path.stat().st_size == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_writes_backup_when_configured(
+    db_core: SqlalchemyCore, backup_path: Path
+):
+    """A configured backup path receives a snapshot on each run."""
+    await FeedDatabase(db_core).upsert_feed(_make_feed("backed_up"))
+
+    result = await DatabaseMaintenance(db_core, backup_path=backup_path).run()
+
+    assert result.backup_path == backup_path
+    assert backup_path.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_prunes_stale_remote_probes(db_core: SqlalchemyCore):
+    """Probes older than the retention window without a download are dropped."""
+    probe_db = RemoteProbeDatabase(db_core)
+    await probe_db.upsert_duration("feed", "recent", "fp", 321)
+    await probe_db.upsert_duration("feed", "stale", "fp", 321)
+
+    async def _age(session: AsyncSession) -> None:
+        await session.execute(
+            update(RemoteProbe)
+            .where(col(RemoteProbe.download_id) == "stale")
+            .values(probed_at=datetime.now(UTC) - 2 * PROBE_RETENTION)
+        )
+
+    await db_core.write(_age)
+
+    result = await DatabaseMaintenance(db_core, remote_probe_db=probe_db).run()
+
+    assert result.probes_deleted == 1
+    assert await probe_db.get_duration("feed", "recent", "fp") == 321
+    assert await probe_db.get_duration("feed", "stale", "fp") is None
+
+
+# --- Tests for backup ---
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_backup_is_self_contained_snapshot(
+    db_core: SqlalchemyCore, backup_path: Path
+):
+    """The snapshot holds committed data and does not depend on a WAL file."""
+    feed_db = FeedDatabase(db_core)
+    await feed_db.upsert_feed(_make_feed("snapshot_feed"))
+
+    await DatabaseMaintenance(db_core).backup(backup_path)
+    await feed_db.upsert_feed(_make_feed("after_snapshot"))
+
+    assert sorted(p.name for p in backup_path.parent.iterdir()) == ["anypod.db"]
+    with closing(sqlite3.connect(backup_path)) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+        rows = conn.execute("SELECT id FROM feed").fetchall()
+    assert rows == [("snapshot_feed",)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_backup_replaces_previous_snapshot(
+    db_core: SqlalchemyCore, backup_path: Path
+):
+    """A new backup overwrites the previous snapshot in place."""
+    feed_db = FeedDatabase(db_core)
+    maintenance = DatabaseMaintenance(db_core)
+    await feed_db.upsert_feed(_make_feed("first"))
+    await maintenance.backup(backup_path)
+    await feed_db.upsert_feed(_make_feed("second"))
+
+    await maintenance.backup(backup_path)
+
+    with closing(sqlite3.connect(backup_path)) as conn:
+        rows = conn.execute("SELECT id FROM feed ORDER BY id").fetchall()
+    assert rows == [("first",), ("second",)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_backup_unwritable_destination_raises_file_error(
+    db_core: SqlalchemyCore, tmp_path: Path
+):
+    """A destination whose parent is a file raises FileOperationError."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+
+    with pytest.raises(FileOperationError):
+        await DatabaseMaintenance(db_core).backup(blocker / "anypod.db")
@@ -0,0 +1,110 @@
+"""Tests for the RemoteProbeDatabase probe-result cache."""
+
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from helpers.alembic import run_migrations
+import pytest
+import pytest_asyncio
+
+from anypod.db import DownloadDatabase, FeedDatabase, RemoteProbeDatabase
+from anypod.db.sqlalchemy_core import SqlalchemyCore
+from anypod.db.types import Download, DownloadStatus, Feed, SourceType
+
+
+@pytest_asyncio.fixture
+async def db_core(tmp_path: Path) -> AsyncGenerator[SqlalchemyCore]:
+    """Provides a migrated SqlalchemyCore instance for testing."""
+    run_migrations(tmp_path / "anypod.db")
+    core = SqlalchemyCore(db_dir=tmp_path)
+    yield core
+    await core.close()
+
+
+@pytest_asyncio.fixture
+async def probe_db(db_core: SqlalchemyCore) -> RemoteProbeDatabase:
+    """Provides a RemoteProbeDatabase instance for testing."""
+    return RemoteProbeDatabase(db_core)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_duration_missing_returns_none(probe_db: RemoteProbeDatabase):
+    """Nothing is returned for a post that was never probed."""
+    assert await probe_db.get_duration("feed", "post", "fp") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_upsert_and_get_duration_round_trip(probe_db: RemoteProbeDatabase):
+    """A stored duration is returned for the same media fingerprint."""
+    await probe_db.upsert_duration("feed", "post", "fp", 321)
+
+    assert await probe_db.get_duration("feed", "post", "fp") == 321
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_changed_fingerprint_misses_and_upsert_replaces(
+    probe_db: RemoteProbeDatabase,
+):
+    """Changed media invalidates the cached duration until it is re-probed."""
+    await probe_db.upsert_duration("feed", "post", "old", 321)
+
+    assert await probe_db.get_duration("feed", "post", "new") is None
+
+    await probe_db.upsert_duration("feed", "post", "new", 654)
+
+    assert await probe_db.get_duration("feed", "post", "new") == 654
+    assert await probe_db.get_duration("feed", "post", "old") is None
+
+
+async def _add_download(
+    db_core: SqlalchemyCore, download_id: str, status: DownloadStatus
+) -> None:
+    await FeedDatabase(db_core).upsert_feed(
+        Feed(
+            id="feed",
+            is_enabled=True,
+            source_type=SourceType.CHANNEL,
+            source_url="http://example.com/feed",
+            last_successful_sync=datetime(2024, 1, 1, tzinfo=UTC),
+        )
+    )
+    await DownloadDatabase(db_core).upsert_download(
+        Download(
+            feed_id="feed",
+            id=download_id,
+            source_url=f"http://example.com/{download_id}",
+            title=download_id,
+            published=datetime(2024, 1, 1, tzinfo=UTC),
+            ext="mp4",
+            mime_type="video/mp4",
+            filesize=1024,
+            duration=60,
+            status=status,
+        )
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_delete_stale_drops_probes_of_gone_or_archived_downloads(
+    db_core: SqlalchemyCore, probe_db: RemoteProbeDatabase
+):
+    """Only probes taken before the cutoff without a live download are deleted."""
+    await _add_download(db_core, "live", DownloadStatus.DOWNLOADED)
+    await _add_download(db_core, "archived", DownloadStatus.ARCHIVED)
+    for post in ("live", "archived", "gone"):
+        await probe_db.upsert_duration("feed", post, "fp", 321)
+
+    # Probes newer than the cutoff may belong to a sync still in progress
+    assert await probe_db.delete_stale(datetime.now(UTC) - timedelta(days=1)) == 0
+
+    deleted = await probe_db.delete_stale(datetime.now(UTC) + timedelta(seconds=1))
+
+    assert deleted == 2
+    assert await probe_db.get_duration("feed", "live", "fp") == 321
+    assert await probe_db.get_duration("feed", "archived", "fp") is None
+    assert await probe_db.get_duration("feed", "gone", "fp") is None
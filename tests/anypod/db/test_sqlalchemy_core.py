@@ -80,6 +80,9 @@ async def test_sqlite_triggers_are_created(
         "downloads_after_delete_total_downloads",
         "downloads_status_to_downloaded_total_downloads",
         "downloads_status_from_downloaded_total_downloads",
+        "downloads_after_insert_status_counts",
+        "downloads_after_delete_status_counts",
+        "downloads_status_change_status_counts",
     ]
 
     for trigger in expected_triggers:
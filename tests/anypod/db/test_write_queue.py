@@ -0,0 +1,206 @@
+# pyright: reportPrivateUsage=false
+
+"""Tests for the single-writer WriteQueue used by SqlalchemyCore."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
+from pathlib import Path
+
+from helpers.alembic import run_migrations
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from anypod.db import FeedDatabase
+from anypod.db.sqlalchemy_core import SqlalchemyCore
+from anypod.db.types import Feed, SourceType
+from anypod.exceptions import FeedNotFoundError
+
+# --- Fixtures ---
+
+
+@pytest_asyncio.fixture
+async def db_core(tmp_path: Path) -> AsyncGenerator[SqlalchemyCore]:
+    """Provides a SqlalchemyCore with a coalescing window wide enough to batch."""
+    db_path = tmp_path / "anypod.db"
+    run_migrations(db_path)
+
+    core = SqlalchemyCore(db_dir=tmp_path, write_coalesce_window=0.05)
+    yield core
+    await core.close()
+
+
+@pytest.fixture
+def commit_counter(db_core: SqlalchemyCore) -> list[int]:
+    """Counts COMMITs issued on the core's engine."""
+    commits: list[int] = []
+
+    def _on_commit(_conn: Connection) -> None:
+        commits.append(1)
+
+    event.listen(db_core.engine.sync_engine, "commit", _on_commit)
+    return commits
+
+
+def _make_feed(feed_id: str) -> Feed:
+    return Feed(
+        id=feed_id,
+        is_enabled=True,
+        source_type=SourceType.CHANNEL,
+        source_url=f"http://example.com/{feed_id}",
+        last_successful_sync=datetime(2024, 1, 1, tzinfo=UTC),
+    )
+
+
+# --- Tests ---
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_write_returns_operation_result(db_core: SqlalchemyCore):
+    """The value returned by the operation is delivered to the caller."""
+    expected = 42
+
+    async def _op(_session: AsyncSession) -> int:
+        return expected
+
+    assert await db_core.write(_op) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_one_commit(
+    db_core: SqlalchemyCore, commit_counter: list[int]
+):
+    """Writes submitted concurrently are committed in a single transaction."""
+    feed_db = FeedDatabase(db_core)
+    feed_ids = [f"feed_{i}" for i in range(5)]
+
+    await asyncio.gather(*(feed_db.upsert_feed(_make_feed(fid)) for fid in feed_ids))
+
+    assert len(commit_counter) == 1, "Concurrent writes should be group-committed"
+    feeds = await feed_db.get_feeds()
+    assert [f.id for f in feeds] == feed_ids
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_failed_write_does_not_affect_batch_peers(db_core: SqlalchemyCore):
+    """A failing operation rolls back only its own changes."""
+    feed_db = FeedDatabase(db_core)
+
+    results = await asyncio.gather(
+        feed_db.upsert_feed(_make_feed("ok_before")),
+        feed_db.mark_rss_generated("missing_feed"),
+        feed_db.upsert_feed(_make_feed("ok_after")),
+        return_exceptions=True,
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], FeedNotFoundError)
+    assert results[2] is None
+    feeds = await feed_db.get_feeds()
+    assert {f.id for f in feeds} == {"ok_before", "ok_after"}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_raising_operation_changes_are_rolled_back(db_core: SqlalchemyCore):
+    """Statements executed before an operation raises are not committed."""
+    feed_db = FeedDatabase(db_core)
+
+    async def _op(session: AsyncSession) -> None:
+        session.add(_make_feed("rolled_back"))
+        await session.flush()
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await db_core.write(_op)
+
+    assert await feed_db.get_feeds() == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_close_flushes_pending_writes(tmp_path: Path):
+    """Closing the core commits writes that are still queued."""
+    run_migrations(tmp_path / "anypod.db")
+    core = SqlalchemyCore(db_dir=tmp_path, write_coalesce_window=0.05)
+    feed_db = FeedDatabase(core)
+
+    pending = asyncio.ensure_future(feed_db.upsert_feed(_make_feed("queued")))
+    await asyncio.sleep(0)
+    await core.close()
+    await pending
+
+    reopened = SqlalchemyCore(db_dir=tmp_path)
+    try:
+        feed = await FeedDatabase(reopened).get_feed_by_id("queued")
+    finally:
+        await reopened.close()
+    assert feed.id == "queued"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_write_restarts_after_close(db_core: SqlalchemyCore):
+    """The writer task is restarted lazily when used after close."""
+    feed_db = FeedDatabase(db_core)
+    await db_core._write_queue.close()
+
+    await feed_db.upsert_feed(_make_feed("after_close"))
+
+    assert (await feed_db.get_feed_by_id("after_close")).id == "after_close"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unexpected_batch_error_fails_callers(db_core: SqlalchemyCore):
+    """A non-database error fails the batch and leaves the writer running."""
+    feed_db = FeedDatabase(db_core)
+    queue = db_core._write_queue
+    session_maker = queue._session_maker
+
+    def _broken_session_maker() -> AsyncSession:
+        raise RuntimeError("boom")
+
+    queue._session_maker = _broken_session_maker  # type: ignore[assignment]
+    with pytest.raises(RuntimeError):
+        await feed_db.upsert_feed(_make_feed("failed"))
+
+    queue._session_maker = session_maker
+    await feed_db.upsert_feed(_make_feed("recovered"))
+    assert (await feed_db.get_feed_by_id("recovered")).id == "recovered"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_writer_cancels_pending_writes(db_core: SqlalchemyCore):
+    """Cancelling the writer task cancels both running and queued writes."""
+    feed_db = FeedDatabase(db_core)
+    started = asyncio.Event()
+
+    async def _blocking_op(session: AsyncSession) -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    running = asyncio.ensure_future(db_core.write(_blocking_op))
+    await started.wait()
+    queued = asyncio.ensure_future(feed_db.upsert_feed(_make_feed("queued")))
+    await asyncio.sleep(0)
+
+    task = db_core._write_queue._task
+    assert task is not None
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await running
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+
+    # The next write starts a fresh writer task
+    await feed_db.upsert_feed(_make_feed("after_cancel"))
+    assert (await feed_db.get_feed_by_id("after_cancel")).id == "after_cancel"
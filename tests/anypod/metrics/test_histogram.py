@@ -0,0 +1,40 @@
+"""Tests for the fixed-bucket Histogram."""
+
+import math
+
+import pytest
+
+from anypod.metrics import Histogram
+
+
+@pytest.mark.unit
+def test_snapshot_empty_histogram():
+    """An empty histogram has zero counts in every bucket."""
+    snapshot = Histogram([1.0, 2.0]).snapshot()
+
+    assert snapshot.buckets == {"1.0": 0, "2.0": 0, "+Inf": 0}
+    assert snapshot.count == 0
+    assert snapshot.sum == 0.0
+
+
+@pytest.mark.unit
+def test_observe_counts_are_cumulative():
+    """Observations land in every bucket whose bound is at or above them."""
+    histogram = Histogram([0.5, 1.0, 5.0])
+
+    for value in (0.1, 0.5, 0.7, 3.0, 10.0):
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+
+    assert snapshot.buckets == {"0.5": 2, "1.0": 3, "5.0": 4, "+Inf": 5}
+    assert snapshot.count == 5
+    assert snapshot.sum == pytest.approx(14.3)
+
+
+@pytest.mark.unit
+def test_bounds_are_sorted_and_exclude_infinity():
+    """Bucket bounds are sorted and an explicit +Inf bound is ignored."""
+    histogram = Histogram([5.0, math.inf, 1.0])
+
+    assert histogram.bounds == [1.0, 5.0]
+    assert list(histogram.snapshot().buckets) == ["1.0", "5.0", "+Inf"]
@@ -0,0 +1,136 @@
+"""Tests for the metrics registry and Prometheus text rendering."""
+
+import pytest
+
+from anypod.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    """Provides an empty registry."""
+    return MetricsRegistry()
+
+
+# --- Tests for Counter ---
+
+
+@pytest.mark.unit
+def test_counter_renders_per_label_set(registry: MetricsRegistry):
+    """Each label set is rendered as its own sample."""
+    counter = registry.counter("runs_total", "Runs.", ["exit_code"])
+
+    counter.inc(exit_code="0")
+    counter.inc(2, exit_code="1")
+
+    assert registry.render() == (
+        "# HELP runs_total Runs.\n"
+        "# TYPE runs_total counter\n"
+        'runs_total{exit_code="0"} 1.0\n'
+        'runs_total{exit_code="1"} 2.0\n'
+    )
+    assert counter.value(exit_code="1") == 2.0
+    assert counter.value(exit_code="2") == 0.0
+
+
+@pytest.mark.unit
+def test_counter_rejects_negative_increment(registry: MetricsRegistry):
+    """Counters cannot decrease."""
+    counter = registry.counter("bytes_total", "Bytes.")
+
+    with pytest.raises(ValueError):
+        counter.inc(-1)
+
+
+@pytest.mark.unit
+def test_counter_rejects_mismatched_labels(registry: MetricsRegistry):
+    """Labels must match the declared label names exactly."""
+    counter = registry.counter("runs_total", "Runs.", ["operation"])
+
+    with pytest.raises(ValueError):
+        counter.inc(op="download")
+
+
+# --- Tests for Gauge ---
+
+
+@pytest.mark.unit
+def test_gauge_keeps_latest_value(registry: MetricsRegistry):
+    """Gauges render the most recently set value, which may decrease."""
+    gauge = registry.gauge("free_bytes", "Free bytes.")
+
+    gauge.set(10)
+    gauge.set(4)
+
+    assert registry.render() == (
+        "# HELP free_bytes Free bytes.\n# TYPE free_bytes gauge\nfree_bytes 4.0\n"
+    )
+    assert gauge.value() == 4.0
+
+
+@pytest.mark.unit
+def test_label_values_are_escaped(registry: MetricsRegistry):
+    """Quotes, backslashes and newlines in label values are escaped."""
+    counter = registry.counter("errors_total", "Errors.", ["operation"])
+
+    counter.inc(operation='say "hi"\\\n')
+
+    assert 'errors_total{operation="say \\"hi\\"\\\\\\n"} 1.0' in registry.render()
+
+
+# --- Tests for LabeledHistogram ---
+
+
+@pytest.mark.unit
+def test_histogram_renders_buckets_sum_and_count(registry: MetricsRegistry):
+    """Histogram samples carry the le label and end with sum and count."""
+    histogram = registry.histogram(
+        "latency_seconds", "Latency.", ["route"], buckets=[0.1, 1.0]
+    )
+
+    histogram.observe(0.05, route="/a")
+    histogram.observe(0.5, route="/a")
+
+    assert registry.render() == (
+        "# HELP latency_seconds Latency.\n"
+        "# TYPE latency_seconds histogram\n"
+        'latency_seconds_bucket{route="/a",le="0.1"} 1\n'
+        'latency_seconds_bucket{route="/a",le="1.0"} 2\n'
+        'latency_seconds_bucket{route="/a",le="+Inf"} 2\n'
+        'latency_seconds_sum{route="/a"} 0.55\n'
+        'latency_seconds_count{route="/a"} 2\n'
+    )
+
+
+@pytest.mark.unit
+def test_histogram_snapshot_per_label_set(registry: MetricsRegistry):
+    """Snapshots are returned per label set, or None if never observed."""
+    histogram = registry.histogram("wait_seconds", "Wait.", ["job"])
+
+    histogram.observe(3.0, job="feed")
+
+    snapshot = histogram.snapshot(job="feed")
+    assert snapshot is not None
+    assert snapshot.count == 1
+    assert histogram.snapshot(job="other") is None
+
+
+# --- Tests for MetricsRegistry ---
+
+
+@pytest.mark.unit
+def test_registry_rejects_duplicate_names(registry: MetricsRegistry):
+    """A metric name can only be registered once."""
+    registry.counter("runs_total", "Runs.")
+
+    with pytest.raises(ValueError):
+        registry.histogram("runs_total", "Runs again.")
+
+
+@pytest.mark.unit
+def test_registry_renders_unobserved_families_as_headers(registry: MetricsRegistry):
+    """Families without samples still render their HELP and TYPE lines."""
+    registry.histogram("idle_seconds", "Idle.")
+
+    assert registry.render() == (
+        "# HELP idle_seconds Idle.\n# TYPE idle_seconds histogram\n"
+    )
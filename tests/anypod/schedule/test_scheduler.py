@@ -7,6 +7,7 @@ for managing scheduled feed processing jobs using APScheduler with async support
 graceful error handling, and proper lifecycle management.
 """
 
+import asyncio
 from asyncio import Semaphore
 from datetime import UTC, datetime
 import time
@@ -16,10 +17,17 @@ from pydantic import ValidationError
 import pytest
 
 from anypod.config import FeedConfig
-from anypod.config.types import FeedMetadataOverrides
+from anypod.config.types import CronExpression, FeedMetadataOverrides
 from anypod.data_coordinator.types import PhaseResult, ProcessingResults
+from anypod.db.types import MaintenanceResult
+from anypod.metrics.instruments import SCHEDULER_QUEUE_WAIT_SECONDS
+from anypod.orphan_gc import OrphanSweepResult
 from anypod.schedule import scheduler
-from anypod.schedule.scheduler import FeedScheduler
+from anypod.schedule.scheduler import (
+    DB_MAINTENANCE_JOB_ID,
+    ORPHAN_GC_JOB_ID,
+    FeedScheduler,
+)
 
 # --- Fixtures ---
 
@@ -193,6 +201,64 @@ def test_get_scheduled_feed_ids_returns_correct_feeds(
     assert set(scheduled_feeds) == set(ready_feed_ids)
 
 
+@pytest.mark.unit
+def test_get_scheduled_feed_ids_excludes_db_maintenance_job(
+    mock_data_coordinator: MagicMock,
+    sample_feed_configs: dict[str, FeedConfig],
+):
+    """Test that the database maintenance job is scheduled but not reported as a feed."""
+    scheduler = FeedScheduler(
+        ready_feed_ids=["test_feed"],
+        feed_configs=sample_feed_configs,
+        data_coordinator=mock_data_coordinator,
+        db_maintenance=MagicMock(),
+        maintenance_schedule=CronExpression("30 4 * * *"),
+    )
+
+    assert set(scheduler._scheduler.get_job_ids()) == {
+        "feed_test_feed",
+        DB_MAINTENANCE_JOB_ID,
+    }
+    assert scheduler.get_scheduled_feed_ids() == ["test_feed"]
+
+
+@pytest.mark.unit
+def test_db_maintenance_not_scheduled_without_schedule(
+    mock_data_coordinator: MagicMock,
+):
+    """Test that no maintenance job is added when the schedule is disabled."""
+    scheduler = FeedScheduler(
+        ready_feed_ids=[],
+        feed_configs={},
+        data_coordinator=mock_data_coordinator,
+        db_maintenance=MagicMock(),
+        maintenance_schedule=None,
+    )
+
+    assert scheduler._scheduler.get_job_ids() == []
+
+
+@pytest.mark.unit
+def test_get_scheduled_feed_ids_excludes_orphan_gc_job(
+    mock_data_coordinator: MagicMock,
+    sample_feed_configs: dict[str, FeedConfig],
+):
+    """Test that the orphan sweep job is scheduled but not reported as a feed."""
+    scheduler = FeedScheduler(
+        ready_feed_ids=["test_feed"],
+        feed_configs=sample_feed_configs,
+        data_coordinator=mock_data_coordinator,
+        orphan_collector=MagicMock(),
+        orphan_gc_schedule=CronExpression("0 5 * * *"),
+    )
+
+    assert set(scheduler._scheduler.get_job_ids()) == {
+        "feed_test_feed",
+        ORPHAN_GC_JOB_ID,
+    }
+    assert scheduler.get_scheduled_feed_ids() == ["test_feed"]
+
+
 # --- Tests for static helper methods ---
 
 
@@ -257,3 +323,79 @@ async def test_process_feed_with_context_sets_context_and_calls_coordinator(
 
     # Verify result is returned
     assert result == mock_data_coordinator.process_feed.return_value
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_process_feed_with_context_records_queue_wait(
+    mock_data_coordinator: MagicMock,
+    sample_feed_config: FeedConfig,
+):
+    """Time spent waiting for the feed semaphore is recorded per job."""
+    feed_semaphore = Semaphore(1)
+    before = SCHEDULER_QUEUE_WAIT_SECONDS.snapshot(job="queued_feed")
+
+    await feed_semaphore.acquire()
+    task = asyncio.create_task(
+        FeedScheduler._process_feed_with_context(
+            mock_data_coordinator, "queued_feed", sample_feed_config, feed_semaphore
+        )
+    )
+    await asyncio.sleep(0.05)
+    feed_semaphore.release()
+    await task
+
+    after = SCHEDULER_QUEUE_WAIT_SECONDS.snapshot(job="queued_feed")
+    assert after is not None
+    assert after.count == (before.count if before else 0) + 1
+    assert after.sum - (before.sum if before else 0.0) >= 0.05
+
+
+# --- Tests for _run_db_maintenance ---
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_db_maintenance_waits_for_feed_semaphore():
+    """Test that maintenance does not start while a feed holds the semaphore."""
+    expected = MaintenanceResult(
+        pages_reclaimed=3, checkpoint_complete=True, backup_path=None
+    )
+    db_maintenance = MagicMock()
+    db_maintenance.run = AsyncMock(return_value=expected)
+    feed_semaphore = Semaphore(1)
+
+    await feed_semaphore.acquire()
+    task = asyncio.create_task(
+        FeedScheduler._run_db_maintenance(db_maintenance, feed_semaphore)
+    )
+    await asyncio.sleep(0)
+    db_maintenance.run.assert_not_called()
+
+    feed_semaphore.release()
+    assert await task == expected
+    db_maintenance.run.assert_awaited_once()
+
+
+# --- Tests for _run_orphan_gc ---
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_orphan_gc_waits_for_feed_semaphore():
+    """Test that the orphan sweep does not start while a feed holds the semaphore."""
+    expected = OrphanSweepResult(entries_scanned=4, files_deleted=1, bytes_reclaimed=9)
+    orphan_collector = MagicMock()
+    orphan_collector.run = AsyncMock(return_value=expected)
+    feed_semaphore = Semaphore(1)
+
+    await feed_semaphore.acquire()
+    task = asyncio.create_task(
+        FeedScheduler._run_orphan_gc(orphan_collector, feed_semaphore)
+    )
+    await asyncio.sleep(0)
+    orphan_collector.run.assert_not_called()
+
+    feed_semaphore.release()
+    assert await task == expected
+    orphan_collector.run.assert_awaited_once()
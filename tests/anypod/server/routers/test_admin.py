@@ -16,9 +16,10 @@ import pytest
 from anypod.config import FeedConfig
 from anypod.config.types import CronExpression, FeedMetadataOverrides
 from anypod.data_coordinator import DataCoordinator
+from anypod.data_coordinator.phase_timings import PhaseTimings
 from anypod.data_coordinator.types import ProcessingResults
 from anypod.db import DownloadDatabase, FeedDatabase
-from anypod.db.types import Download, DownloadStatus
+from anypod.db.types import Download, DownloadStatus, StatusCounterMismatch
 from anypod.exceptions import (
     DatabaseOperationError,
     DownloadNotFoundError,
@@ -26,7 +27,10 @@ from anypod.exceptions import (
     FeedNotFoundError,
 )
 from anypod.file_manager import FileManager
+from anypod.loop_monitor import LoopLagMonitor
 from anypod.server.routers.admin import router
+from anypod.ytdlp_wrapper import YtdlpWrapper
+from anypod.ytdlp_wrapper.core import DownloadProgressTracker
 
 # Shared test constants
 ADMIN_PREFIX = "/admin"
@@ -92,6 +96,7 @@ def app(
     app.state.data_coordinator = mock_data_coordinator
     app.state.manual_feed_runner = mock_manual_feed_runner
     app.state.feed_configs = feed_configs
+    app.state.loop_monitor = None
 
     return app
 
@@ -984,3 +989,136 @@ def test_refresh_metadata_enqueue_error(
 
     assert response.status_code == 500
     assert response.json()["detail"] == "Failed to refresh metadata"
+
+
+# --- Tests for POST /admin/db/status-counters/check ---
+
+
+@pytest.mark.unit
+def test_check_status_counters_consistent(
+    client: TestClient,
+    mock_feed_database: Mock,
+) -> None:
+    """Reports consistency when no counters drifted."""
+    mock_feed_database.check_status_counters.return_value = []
+
+    response = client.post(f"{ADMIN_PREFIX}/db/status-counters/check")
+
+    assert response.status_code == 200
+    assert response.json() == {"consistent": True, "repaired": False, "mismatches": []}
+    mock_feed_database.check_status_counters.assert_awaited_once_with(repair=False)
+
+
+@pytest.mark.unit
+def test_check_status_counters_repair(
+    client: TestClient,
+    mock_feed_database: Mock,
+) -> None:
+    """Returns the mismatches found and flags that they were repaired."""
+    mock_feed_database.check_status_counters.return_value = [
+        StatusCounterMismatch(
+            feed_id=FEED_ID, status=DownloadStatus.ERROR, stored=4, actual=2
+        )
+    ]
+
+    response = client.post(f"{ADMIN_PREFIX}/db/status-counters/check?repair=true")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["consistent"] is False
+    assert body["repaired"] is True
+    assert body["mismatches"] == [
+        {"feed_id": FEED_ID, "status": "ERROR", "stored": 4, "actual": 2}
+    ]
+    mock_feed_database.check_status_counters.assert_awaited_once_with(repair=True)
+
+
+@pytest.mark.unit
+def test_check_status_counters_database_error(
+    client: TestClient,
+    mock_feed_database: Mock,
+) -> None:
+    """500 when the counter check fails in the database."""
+    mock_feed_database.check_status_counters.side_effect = DatabaseOperationError(
+        "Database error"
+    )
+
+    response = client.post(f"{ADMIN_PREFIX}/db/status-counters/check")
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Database error"
+
+
+# --- Tests for GET /admin/diagnostics ---
+
+
+@pytest.mark.unit
+def test_get_diagnostics_reports_loop_and_phases(
+    app: FastAPI,
+    client: TestClient,
+    mock_data_coordinator: Mock,
+) -> None:
+    """Loop lag, slow callbacks and phase histograms are all reported."""
+    monitor = LoopLagMonitor()
+    monitor.record(0.002)
+    monitor.record_slow_callback("process_feed", 0.25)
+    app.state.loop_monitor = monitor
+    timings = PhaseTimings()
+    timings.record("download", wall_seconds=3.0, cpu_seconds=0.5)
+    mock_data_coordinator.phase_timings = timings
+
+    response = client.get(f"{ADMIN_PREFIX}/diagnostics")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["loop_lag"]["samples"] == 1
+    assert body["slow_callbacks"] == {
+        "process_feed": {"count": 1, "total_ms": 250.0, "max_ms": 250.0}
+    }
+    download = body["phases"]["download"]
+    assert download["wall_seconds"]["count"] == 1
+    assert download["wall_seconds"]["sum"] == 3.0
+    assert download["cpu_seconds"]["buckets"]["+Inf"] == 1
+
+
+@pytest.mark.unit
+def test_get_diagnostics_without_loop_monitor(
+    client: TestClient,
+    mock_data_coordinator: Mock,
+) -> None:
+    """Loop fields are empty when no monitor is running."""
+    mock_data_coordinator.phase_timings = PhaseTimings()
+
+    response = client.get(f"{ADMIN_PREFIX}/diagnostics")
+
+    assert response.status_code == 200
+    assert response.json() == {"loop_lag": None, "slow_callbacks": {}, "phases": {}}
+
+
+# --- Tests for GET /admin/downloads/progress ---
+
+
+@pytest.mark.unit
+def test_get_download_progress_lists_active_downloads(
+    app: FastAPI,
+    client: TestClient,
+) -> None:
+    """Running downloads are reported with their parsed progress."""
+    tracker = DownloadProgressTracker()
+    ytdlp_wrapper = Mock(spec=YtdlpWrapper)
+    ytdlp_wrapper.progress_tracker = tracker
+    app.state.ytdlp_wrapper = ytdlp_wrapper
+
+    with tracker.track(FEED_ID, "dl_1") as monitor:
+        monitor.update("[anypod-progress] downloading 256 1024 NA 128.0 6")
+        response = client.get(f"{ADMIN_PREFIX}/downloads/progress")
+
+    assert response.status_code == 200
+    (download,) = response.json()["downloads"]
+    assert download["feed_id"] == FEED_ID
+    assert download["download_id"] == "dl_1"
+    assert download["status"] == "downloading"
+    assert download["downloaded_bytes"] == 256
+    assert download["total_bytes"] == 1024
+    assert download["speed_bps"] == 128.0
+    assert download["eta_seconds"] == 6.0
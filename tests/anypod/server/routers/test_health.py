@@ -2,10 +2,13 @@
 
 """Tests for the health check router."""
 
+from unittest.mock import MagicMock
+
 from fastapi import FastAPI
 from helpers.test_client import ClientProtocol, create_test_client
 import pytest
 
+from anypod.disk_space import DiskSpaceGuard
 from anypod.server.routers.health import router
 
 
@@ -14,6 +17,7 @@ def app() -> FastAPI:
     """Create a minimal FastAPI app with just the health router."""
     app = FastAPI()
     app.include_router(router)
+    app.state.disk_space_guard = None
     return app
 
 
@@ -39,3 +43,21 @@ def test_health_check_success(client: ClientProtocol):
     assert data["service"] == "anypod"
     assert data["version"] == "0.1.0"
     assert "timestamp" in data
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("low_space", "status"), [(False, "healthy"), (True, "degraded")]
+)
+def test_health_check_reports_low_disk_space(
+    app: FastAPI, client: ClientProtocol, low_space: bool, status: str
+):
+    """Health is degraded while the data volume is low on disk space."""
+    guard = MagicMock(spec=DiskSpaceGuard)
+    guard.is_low_on_space.return_value = low_space
+    app.state.disk_space_guard = guard
+
+    response = client.get("/api/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == status
@@ -0,0 +1,34 @@
+"""Tests for the Prometheus metrics router."""
+
+from fastapi import FastAPI
+from helpers.test_client import ClientProtocol, create_test_client
+import pytest
+
+from anypod.metrics.instruments import YTDLP_RUNS
+from anypod.server.routers.metrics import router
+
+
+@pytest.fixture
+def client() -> ClientProtocol:
+    """Create a test client for the metrics router."""
+    app = FastAPI()
+    app.include_router(router)
+    return create_test_client(app)
+
+
+@pytest.mark.unit
+def test_get_metrics_renders_registry(client: ClientProtocol):
+    """The endpoint serves the registry in the Prometheus text format."""
+    YTDLP_RUNS.inc(operation="download", exit_code="0")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == (
+        "text/plain; version=0.0.4; charset=utf-8"
+    )
+    assert "# TYPE anypod_ytdlp_runs_total counter" in response.text
+    assert 'anypod_ytdlp_runs_total{operation="download",exit_code="0"}' in (
+        response.text
+    )
+    assert "# TYPE anypod_db_operation_duration_seconds histogram" in response.text
@@ -5,7 +5,7 @@
 from datetime import UTC, datetime
 from html.parser import HTMLParser
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from fastapi import FastAPI, Response
 from helpers.test_client import (
@@ -20,8 +20,10 @@ from anypod.db.types import Download, DownloadStatus, Feed, SourceType
 from anypod.exceptions import (
     DatabaseOperationError,
     FileOperationError,
+    ImageProcessingError,
 )
 from anypod.file_manager import FileManager
+from anypod.image_derivatives import ImageDerivativeCache
 from anypod.server.routers.static import router
 
 
@@ -90,11 +92,20 @@ def mock_download_database() -> Mock:
     return Mock(spec=DownloadDatabase)
 
 
+@pytest.fixture
+def mock_image_cache() -> Mock:
+    """Create a mock ImageDerivativeCache for testing."""
+    mock = Mock(spec=ImageDerivativeCache)
+    mock.get = AsyncMock()
+    return mock
+
+
 @pytest.fixture
 def app(
     mock_file_manager: Mock,
     mock_feed_database: Mock,
     mock_download_database: Mock,
+    mock_image_cache: Mock,
 ) -> FastAPI:
     """Create a FastAPI app with the static router and mocked dependencies."""
     app = FastAPI()
@@ -104,6 +115,7 @@ def app(
     app.state.file_manager = mock_file_manager
     app.state.feed_database = mock_feed_database
     app.state.download_database = mock_download_database
+    app.state.image_cache = mock_image_cache
 
     return app
 
@@ -654,6 +666,75 @@ def test_serve_download_image_success(
     )
 
 
+@pytest.mark.unit
+@patch("anypod.server.routers.static.FileResponse")
+def test_serve_download_image_resized(
+    mock_file_response: Mock,
+    client: TestClient,
+    mock_file_manager: Mock,
+    mock_image_cache: Mock,
+) -> None:
+    """A width query serves the cached resized copy."""
+    original = Path("/ignored/download123.jpg")
+    resized = Path("/cache/abc-w300.jpg")
+    mock_file_manager.get_image_path.return_value = original
+    mock_image_cache.get.return_value = resized
+    mock_file_response.side_effect = _file_response_side_effect
+
+    response = client.get("/images/test_feed/download123.jpg?w=300")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/jpeg"
+    mock_image_cache.get.assert_awaited_once_with(original, 300)
+    assert mock_file_response.call_args.kwargs["path"] == resized
+
+
+@pytest.mark.unit
+@patch("anypod.server.routers.static.FileResponse")
+def test_serve_feed_image_resize_failure_serves_original(
+    mock_file_response: Mock,
+    client: TestClient,
+    mock_file_manager: Mock,
+    mock_image_cache: Mock,
+) -> None:
+    """If resizing fails the original image is served."""
+    original = Path("/ignored/test_feed.jpg")
+    mock_file_manager.get_image_path.return_value = original
+    mock_image_cache.get.side_effect = ImageProcessingError("boom")
+    mock_file_response.side_effect = _file_response_side_effect
+
+    response = client.get("/images/test_feed.jpg?w=144")
+
+    assert response.status_code == 200
+    assert mock_file_response.call_args.kwargs["path"] == original
+
+
+@pytest.mark.unit
+@patch("anypod.server.routers.static.FileResponse")
+def test_serve_image_width_ignored_for_non_jpg(
+    mock_file_response: Mock,
+    client: TestClient,
+    mock_file_manager: Mock,
+    mock_image_cache: Mock,
+) -> None:
+    """Only JPG images are resized."""
+    mock_file_manager.get_image_path.return_value = Path("/ignored/test_feed.png")
+    mock_file_response.side_effect = _file_response_side_effect
+
+    response = client.get("/images/test_feed.png?w=300")
+
+    assert response.status_code == 200
+    mock_image_cache.get.assert_not_called()
+
+
+@pytest.mark.unit
+def test_serve_image_rejects_invalid_width(client: TestClient) -> None:
+    """A non-positive width is rejected."""
+    response = client.get("/images/test_feed.jpg?w=0")
+
+    assert response.status_code == 422
+
+
 @pytest.mark.unit
 def test_serve_download_image_not_found(client: TestClient, mock_file_manager: Mock):
     """Test download image serving when file doesn't exist."""
@@ -15,6 +15,7 @@ from anypod.db.feed_db import FeedDatabase
 from anypod.file_manager import FileManager
 from anypod.manual_feed_runner import ManualFeedRunner
 from anypod.manual_submission_service import ManualSubmissionService
+from anypod.metrics.instruments import HTTP_REQUEST_SECONDS
 from anypod.server.app import create_app
 from anypod.ytdlp_wrapper import YtdlpWrapper
 
@@ -198,3 +199,46 @@ def test_create_app_middleware_configured(
     assert logging_middleware is not None, (
         "Custom logging middleware should be configured"
     )
+
+
+@pytest.mark.unit
+def test_request_latency_recorded_by_route_template(client: ClientProtocol):
+    """Requests are timed under their route template, not the raw path."""
+    labels = {"method": "GET", "route": "/api/health", "status": "200"}
+    before = HTTP_REQUEST_SECONDS.snapshot(**labels)
+
+    response = client.get("/api/health")
+
+    assert response.status_code == 200
+    after = HTTP_REQUEST_SECONDS.snapshot(**labels)
+    assert after is not None
+    assert after.count == (before.count if before else 0) + 1
+
+
+@pytest.mark.unit
+def test_create_app_single_server_mounts_metrics_under_admin(
+    mock_file_manager: Mock,
+    mock_feed_database: Mock,
+    mock_download_database: Mock,
+    mock_feed_configs: dict[str, FeedConfig],
+    mock_data_coordinator: Mock,
+    mock_ytdlp_wrapper: Mock,
+    mock_manual_feed_runner: Mock,
+    mock_manual_submission_service: Mock,
+):
+    """Single-server mode serves metrics behind the /admin prefix only."""
+    app = create_app(
+        file_manager=mock_file_manager,
+        feed_database=mock_feed_database,
+        download_database=mock_download_database,
+        feed_configs=mock_feed_configs,
+        data_coordinator=mock_data_coordinator,
+        ytdlp_wrapper=mock_ytdlp_wrapper,
+        manual_feed_runner=mock_manual_feed_runner,
+        manual_submission_service=mock_manual_submission_service,
+        include_admin=True,
+    )
+    client = create_test_client(app)
+
+    assert client.get("/admin/metrics").status_code == 200
+    assert client.get("/metrics").status_code == 404
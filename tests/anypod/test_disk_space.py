@@ -0,0 +1,142 @@
+"""Unit tests for DiskSpaceGuard download admission control."""
+
+from datetime import UTC, datetime
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from anypod.db.types import Download, DownloadStatus
+from anypod.disk_space import DiskSpaceGuard
+
+MIN_FREE = 100
+DEFAULT_ESTIMATE = 50
+
+
+def _download(filesize: int) -> Download:
+    return Download(
+        feed_id="feed",
+        id=f"vid{filesize}",
+        source_url="https://example.com/vid",
+        title="vid",
+        published=datetime(2024, 1, 1, tzinfo=UTC),
+        ext="mp4",
+        mime_type="video/mp4",
+        duration=60,
+        status=DownloadStatus.QUEUED,
+        filesize=filesize,
+    )
+
+
+def _statvfs(free_bytes: int) -> MagicMock:
+    return MagicMock(f_bavail=free_bytes, f_frsize=1)
+
+
+@pytest.fixture
+def guard(tmp_path: Path) -> DiskSpaceGuard:
+    """Provide a guard with small thresholds."""
+    return DiskSpaceGuard(
+        tmp_path, min_free_bytes=MIN_FREE, default_estimate=DEFAULT_ESTIMATE
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("filesize", "expected"), [(0, 50), (1, 50), (30, 30)])
+def test_estimate_size_falls_back_for_unknown_sizes(
+    guard: DiskSpaceGuard, filesize: int, expected: int
+):
+    """Missing or placeholder sizes use the default estimate."""
+    assert guard.estimate_size(_download(filesize)) == expected
+
+
+@pytest.mark.unit
+def test_reserve_admits_and_releases(guard: DiskSpaceGuard):
+    """Admitted downloads hold their estimate until they finish."""
+    with patch("os.statvfs", return_value=_statvfs(200)):
+        with guard.reserve(_download(30)) as admitted:
+            assert admitted is True
+            assert guard.reserved_bytes == 30
+        assert guard.reserved_bytes == 0
+    assert guard.low_space is False
+
+
+@pytest.mark.unit
+def test_reserve_accounts_for_in_flight_downloads(guard: DiskSpaceGuard):
+    """Space reserved by running downloads is not offered to new ones."""
+    with (
+        patch("os.statvfs", return_value=_statvfs(200)),
+        guard.reserve(_download(60)) as first,
+        guard.reserve(_download(60)) as second,
+    ):
+        assert first is True
+        assert second is False
+        assert guard.reserved_bytes == 60
+        assert guard.low_space is True
+
+
+@pytest.mark.unit
+def test_reserve_recovers_when_space_frees_up(guard: DiskSpaceGuard):
+    """Low-space mode clears once a download fits again."""
+    with patch("os.statvfs", return_value=_statvfs(120)):
+        with guard.reserve(_download(30)) as admitted:
+            assert admitted is False
+        assert guard.low_space is True
+
+    with (
+        patch("os.statvfs", return_value=_statvfs(1000)),
+        guard.reserve(_download(30)) as admitted,
+    ):
+        assert admitted is True
+    assert guard.low_space is False
+
+
+@pytest.mark.unit
+def test_is_low_on_space_reads_current_free_space(guard: DiskSpaceGuard):
+    """The check reflects the volume now, not the last admission decision."""
+    with patch("os.statvfs", return_value=_statvfs(120)):
+        with guard.reserve(_download(30)) as admitted:
+            assert admitted is False
+        assert guard.is_low_on_space() is False
+
+    with patch("os.statvfs", return_value=_statvfs(1000)):
+        with guard.reserve(_download(30)):
+            pass
+        assert guard.low_space is False
+
+    with patch("os.statvfs", return_value=_statvfs(50)):
+        assert guard.low_space is False
+        assert guard.is_low_on_space() is True
+
+
+@pytest.mark.unit
+def test_is_low_on_space_counts_reserved_bytes(guard: DiskSpaceGuard):
+    """Space held by running downloads is not counted as free."""
+    with patch("os.statvfs", return_value=_statvfs(200)):
+        with guard.reserve(_download(60)) as admitted:
+            assert admitted is True
+            assert guard.is_low_on_space() is False
+            with patch("os.statvfs", return_value=_statvfs(150)):
+                assert guard.is_low_on_space() is True
+        assert guard.is_low_on_space() is False
+
+
+@pytest.mark.unit
+def test_reserve_admits_when_statvfs_fails(guard: DiskSpaceGuard):
+    """An unreadable volume does not block downloads."""
+    with (
+        patch("os.statvfs", side_effect=OSError("gone")),
+        guard.reserve(_download(30)) as admitted,
+    ):
+        assert admitted is True
+
+
+@pytest.mark.unit
+def test_free_bytes_reads_real_volume(guard: DiskSpaceGuard, tmp_path: Path):
+    """Free space is reported from statvfs of the data directory."""
+    stats = os.statvfs(tmp_path)
+
+    free = guard.free_bytes()
+
+    assert free is not None
+    assert abs(free - stats.f_bavail * stats.f_frsize) < 1024 * 1024 * 1024
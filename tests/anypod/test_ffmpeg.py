@@ -42,3 +42,47 @@ async def test_ffmpeg_convert_image_to_jpg_failure(
 
     with pytest.raises(FFmpegError):
         await ffm.convert_image_to_jpg(tmp_path / "in.png", tmp_path / "out.jpg")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_ffmpeg_convert_image_to_jpg_scales_to_max_dimension(
+    mock_cse: AsyncMock, tmp_path: Path
+) -> None:
+    """max_dimension adds a downscaling filter that keeps the aspect ratio."""
+    ffm = FFmpeg()
+    mock_proc = AsyncMock()
+    mock_proc.returncode = 0
+    mock_proc.communicate.return_value = (b"", b"")
+    mock_cse.return_value = mock_proc
+
+    await ffm.convert_image_to_jpg(
+        tmp_path / "in.png", tmp_path / "out.jpg", max_dimension=3000
+    )
+
+    args = mock_cse.call_args[0]
+    scale = args[args.index("-vf") + 1]
+    assert "min(iw,3000)" in scale
+    assert "force_original_aspect_ratio=decrease" in scale
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_ffmpeg_convert_image_to_jpg_scales_to_max_width(
+    mock_cse: AsyncMock, tmp_path: Path
+) -> None:
+    """max_width bounds only the width and derives an even height."""
+    ffm = FFmpeg()
+    mock_proc = AsyncMock()
+    mock_proc.returncode = 0
+    mock_proc.communicate.return_value = (b"", b"")
+    mock_cse.return_value = mock_proc
+
+    await ffm.convert_image_to_jpg(
+        tmp_path / "in.jpg", tmp_path / "out.jpg", max_width=300
+    )
+
+    args = mock_cse.call_args[0]
+    assert args[args.index("-vf") + 1] == "scale='min(iw,300)':-2"
@@ -69,3 +69,76 @@ async def test_ffprobe_duration_from_url_error(mock_cse: AsyncMock) -> None:
 
     with pytest.raises(FFProbeError):
         await probe.get_duration_seconds_from_url("http://x")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_ffprobe_timeout_raises_ffprobe_error(tmp_path: Path) -> None:
+    """A hung ffprobe is stopped and reported as FFProbeError."""
+    runner = AsyncMock()
+    runner.run.side_effect = TimeoutError()
+    probe = FFProbe(runner)
+
+    with pytest.raises(FFProbeError, match="timed out"):
+        await probe.is_jpg_file(tmp_path / "file")
+
+
+_PROBE_JSON = b"""{
+  "streams": [
+    {"index": 0, "codec_type": "video", "codec_name": "h264", "width": 1920,
+     "height": 1080, "bit_rate": "4000000"},
+    {"index": 1, "codec_type": "audio", "codec_name": "aac", "channels": 2,
+     "sample_rate": "48000", "bit_rate": "128000"}
+  ],
+  "chapters": [
+    {"start_time": "0.000000", "end_time": "60.000000", "tags": {"title": "Intro"}}
+  ],
+  "format": {"format_name": "mov,mp4,m4a", "duration": "125.700000",
+             "bit_rate": "4130000"}
+}"""
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_ffprobe_probe_parses_format_streams_and_chapters(
+    mock_cse: AsyncMock, tmp_path: Path
+) -> None:
+    """Probe returns duration, bitrate, stream layout and chapters from one run."""
+    media = tmp_path / "episode.mp4"
+    media.write_bytes(b"data")
+    mock_proc = AsyncMock()
+    mock_proc.returncode = 0
+    mock_proc.communicate.return_value = (_PROBE_JSON, b"")
+    mock_cse.return_value = mock_proc
+
+    result = await FFProbe().probe(media)
+
+    assert result.duration == 125.7
+    assert result.duration_seconds == 125
+    assert result.bit_rate == 4130000
+    assert result.format_name == "mov,mp4,m4a"
+    assert [s.codec_name for s in result.streams] == ["h264", "aac"]
+    assert result.streams[0].height == 1080
+    assert result.streams[1].sample_rate == 48000
+    assert result.has_video
+    assert result.chapters[0].title == "Intro"
+    assert result.chapters[0].end == 60.0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_ffprobe_duration_from_file_without_duration_raises(
+    mock_cse: AsyncMock, tmp_path: Path
+) -> None:
+    """A file whose container reports no duration raises FFProbeError."""
+    media = tmp_path / "broken.mp4"
+    media.write_bytes(b"data")
+    mock_proc = AsyncMock()
+    mock_proc.returncode = 0
+    mock_proc.communicate.return_value = (b'{"format": {}}', b"")
+    mock_cse.return_value = mock_proc
+
+    with pytest.raises(FFProbeError):
+        await FFProbe().get_duration_seconds_from_file(media)
@@ -73,6 +73,69 @@ async def test_delete_download_file_not_found(file_manager: FileManager):
         await file_manager.delete_download_file(feed_id, download_id, ext)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_delete_download_file_reports_shared_link(file_manager: FileManager):
+    """Deleting one link of a shared file reports that no space was freed."""
+    original = save_file(file_manager, "feed_a", "vid.mp4", b"media")
+    await file_manager.link_download_file("feed_a", "feed_b", "vid", "mp4")
+
+    assert await file_manager.delete_download_file("feed_a", "vid", "mp4") is False
+    assert not original.exists()
+    assert await file_manager.delete_download_file("feed_b", "vid", "mp4") is True
+
+
+# --- Tests for link_download_file ---
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_link_download_file_shares_inode(file_manager: FileManager):
+    """Linking exposes the same file under the target feed."""
+    original = save_file(file_manager, "feed_a", "vid.mp4", b"media")
+
+    await file_manager.link_download_file("feed_a", "feed_b", "vid", "mp4")
+
+    linked = file_manager._paths.base_data_dir / "feed_b" / "vid.mp4"
+    assert linked.read_bytes() == b"media"
+    assert linked.stat().st_ino == original.stat().st_ino
+    assert not list(linked.parent.glob(".*.link"))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_link_download_file_replaces_existing(file_manager: FileManager):
+    """An existing target file is atomically replaced by the link."""
+    original = save_file(file_manager, "feed_a", "vid.mp4", b"media")
+    existing = save_file(file_manager, "feed_b", "vid.mp4", b"media")
+
+    await file_manager.link_download_file("feed_a", "feed_b", "vid", "mp4")
+
+    assert existing.stat().st_ino == original.stat().st_ino
+    assert original.stat().st_nlink == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_link_download_file_missing_source(file_manager: FileManager):
+    """A missing source file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        await file_manager.link_download_file("feed_a", "feed_b", "missing", "mp4")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_link_download_file_os_error(file_manager: FileManager):
+    """OS errors while linking are wrapped in FileOperationError."""
+    save_file(file_manager, "feed_a", "vid.mp4", b"media")
+
+    with (
+        patch("aiofiles.os.link", side_effect=OSError("cross-device link")),
+        pytest.raises(FileOperationError),
+    ):
+        await file_manager.link_download_file("feed_a", "feed_b", "vid", "mp4")
+
+
 # --- Tests for download_exists ---
 
 
@@ -0,0 +1,29 @@
+"""Unit tests for the shared outbound HTTP client factory."""
+
+import pytest
+
+from anypod.http_client import create_http_client
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_http_client_configures_timeouts_and_redirects() -> None:
+    """The client follows redirects and caps the connect timeout."""
+    client = create_http_client(timeout=45.0, max_connections=4)
+    try:
+        assert client.follow_redirects is True
+        assert client.timeout.read == 45.0
+        assert client.timeout.connect == 10.0
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_http_client_short_timeout_bounds_connect() -> None:
+    """A timeout below the connect cap also bounds connecting."""
+    client = create_http_client(timeout=2.0)
+    try:
+        assert client.timeout.connect == 2.0
+    finally:
+        await client.aclose()
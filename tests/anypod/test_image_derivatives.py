@@ -0,0 +1,154 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit tests for ImageDerivativeCache generation and LRU eviction."""
+
+import asyncio
+import os
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from anypod.image_derivatives import ImageDerivativeCache
+from anypod.image_pipeline import ImagePipeline
+from anypod.path_manager import PathManager
+
+
+@pytest.fixture
+def paths(tmp_path: Path) -> PathManager:
+    """Provide a PathManager rooted in a temporary directory."""
+    return PathManager(tmp_path, "http://localhost")
+
+
+@pytest.fixture
+def pipeline_mock() -> MagicMock:
+    """Provide an ImagePipeline whose resize writes ``width`` bytes."""
+    mock = MagicMock(spec=ImagePipeline)
+
+    async def _resize(_source: Path, dest: Path, width: int) -> None:
+        dest.write_bytes(b"x" * width)
+
+    mock.resize_jpg = AsyncMock(side_effect=_resize)
+    return mock
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """Provide a stored image to resize."""
+    path = tmp_path / "images" / "feed" / "downloads" / "video.jpg"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"original")
+    return path
+
+
+def _cache(
+    paths: PathManager, pipeline: MagicMock, max_bytes: int = 10_000
+) -> ImageDerivativeCache:
+    return ImageDerivativeCache(
+        paths, pipeline, max_bytes=max_bytes, widths=(144, 300, 600)
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("requested", "expected"), [(1, 144), (144, 144), (200, 300), (601, None)]
+)
+def test_snap_width(
+    paths: PathManager, pipeline_mock: MagicMock, requested: int, expected: int | None
+) -> None:
+    """Widths round up to the next supported width or None past the largest."""
+    assert _cache(paths, pipeline_mock).snap_width(requested) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_generates_once_then_hits(
+    paths: PathManager, pipeline_mock: MagicMock, source: Path
+) -> None:
+    """The first request generates the derivative; later requests reuse it."""
+    cache = _cache(paths, pipeline_mock)
+
+    first = await cache.get(source, 250)
+    second = await cache.get(source, 300)
+
+    assert first == second
+    assert first.parent == paths.base_image_cache_dir
+    assert first.read_bytes() == b"x" * 300
+    pipeline_mock.resize_jpg.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_wider_than_supported_returns_source(
+    paths: PathManager, pipeline_mock: MagicMock, source: Path
+) -> None:
+    """Requests wider than every derivative serve the original."""
+    assert await _cache(paths, pipeline_mock).get(source, 5000) == source
+    pipeline_mock.resize_jpg.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_generation(
+    paths: PathManager, pipeline_mock: MagicMock, source: Path
+) -> None:
+    """Concurrent requests for the same derivative resize only once."""
+    cache = _cache(paths, pipeline_mock)
+
+    results = await asyncio.gather(*(cache.get(source, 300) for _ in range(5)))
+
+    assert len(set(results)) == 1
+    pipeline_mock.resize_jpg.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_replaced_source_gets_new_derivative(
+    paths: PathManager, pipeline_mock: MagicMock, source: Path
+) -> None:
+    """Changing the source image invalidates its derivatives."""
+    cache = _cache(paths, pipeline_mock)
+    before = await cache.get(source, 300)
+
+    source.write_bytes(b"new artwork")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    after = await cache.get(source, 300)
+
+    assert before != after
+    assert pipeline_mock.resize_jpg.await_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used(
+    paths: PathManager, pipeline_mock: MagicMock, source: Path
+) -> None:
+    """Exceeding the budget removes the least recently used derivative."""
+    cache = _cache(paths, pipeline_mock, max_bytes=800)
+    small = await cache.get(source, 144)
+    medium = await cache.get(source, 300)
+    await cache.get(source, 144)  # touch: medium is now least recently used
+
+    large = await cache.get(source, 600)
+
+    assert small.exists()
+    assert large.exists()
+    assert not medium.exists()
+    assert cache._total_bytes == 744
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_existing_derivatives_loaded_from_disk(
+    paths: PathManager, pipeline_mock: MagicMock, source: Path
+) -> None:
+    """Derivatives from a previous run count toward the budget and are reused."""
+    derivative = await _cache(paths, pipeline_mock).get(source, 300)
+    pipeline_mock.resize_jpg.reset_mock()
+
+    cache = _cache(paths, pipeline_mock)
+    assert await cache.get(source, 300) == derivative
+
+    pipeline_mock.resize_jpg.assert_not_called()
+    assert cache._total_bytes == 300
@@ -5,11 +5,13 @@
 Covers direct HTTP image downloads and yt-dlp-backed feed thumbnail downloads.
 """
 
+from collections.abc import AsyncGenerator, AsyncIterator
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
+import pytest_asyncio
 import respx
 
 from anypod.db.types import SourceType
@@ -19,7 +21,12 @@ from anypod.exceptions import (
 )
 from anypod.ffmpeg import FFmpeg
 from anypod.ffprobe import FFProbe
-from anypod.image_downloader import ImageDownloader
+from anypod.image_downloader import (
+    DirectImageResult,
+    ImageDownloader,
+    ImageValidators,
+)
+from anypod.image_pipeline import ImagePipeline
 from anypod.path_manager import PathManager
 from anypod.ytdlp_wrapper import YtdlpWrapper
 
@@ -53,16 +60,36 @@ def ffmpeg_mock() -> MagicMock:
     return MagicMock(spec=FFmpeg)
 
 
+@pytest_asyncio.fixture
+async def http_client() -> AsyncGenerator[httpx.AsyncClient]:
+    """Provide an HTTP client whose requests respx can intercept."""
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
+@pytest.fixture
+def image_pipeline(ffprobe_mock: MagicMock, ffmpeg_mock: MagicMock) -> ImagePipeline:
+    """Provide an ImagePipeline that converts through the mocked ffprobe/ffmpeg."""
+    return ImagePipeline(ffprobe_mock, ffmpeg_mock, in_process=False)
+
+
 @pytest.fixture
 def image_downloader(
     path_manager: PathManager,
     ytdlp_wrapper_mock: MagicMock,
     ffprobe_mock: MagicMock,
     ffmpeg_mock: MagicMock,
+    image_pipeline: ImagePipeline,
+    http_client: httpx.AsyncClient,
 ) -> ImageDownloader:
     """Provide an ImageDownloader instance using temp paths and mocked yt-dlp wrapper."""
     return ImageDownloader(
-        path_manager, ytdlp_wrapper_mock, ffprobe=ffprobe_mock, ffmpeg=ffmpeg_mock
+        path_manager,
+        ytdlp_wrapper_mock,
+        ffprobe=ffprobe_mock,
+        ffmpeg=ffmpeg_mock,
+        http_client=http_client,
+        image_pipeline=image_pipeline,
     )
 
 
@@ -100,6 +127,217 @@ async def test_download_feed_image_direct_http_error(
     assert exc.value.url == url
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_feed_image_direct_streams_jpg_to_final_path(
+    respx_mock: respx.Router,
+    image_downloader: ImageDownloader,
+    ffprobe_mock: MagicMock,
+    path_manager: PathManager,
+) -> None:
+    """A JPG body is streamed to disk and moved into place."""
+    url = "https://img.example/art.jpg"
+    respx_mock.get(url).mock(return_value=httpx.Response(200, content=b"jpeg-bytes"))
+    ffprobe_mock.is_jpg_file = AsyncMock(return_value=True)
+
+    result = await image_downloader.download_feed_image_direct("feed", url)
+
+    assert result.ext == "jpg"
+    assert result.changed is True
+    final_path = await path_manager.image_path("feed", None, "jpg")
+    assert final_path.read_bytes() == b"jpeg-bytes"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_feed_image_direct_rejects_declared_oversize(
+    respx_mock: respx.Router,
+    path_manager: PathManager,
+    ytdlp_wrapper_mock: MagicMock,
+    ffprobe_mock: MagicMock,
+    ffmpeg_mock: MagicMock,
+    http_client: httpx.AsyncClient,
+) -> None:
+    """A Content-Length above the cap fails before the body is read."""
+    url = "https://img.example/huge.jpg"
+    respx_mock.get(url).mock(
+        return_value=httpx.Response(
+            200, content=b"x" * 10, headers={"Content-Length": "10"}
+        )
+    )
+    downloader = ImageDownloader(
+        path_manager,
+        ytdlp_wrapper_mock,
+        ffprobe_mock,
+        ffmpeg_mock,
+        http_client,
+        max_image_bytes=5,
+    )
+
+    with pytest.raises(ImageDownloadError, match="maximum allowed size"):
+        await downloader.download_feed_image_direct("feed", url)
+    ffprobe_mock.is_jpg_file.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_feed_image_direct_rejects_streamed_oversize(
+    respx_mock: respx.Router,
+    path_manager: PathManager,
+    ytdlp_wrapper_mock: MagicMock,
+    ffprobe_mock: MagicMock,
+    ffmpeg_mock: MagicMock,
+    http_client: httpx.AsyncClient,
+) -> None:
+    """A body without Content-Length is cut off at the cap and cleaned up."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for _ in range(4):
+            yield b"abc"
+
+    url = "https://img.example/chunked.jpg"
+    respx_mock.get(url).mock(return_value=httpx.Response(200, content=chunks()))
+    downloader = ImageDownloader(
+        path_manager,
+        ytdlp_wrapper_mock,
+        ffprobe_mock,
+        ffmpeg_mock,
+        http_client,
+        max_image_bytes=5,
+    )
+
+    with pytest.raises(ImageDownloadError, match="maximum allowed size"):
+        await downloader.download_feed_image_direct("feed", url)
+    tmp_dir = await path_manager.feed_tmp_dir("feed")
+    assert list(tmp_dir.iterdir()) == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_feed_image_direct_uses_shared_client(
+    respx_mock: respx.Router,
+    path_manager: PathManager,
+    ytdlp_wrapper_mock: MagicMock,
+    ffprobe_mock: MagicMock,
+    ffmpeg_mock: MagicMock,
+    image_pipeline: ImagePipeline,
+) -> None:
+    """Downloads reuse the injected client and leave it open."""
+    url = "https://img.example/art.jpg"
+    respx_mock.get(url).mock(return_value=httpx.Response(200, content=b"jpeg"))
+    ffprobe_mock.is_jpg_file = AsyncMock(return_value=True)
+
+    async with httpx.AsyncClient() as client:
+        downloader = ImageDownloader(
+            path_manager,
+            ytdlp_wrapper_mock,
+            ffprobe_mock,
+            ffmpeg_mock,
+            http_client=client,
+            image_pipeline=image_pipeline,
+        )
+        await downloader.download_feed_image_direct("feed", url)
+        await downloader.download_feed_image_direct("feed", url)
+
+        assert downloader._http_client is client
+        assert not client.is_closed
+    assert respx_mock.calls.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_feed_image_direct_not_modified_skips_processing(
+    respx_mock: respx.Router,
+    image_downloader: ImageDownloader,
+    ffprobe_mock: MagicMock,
+    path_manager: PathManager,
+) -> None:
+    """A 304 keeps the stored image and its validators without ffprobe."""
+    url = "https://img.example/art.jpg"
+    final_path = await path_manager.image_path("feed", None, "jpg")
+    final_path.write_bytes(b"stored")
+    cached = ImageValidators(
+        etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT", content_hash="h"
+    )
+    route = respx_mock.get(url).mock(return_value=httpx.Response(304))
+
+    result = await image_downloader.download_feed_image_direct(
+        "feed", url, cached=cached
+    )
+
+    assert result.changed is False
+    assert result.validators == cached
+    request = route.calls.last.request
+    assert request.headers["If-None-Match"] == '"v1"'
+    assert request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert final_path.read_bytes() == b"stored"
+    ffprobe_mock.is_jpg_file.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_feed_image_direct_same_content_skips_processing(
+    respx_mock: respx.Router,
+    image_downloader: ImageDownloader,
+    ffprobe_mock: MagicMock,
+    path_manager: PathManager,
+) -> None:
+    """Identical bytes from a new URL are not converted again."""
+    body = b"same-artwork"
+    first = await _download_with_body(
+        respx_mock, image_downloader, ffprobe_mock, "https://a.example/1.jpg", body
+    )
+    ffprobe_mock.is_jpg_file.reset_mock()
+    respx_mock.get("https://b.example/2.jpg").mock(
+        return_value=httpx.Response(200, content=body, headers={"ETag": '"b"'})
+    )
+
+    result = await image_downloader.download_feed_image_direct(
+        "feed",
+        "https://b.example/2.jpg",
+        cached=ImageValidators(content_hash=first.validators.content_hash),
+    )
+
+    assert result.changed is False
+    assert result.validators.etag == '"b"'
+    assert result.validators.content_hash == first.validators.content_hash
+    ffprobe_mock.is_jpg_file.assert_not_called()
+    final_path = await path_manager.image_path("feed", None, "jpg")
+    assert final_path.read_bytes() == body
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_feed_image_direct_ignores_validators_without_file(
+    respx_mock: respx.Router,
+    image_downloader: ImageDownloader,
+    ffprobe_mock: MagicMock,
+) -> None:
+    """Validators are not sent when the stored image no longer exists."""
+    url = "https://img.example/art.jpg"
+    route = respx_mock.get(url).mock(return_value=httpx.Response(200, content=b"jpeg"))
+    ffprobe_mock.is_jpg_file = AsyncMock(return_value=True)
+
+    result = await image_downloader.download_feed_image_direct(
+        "feed", url, cached=ImageValidators(etag='"v1"', content_hash="h")
+    )
+
+    assert result.changed is True
+    assert "If-None-Match" not in route.calls.last.request.headers
+
+
+async def _download_with_body(
+    respx_mock: respx.Router,
+    image_downloader: ImageDownloader,
+    ffprobe_mock: MagicMock,
+    url: str,
+    body: bytes,
+) -> DirectImageResult:
+    respx_mock.get(url).mock(return_value=httpx.Response(200, content=body))
+    ffprobe_mock.is_jpg_file = AsyncMock(return_value=True)
+    return await image_downloader.download_feed_image_direct("feed", url)
+
+
 # --- Tests: download_feed_image_ytdlp ---
 
 
@@ -0,0 +1,218 @@
+"""Unit tests for ImagePipeline format sniffing, conversion and resizing."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from anypod.exceptions import FFmpegError, ImageProcessingError
+from anypod.ffmpeg import FFmpeg
+from anypod.ffprobe import FFProbe
+from anypod.image_pipeline import ImageFormat, ImagePipeline, sniff_image_format
+
+JPEG_HEADER = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01"
+PNG_HEADER = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+
+
+@pytest.fixture
+def ffprobe_mock() -> MagicMock:
+    """Provide a MagicMock for FFProbe with async methods."""
+    mock = MagicMock(spec=FFProbe)
+    mock.is_jpg_file = AsyncMock(return_value=False)
+    return mock
+
+
+@pytest.fixture
+def ffmpeg_mock() -> MagicMock:
+    """Provide a MagicMock for FFmpeg with async methods."""
+    mock = MagicMock(spec=FFmpeg)
+    mock.convert_image_to_jpg = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def pipeline(ffprobe_mock: MagicMock, ffmpeg_mock: MagicMock) -> ImagePipeline:
+    """Provide an ImagePipeline that falls back to ffprobe/ffmpeg."""
+    return ImagePipeline(
+        ffprobe_mock, ffmpeg_mock, max_dimension=3000, in_process=False
+    )
+
+
+# --- Tests: sniff_image_format ---
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (JPEG_HEADER, ImageFormat.JPEG),
+        (PNG_HEADER, ImageFormat.PNG),
+        (b"GIF89a\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00", ImageFormat.GIF),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", ImageFormat.WEBP),
+        (b"\x00\x00\x00\x1cftypavif\x00\x00\x00\x00", ImageFormat.AVIF),
+        (
+            b"BM\x36\x00\x00\x00\x00\x00\x00\x00\x36\x00\x00\x00\x28\x00",
+            ImageFormat.BMP,
+        ),
+        (b"<html><body>nope", None),
+        (b"", None),
+    ],
+)
+def test_sniff_image_format(header: bytes, expected: ImageFormat | None) -> None:
+    """Magic bytes map to the expected format."""
+    assert sniff_image_format(header) == expected
+
+
+# --- Tests: ImagePipeline (ffmpeg fallback) ---
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_is_jpg_uses_magic_bytes_without_ffprobe(
+    pipeline: ImagePipeline, ffprobe_mock: MagicMock, tmp_path: Path
+) -> None:
+    """Recognised formats are detected without spawning ffprobe."""
+    path = tmp_path / "art"
+    path.write_bytes(JPEG_HEADER)
+
+    assert await pipeline.is_jpg(path) is True
+    ffprobe_mock.is_jpg_file.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_is_jpg_falls_back_to_ffprobe_for_unknown_bytes(
+    pipeline: ImagePipeline, ffprobe_mock: MagicMock, tmp_path: Path
+) -> None:
+    """Unrecognised bytes are checked with ffprobe."""
+    path = tmp_path / "art"
+    path.write_bytes(b"unknown-format-bytes")
+    ffprobe_mock.is_jpg_file.return_value = True
+
+    assert await pipeline.is_jpg(path) is True
+    ffprobe_mock.is_jpg_file.assert_awaited_once_with(path)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_to_jpg_moves_jpg_without_ffmpeg(
+    pipeline: ImagePipeline, ffmpeg_mock: MagicMock, tmp_path: Path
+) -> None:
+    """A JPG source is moved into place rather than re-encoded."""
+    source = tmp_path / "tmp_art"
+    dest = tmp_path / "feed.jpg"
+    source.write_bytes(JPEG_HEADER)
+
+    await pipeline.to_jpg(source, dest)
+
+    assert dest.read_bytes() == JPEG_HEADER
+    assert not source.exists()
+    ffmpeg_mock.convert_image_to_jpg.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_to_jpg_converts_other_formats_with_ffmpeg(
+    pipeline: ImagePipeline, ffmpeg_mock: MagicMock, tmp_path: Path
+) -> None:
+    """Non-JPG images are converted and bounded by ffmpeg."""
+    source = tmp_path / "tmp_art"
+    dest = tmp_path / "feed.jpg"
+    source.write_bytes(PNG_HEADER)
+
+    await pipeline.to_jpg(source, dest)
+
+    ffmpeg_mock.convert_image_to_jpg.assert_awaited_once_with(
+        source, dest, max_dimension=3000
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_to_jpg_wraps_ffmpeg_errors(
+    pipeline: ImagePipeline, ffmpeg_mock: MagicMock, tmp_path: Path
+) -> None:
+    """Ffmpeg failures surface as ImageProcessingError."""
+    source = tmp_path / "tmp_art"
+    source.write_bytes(PNG_HEADER)
+    ffmpeg_mock.convert_image_to_jpg.side_effect = FFmpegError("boom")
+
+    with pytest.raises(ImageProcessingError):
+        await pipeline.to_jpg(source, tmp_path / "feed.jpg")
+
+
+# --- Tests: ImagePipeline (Pillow) ---
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_to_jpg_in_process_resizes_and_flattens(
+    ffprobe_mock: MagicMock, ffmpeg_mock: MagicMock, tmp_path: Path
+) -> None:
+    """Pillow converts a transparent PNG to a downscaled JPG on white."""
+    image_module = pytest.importorskip("PIL.Image")
+    source = tmp_path / "art.png"
+    dest = tmp_path / "art.jpg"
+    image_module.new("RGBA", (400, 200), (255, 0, 0, 0)).save(source, "PNG")
+    pipeline = ImagePipeline(
+        ffprobe_mock, ffmpeg_mock, max_dimension=100, in_process=True
+    )
+
+    await pipeline.to_jpg(source, dest)
+
+    with image_module.open(dest) as result:
+        assert result.format == "JPEG"
+        assert result.size == (100, 50)
+        assert all(channel >= 250 for channel in result.getpixel((50, 25)))
+    ffmpeg_mock.convert_image_to_jpg.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_to_jpg_in_process_rejects_non_images(
+    ffprobe_mock: MagicMock, ffmpeg_mock: MagicMock, tmp_path: Path
+) -> None:
+    """Undecodable input raises ImageProcessingError."""
+    pytest.importorskip("PIL")
+    source = tmp_path / "art"
+    source.write_bytes(b"not an image")
+    pipeline = ImagePipeline(ffprobe_mock, ffmpeg_mock, in_process=True)
+
+    with pytest.raises(ImageProcessingError):
+        await pipeline.to_jpg(source, tmp_path / "art.jpg")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_resize_jpg_uses_ffmpeg_width_filter(
+    pipeline: ImagePipeline, ffmpeg_mock: MagicMock, tmp_path: Path
+) -> None:
+    """Without Pillow, derivatives are resized by ffmpeg."""
+    source = tmp_path / "art.jpg"
+    dest = tmp_path / "art-w300.jpg"
+
+    await pipeline.resize_jpg(source, dest, 300)
+
+    ffmpeg_mock.convert_image_to_jpg.assert_awaited_once_with(
+        source, dest, max_width=300
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_resize_jpg_in_process_keeps_aspect_ratio(
+    ffprobe_mock: MagicMock, ffmpeg_mock: MagicMock, tmp_path: Path
+) -> None:
+    """Pillow scales to the requested width and never upscales."""
+    image_module = pytest.importorskip("PIL.Image")
+    source = tmp_path / "art.jpg"
+    image_module.new("RGB", (1280, 720)).save(source, "JPEG")
+    pipeline = ImagePipeline(ffprobe_mock, ffmpeg_mock, in_process=True)
+
+    await pipeline.resize_jpg(source, tmp_path / "small.jpg", 320)
+    await pipeline.resize_jpg(source, tmp_path / "big.jpg", 2000)
+
+    with image_module.open(tmp_path / "small.jpg") as small:
+        assert small.size == (320, 180)
+    with image_module.open(tmp_path / "big.jpg") as big:
+        assert big.size == (1280, 720)
@@ -0,0 +1,162 @@
+# pyright: reportPrivateUsage=false
+
+"""Tests for the LoopLagMonitor event-loop lag sampler."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from anypod.loop_monitor import LoopLagMonitor, LoopLagStats, SlowCallbackStats
+
+
+@pytest.mark.unit
+def test_stats_empty_window_is_zero():
+    """Stats are all zero before any sample is recorded."""
+    assert LoopLagMonitor().stats() == LoopLagStats(
+        samples=0, p50_ms=0.0, p99_ms=0.0, max_ms=0.0
+    )
+
+
+@pytest.mark.unit
+def test_stats_percentiles_over_window():
+    """Percentiles are computed over the most recent window of samples."""
+    monitor = LoopLagMonitor(window=100, warn_threshold=10.0)
+    monitor.record(5.0)  # evicted by the 100 samples below
+    for i in range(1, 101):
+        monitor.record(i / 1000)
+
+    stats = monitor.stats()
+
+    assert stats.samples == 100
+    assert stats.p50_ms == pytest.approx(50.0)
+    assert stats.p99_ms == pytest.approx(99.0)
+    assert stats.max_ms == pytest.approx(100.0)
+
+
+@pytest.mark.unit
+def test_record_warns_above_threshold():
+    """Only samples above the threshold are logged as warnings."""
+    monitor = LoopLagMonitor(warn_threshold=0.1)
+
+    # The anypod logger does not propagate, so caplog cannot see its records
+    with patch("anypod.loop_monitor.logger") as mock_logger:
+        monitor.record(0.05)
+        monitor.record(0.2)
+
+    mock_logger.warning.assert_called_once()
+    assert mock_logger.warning.call_args.args == ("Event loop lag exceeded threshold.",)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_monitor_detects_blocking_call():
+    """Blocking the loop shows up as lag once the sampler wakes."""
+    monitor = LoopLagMonitor(interval=0.01, warn_threshold=10.0)
+    monitor.start()
+    await asyncio.sleep(0.03)
+
+    time.sleep(0.1)  # block the loop
+    await asyncio.sleep(0.03)
+    await monitor.stop()
+
+    assert not monitor.running
+    assert monitor.stats().max_ms >= 50
+
+
+@pytest.mark.unit
+def test_slow_callbacks_ranked_by_total_time():
+    """Slow callbacks are aggregated per name and ranked worst first."""
+    monitor = LoopLagMonitor()
+
+    monitor.record_slow_callback("fast_twice", 0.15)
+    monitor.record_slow_callback("slow_once", 0.5)
+    monitor.record_slow_callback("fast_twice", 0.15)
+
+    assert list(monitor.slow_callbacks().items()) == [
+        ("slow_once", SlowCallbackStats(count=1, total_ms=500.0, max_ms=500.0)),
+        ("fast_twice", SlowCallbackStats(count=2, total_ms=300.0, max_ms=150.0)),
+    ]
+
+
+async def _blocking_coroutine() -> None:
+    time.sleep(0.1)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_slow_callback_reported_with_coroutine_name():
+    """A task step that blocks the loop is attributed to its coroutine."""
+    monitor = LoopLagMonitor(
+        warn_threshold=10.0, slow_callback_threshold=0.05, trace_slow_callbacks=True
+    )
+    monitor.start()
+    try:
+        await asyncio.create_task(_blocking_coroutine())
+    finally:
+        await monitor.stop()
+
+    slow = monitor.slow_callbacks()
+    assert "_blocking_coroutine" in slow
+    assert slow["_blocking_coroutine"].max_ms >= 50
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stop_restores_handle_run():
+    """Stopping the monitor removes the callback timing wrapper."""
+    original = asyncio.Handle._run  # type: ignore[attr-defined]
+    monitor = LoopLagMonitor(trace_slow_callbacks=True)
+
+    monitor.start()
+    assert asyncio.Handle._run is not original  # type: ignore[attr-defined]
+    await monitor.stop()
+
+    assert asyncio.Handle._run is original  # type: ignore[attr-defined]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_callback_tracing_off_by_default():
+    """Without opting in, starting the monitor leaves asyncio untouched."""
+    original = asyncio.Handle._run  # type: ignore[attr-defined]
+    monitor = LoopLagMonitor()
+
+    monitor.start()
+    try:
+        assert asyncio.Handle._run is original  # type: ignore[attr-defined]
+    finally:
+        await monitor.stop()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_callback_tracing_skipped_without_handle_run():
+    """A Python without Handle._run only samples lag and logs why."""
+    original = asyncio.Handle._run  # type: ignore[attr-defined]
+    monitor = LoopLagMonitor(trace_slow_callbacks=True)
+
+    with patch("anypod.loop_monitor.logger") as mock_logger:
+        del asyncio.Handle._run  # type: ignore[attr-defined]
+        try:
+            monitor.start()
+        finally:
+            asyncio.Handle._run = original  # type: ignore[method-assign]
+        assert monitor.running
+        await monitor.stop()
+
+    assert monitor._original_handle_run is None
+    assert asyncio.Handle._run is original  # type: ignore[attr-defined]
+    mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stop_without_start_is_noop():
+    """Stopping a monitor that never started does nothing."""
+    monitor = LoopLagMonitor()
+
+    await monitor.stop()
+
+    assert not monitor.running
@@ -0,0 +1,188 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit tests for MediaDeduplicator media reuse and the deduplication pass."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from anypod.db import DownloadDatabase
+from anypod.db.types import Download, DownloadStatus, TranscriptSource
+from anypod.exceptions import DatabaseOperationError
+from anypod.file_manager import FileManager
+from anypod.media_dedup import MediaDeduplicator, media_content_key
+from anypod.path_manager import PathManager
+
+
+@pytest.fixture
+def file_manager(tmp_path: Path) -> FileManager:
+    """Provide a FileManager rooted in a temporary directory."""
+    return FileManager(PathManager(tmp_path, "http://localhost"))
+
+
+@pytest.fixture
+def download_db_mock() -> MagicMock:
+    """Provide a DownloadDatabase with async query mocks."""
+    mock = MagicMock(spec=DownloadDatabase)
+    mock.get_downloaded_by_content_key = AsyncMock(return_value=[])
+    mock.get_duplicate_downloads = AsyncMock(return_value=[])
+    return mock
+
+
+def _download(feed_id: str, download_id: str = "vid", **kwargs: object) -> Download:
+    fields: dict[str, object] = {
+        "feed_id": feed_id,
+        "id": download_id,
+        "source_url": f"https://example.com/{download_id}",
+        "title": download_id,
+        "published": datetime(2024, 1, 1, tzinfo=UTC),
+        "ext": "mp4",
+        "mime_type": "video/mp4",
+        "duration": 60,
+        "status": DownloadStatus.DOWNLOADED,
+        "filesize": 5,
+    }
+    fields.update(kwargs)
+    return Download(**fields)  # type: ignore[arg-type]
+
+
+def _store(file_manager: FileManager, feed_id: str, name: str, data: bytes) -> Path:
+    path = file_manager._paths.base_data_dir / feed_id / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+@pytest.mark.unit
+def test_media_content_key_depends_on_video_and_args() -> None:
+    """Keys match for the same video and arguments regardless of feed."""
+    a = _download("feed_a")
+    b = _download("feed_b")
+
+    assert media_content_key(a, ["-f", "best"]) == media_content_key(b, ["-f", "best"])
+    assert media_content_key(a, ["-f", "best"]) != media_content_key(a, ["-f", "worst"])
+    assert media_content_key(a, []) != media_content_key(
+        _download("feed_a", "other"), []
+    )
+
+
+@pytest.mark.unit
+def test_media_content_key_normalizes_source_url() -> None:
+    """Case of scheme/host, query order and fragments do not change the key."""
+    a = _download("feed_a", source_url="https://Example.com/watch?v=vid&t=1#top")
+    b = _download("feed_b", source_url="https://example.com/watch?t=1&v=vid")
+
+    assert media_content_key(a, []) == media_content_key(b, [])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reuse_existing_links_media_and_artifacts(
+    file_manager: FileManager, download_db_mock: MagicMock
+) -> None:
+    """Media, thumbnail and matching transcript are linked from the source feed."""
+    source = _download(
+        "feed_a",
+        thumbnail_ext="jpg",
+        transcript_ext="vtt",
+        transcript_lang="en",
+        transcript_source=TranscriptSource.CREATOR,
+    )
+    media = _store(file_manager, "feed_a", "vid.mp4", b"media")
+    paths = file_manager._paths
+    thumb = await paths.image_path("feed_a", "vid", "jpg")
+    thumb.write_bytes(b"thumb")
+    transcript = await paths.transcript_path("feed_a", "vid", "en", "vtt")
+    transcript.write_bytes(b"WEBVTT")
+    download_db_mock.get_downloaded_by_content_key.return_value = [source]
+    dedup = MediaDeduplicator(download_db_mock, file_manager)
+    target = _download("feed_b", status=DownloadStatus.QUEUED, filesize=0)
+
+    completion = await dedup.reuse_existing(target, "key", "en")
+
+    assert completion is not None
+    assert completion.filesize == source.filesize
+    assert completion.thumbnail_ext == "jpg"
+    assert completion.transcript_ext == "vtt"
+    assert completion.content_key == "key"
+    linked = await paths.media_file_path("feed_b", "vid", "mp4")
+    assert linked.stat().st_ino == media.stat().st_ino
+    assert (await paths.image_path("feed_b", "vid", "jpg")).exists()
+    assert (await paths.transcript_path("feed_b", "vid", "en", "vtt")).exists()
+    download_db_mock.get_downloaded_by_content_key.assert_awaited_once_with(
+        "key", exclude_feed_id="feed_b"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reuse_existing_skips_missing_source_files(
+    file_manager: FileManager, download_db_mock: MagicMock
+) -> None:
+    """Candidates whose file is gone are skipped, falling back to download."""
+    download_db_mock.get_downloaded_by_content_key.return_value = [_download("feed_a")]
+    dedup = MediaDeduplicator(download_db_mock, file_manager)
+
+    completion = await dedup.reuse_existing(_download("feed_b"), "key", None)
+
+    assert completion is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_reuse_existing_tolerates_database_errors(
+    file_manager: FileManager, download_db_mock: MagicMock
+) -> None:
+    """A failed lookup means the media is downloaded normally."""
+    download_db_mock.get_downloaded_by_content_key.side_effect = DatabaseOperationError(
+        "boom"
+    )
+    dedup = MediaDeduplicator(download_db_mock, file_manager)
+
+    assert await dedup.reuse_existing(_download("feed_b"), "key", None) is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_deduplicate_existing_links_identical_files(
+    file_manager: FileManager, download_db_mock: MagicMock
+) -> None:
+    """Identical copies become hardlinks; differing contents are left alone."""
+    first = _store(file_manager, "feed_a", "vid.mp4", b"media")
+    second = _store(file_manager, "feed_b", "vid.mp4", b"media")
+    different = _store(file_manager, "feed_c", "vid.mp4", b"other")
+    download_db_mock.get_duplicate_downloads.return_value = [
+        _download("feed_a"),
+        _download("feed_b"),
+        _download("feed_c"),
+    ]
+    dedup = MediaDeduplicator(download_db_mock, file_manager)
+
+    result = await dedup.deduplicate_existing()
+
+    assert result.files_linked == 1
+    assert result.bytes_saved == 5
+    assert second.stat().st_ino == first.stat().st_ino
+    assert different.stat().st_ino != first.stat().st_ino
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_deduplicate_existing_skips_already_linked(
+    file_manager: FileManager, download_db_mock: MagicMock
+) -> None:
+    """Copies that already share an inode are not counted again."""
+    _store(file_manager, "feed_a", "vid.mp4", b"media")
+    await file_manager.link_download_file("feed_a", "feed_b", "vid", "mp4")
+    download_db_mock.get_duplicate_downloads.return_value = [
+        _download("feed_a"),
+        _download("feed_b"),
+    ]
+    dedup = MediaDeduplicator(download_db_mock, file_manager)
+
+    result = await dedup.deduplicate_existing()
+
+    assert result.files_linked == 0
+    assert result.bytes_saved == 0
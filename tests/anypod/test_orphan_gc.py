@@ -0,0 +1,219 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit tests for the OrphanFileCollector sweep."""
+
+from collections.abc import Iterator
+from datetime import timedelta
+import os
+from pathlib import Path
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from anypod.db import DownloadDatabase
+from anypod.db.types import DownloadStatus, PruneCandidate
+from anypod.exceptions import DatabaseOperationError
+from anypod.orphan_gc import OrphanFileCollector
+from anypod.path_manager import PathManager
+
+GRACE_PERIOD = timedelta(hours=1)
+
+
+@pytest.fixture
+def paths(tmp_path: Path) -> PathManager:
+    """Provide a PathManager rooted in a temporary directory."""
+    return PathManager(tmp_path, "http://localhost")
+
+
+@pytest.fixture
+def download_db_mock() -> MagicMock:
+    """Provide a DownloadDatabase referencing one download in feed_a."""
+    mock = MagicMock(spec=DownloadDatabase)
+    mock.get_stored_file_keys = AsyncMock(
+        return_value=[
+            PruneCandidate(
+                feed_id="feed_a",
+                id="kept",
+                status=DownloadStatus.DOWNLOADED,
+                ext="mp4",
+                thumbnail_ext="jpg",
+                transcript_lang="en",
+                transcript_ext="vtt",
+            )
+        ]
+    )
+    return mock
+
+
+def _write(path: Path, size: int = 10) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+    return path
+
+
+@pytest.fixture
+def after_grace_period() -> Iterator[None]:
+    """Pretend the grace period has passed for every file created in the test."""
+    clock = MagicMock()
+    clock.time.return_value = time.time() + 2 * GRACE_PERIOD.total_seconds()
+    with patch("anypod.orphan_gc.time", clock):
+        yield
+
+
+def _collector(
+    download_db_mock: MagicMock, paths: PathManager, batch_size: int = 100
+) -> OrphanFileCollector:
+    return OrphanFileCollector(
+        download_db_mock, paths, grace_period=GRACE_PERIOD, batch_size=batch_size
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("after_grace_period")
+async def test_run_deletes_unreferenced_files(
+    paths: PathManager, download_db_mock: MagicMock
+) -> None:
+    """Files without a download are deleted; referenced and feed files stay."""
+    kept = [
+        _write(paths.base_data_dir / "feed_a" / "kept.mp4"),
+        _write(paths.base_images_dir / "feed_a" / "downloads" / "kept.jpg"),
+        _write(paths.base_images_dir / "feed_a" / "feed_a.jpg"),
+        _write(paths.base_transcripts_dir / "feed_a" / "kept.en.vtt"),
+        _write(paths.base_feeds_dir / "gone.xml"),
+    ]
+    orphans = [
+        _write(paths.base_data_dir / "feed_a" / "gone.mp4", 100),
+        _write(paths.base_data_dir / "feed_b" / "kept.mp4", 100),
+        _write(paths.base_images_dir / "feed_a" / "downloads" / "gone.jpg"),
+        _write(paths.base_transcripts_dir / "feed_a" / "kept.de.vtt"),
+        _write(paths.base_tmp_dir / "feed_a" / "kept.mp4.part"),
+    ]
+
+    result = await _collector(download_db_mock, paths).run()
+
+    assert result.complete
+    assert result.entries_scanned == 8
+    assert result.files_deleted == len(orphans)
+    assert result.bytes_reclaimed == 230
+    assert all(path.exists() for path in kept)
+    assert not any(path.exists() for path in orphans)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("after_grace_period")
+async def test_run_keeps_files_of_resumable_downloads(
+    paths: PathManager, download_db_mock: MagicMock
+) -> None:
+    """Tmp files of QUEUED downloads with a resume marker wait for resumption."""
+    download_db_mock.get_stored_file_keys.return_value = [
+        PruneCandidate(
+            feed_id="feed_a",
+            id=download_id,
+            status=status,
+            ext="mp4",
+            thumbnail_ext=None,
+            transcript_lang=None,
+            transcript_ext=None,
+        )
+        for download_id, status in [
+            ("queued.v2", DownloadStatus.QUEUED),
+            ("unmarked", DownloadStatus.QUEUED),
+            ("done", DownloadStatus.DOWNLOADED),
+        ]
+    ]
+    tmp_dir = paths.base_tmp_dir / "feed_a"
+    kept = [
+        _write(tmp_dir / "queued.v2.resume"),
+        _write(tmp_dir / "queued.v2.f137.mp4.part"),
+    ]
+    orphans = [
+        _write(tmp_dir / "unmarked.mp4.part"),
+        _write(tmp_dir / "done.resume"),
+        _write(tmp_dir / "done.mp4.part"),
+    ]
+
+    result = await _collector(download_db_mock, paths).run()
+
+    assert result.files_deleted == len(orphans)
+    assert all(path.exists() for path in kept)
+    assert not any(path.exists() for path in orphans)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_keeps_recent_files(
+    paths: PathManager, download_db_mock: MagicMock
+) -> None:
+    """Unreferenced files changed within the grace period are left alone."""
+    orphan = _write(paths.base_tmp_dir / "feed_a" / "tmp_123")
+
+    result = await _collector(download_db_mock, paths).run()
+
+    assert result.files_deleted == 0
+    assert orphan.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("after_grace_period")
+async def test_run_counts_only_last_link_as_reclaimed(
+    paths: PathManager, download_db_mock: MagicMock
+) -> None:
+    """Deleting one of several hardlinks frees no space."""
+    kept = _write(paths.base_data_dir / "feed_a" / "kept.mp4")
+    orphan = paths.base_data_dir / "feed_b" / "kept.mp4"
+    orphan.parent.mkdir(parents=True)
+    os.link(kept, orphan)
+
+    result = await _collector(download_db_mock, paths).run()
+
+    assert result.files_deleted == 1
+    assert result.bytes_reclaimed == 0
+    assert kept.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("after_grace_period")
+async def test_run_resumes_from_cursor(
+    paths: PathManager, download_db_mock: MagicMock
+) -> None:
+    """Each run examines one batch and the next run continues after it."""
+    orphans = [
+        _write(paths.base_data_dir / "feed_a" / f"gone{i}.mp4") for i in range(3)
+    ]
+    collector = _collector(download_db_mock, paths, batch_size=2)
+
+    first = await collector.run()
+    assert not first.complete
+    assert first.files_deleted == 2
+    assert orphans[2].exists()
+
+    second = await collector.run()
+    assert second.complete
+    assert second.entries_scanned == 1
+    assert not orphans[2].exists()
+
+    # The next run starts over from the first directory
+    third = await collector.run()
+    assert third.complete
+    assert third.entries_scanned == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("after_grace_period")
+async def test_run_propagates_database_errors(
+    paths: PathManager, download_db_mock: MagicMock
+) -> None:
+    """Nothing is deleted when the key set cannot be loaded."""
+    orphan = _write(paths.base_data_dir / "feed_a" / "gone.mp4")
+    download_db_mock.get_stored_file_keys.side_effect = DatabaseOperationError("boom")
+
+    with pytest.raises(DatabaseOperationError):
+        await _collector(download_db_mock, paths).run()
+
+    assert orphan.exists()
@@ -0,0 +1,186 @@
+# pyright: reportPrivateUsage=false
+
+"""Unit tests for PartialDownloadRecovery markers and the startup recovery pass."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from anypod.config import FeedConfig
+from anypod.db import DownloadDatabase
+from anypod.db.types import Download, DownloadStatus
+from anypod.exceptions import DownloadNotFoundError
+from anypod.media_dedup import media_content_key
+from anypod.partial_recovery import PartialDownloadRecovery
+from anypod.path_manager import PathManager
+
+FEED_ID = "feed_a"
+
+
+def _feed_config(yt_args: str = "--format best", enabled: bool = True) -> FeedConfig:
+    return FeedConfig(
+        url="http://example.com/feed_url",
+        yt_args=yt_args,  # type: ignore # this gets preprocessed into a list
+        schedule="0 0 * * *",  # type: ignore
+        enabled=enabled,
+    )
+
+
+def _download(
+    download_id: str, status: DownloadStatus = DownloadStatus.QUEUED
+) -> Download:
+    return Download(
+        feed_id=FEED_ID,
+        id=download_id,
+        source_url=f"https://example.com/{download_id}",
+        title=download_id,
+        published=datetime(2024, 1, 1, tzinfo=UTC),
+        ext="mp4",
+        mime_type="video/mp4",
+        filesize=1024,
+        duration=60,
+        status=status,
+    )
+
+
+@pytest.fixture
+def paths(tmp_path: Path) -> PathManager:
+    """Provide a PathManager rooted in a temporary directory."""
+    return PathManager(tmp_path, "http://localhost")
+
+
+@pytest.fixture
+def downloads() -> dict[str, Download]:
+    """Provide the downloads the mocked database knows about, keyed by id."""
+    return {}
+
+
+@pytest.fixture
+def recovery(
+    paths: PathManager, downloads: dict[str, Download]
+) -> PartialDownloadRecovery:
+    """Provide a recovery instance backed by the ``downloads`` fixture."""
+
+    async def get_download_by_id(feed_id: str, download_id: str) -> Download:
+        if download_id not in downloads:
+            raise DownloadNotFoundError("missing", feed_id, download_id)
+        return downloads[download_id]
+
+    download_db = MagicMock(spec=DownloadDatabase)
+    download_db.get_download_by_id = AsyncMock(side_effect=get_download_by_id)
+    return PartialDownloadRecovery(download_db, paths)
+
+
+def _write(directory: Path, name: str, size: int) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / name
+    path.write_bytes(b"x" * size)
+    return path
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_mark_started_and_finished_manage_marker(
+    paths: PathManager, recovery: PartialDownloadRecovery
+) -> None:
+    """The marker holds the content key until the download finishes."""
+    download = _download("vid")
+    marker = paths.base_tmp_dir / FEED_ID / "vid.resume"
+
+    await recovery.mark_started(download, "key")
+    assert marker.read_text() == "key"
+
+    await recovery.mark_finished(download)
+    assert not marker.exists()
+    # Removing an already missing marker is harmless
+    await recovery.mark_finished(download)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_recover_keeps_matching_queued_download(
+    paths: PathManager,
+    recovery: PartialDownloadRecovery,
+    downloads: dict[str, Download],
+) -> None:
+    """Files of a QUEUED download with an unchanged content key are kept."""
+    feed_config = _feed_config()
+    download = _download("vid")
+    downloads["vid"] = download
+    await recovery.mark_started(
+        download, media_content_key(download, feed_config.yt_args)
+    )
+    tmp_dir = paths.base_tmp_dir / FEED_ID
+    kept = [
+        _write(tmp_dir, "vid.f137.mp4.part", 300),
+        _write(tmp_dir, "vid.f140.m4a", 50),
+    ]
+
+    result = await recovery.recover({FEED_ID: feed_config})
+
+    assert result.downloads_resumable == 1
+    assert result.bytes_salvaged == 350
+    assert result.files_removed == 0
+    assert all(path.exists() for path in kept)
+    assert (tmp_dir / "vid.resume").exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "status,yt_args,enabled",
+    [
+        (DownloadStatus.QUEUED, "--format worst", True),
+        (DownloadStatus.DOWNLOADED, "--format best", True),
+        (DownloadStatus.QUEUED, "--format best", False),
+    ],
+)
+async def test_recover_discards_stale_downloads(
+    paths: PathManager,
+    recovery: PartialDownloadRecovery,
+    downloads: dict[str, Download],
+    status: DownloadStatus,
+    yt_args: str,
+    enabled: bool,
+) -> None:
+    """Changed arguments, finished downloads and disabled feeds lose their files."""
+    download = _download("vid", status)
+    downloads["vid"] = download
+    await recovery.mark_started(
+        download, media_content_key(download, _feed_config().yt_args)
+    )
+    tmp_dir = paths.base_tmp_dir / FEED_ID
+    partial = _write(tmp_dir, "vid.mp4.part", 300)
+
+    result = await recovery.recover({FEED_ID: _feed_config(yt_args, enabled)})
+
+    assert result.downloads_resumable == 0
+    assert result.files_removed == 2
+    assert result.bytes_discarded == 300
+    assert not partial.exists()
+    assert not (tmp_dir / "vid.resume").exists()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_recover_removes_unmarked_partials_only(
+    paths: PathManager, recovery: PartialDownloadRecovery
+) -> None:
+    """Partial files without a marker, or of unknown downloads, are removed."""
+    tmp_dir = paths.base_tmp_dir / FEED_ID
+    unmarked = _write(tmp_dir, "old.mp4.part", 100)
+    fragment_state = _write(tmp_dir, "old.mp4.part.ytdl", 1)
+    other = _write(tmp_dir, "tmp_abc", 10)
+    await recovery.mark_started(_download("gone"), "key")
+    gone = _write(tmp_dir, "gone.mp4.part", 20)
+
+    result = await recovery.recover({FEED_ID: _feed_config()})
+
+    assert result.files_removed == 4
+    assert result.bytes_discarded == 121
+    assert not unmarked.exists()
+    assert not fragment_state.exists()
+    assert not gone.exists()
+    assert other.exists()
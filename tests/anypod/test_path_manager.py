@@ -312,6 +312,14 @@ def test_image_url_download_level(path_manager: PathManager):
     assert url == f"{path_manager.base_url}/images/{feed_id}/{download_id}.{ext}"
 
 
+@pytest.mark.unit
+def test_image_url_with_width(path_manager: PathManager):
+    """Tests that a width is appended as the resize query parameter."""
+    url = path_manager.image_url("content_feed", "video_123", "jpg", width=300)
+
+    assert url == f"{path_manager.base_url}/images/content_feed/video_123.jpg?w=300"
+
+
 @pytest.mark.unit
 def test_image_url_special_characters(path_manager: PathManager):
     """Tests image_url with special characters in identifiers."""
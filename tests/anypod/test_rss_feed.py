@@ -2,9 +2,13 @@
 
 """Tests for RSS feed generation functionality."""
 
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import UTC, datetime
+import multiprocessing
 from pathlib import Path
 from types import TracebackType
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 from xml.etree import ElementTree as ET
 
@@ -18,7 +22,7 @@ from anypod.db import DownloadDatabase
 from anypod.db.types import Download, DownloadStatus, Feed, SourceType
 from anypod.exceptions import DatabaseOperationError, RSSGenerationError
 from anypod.path_manager import PathManager
-from anypod.rss.rss_feed import RSSFeedGenerator
+from anypod.rss.rss_feed import RSSFeedGenerator, _render_feed_xml
 
 # Test constants
 TEST_BASE_URL = "http://localhost:8024"
@@ -206,6 +210,73 @@ async def test_update_feed_database_error(
     assert exc_info.value.feed_id == feed_id
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_feed_renders_in_worker_process(
+    mock_download_db: MagicMock,
+    path_manager: PathManager,
+    test_feed: Feed,
+    sample_downloads: list[Download],
+    capture_rss_write: dict[str, bytes],
+):
+    """Test that rendering in a process pool matches rendering inline."""
+    mock_download_db.get_downloads_by_status.return_value = sample_downloads
+    inline_xml = _render_feed_xml(
+        path_manager, TEST_FEED_ID, test_feed, sample_downloads
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("forkserver")
+    ) as executor:
+        generator = RSSFeedGenerator(mock_download_db, path_manager, executor)
+        await generator.update_feed(TEST_FEED_ID, test_feed)
+
+    rendered = ET.fromstring(capture_rss_write["data"])
+    expected = ET.fromstring(inline_xml)
+    # lastBuildDate is "now" and differs between the two renders
+    for root in (rendered, expected):
+        channel = root.find("channel")
+        assert channel is not None
+        build_date = channel.find("lastBuildDate")
+        assert build_date is not None
+        channel.remove(build_date)
+    assert ET.tostring(rendered) == ET.tostring(expected)
+
+
+class _BrokenPoolExecutor(Executor):
+    def __init__(self) -> None:
+        self.submissions = 0
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Future[Any]:
+        self.submissions += 1
+        future: Future[Any] = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_update_feed_broken_worker_pool_falls_back_to_threads(
+    mock_download_db: MagicMock,
+    path_manager: PathManager,
+    test_feed: Feed,
+    sample_downloads: list[Download],
+    capture_rss_write: dict[str, bytes],
+):
+    """Test that a crashed render worker does not stop feed generation."""
+    mock_download_db.get_downloads_by_status.return_value = sample_downloads
+    executor = _BrokenPoolExecutor()
+    generator = RSSFeedGenerator(mock_download_db, path_manager, executor)
+
+    await generator.update_feed(TEST_FEED_ID, test_feed)
+    first_xml = capture_rss_write["data"]
+    await generator.update_feed(TEST_FEED_ID, test_feed)
+
+    assert ET.fromstring(first_xml).find("channel") is not None
+    # The broken pool is not tried again
+    assert executor.submissions == 1
+
+
 # --- Tests for RSS XML content ---
 
 
@@ -386,11 +457,12 @@ async def test_channel_and_items_use_hosted_images_when_exts_present(
     assert itunes_image is not None
     assert itunes_image.get("href") == f"{TEST_BASE_URL}/images/{feed_id}.jpg"
 
+    # RSS <image> is capped at 144px wide, so it links to a resized copy
     rss_image = channel.find("image")
     assert rss_image is not None
     rss_image_url = rss_image.find("url")
     assert rss_image_url is not None
-    assert rss_image_url.text == f"{TEST_BASE_URL}/images/{feed_id}.jpg"
+    assert rss_image_url.text == f"{TEST_BASE_URL}/images/{feed_id}.jpg?w=144"
 
     # Item-level itunes:image should point to hosted per-download thumbnails
     items = channel.findall("item")
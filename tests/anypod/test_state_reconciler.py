@@ -31,7 +31,11 @@ from anypod.exceptions import (
     StateReconciliationError,
 )
 from anypod.file_manager import FileManager
-from anypod.image_downloader import ImageDownloader
+from anypod.image_downloader import (
+    DirectImageResult,
+    ImageDownloader,
+    ImageValidators,
+)
 from anypod.state_reconciler import MIN_SYNC_DATE, StateReconciler
 from anypod.ytdlp_wrapper import YtdlpWrapper
 
@@ -42,6 +46,11 @@ NEW_FEED_ID = "new_feed"
 NEW_FEED_URL = "https://example.com/new_feed"
 REMOVED_FEED_ID = "removed_feed"
 TEST_CRON_SCHEDULE = "0 * * * *"
+DIRECT_IMAGE_RESULT = DirectImageResult(
+    ext="jpg",
+    validators=ImageValidators(etag='"v1"', content_hash="hash-v1"),
+    changed=True,
+)
 
 # Mock Feed objects for testing
 BASE_TIME = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
@@ -214,7 +223,7 @@ def mock_file_manager() -> MagicMock:
 def mock_image_downloader() -> MagicMock:
     """Provides a MagicMock for ImageDownloader with async methods."""
     dl = MagicMock(spec=ImageDownloader)
-    dl.download_feed_image_direct = AsyncMock(return_value="jpg")
+    dl.download_feed_image_direct = AsyncMock(return_value=DIRECT_IMAGE_RESULT)
     dl.download_feed_image_ytdlp = AsyncMock(return_value="jpg")
     return dl
 
@@ -1170,7 +1179,7 @@ async def test_handle_image_url_changes_override_added(
     updated_feed = deepcopy(db_feed)
     updated_feed.remote_image_url = "https://example.com/new-image.jpg"
 
-    mock_image_downloader.download_feed_image_direct.return_value = "jpg"
+    mock_image_downloader.download_feed_image_direct.return_value = DIRECT_IMAGE_RESULT
 
     result = await state_reconciler._handle_image_url_changes(
         FEED_ID, config, db_feed, updated_feed
@@ -1178,7 +1187,7 @@ async def test_handle_image_url_changes_override_added(
 
     assert result == "jpg"
     mock_image_downloader.download_feed_image_direct.assert_called_once_with(
-        FEED_ID, "https://example.com/new-image.jpg"
+        FEED_ID, "https://example.com/new-image.jpg", cached=None
     )
     mock_image_downloader.download_feed_image_ytdlp.assert_not_called()
 
@@ -1205,7 +1214,7 @@ async def test_handle_image_url_changes_override_changed(
     updated_feed = deepcopy(db_feed)
     updated_feed.remote_image_url = "https://example.com/new-image.jpg"
 
-    mock_image_downloader.download_feed_image_direct.return_value = "jpg"
+    mock_image_downloader.download_feed_image_direct.return_value = DIRECT_IMAGE_RESULT
 
     result = await state_reconciler._handle_image_url_changes(
         FEED_ID, config, db_feed, updated_feed
@@ -1213,7 +1222,7 @@ async def test_handle_image_url_changes_override_changed(
 
     assert result == "jpg"
     mock_image_downloader.download_feed_image_direct.assert_called_once_with(
-        FEED_ID, "https://example.com/new-image.jpg"
+        FEED_ID, "https://example.com/new-image.jpg", cached=None
     )
 
 
@@ -1315,6 +1324,95 @@ async def test_handle_image_url_changes_override_removed_same_natural_url(
     mock_image_downloader.download_feed_image_ytdlp.assert_not_called()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_handle_image_url_changes_revalidates_direct_image(
+    state_reconciler: StateReconciler,
+    mock_image_downloader: MagicMock,
+    base_feed_config: FeedConfig,
+) -> None:
+    """Unchanged override URL with a directly fetched image is revalidated."""
+    url = "https://example.com/image.jpg"
+    db_feed = deepcopy(MOCK_FEED)
+    db_feed.remote_image_url = url
+    db_feed.image_ext = "jpg"
+    db_feed.image_etag = '"v1"'
+    db_feed.image_content_hash = "hash-v1"
+
+    config = deepcopy(base_feed_config)
+    config.metadata = FeedMetadataOverrides(image_url=url)  # type: ignore # fields default to None
+    updated_feed = deepcopy(db_feed)
+
+    result = await state_reconciler._handle_image_url_changes(
+        FEED_ID, config, db_feed, updated_feed
+    )
+
+    assert result == "jpg"
+    mock_image_downloader.download_feed_image_direct.assert_called_once_with(
+        FEED_ID,
+        url,
+        cached=ImageValidators(etag='"v1"', content_hash="hash-v1"),
+    )
+    assert updated_feed == db_feed
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_handle_image_url_changes_new_url_sends_only_content_hash(
+    state_reconciler: StateReconciler,
+    mock_image_downloader: MagicMock,
+    base_feed_config: FeedConfig,
+) -> None:
+    """Validators of the old URL are not reused for a new URL."""
+    db_feed = deepcopy(MOCK_FEED)
+    db_feed.remote_image_url = "https://example.com/old.jpg"
+    db_feed.image_ext = "jpg"
+    db_feed.image_etag = '"old"'
+    db_feed.image_content_hash = "hash-old"
+
+    config = deepcopy(base_feed_config)
+    config.metadata = FeedMetadataOverrides(image_url="https://example.com/new.jpg")  # type: ignore # fields default to None
+    updated_feed = deepcopy(db_feed)
+    updated_feed.remote_image_url = "https://example.com/new.jpg"
+
+    await state_reconciler._handle_image_url_changes(
+        FEED_ID, config, db_feed, updated_feed
+    )
+
+    mock_image_downloader.download_feed_image_direct.assert_called_once_with(
+        FEED_ID,
+        "https://example.com/new.jpg",
+        cached=ImageValidators(content_hash="hash-old"),
+    )
+    assert updated_feed.image_etag == '"v1"'
+    assert updated_feed.image_content_hash == "hash-v1"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_handle_image_url_changes_ytdlp_clears_validators(
+    state_reconciler: StateReconciler,
+    base_feed_config: FeedConfig,
+) -> None:
+    """Switching to a yt-dlp image drops the direct download validators."""
+    db_feed = deepcopy(MOCK_FEED)
+    db_feed.remote_image_url = "https://example.com/override.jpg"
+    db_feed.image_etag = '"v1"'
+    db_feed.image_content_hash = "hash-v1"
+
+    config = deepcopy(base_feed_config)
+    config.metadata = None
+    updated_feed = deepcopy(db_feed)
+    updated_feed.remote_image_url = "https://example.com/natural.jpg"
+
+    await state_reconciler._handle_image_url_changes(
+        FEED_ID, config, db_feed, updated_feed
+    )
+
+    assert updated_feed.image_etag is None
+    assert updated_feed.image_content_hash is None
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_handle_image_url_changes_direct_download_failure(
@@ -1633,6 +1731,41 @@ async def test_fetch_feed_metadata_manual_skips_discovery(
     mock_ytdlp_wrapper.fetch_playlist_metadata.assert_not_called()
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_manual_image_override_revalidates_unchanged_url(
+    state_reconciler: StateReconciler,
+    mock_image_downloader: MagicMock,
+) -> None:
+    """An unchanged manual override URL is fetched conditionally."""
+    url = "https://example.com/manual.jpg"
+    manual_config = FeedConfig(
+        url=None,
+        schedule="manual",  # type: ignore[arg-type]
+        metadata=FeedMetadataOverrides(title="Manual", image_url=url),
+    )
+    db_feed = deepcopy(MOCK_FEED)
+    db_feed.remote_image_url = url
+    db_feed.image_ext = "jpg"
+    db_feed.image_last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+    db_feed.image_content_hash = "hash-v0"
+    target = deepcopy(db_feed)
+
+    result = await state_reconciler._download_manual_image_override(
+        "manual", manual_config, target, existing_feed=db_feed
+    )
+
+    assert result == "jpg"
+    mock_image_downloader.download_feed_image_direct.assert_called_once_with(
+        "manual",
+        url,
+        cached=ImageValidators(
+            last_modified="Mon, 01 Jan 2024 00:00:00 GMT", content_hash="hash-v0"
+        ),
+    )
+    assert target.image_content_hash == "hash-v1"
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_handle_existing_manual_feed_updates_metadata_and_image(
@@ -1669,7 +1802,7 @@ async def test_handle_existing_manual_feed_updates_metadata_and_image(
         since=None,
         keep_last=None,
     )
-    mock_image_downloader.download_feed_image_direct.return_value = "jpg"
+    mock_image_downloader.download_feed_image_direct.return_value = DIRECT_IMAGE_RESULT
 
     result = await state_reconciler._handle_existing_feed(
         "manual", manual_config, db_feed
@@ -1677,12 +1810,14 @@ async def test_handle_existing_manual_feed_updates_metadata_and_image(
 
     assert result is True
     mock_image_downloader.download_feed_image_direct.assert_called_once_with(
-        "manual", "https://example.com/manual-new.jpg"
+        "manual", "https://example.com/manual-new.jpg", cached=None
     )
     updated_feed = mock_feed_db.upsert_feed.await_args[0][0]
     assert updated_feed.title == "Updated Manual Feed"
     assert updated_feed.description == "Fresh description"
     assert updated_feed.image_ext == "jpg"
+    assert updated_feed.image_etag == '"v1"'
+    assert updated_feed.image_content_hash == "hash-v1"
     mock_ytdlp_wrapper.discover_feed_properties.assert_not_called()
     mock_ytdlp_wrapper.fetch_playlist_metadata.assert_not_called()
 
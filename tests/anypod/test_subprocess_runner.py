@@ -0,0 +1,157 @@
+# pyright: reportPrivateUsage=false
+"""Tests for the shared external tool subprocess runner."""
+
+import asyncio
+import os
+from pathlib import Path
+import resource
+import sys
+
+import pytest
+
+from anypod.subprocess_runner import (
+    ResourceLimits,
+    SubprocessOperation,
+    SubprocessRunner,
+)
+
+_SPAWN_CHILD_AND_HANG = (
+    "import subprocess, sys, time\n"
+    "child = subprocess.Popen(['sleep', '60'])\n"
+    "print(child.pid, flush=True)\n"
+    "time.sleep(60)\n"
+)
+
+
+def _is_running(pid: int) -> bool:
+    """Return whether a process exists and is not a zombie."""
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except FileNotFoundError:
+        return False
+    return stat.rsplit(")", 1)[1].split()[0] not in ("Z", "X")
+
+
+async def _wait_until_gone(pid: int) -> bool:
+    """Poll until the process has exited, giving up after a few seconds."""
+    for _ in range(100):
+        if not _is_running(pid):
+            return True
+        await asyncio.sleep(0.05)
+    return False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_captures_output_and_duration():
+    """A completed run returns exit code, output and a duration."""
+    runner = SubprocessRunner()
+
+    result = await runner.run(
+        SubprocessOperation.FFPROBE,
+        [
+            sys.executable,
+            "-c",
+            "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)",
+        ],
+    )
+
+    assert result.returncode == 3
+    assert result.stdout.strip() == b"out"
+    assert result.stderr.strip() == b"err"
+    assert result.duration_seconds > 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_missing_executable_raises_file_not_found():
+    """A missing executable surfaces as FileNotFoundError."""
+    runner = SubprocessRunner()
+
+    with pytest.raises(FileNotFoundError):
+        await runner.run(SubprocessOperation.FFMPEG, ["anypod-no-such-binary"])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.skipif(not Path("/proc").is_dir(), reason="requires procfs")
+async def test_timeout_kills_whole_process_group():
+    """On timeout the process and the children it spawned are killed."""
+    runner = SubprocessRunner(timeouts={SubprocessOperation.FFPROBE: 1.0})
+    child_pid: int | None = None
+
+    with pytest.raises(TimeoutError):
+        async with runner.open(
+            SubprocessOperation.FFPROBE,
+            [sys.executable, "-c", _SPAWN_CHILD_AND_HANG],
+            stdout=asyncio.subprocess.PIPE,
+        ) as process:
+            assert process.stdout is not None
+            child_pid = int(await process.stdout.readline())
+            await process.wait()
+
+    assert child_pid is not None
+    assert await _wait_until_gone(child_pid)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancellation_kills_process():
+    """Cancelling the awaiting task kills and reaps the subprocess."""
+    runner = SubprocessRunner()
+    started = asyncio.Event()
+    pids: list[int] = []
+
+    async def _run() -> None:
+        async with runner.open(SubprocessOperation.FFMPEG, ["sleep", "60"]) as process:
+            pids.append(process.pid)
+            started.set()
+            await process.wait()
+
+    task = asyncio.create_task(_run())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(task, timeout=5)
+
+    with pytest.raises(ProcessLookupError):
+        os.kill(pids[0], 0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_resource_limits_are_applied_to_child():
+    """Memory and niceness limits are set on the started process."""
+    limit = 4 * 1024**3
+    runner = SubprocessRunner(limits=ResourceLimits(max_memory_bytes=limit, nice=5))
+
+    async with runner.open(SubprocessOperation.FFMPEG, ["sleep", "60"]) as process:
+        soft, hard = resource.prlimit(process.pid, resource.RLIMIT_AS)
+        priority = os.getpriority(os.PRIO_PROCESS, process.pid)
+        runner.kill(process)
+
+    assert (soft, hard) == (limit, limit)
+    assert priority >= 5
+
+
+@pytest.mark.unit
+def test_ionice_class_prefixes_command():
+    """An I/O class wraps the command with ionice."""
+    runner = SubprocessRunner(limits=ResourceLimits(ionice_class=3))
+
+    assert runner._command(["ffmpeg", "-y"]) == [
+        "ionice",
+        "-c",
+        "3",
+        "ffmpeg",
+        "-y",
+    ]
+
+
+@pytest.mark.unit
+def test_timeout_for_unconfigured_operation_is_unbounded():
+    """Operations without a configured timeout are not bounded."""
+    runner = SubprocessRunner(timeouts={SubprocessOperation.FFPROBE: 5.0})
+
+    assert runner.timeout_for(SubprocessOperation.FFPROBE) == 5.0
+    assert runner.timeout_for(SubprocessOperation.YTDLP_DOWNLOAD) is None
@@ -1,5 +1,6 @@
 """Unit tests for PatreonHandler and related Patreon-specific functionality."""
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -29,7 +30,7 @@ def ffprobe_mock() -> MagicMock:
 @pytest.fixture
 def patreon_handler(ffprobe_mock: MagicMock) -> PatreonHandler:
     """Provide a PatreonHandler with injected FFProbe mock."""
-    return PatreonHandler(ffprobe=ffprobe_mock)
+    return PatreonHandler(ffprobe=ffprobe_mock, ytdlp_core=YtdlpCore())
 
 
 @pytest.fixture
@@ -196,6 +197,99 @@ async def test_extract_download_metadata_probes_duration_when_missing(
     assert kwargs["headers"]["Referer"] == "https://www.patreon.com"
 
 
+def _entry_without_duration(
+    minimal_entry_data: dict[str, Any], media_url: str
+) -> YtdlpInfo:
+    """Build a post entry that lacks a duration and exposes one media URL."""
+    data = minimal_entry_data.copy()
+    data.update(
+        {"ext": "mp4", "duration": 0, "requested_downloads": [{"url": media_url}]}
+    )
+    return YtdlpInfo(data)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_probe_duration_uses_cache_when_media_unchanged(
+    ffprobe_mock: MagicMock,
+    minimal_entry_data: dict[str, Any],
+):
+    """A cached duration for the same media skips the remote probe even if the URL token rotates."""
+    probe_cache = MagicMock()
+    probe_cache.get_duration = AsyncMock(return_value=None)
+    probe_cache.upsert_duration = AsyncMock()
+    ffprobe_mock.get_duration_seconds_from_url = AsyncMock(return_value=234)
+    handler = PatreonHandler(
+        ffprobe=ffprobe_mock, ytdlp_core=YtdlpCore(), probe_cache=probe_cache
+    )
+
+    first = await handler.extract_download_metadata(
+        FEED_ID,
+        _entry_without_duration(
+            minimal_entry_data, "https://cdn.patreon.com/v.mp4?token=a"
+        ),
+    )
+    fingerprint = probe_cache.upsert_duration.await_args.args[2]
+    probe_cache.upsert_duration.assert_awaited_once_with(
+        FEED_ID, "post123", fingerprint, 234
+    )
+
+    probe_cache.get_duration.return_value = 234
+    second = await handler.extract_download_metadata(
+        FEED_ID,
+        _entry_without_duration(
+            minimal_entry_data, "https://cdn.patreon.com/v.mp4?token=b"
+        ),
+    )
+
+    assert first.duration == second.duration == 234
+    ffprobe_mock.get_duration_seconds_from_url.assert_awaited_once()
+    assert probe_cache.get_duration.await_args_list[1].args == (
+        FEED_ID,
+        "post123",
+        fingerprint,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_probe_duration_bounds_concurrent_probes(
+    ffprobe_mock: MagicMock,
+    minimal_entry_data: dict[str, Any],
+):
+    """No more than the configured number of remote probes run at once."""
+    active = 0
+    peak = 0
+
+    async def _probe(*_args: Any, **_kwargs: Any) -> int:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return 60
+
+    ffprobe_mock.get_duration_seconds_from_url = AsyncMock(side_effect=_probe)
+    handler = PatreonHandler(
+        ffprobe=ffprobe_mock, ytdlp_core=YtdlpCore(), max_concurrent_probes=2
+    )
+
+    downloads = await asyncio.gather(
+        *(
+            handler.extract_download_metadata(
+                FEED_ID,
+                _entry_without_duration(
+                    minimal_entry_data, f"https://cdn.patreon.com/{i}.mp4"
+                ),
+            )
+            for i in range(6)
+        )
+    )
+
+    assert [d.duration for d in downloads] == [60] * 6
+    assert peak == 2
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_extract_download_metadata_filtered_when_ext_missing(
@@ -0,0 +1,137 @@
+# pyright: reportPrivateUsage=false
+
+"""Tests for yt-dlp download progress parsing and stall detection."""
+
+import pytest
+
+from anypod.ytdlp_wrapper.core.progress import (
+    PROGRESS_PREFIX,
+    DownloadProgressTracker,
+    ProgressMonitor,
+)
+
+FEED_ID = "progress_feed"
+DOWNLOAD_ID = "progress_download"
+
+
+def _line(
+    status: str = "downloading",
+    downloaded: str = "0",
+    total: str = "NA",
+    estimate: str = "NA",
+    speed: str = "NA",
+    eta: str = "NA",
+) -> str:
+    return f"{PROGRESS_PREFIX} {status} {downloaded} {total} {estimate} {speed} {eta}\n"
+
+
+@pytest.fixture
+def monitor() -> ProgressMonitor:
+    """Provides a monitor with a 1000 B/s floor over 10 seconds."""
+    return ProgressMonitor(FEED_ID, DOWNLOAD_ID, min_speed=1000, stall_window=10)
+
+
+# --- Tests for ProgressMonitor.update ---
+
+
+@pytest.mark.unit
+def test_update_parses_progress_line(monitor: ProgressMonitor):
+    """Progress fields are parsed from a template line."""
+    assert monitor.update(_line("downloading", "2048", "8192", "NA", "512.5", "12"))
+
+    snapshot = monitor.snapshot()
+    assert snapshot.status == "downloading"
+    assert snapshot.downloaded_bytes == 2048
+    assert snapshot.total_bytes == 8192
+    assert snapshot.speed_bps == 512.5
+    assert snapshot.eta_seconds == 12.0
+
+
+@pytest.mark.unit
+def test_update_falls_back_to_estimated_total(monitor: ProgressMonitor):
+    """Fragmented downloads report an estimated total instead of an exact one."""
+    monitor.update(_line(downloaded="100", estimate="4096.0"))
+
+    assert monitor.snapshot().total_bytes == 4096
+    assert monitor.snapshot().speed_bps is None
+
+
+@pytest.mark.unit
+def test_update_ignores_regular_output(monitor: ProgressMonitor):
+    """Lines without the progress prefix are left for the logs."""
+    assert not monitor.update("[download] Destination: video.mp4\n")
+    assert monitor.snapshot().status == "starting"
+
+
+@pytest.mark.unit
+def test_update_accumulates_bytes_across_files(monitor: ProgressMonitor):
+    """Bytes from a finished stream are kept when the next stream starts."""
+    monitor.update(_line("downloading", "5000"))
+    monitor.update(_line("finished", "6000"))
+    monitor.update(_line("downloading", "1000"))
+
+    snapshot = monitor.snapshot()
+    assert snapshot.downloaded_bytes == 1000
+    assert snapshot.transferred_bytes == 7000
+
+
+# --- Tests for ProgressMonitor.check_stalled ---
+
+
+@pytest.mark.unit
+def test_check_stalled_below_floor_for_full_window(monitor: ProgressMonitor):
+    """A download below the floor for the whole window is stalled."""
+    start = monitor._window_start
+    monitor.update(_line("downloading", "500"))
+
+    assert not monitor.check_stalled(start + 5)
+    assert monitor.check_stalled(start + 10)
+    assert monitor.stalled
+
+
+@pytest.mark.unit
+def test_check_stalled_restarts_window_above_floor(monitor: ProgressMonitor):
+    """A window above the floor resets the measurement for the next one."""
+    start = monitor._window_start
+    monitor.update(_line("downloading", "50000"))
+
+    assert not monitor.check_stalled(start + 10)
+    monitor.update(_line("downloading", "55000"))
+    assert not monitor.check_stalled(start + 15)
+    assert monitor.check_stalled(start + 20)
+
+
+@pytest.mark.unit
+def test_check_stalled_ignores_post_processing(monitor: ProgressMonitor):
+    """Time spent after a stream finishes is never counted as a stall."""
+    start = monitor._window_start
+    monitor.update(_line("finished", "1000"))
+
+    assert not monitor.check_stalled(start + 60)
+    assert not monitor.stalled
+
+
+@pytest.mark.unit
+def test_check_stalled_disabled_without_floor():
+    """A floor of zero disables stall detection."""
+    monitor = ProgressMonitor(FEED_ID, DOWNLOAD_ID, min_speed=0, stall_window=1)
+    monitor.update(_line("downloading", "0"))
+
+    assert not monitor.check_stalled(monitor._window_start + 3600)
+
+
+# --- Tests for DownloadProgressTracker ---
+
+
+@pytest.mark.unit
+def test_tracker_reports_only_active_downloads():
+    """Downloads appear while tracked and disappear once the block exits."""
+    tracker = DownloadProgressTracker(min_speed=2048, stall_window=30)
+
+    with tracker.track(FEED_ID, DOWNLOAD_ID) as monitor:
+        monitor.update(_line("downloading", "10"))
+        assert monitor.min_speed == 2048
+        assert monitor.stall_window == 30
+        assert [p.download_id for p in tracker.active()] == [DOWNLOAD_ID]
+
+    assert tracker.active() == []
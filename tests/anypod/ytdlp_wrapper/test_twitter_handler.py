@@ -28,7 +28,7 @@ UPLOADER_ID = "interesting_aIl"
 @pytest.fixture
 def twitter_handler() -> TwitterHandler:
     """Return a TwitterHandler instance."""
-    return TwitterHandler()
+    return TwitterHandler(YtdlpCore())
 
 
 @pytest.fixture
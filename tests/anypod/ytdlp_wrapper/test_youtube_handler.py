@@ -25,7 +25,7 @@ from anypod.ytdlp_wrapper.handlers.youtube_handler import (
 @pytest.fixture
 def youtube_handler() -> YoutubeHandler:
     """Provides a YoutubeHandler instance for the tests."""
-    return YoutubeHandler()
+    return YoutubeHandler(YtdlpCore())
 
 
 @pytest.fixture
@@ -1039,7 +1039,7 @@ def test_extract_feed_metadata_channel_specific_fields():
         "epoch": 1678886400,  # yt-dlp request timestamp
     }
 
-    youtube_handler = YoutubeHandler()
+    youtube_handler = YoutubeHandler(YtdlpCore())
     ytdlp_info = YtdlpInfo(channel_ytdlp_data)
 
     extracted_feed = youtube_handler.extract_feed_metadata(
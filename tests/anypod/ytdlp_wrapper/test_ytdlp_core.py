@@ -1,12 +1,31 @@
 # pyright: reportPrivateUsage=false
 """Tests for low-level yt-dlp subprocess handling."""
 
+import asyncio
+import sys
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from anypod.exceptions import YtdlpApiError
-from anypod.ytdlp_wrapper.core import YtdlpArgs, YtdlpCore
+from anypod.metrics.instruments import YTDLP_RUNS
+from anypod.subprocess_runner import SubprocessOperation, SubprocessRunner
+from anypod.ytdlp_wrapper.core import ProgressMonitor, YtdlpArgs, YtdlpCore
+from anypod.ytdlp_wrapper.core.progress import PROGRESS_PREFIX
+
+_real_create_subprocess_exec = asyncio.create_subprocess_exec
+
+
+def _fake_ytdlp(script: str) -> Any:
+    """Return a create_subprocess_exec replacement running ``script`` instead."""
+
+    async def _spawn(*_cmd: str, **kwargs: Any) -> asyncio.subprocess.Process:
+        return await _real_create_subprocess_exec(
+            sys.executable, "-c", script, **kwargs
+        )
+
+    return _spawn
 
 
 @pytest.mark.unit
@@ -29,7 +48,7 @@ async def test_extract_downloads_info_raises_on_dns_resolution_error(
     mock_create_subprocess_exec.return_value = mock_proc
 
     with pytest.raises(YtdlpApiError):
-        await YtdlpCore.extract_downloads_info(
+        await YtdlpCore().extract_downloads_info(
             YtdlpArgs(), "https://youtube.com/playlist?list=test"
         )
 
@@ -52,7 +71,7 @@ async def test_extract_downloads_info_ignores_non_network_ytdlp_errors(
     mock_proc.wait = AsyncMock()
     mock_create_subprocess_exec.return_value = mock_proc
 
-    result = await YtdlpCore.extract_downloads_info(
+    result = await YtdlpCore().extract_downloads_info(
         YtdlpArgs(), "https://youtube.com/playlist?list=test"
     )
 
@@ -74,6 +93,99 @@ async def test_extract_downloads_info_ignores_generic_non_network_ytdlp_errors(
     mock_proc.wait = AsyncMock()
     mock_create_subprocess_exec.return_value = mock_proc
 
-    result = await YtdlpCore.extract_downloads_info(YtdlpArgs(), "https://example.com")
+    result = await YtdlpCore().extract_downloads_info(
+        YtdlpArgs(), "https://example.com"
+    )
 
     assert result.payload == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+async def test_download_records_exit_code_metric(
+    mock_create_subprocess_exec: AsyncMock,
+):
+    """Failed downloads are counted under their exit code."""
+    mock_proc = MagicMock()
+    mock_proc.returncode = 2
+    mock_proc.communicate = AsyncMock(return_value=(b"", b"ERROR: boom"))
+    mock_proc.wait = AsyncMock()
+    mock_create_subprocess_exec.return_value = mock_proc
+    before = YTDLP_RUNS.value(operation="download", exit_code="2")
+
+    with pytest.raises(YtdlpApiError):
+        await YtdlpCore().download(YtdlpArgs(), "https://example.com/video")
+
+    assert YTDLP_RUNS.value(operation="download", exit_code="2") == before + 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_with_progress_consumes_progress_lines():
+    """Progress lines update the monitor and are kept out of the logs."""
+    script = (
+        "print('[download] Destination: video.mp4')\n"
+        f"print('{PROGRESS_PREFIX} downloading 512 1024 NA 256.0 2', flush=True)\n"
+        f"print('{PROGRESS_PREFIX} finished 1024 1024 NA NA NA', flush=True)\n"
+    )
+    monitor = ProgressMonitor("feed", "dl")
+
+    with patch("asyncio.create_subprocess_exec", _fake_ytdlp(script)):
+        logs = await YtdlpCore().download(
+            YtdlpArgs(), "https://example.com/video", progress=monitor
+        )
+
+    assert "Destination: video.mp4" in logs
+    assert PROGRESS_PREFIX not in logs
+    snapshot = monitor.snapshot()
+    assert snapshot.status == "finished"
+    assert snapshot.transferred_bytes == 1024
+    assert not monitor.stalled
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_download_with_progress_kills_stalled_download():
+    """A download stuck below the throughput floor is killed and reported."""
+    script = (
+        "import time\n"
+        f"print('{PROGRESS_PREFIX} downloading 10 1000000 NA 5.0 NA', flush=True)\n"
+        "time.sleep(30)\n"
+    )
+    monitor = ProgressMonitor(
+        "feed", "dl", min_speed=1000, stall_window=0.2, check_interval=0.05
+    )
+
+    with (
+        patch("asyncio.create_subprocess_exec", _fake_ytdlp(script)),
+        pytest.raises(YtdlpApiError, match="stalled"),
+    ):
+        await asyncio.wait_for(
+            YtdlpCore().download(
+                YtdlpArgs(), "https://example.com/video", progress=monitor
+            ),
+            timeout=10,
+        )
+
+    assert monitor.stalled
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_metadata_extraction_timeout_raises_api_error():
+    """A metadata run exceeding its time limit is killed and reported."""
+    runner = SubprocessRunner(timeouts={SubprocessOperation.YTDLP_METADATA: 0.5})
+
+    with (
+        patch(
+            "asyncio.create_subprocess_exec", _fake_ytdlp("import time\ntime.sleep(30)")
+        ),
+        pytest.raises(YtdlpApiError, match="time limit"),
+    ):
+        await asyncio.wait_for(
+            YtdlpCore(runner).extract_playlist_info(
+                YtdlpArgs(), "https://example.com/list"
+            ),
+            timeout=10,
+        )
@@ -2,6 +2,7 @@
 
 """Tests for the YtdlpWrapper class and its yt-dlp integration functionality."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -9,13 +10,24 @@ import pytest
 
 from anypod.db.app_state_db import AppStateDatabase
 from anypod.db.types import Download, DownloadStatus, Feed, SourceType
-from anypod.exceptions import YtdlpApiError
+from anypod.exceptions import YtdlpApiError, YtdlpDataError
 from anypod.ffmpeg import FFmpeg
-from anypod.ffprobe import FFProbe
+from anypod.ffprobe import FFProbe, MediaProbe
+from anypod.image_pipeline import ImagePipeline
 from anypod.path_manager import PathManager
 from anypod.ytdlp_wrapper import YtdlpWrapper
-from anypod.ytdlp_wrapper.core import YtdlpArgs, YtdlpCore, YtdlpInfo, YtdlpRunResult
-from anypod.ytdlp_wrapper.handlers import HandlerSelector, YoutubeHandler
+from anypod.ytdlp_wrapper.core import (
+    ProgressMonitor,
+    YtdlpArgs,
+    YtdlpCore,
+    YtdlpInfo,
+    YtdlpRunResult,
+)
+from anypod.ytdlp_wrapper.handlers import (
+    HandlerSelector,
+    YoutubeHandler,
+    YtdlpYoutubeVideoFilteredOutError,
+)
 
 
 def _return_same_args(
@@ -37,6 +49,7 @@ def _mock_prepare_media_download_args(
 def mock_youtube_handler() -> MagicMock:
     """Fixture to provide a mocked YoutubeHandler."""
     handler = MagicMock(spec=YoutubeHandler)
+    handler.io_bound_extraction = False
     handler.prepare_playlist_info_args.side_effect = _return_same_args
     handler.prepare_thumbnail_args.side_effect = _return_same_args
     handler.prepare_downloads_info_args.side_effect = _return_same_args
@@ -75,7 +88,9 @@ def ffmpeg_mock() -> MagicMock:
 def ffprobe_mock() -> MagicMock:
     """Provide a mocked FFProbe instance."""
     mock = MagicMock(spec=FFProbe)
-    mock.get_duration_seconds_from_file = AsyncMock(return_value=321)
+    mock.probe = AsyncMock(
+        return_value=MediaProbe(duration=321.5, bit_rate=None, format_name=None)
+    )
     return mock
 
 
@@ -100,6 +115,8 @@ def ytdlp_wrapper_with_provider(
         ffmpeg=ffmpeg_mock,
         ffprobe=ffprobe_mock,
         handler_selector=handler_selector_mock,
+        ytdlp_core=YtdlpCore(),
+        image_pipeline=ImagePipeline(ffprobe_mock, ffmpeg_mock, in_process=False),
     )
     return wrapper
 
@@ -124,6 +141,8 @@ def ytdlp_wrapper(
         ffmpeg=ffmpeg_mock,
         ffprobe=ffprobe_mock,
         handler_selector=handler_selector_mock,
+        ytdlp_core=YtdlpCore(),
+        image_pipeline=ImagePipeline(ffprobe_mock, ffmpeg_mock, in_process=False),
     )
     return wrapper
 
@@ -343,6 +362,90 @@ async def test_fetch_new_downloads_metadata_returns_downloads(
     )
 
 
+def _download_for(feed_id: str, download_id: str) -> Download:
+    """Build a minimal queued Download for extraction tests."""
+    return Download(
+        feed_id=feed_id,
+        id=download_id,
+        source_url=f"https://example.com/{download_id}",
+        title=download_id,
+        published=datetime(2023, 1, 1, 0, 0, 0, tzinfo=UTC),
+        ext="mp4",
+        mime_type="video/mp4",
+        filesize=1,
+        duration=1,
+        status=DownloadStatus.QUEUED,
+    )
+
+
+def _concurrency_tracking_handler(io_bound: bool) -> tuple[MagicMock, list[int]]:
+    """Return a handler mock recording the peak number of concurrent extractions."""
+    handler = MagicMock(spec=YoutubeHandler)
+    handler.io_bound_extraction = io_bound
+    active = [0]
+    peak = [0]
+
+    async def _extract(feed_id: str, info: YtdlpInfo, *_args: object) -> Download:
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        # Later entries finish first to prove ordering is preserved
+        await asyncio.sleep(0.001 * (10 - int(info.required("id", str))))
+        active[0] -= 1
+        if info.required("id", str) == "3":
+            raise YtdlpYoutubeVideoFilteredOutError(feed_id, "3")
+        return _download_for(feed_id, info.required("id", str))
+
+    handler.extract_download_metadata = AsyncMock(side_effect=_extract)
+    return handler, peak
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("io_bound", "expect_concurrent"), [(True, True), (False, False)]
+)
+async def test_extract_downloads_fans_out_only_for_io_bound_handlers(
+    io_bound: bool, expect_concurrent: bool
+):
+    """I/O-bound handlers extract concurrently; order is kept and filtered entries are skipped."""
+    handler, peak = _concurrency_tracking_handler(io_bound)
+    infos = [YtdlpInfo({"id": str(i)}) for i in range(6)]
+
+    downloads = await YtdlpWrapper._extract_downloads(
+        handler, "feed", infos, None, None
+    )
+
+    assert [d.id for d in downloads] == ["0", "1", "2", "4", "5"]
+    assert (peak[0] > 1) is expect_concurrent
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_downloads_concurrent_raises_earliest_entry_error():
+    """With concurrent extraction, the first failing entry's error is raised."""
+    handler = MagicMock(spec=YoutubeHandler)
+    handler.io_bound_extraction = True
+    first_error = YtdlpDataError("first")
+
+    async def _extract(feed_id: str, info: YtdlpInfo, *_args: object) -> Download:
+        match info.required("id", str):
+            case "1":
+                await asyncio.sleep(0.01)
+                raise first_error
+            case "2":
+                raise YtdlpDataError("second")
+            case download_id:
+                return _download_for(feed_id, download_id)
+
+    handler.extract_download_metadata = AsyncMock(side_effect=_extract)
+    infos = [YtdlpInfo({"id": str(i)}) for i in range(3)]
+
+    with pytest.raises(YtdlpDataError) as exc_info:
+        await YtdlpWrapper._extract_downloads(handler, "feed", infos, None, None)
+
+    assert exc_info.value is first_error
+
+
 # --- Tests for YtdlpWrapper.download_feed_thumbnail ---
 
 
@@ -507,6 +610,64 @@ async def test_download_media_thumbnail_success(
     assert call_args[1] == source_url
 
 
+@pytest.mark.unit
+@patch.object(YtdlpCore, "download")
+@pytest.mark.asyncio
+async def test_download_media_thumbnail_converts_in_process(
+    mock_ytdlcore_download: AsyncMock,
+    paths: PathManager,
+    app_state_db_mock: MagicMock,
+    handler_selector_mock: MagicMock,
+    mock_youtube_handler: MagicMock,
+    ffmpeg_mock: MagicMock,
+    ffprobe_mock: MagicMock,
+):
+    """With an in-process pipeline yt-dlp skips conversion and the pipeline converts."""
+    handler_selector_mock.select.return_value = mock_youtube_handler
+    pipeline = MagicMock(spec=ImagePipeline)
+    pipeline.in_process = True
+    pipeline.to_jpg = AsyncMock()
+    wrapper = YtdlpWrapper(
+        paths,
+        None,
+        app_state_db=app_state_db_mock,
+        yt_channel="stable",
+        yt_update_freq=timedelta(hours=12),
+        ffmpeg=ffmpeg_mock,
+        ffprobe=ffprobe_mock,
+        handler_selector=handler_selector_mock,
+        ytdlp_core=YtdlpCore(),
+        image_pipeline=pipeline,
+    )
+    download = Download(
+        feed_id="test_feed",
+        id="test_download_id",
+        source_url="https://www.youtube.com/watch?v=test123",
+        title="Test Video",
+        published=datetime(2023, 1, 1, 0, 0, 0, tzinfo=UTC),
+        ext="mp4",
+        mime_type="video/mp4",
+        filesize=12345,
+        duration=120,
+        status=DownloadStatus.QUEUED,
+    )
+    webp_path = await paths.image_path("test_feed", "test_download_id", "webp")
+    jpg_path = await paths.image_path("test_feed", "test_download_id", "jpg")
+
+    async def _write_thumbnail(*_: object, **__: object) -> str:
+        webp_path.write_bytes(b"RIFF\x00\x00\x00\x00WEBPVP8 ")
+        return "logs"
+
+    mock_ytdlcore_download.side_effect = _write_thumbnail
+
+    await wrapper.download_media_thumbnail(download, user_yt_cli_args=[])
+
+    cmd_list = mock_ytdlcore_download.call_args[0][0].to_list()
+    assert "--convert-thumbnails" not in cmd_list
+    pipeline.to_jpg.assert_awaited_once_with(webp_path, jpg_path)
+    assert not webp_path.exists()
+
+
 @pytest.mark.unit
 @patch.object(YtdlpCore, "download")
 @pytest.mark.asyncio
@@ -604,17 +765,21 @@ async def test_download_media_to_file_success_simplified(
 
     # Check the download call
     mock_ytdlcore_download.assert_called_once()
-    download_args, _ = mock_ytdlcore_download.call_args
+    download_args, download_kwargs = mock_ytdlcore_download.call_args
     assert isinstance(download_args[0], YtdlpArgs)
+    assert "--continue" in download_args[0].to_list()
     assert download_args[1] == dummy_download.source_url
+    progress = download_kwargs["progress"]
+    assert isinstance(progress, ProgressMonitor)
+    assert progress.download_id == download_id
+    assert ytdlp_wrapper.progress_tracker.active() == []
 
     mock_aiofiles_wrap.assert_called_once()
     mock_glob.assert_called_once_with(f"{download_id}.*")
 
     mock_is_file.assert_called_once_with(expected_final_file)
-    ffprobe_mock.get_duration_seconds_from_file.assert_awaited_once_with(
-        expected_final_file
-    )
+    ffprobe_mock.probe.assert_awaited_once_with(expected_final_file)
+    assert result.probe == ffprobe_mock.probe.return_value
 
     assert mock_is_file.call_count >= 1
 
@@ -18,7 +18,7 @@ from anypod.config.config import (
     DynamicYamlConfigSettingsSource,
     FeedConfig,
 )
-from anypod.config.types import FeedMetadataOverrides
+from anypod.config.types import CronExpression, FeedMetadataOverrides
 from anypod.exceptions import ConfigLoadError
 
 # --- Tests for AppSettings configuration loading ---
@@ -431,6 +431,84 @@ def test_yaml_complex_types_load_correctly(tmp_path: Path):
     assert str(settings.tz) == "America/Los_Angeles"
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "env_value,expected",
+    [
+        ("0 3 * * 0", CronExpression("0 3 * * 0")),
+        (" @daily ", CronExpression("@daily")),
+        ("off", None),
+        ("OFF", None),
+        ("", None),
+    ],
+)
+def test_db_maintenance_schedule_parses_env(
+    tmp_path: Path, env_value: str, expected: CronExpression | None
+):
+    """DB_MAINTENANCE_SCHEDULE accepts a cron expression or 'off'."""
+    config_path = tmp_path / "empty.yaml"
+    with Path.open(config_path, "w", encoding="utf-8") as f:
+        yaml.dump({"feeds": {}}, f)
+
+    with patch.dict(os.environ, {"DB_MAINTENANCE_SCHEDULE": env_value}):
+        settings = AppSettings(config_file=config_path)
+
+    assert settings.db_maintenance_schedule == expected
+    if expected is not None:
+        assert str(settings.db_maintenance_schedule) == str(expected)
+
+
+@pytest.mark.unit
+def test_db_maintenance_schedule_invalid_cron_raises_error(tmp_path: Path):
+    """An unparseable DB_MAINTENANCE_SCHEDULE is rejected."""
+    config_path = tmp_path / "empty.yaml"
+    with Path.open(config_path, "w", encoding="utf-8") as f:
+        yaml.dump({"feeds": {}}, f)
+
+    with (
+        patch.dict(os.environ, {"DB_MAINTENANCE_SCHEDULE": "not a cron"}),
+        pytest.raises(ValidationError),
+    ):
+        AppSettings(config_file=config_path)
+
+
+@pytest.mark.unit
+def test_orphan_gc_settings_parse_env(tmp_path: Path):
+    """ORPHAN_GC_* settings are read from the environment."""
+    config_path = tmp_path / "empty.yaml"
+    with Path.open(config_path, "w", encoding="utf-8") as f:
+        yaml.dump({"feeds": {}}, f)
+
+    with patch.dict(
+        os.environ,
+        {
+            "ORPHAN_GC_SCHEDULE": "off",
+            "ORPHAN_GC_GRACE_PERIOD": "2h",
+            "ORPHAN_GC_BATCH_SIZE": "1000",
+        },
+    ):
+        settings = AppSettings(config_file=config_path)
+
+    assert settings.orphan_gc_schedule is None
+    assert settings.orphan_gc_grace_period == timedelta(hours=2)
+    assert settings.orphan_gc_batch_size == 1000
+
+
+@pytest.mark.unit
+def test_download_throughput_floor_parses_env(tmp_path: Path):
+    """DOWNLOAD_MIN_SPEED and DOWNLOAD_STALL_TIMEOUT are read from the environment."""
+    config_path = tmp_path / "empty.yaml"
+    with Path.open(config_path, "w", encoding="utf-8") as f:
+        yaml.dump({"feeds": {}}, f)
+
+    env = {"DOWNLOAD_MIN_SPEED": "0", "DOWNLOAD_STALL_TIMEOUT": "2m"}
+    with patch.dict(os.environ, env):
+        settings = AppSettings(config_file=config_path)
+
+    assert settings.download_min_speed == 0
+    assert settings.download_stall_timeout == timedelta(minutes=2)
+
+
 # --- Tests for FeedConfig.yt_args validator ---
 
 
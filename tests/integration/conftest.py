@@ -7,6 +7,7 @@ from pathlib import Path
 
 from helpers.alembic import run_migrations
 from helpers.test_client import ClientProtocol, create_test_client
+import httpx
 import pytest
 import pytest_asyncio
 
@@ -22,12 +23,14 @@ from anypod.db.sqlalchemy_core import SqlalchemyCore
 from anypod.ffmpeg import FFmpeg
 from anypod.ffprobe import FFProbe
 from anypod.file_manager import FileManager
+from anypod.http_client import create_http_client
 from anypod.image_downloader import ImageDownloader
 from anypod.manual_feed_runner import ManualFeedRunner
 from anypod.manual_submission_service import ManualSubmissionService
 from anypod.path_manager import PathManager
 from anypod.rss.rss_feed import RSSFeedGenerator
 from anypod.server.app import create_admin_app, create_app
+from anypod.ytdlp_wrapper.core import YtdlpCore
 from anypod.ytdlp_wrapper.handlers import HandlerSelector
 from anypod.ytdlp_wrapper.ytdlp_wrapper import YtdlpWrapper
 
@@ -136,13 +139,23 @@ def ffprobe() -> FFProbe:
 
 
 @pytest.fixture
-def handler_selector(ffprobe: FFProbe) -> HandlerSelector:
+def ytdlp_core() -> YtdlpCore:
+    """Provide a YtdlpCore instance running yt-dlp with default limits.
+
+    Returns:
+        YtdlpCore instance shared by the handlers and the wrapper.
+    """
+    return YtdlpCore()
+
+
+@pytest.fixture
+def handler_selector(ffprobe: FFProbe, ytdlp_core: YtdlpCore) -> HandlerSelector:
     """Provide a HandlerSelector instance with shared FFProbe.
 
     Returns:
         HandlerSelector instance configured with test FFProbe.
     """
-    return HandlerSelector(ffprobe)
+    return HandlerSelector(ffprobe, ytdlp_core)
 
 
 @pytest.fixture
@@ -150,6 +163,7 @@ def ytdlp_wrapper(
     path_manager: PathManager,
     db_core: SqlalchemyCore,
     handler_selector: HandlerSelector,
+    ytdlp_core: YtdlpCore,
     ffmpeg: FFmpeg,
     ffprobe: FFProbe,
 ) -> YtdlpWrapper:
@@ -168,22 +182,38 @@ def ytdlp_wrapper(
         ffmpeg=ffmpeg,
         ffprobe=ffprobe,
         handler_selector=handler_selector,
+        ytdlp_core=ytdlp_core,
     )
 
 
+@pytest_asyncio.fixture
+async def http_client() -> AsyncGenerator[httpx.AsyncClient]:
+    """Provide the shared outbound HTTP client, closed after the test."""
+    client = create_http_client()
+    yield client
+    await client.aclose()
+
+
 @pytest.fixture
 def image_downloader(
     path_manager: PathManager,
     ytdlp_wrapper: YtdlpWrapper,
     ffprobe: FFProbe,
     ffmpeg: FFmpeg,
+    http_client: httpx.AsyncClient,
 ) -> ImageDownloader:
     """Provide an ImageDownloader instance with shared components.
 
     Returns:
         ImageDownloader instance configured with test path manager and ytdlp wrapper.
     """
-    return ImageDownloader(path_manager, ytdlp_wrapper, ffprobe=ffprobe, ffmpeg=ffmpeg)
+    return ImageDownloader(
+        path_manager,
+        ytdlp_wrapper,
+        ffprobe=ffprobe,
+        ffmpeg=ffmpeg,
+        http_client=http_client,
+    )
 
 
 @pytest.fixture
@@ -35,7 +35,7 @@ async def test_download_feed_image_direct_jpg_no_conversion(
 
     result = await image_downloader.download_feed_image_direct(feed_id, url)
 
-    assert result == "jpg"
+    assert result.ext == "jpg"
 
     # Verify file was saved correctly
     expected_path = await path_manager.image_path(feed_id, None, "jpg")
@@ -61,7 +61,7 @@ async def test_download_feed_image_direct_png_with_conversion(
 
     result = await image_downloader.download_feed_image_direct(feed_id, url)
 
-    assert result == "jpg"
+    assert result.ext == "jpg"
 
     # Verify file was converted and saved as JPG
     expected_path = await path_manager.image_path(feed_id, None, "jpg")
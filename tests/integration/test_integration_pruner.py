@@ -922,7 +922,7 @@ async def test_archive_feed_transaction_rollback_on_failure(
     feed_db: FeedDatabase,
     file_manager: FileManager,
 ):
-    """Tests archive_feed transaction rollback when download archival fails."""
+    """Tests archive_feed leaves records and the feed intact when archival fails."""
     feed_id = "rollback_test_feed"
 
     # Create test feed
@@ -987,45 +987,40 @@ async def test_archive_feed_transaction_rollback_on_failure(
     assert len(initial_downloaded) == 1
     assert len(initial_queued) == 1
 
-    # Mock archive_download to fail partway through
-    original_archive = download_db.archive_download
+    # Mock the bulk archive update to fail
+    original_archive = download_db.archive_downloads
 
-    async def failing_archive(feed_id: str, download_id: str) -> None:
-        if download_id == "download_2":
-            from anypod.exceptions import DatabaseOperationError
+    async def failing_archive(feed_id: str, download_ids: list[str]) -> int:
+        from anypod.exceptions import DatabaseOperationError
 
-            raise DatabaseOperationError("Simulated archive failure")
-        return await original_archive(feed_id, download_id)
+        raise DatabaseOperationError("Simulated archive failure")
 
-    download_db.archive_download = failing_archive
+    download_db.archive_downloads = failing_archive
 
     try:
-        # Archive should fail and rollback
         with pytest.raises(PruneError):
             await pruner.archive_feed(feed_id)
 
-        # Verify rollback occurred - downloads should still be in original states
+        # No download was archived, so they are all still in their original states
         remaining_downloaded = await download_db.get_downloads_by_status(
             DownloadStatus.DOWNLOADED, feed_id=feed_id
         )
         remaining_queued = await download_db.get_downloads_by_status(
             DownloadStatus.QUEUED, feed_id=feed_id
         )
-
-        # Transaction should have rolled back
         assert len(remaining_downloaded) == 1
         assert len(remaining_queued) == 1
 
-        # Files should still exist for downloaded items
-        for download in initial_downloaded:
-            assert await file_manager.download_exists(
-                feed_id, download.id, download.ext
-            )
-
-        # Feed should still be enabled (rollback)
+        # Feed should still be enabled so archival can be retried
         feed = await feed_db.get_feed_by_id(feed_id)
         assert feed.is_enabled is True
 
     finally:
         # Cleanup
-        download_db.archive_download = original_archive
+        download_db.archive_downloads = original_archive
+
+    # Retrying completes the archival even though the media file is already gone
+    archived_count, _ = await pruner.archive_feed(feed_id)
+    assert archived_count == 2
+    feed = await feed_db.get_feed_by_id(feed_id)
+    assert feed.is_enabled is False
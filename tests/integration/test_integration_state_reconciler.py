@@ -8,6 +8,7 @@ feed state changes, and retention policy changes.
 
 from datetime import UTC, datetime
 
+import httpx
 import pytest
 
 from anypod.config import FeedConfig
@@ -46,10 +47,15 @@ def state_reconciler(
     path_manager: PathManager,
     ffprobe: FFProbe,
     ffmpeg: FFmpeg,
+    http_client: httpx.AsyncClient,
 ) -> StateReconciler:
     """Provides a StateReconciler instance with real dependencies."""
     image_downloader = ImageDownloader(
-        path_manager, ytdlp_wrapper, ffprobe=ffprobe, ffmpeg=ffmpeg
+        path_manager,
+        ytdlp_wrapper,
+        ffprobe=ffprobe,
+        ffmpeg=ffmpeg,
+        http_client=http_client,
     )
     return StateReconciler(
         file_manager,